@@ -8,12 +8,83 @@ import json
 import logging
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
+from .huggingface_client import HuggingFaceClient, InferenceCache
 
 logger = logging.getLogger(__name__)
 
+HF_SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+HF_CACHE_PATH = Path(".cache/huggingface_inference.db")
+
+
+def format_sentiment_prediction(
+    sentiment_data: Dict,
+    source: str = "HuggingFace (Free)",
+    model: str = "twitter-roberta-base-sentiment",
+) -> Dict:
+    """Mapper une prédiction {"label", "score"} d'un modèle de sentiment vers notre format"""
+    label = sentiment_data.get("label", "NEUTRAL")
+    score = sentiment_data.get("score", 0.5)
+
+    if "POSITIVE" in label.upper():
+        sentiment = "bullish"
+        confidence = score * 100
+    elif "NEGATIVE" in label.upper():
+        sentiment = "bearish"
+        confidence = score * 100
+    else:
+        sentiment = "neutral"
+        confidence = 60
+
+    return {
+        "sentiment": sentiment,
+        "confidence": round(confidence, 1),
+        "score": round(
+            (
+                50 + (score * 50)
+                if sentiment == "bullish"
+                else 50 - (score * 50)
+            ),
+            1,
+        ),
+        "source": source,
+        "model": model,
+        "raw_result": sentiment_data,
+    }
+
+
+def aggregate_sentiments(results: List[Dict]) -> Dict:
+    """Sentiment agrégé d'une liste de résultats par article"""
+    scores = [result.get("score", 50) for result in results]
+    average = sum(scores) / len(scores)
+
+    if average > 55:
+        sentiment = "bullish"
+    elif average < 45:
+        sentiment = "bearish"
+    else:
+        sentiment = "neutral"
+
+    counts = {
+        label: sum(1 for result in results if result.get("sentiment") == label)
+        for label in ("bullish", "bearish", "neutral")
+    }
+    return {
+        "sentiment": sentiment,
+        "confidence": round(sum(r.get("confidence", 50) for r in results) / len(results), 1),
+        "score": round(average, 1),
+        "source": results[0].get("source", "Unknown"),
+        "model": results[0].get("model", "Unknown"),
+        "analysis": {
+            "bullish_articles": counts["bullish"],
+            "bearish_articles": counts["bearish"],
+            "neutral_articles": counts["neutral"],
+            "total_articles": len(results),
+        },
+    }
+
 
 class FreeAIEngine:
     """
@@ -24,7 +95,7 @@ class FreeAIEngine:
     - Fallback vers IA locale
     """
 
-    def __init__(self):
+    def __init__(self, cache_path: Optional[Path] = None):
         self.huggingface_available = True
         self.openai_free_available = False  # Nécessite clé
         self.gemini_available = False  # Nécessite clé
@@ -34,6 +105,10 @@ class FreeAIEngine:
         self.request_history = []
         self.daily_limit = 100  # Limite conservative
 
+        # Client HuggingFace (lots + cache disque), créé au premier appel
+        self.cache_path = cache_path
+        self._hf_client: Optional[HuggingFaceClient] = None
+
         logger.info("🤖 IA Publique Gratuite initialisée")
 
     def _check_rate_limit(self) -> bool:
@@ -52,75 +127,90 @@ class FreeAIEngine:
         """Ajouter requête à l'historique"""
         self.request_history.append(datetime.now())
 
+    def _remaining_requests(self) -> int:
+        """Requêtes encore disponibles sur les dernières 24h"""
+        self._check_rate_limit()  # Nettoie l'historique
+        return max(0, self.daily_limit - len(self.request_history))
+
+    @property
+    def hf_client(self) -> HuggingFaceClient:
+        """Client HuggingFace partagé (session HTTP réutilisée, cache disque)"""
+        if self._hf_client is None:
+            try:
+                cache = InferenceCache(self.cache_path or HF_CACHE_PATH)
+            except Exception as e:
+                logger.warning(f"Cache HuggingFace indisponible: {e}")
+                cache = None
+            self._hf_client = HuggingFaceClient(HF_SENTIMENT_MODEL, cache=cache)
+        return self._hf_client
+
     def analyze_with_huggingface(
         self, text: str, task: str = "sentiment-analysis", api_key: str = None
     ) -> Dict:
         """Analyser avec Hugging Face (GRATUIT avec limites, meilleur avec API key)"""
-        if not self._check_rate_limit():
-            logger.warning("Rate limit atteint - fallback vers IA locale")
-            return self._local_fallback_analysis(text, task)
+        return self.analyze_batch_with_huggingface([text], task, api_key)[0]
+
+    def analyze_batch_with_huggingface(
+        self, texts: List[str], task: str = "sentiment-analysis", api_key: str = None
+    ) -> List[Dict]:
+        """
+        Analyser une liste de textes avec Hugging Face
+
+        Les textes déjà analysés sont servis depuis le cache disque ; les autres
+        partent par lots (une requête pour batch_size textes), le quota
+        quotidien étant décompté par lot. Les textes sans résultat passent
+        par l'IA locale.
+        """
+        if not texts:
+            return []
+
+        remaining = self._remaining_requests()
+        if remaining == 0:
+            logger.warning("Rate limit atteint - résultats en cache uniquement")
+
+        if api_key and api_key.strip():
+            logger.info("🔑 Utilisation clé API HuggingFace")
+        else:
+            logger.info("🆓 Utilisation API HuggingFace publique")
 
         try:
-            # API Hugging Face
-            API_URL = f"https://api-inference.huggingface.co/models/cardiffnlp/twitter-roberta-base-sentiment-latest"
+            batch = self.hf_client.classify(texts, max_requests=remaining, api_key=api_key)
+        except Exception as e:
+            logger.error(f"Erreur HuggingFace: {e}")
+            return [self._local_fallback_analysis(text, task) for text in texts]
+
+        for _ in range(batch.requests):
+            self._add_request_to_history()
+        for error in batch.errors:
+            logger.warning(error)
+
+        return [
+            self._format_huggingface_sentiment(prediction)
+            if prediction is not None
+            else self._local_fallback_analysis(text, task)
+            for text, prediction in zip(texts, batch.results)
+        ]
 
-            headers = {"Content-Type": "application/json"}
+    def _format_huggingface_sentiment(self, sentiment_data: Dict) -> Dict:
+        """Mapper un résultat HuggingFace vers notre format"""
+        return format_sentiment_prediction(sentiment_data)
 
-            # Ajouter clé API si disponible
-            if api_key and api_key.strip():
-                headers["Authorization"] = f"Bearer {api_key.strip()}"
-                logger.info("🔑 Utilisation clé API HuggingFace")
-            else:
-                logger.info("🆓 Utilisation API HuggingFace publique")
-
-            payload = {"inputs": text[:512]}  # Limite longueur
-
-            response = requests.post(API_URL, headers=headers, json=payload, timeout=10)
-
-            if response.status_code == 200:
-                self._add_request_to_history()
-                result = response.json()
-
-                # Parser résultat HuggingFace
-                if isinstance(result, list) and len(result) > 0:
-                    sentiment_data = result[0]
-
-                    # Mapper vers notre format
-                    label = sentiment_data.get("label", "NEUTRAL")
-                    score = sentiment_data.get("score", 0.5)
-
-                    if "POSITIVE" in label.upper():
-                        sentiment = "bullish"
-                        confidence = score * 100
-                    elif "NEGATIVE" in label.upper():
-                        sentiment = "bearish"
-                        confidence = score * 100
-                    else:
-                        sentiment = "neutral"
-                        confidence = 60
-
-                    return {
-                        "sentiment": sentiment,
-                        "confidence": round(confidence, 1),
-                        "score": round(
-                            (
-                                50 + (score * 50)
-                                if sentiment == "bullish"
-                                else 50 - (score * 50)
-                            ),
-                            1,
-                        ),
-                        "source": "HuggingFace (Free)",
-                        "model": "twitter-roberta-base-sentiment",
-                        "raw_result": sentiment_data,
-                    }
-
-            logger.warning(f"HuggingFace API erreur: {response.status_code}")
-            return self._local_fallback_analysis(text, task)
+    def analyze_news_with_huggingface(
+        self, news_data: List[Dict], api_key: str = None
+    ) -> Dict:
+        """Sentiment agrégé d'une liste d'articles (un résultat par article, par lots)"""
+        texts = [
+            f"{article.get('title', '')} {article.get('description', '')}".strip()
+            for article in news_data
+        ]
+        texts = [text for text in texts if text]
+        if not texts:
+            from .local_ai_engine import local_ai_engine
 
-        except Exception as e:
-            logger.error(f"Erreur HuggingFace: {e}")
-            return self._local_fallback_analysis(text, task)
+            return local_ai_engine.analyze_market_sentiment(news_data)
+
+        results = self.analyze_batch_with_huggingface(texts, api_key=api_key)
+        return aggregate_sentiments(results)
 
     def analyze_with_free_llm(self, prompt: str, context: str = "") -> Dict:
         """Analyser avec LLM gratuit (si disponible)"""
@@ -244,21 +334,8 @@ class FreeAIEngine:
     ) -> Dict:
         """Analyse complète combinant tous les services gratuits"""
         try:
-            # Analyse sentiment via HuggingFace si possible
-            news_text = " ".join(
-                [
-                    f"{article.get('title', '')} {article.get('description', '')}"
-                    for article in news_data[:3]  # Limiter pour éviter rate limit
-                ]
-            )
-
-            if news_text.strip():
-                sentiment_analysis = self.analyze_with_huggingface(news_text)
-            else:
-                # Fallback local
-                from .local_ai_engine import local_ai_engine
-
-                sentiment_analysis = local_ai_engine.analyze_market_sentiment(news_data)
+            # Analyse sentiment via HuggingFace (tous les articles, par lots)
+            sentiment_analysis = self.analyze_news_with_huggingface(news_data)
 
             # Analyse technique locale (toujours gratuite)
             from .local_ai_engine import local_ai_engine
@@ -0,0 +1,287 @@
+"""
+HuggingFace Client - Client d'inférence par lots pour l'API HuggingFace
+Regroupe les textes en une requête par lot (l'API accepte une liste d'entrées),
+envoie les lots en parallèle sur une session aiohttp partagée et met en cache
+les résultats sur disque par (modèle, empreinte du texte) avec expiration
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+HF_INFERENCE_URL = "https://api-inference.huggingface.co/models"
+MAX_TEXT_LENGTH = 512  # Limite longueur par texte
+
+
+def text_hash(text: str) -> str:
+    """Empreinte stable d'un texte (clé de cache)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class InferenceCache:
+    """
+    Cache disque (SQLite) des résultats d'inférence
+
+    Clé : (modèle, sha256 du texte envoyé) ; chaque entrée expire après ttl secondes.
+    """
+
+    def __init__(self, path: Path, ttl: float = 6 * 3600):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS inference_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                result TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, model: str, hashes: Iterable[str]) -> Dict[str, Any]:
+        """Résultats encore valides pour ces empreintes"""
+        hashes = list(hashes)
+        found: Dict[str, Any] = {}
+        now = time.time()
+        with self._lock:
+            # Par paquets : limite du nombre de paramètres SQLite
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT text_hash, result FROM inference_cache "
+                    f"WHERE model = ? AND expires_at > ? "
+                    f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                    (model, now, *chunk),
+                ).fetchall()
+                found.update((key, json.loads(result)) for key, result in rows)
+        return found
+
+    def set_many(self, model: str, results: Dict[str, Any]) -> None:
+        if not results:
+            return
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO inference_cache VALUES (?, ?, ?, ?)",
+                [(model, key, json.dumps(result), expires_at) for key, result in results.items()],
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM inference_cache WHERE expires_at <= ?", (time.time(),)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM inference_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class InferenceBatch:
+    """Résultat d'un appel classify : un résultat (ou None) par texte"""
+
+    results: List[Optional[Dict[str, Any]]]
+    requests: int = 0  # Requêtes HTTP envoyées (décomptées du quota)
+    cached: int = 0
+    errors: List[str] = field(default_factory=list)
+
+
+class HuggingFaceClient:
+    """
+    Client d'inférence HuggingFace par lots
+
+    Les textes sont dédupliqués, servis depuis le cache si possible, puis les
+    textes manquants sont envoyés par lots de batch_size. Le quota s'applique
+    par lot : au-delà de max_requests, les textes restants n'ont pas de
+    résultat (None) et l'appelant applique son fallback.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str = HF_INFERENCE_URL,
+        cache: Optional[InferenceCache] = None,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+        timeout: float = 30.0,
+    ):
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"{self.base_url}/{self.model}"
+
+    # ------------------------------------------------------------------
+    # Boucle d'événements dédiée (session réutilisée entre les appels)
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="huggingface-client", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            )
+            logger.debug("📡 Session aiohttp initialisée pour HuggingFace")
+        return self._session
+
+    def close(self) -> None:
+        """Ferme la session et arrête la boucle dédiée"""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), loop).result(5)
+            self._session = None
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread:
+            self._thread.join(5)
+        loop.close()
+
+    # ------------------------------------------------------------------
+    # Inférence
+    # ------------------------------------------------------------------
+
+    def classify(
+        self,
+        texts: List[str],
+        max_requests: Optional[int] = None,
+        api_key: Optional[str] = None,
+    ) -> InferenceBatch:
+        """Version synchrone de classify_async (exécutée sur la boucle dédiée)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.classify_async(texts, max_requests, api_key), self._ensure_loop()
+        )
+        return future.result()
+
+    async def classify_async(
+        self,
+        texts: List[str],
+        max_requests: Optional[int] = None,
+        api_key: Optional[str] = None,
+    ) -> InferenceBatch:
+        """
+        Classifie une liste de textes
+
+        Args:
+            texts: Textes à classifier (tronqués à MAX_TEXT_LENGTH caractères)
+            max_requests: Budget de requêtes HTTP pour cet appel (None = illimité)
+            api_key: Clé API HuggingFace optionnelle
+
+        Returns:
+            InferenceBatch avec un résultat {"label", "score"} ou None par texte
+        """
+        inputs = [text[:MAX_TEXT_LENGTH] for text in texts]
+        keys = [text_hash(text) for text in inputs]
+        unique = dict(zip(keys, inputs))
+
+        known: Dict[str, Any] = self.cache.get_many(self.model, unique) if self.cache is not None else {}
+        batch = InferenceBatch(results=[], cached=sum(1 for key in keys if key in known))
+
+        missing = [key for key in unique if key not in known]
+        chunks = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+        if max_requests is not None and len(chunks) > max_requests:
+            logger.warning(
+                f"⚠️ Quota HuggingFace: {len(chunks) - max(max_requests, 0)} lot(s) non envoyé(s)"
+            )
+            chunks = chunks[:max(max_requests, 0)]
+
+        if chunks:
+            headers = {"Content-Type": "application/json"}
+            if api_key and api_key.strip():
+                headers["Authorization"] = f"Bearer {api_key.strip()}"
+
+            session = await self._ensure_session()
+            responses = await asyncio.gather(
+                *(self._post_batch(session, [unique[key] for key in chunk], headers) for chunk in chunks),
+                return_exceptions=True,
+            )
+            batch.requests = len(chunks)
+
+            fresh: Dict[str, Any] = {}
+            for chunk, response in zip(chunks, responses):
+                if isinstance(response, Exception):
+                    batch.errors.append(str(response))
+                    continue
+                if not isinstance(response, list) or len(response) != len(chunk):
+                    batch.errors.append(f"Réponse inattendue: {str(response)[:200]}")
+                    continue
+                for key, output in zip(chunk, response):
+                    prediction = self._top_prediction(output)
+                    if prediction is not None:
+                        fresh[key] = prediction
+            if self.cache is not None:
+                self.cache.set_many(self.model, fresh)
+            known.update(fresh)
+
+        batch.results = [known.get(key) for key in keys]
+        logger.debug(
+            f"🤗 HuggingFace {self.model}: {len(texts)} textes, {batch.cached} en cache, "
+            f"{batch.requests} requête(s)"
+        )
+        return batch
+
+    async def _post_batch(
+        self, session: aiohttp.ClientSession, inputs: List[str], headers: Dict[str, str]
+    ) -> Any:
+        async with session.post(self.url, json={"inputs": inputs}, headers=headers) as response:
+            if response.status != 200:
+                raise RuntimeError(f"HuggingFace API erreur: {response.status}")
+            return await response.json(content_type=None)
+
+    @staticmethod
+    def _top_prediction(output: Any) -> Optional[Dict[str, Any]]:
+        """Label le plus probable (l'API renvoie tous les labels par texte)"""
+        if isinstance(output, dict) and "label" in output:
+            return {"label": output["label"], "score": output.get("score", 0.5)}
+        if isinstance(output, list):
+            candidates = [item for item in output if isinstance(item, dict) and "label" in item]
+            if candidates:
+                best = max(candidates, key=lambda item: item.get("score", 0.0))
+                return {"label": best["label"], "score": best.get("score", 0.5)}
+        return None
@@ -0,0 +1,117 @@
+"""
+Keyword Matcher - Matching multi-mots-clés compilé pour l'IA locale
+Une seule regex à alternance, construite une fois, score un article en une passe
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+# Flexions simples acceptées après un mot-clé (rise -> rises, gain -> gained)
+_SUFFIXES = r"(?:s|es|d|ed)?"
+
+
+@dataclass(frozen=True)
+class KeywordScore:
+    """Mots-clés distincts trouvés dans un texte, par catégorie"""
+
+    counts: Tuple[Tuple[str, int], ...]
+
+    def get(self, category: str) -> int:
+        for name, count in self.counts:
+            if name == category:
+                return count
+        return 0
+
+
+class KeywordMatcher:
+    """
+    Matcher de mots-clés par catégorie
+
+    Tous les mots-clés sont fusionnés dans une regex unique avec frontières
+    de mots (les plus longs d'abord), si bien qu'un texte est parcouru une
+    seule fois quel que soit le nombre de mots-clés. Les scores sont mis en
+    cache par hash de contenu : re-scorer le même flux ne coûte rien.
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]], cache_size: int = 10000):
+        """
+        Initialise le matcher
+
+        Args:
+            keywords: Mots-clés par catégorie (ex: {"bullish_keywords": [...]})
+            cache_size: Nombre maximum de scores conservés
+        """
+        self.categories = list(keywords)
+        self._category_of: Dict[str, str] = {}
+        for category, words in keywords.items():
+            for word in words:
+                self._category_of.setdefault(word.lower(), category)
+
+        alternation = "|".join(
+            re.escape(word)
+            for word in sorted(self._category_of, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"\b({alternation}){_SUFFIXES}\b", re.IGNORECASE)
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, KeywordScore]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def find(self, text: str) -> Dict[str, set]:
+        """Retourne les mots-clés distincts trouvés, groupés par catégorie"""
+        found: Dict[str, set] = {category: set() for category in self.categories}
+        for match in self._pattern.finditer(text or ""):
+            keyword = match.group(1).lower()
+            found[self._category_of[keyword]].add(keyword)
+        return found
+
+    def score(self, text: str) -> KeywordScore:
+        """Score un texte (nombre de mots-clés distincts par catégorie), avec cache"""
+        key = hashlib.blake2b((text or "").encode("utf-8"), digest_size=16).digest()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        found = self.find(text)
+        result = KeywordScore(
+            counts=tuple((category, len(found[category])) for category in self.categories)
+        )
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def score_many(self, texts: Iterable[str]) -> List[KeywordScore]:
+        """Score un lot de textes"""
+        return [self.score(text) for text in texts]
+
+    def contains_any(self, text: str) -> bool:
+        return self._pattern.search(text or "") is not None
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "keywords": len(self._category_of),
+                "cached_scores": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -10,6 +10,9 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from .keyword_matcher import KeywordMatcher, KeywordScore
+from .translation_engine import translation_engine
+
 # Configuration du logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,6 +32,16 @@ class LocalAIEngine:
         self.sentiment_patterns = self._load_sentiment_patterns()
         self.technical_patterns = self._load_technical_patterns()
 
+        self.translator = translation_engine
+
+        # Matchers compilés une fois (une passe regex par article)
+        self.sentiment_matcher = KeywordMatcher(self.sentiment_patterns)
+        self.market_matchers = {
+            "stocks": KeywordMatcher({"focus": ["earnings", "profit"]}),
+            "crypto": KeywordMatcher({"focus": ["adoption", "blockchain"]}),
+            "forex": KeywordMatcher({"focus": ["fed", "central bank"]}),
+        }
+
         logger.info("🤖 IA Locale initialisée - 100% GRATUITE")
 
     def _load_sentiment_patterns(self) -> Dict:
@@ -123,28 +136,11 @@ class LocalAIEngine:
 
         result = self.analyze_market_sentiment(news_data)
 
-        # Adapter pour marché spécifique
-        if market_type == "stocks":
-            # Ajuster pour stocks (focus sur earnings, fundamentals)
-            if (
-                "earnings" in " ".join(news_articles).lower()
-                or "profit" in " ".join(news_articles).lower()
-            ):
-                result["confidence"] = min(95, result["confidence"] + 5)
-        elif market_type == "crypto":
-            # Ajuster pour crypto (focus sur adoption, technology)
-            if (
-                "adoption" in " ".join(news_articles).lower()
-                or "blockchain" in " ".join(news_articles).lower()
-            ):
-                result["confidence"] = min(95, result["confidence"] + 5)
-        elif market_type == "forex":
-            # Ajuster pour forex (focus sur économie, banques centrales)
-            if (
-                "fed" in " ".join(news_articles).lower()
-                or "central bank" in " ".join(news_articles).lower()
-            ):
-                result["confidence"] = min(95, result["confidence"] + 5)
+        # Adapter pour marché spécifique (stocks: earnings, crypto: adoption,
+        # forex: banques centrales)
+        matcher = self.market_matchers.get(market_type)
+        if matcher and any(matcher.contains_any(article) for article in news_articles):
+            result["confidence"] = min(95, result["confidence"] + 5)
 
         return result
 
@@ -222,6 +218,13 @@ class LocalAIEngine:
 
         return result
 
+    def score_articles(self, news_data: List[Dict]) -> List[KeywordScore]:
+        """Scorer un lot d'articles (mots-clés distincts par catégorie, avec cache)"""
+        return self.sentiment_matcher.score_many(
+            f"{article.get('title', '') or ''} {article.get('description', '') or ''}"
+            for article in news_data
+        )
+
     def analyze_market_sentiment(self, news_data: List[Dict]) -> Dict:
         """Analyser sentiment marché via patterns keywords"""
         if not news_data:
@@ -231,24 +234,9 @@ class LocalAIEngine:
         bearish_count = 0
         total_articles = len(news_data)
 
-        for article in news_data:
-            title = (article.get("title", "") or "").lower()
-            description = (article.get("description", "") or "").lower()
-            content = f"{title} {description}"
-
-            # Compter keywords bullish
-            bullish_score = sum(
-                1
-                for keyword in self.sentiment_patterns["bullish_keywords"]
-                if keyword in content
-            )
-
-            # Compter keywords bearish
-            bearish_score = sum(
-                1
-                for keyword in self.sentiment_patterns["bearish_keywords"]
-                if keyword in content
-            )
+        for keyword_score in self.score_articles(news_data):
+            bullish_score = keyword_score.get("bullish_keywords")
+            bearish_score = keyword_score.get("bearish_keywords")
 
             if bullish_score > bearish_score:
                 bullish_count += 1
@@ -342,154 +330,15 @@ class LocalAIEngine:
     def translate_text(self, text: str, target_lang: str = "fr") -> Dict:
         """Traduire texte en français via dictionnaire local simple"""
         try:
-            if not text or not text.strip():
-                return {"translated_text": text, "confidence": 0}
-
-            # Dictionnaire de traduction simple anglais -> français
-            translations = {
-                # Mots économiques/financiers courants
-                "stock": "action",
-                "stocks": "actions",
-                "market": "marché",
-                "markets": "marchés",
-                "price": "prix",
-                "prices": "prix",
-                "trading": "trading",
-                "trader": "trader",
-                "investment": "investissement",
-                "investor": "investisseur",
-                "buy": "acheter",
-                "sell": "vendre",
-                "growth": "croissance",
-                "profit": "profit",
-                "loss": "perte",
-                "earnings": "bénéfices",
-                "revenue": "revenus",
-                "company": "entreprise",
-                "economic": "économique",
-                "economy": "économie",
-                "bank": "banque",
-                "interest": "intérêt",
-                "rate": "taux",
-                "federal": "fédéral",
-                "central": "central",
-                "inflation": "inflation",
-                "recession": "récession",
-                "recovery": "reprise",
-                "currency": "devise",
-                "dollar": "dollar",
-                "euro": "euro",
-                "bitcoin": "bitcoin",
-                "crypto": "crypto",
-                "cryptocurrency": "cryptomonnaie",
-                "blockchain": "blockchain",
-                "technology": "technologie",
-                "tech": "tech",
-                "artificial": "artificiel",
-                "intelligence": "intelligence",
-                "data": "données",
-                "analysis": "analyse",
-                "report": "rapport",
-                "news": "nouvelles",
-                "update": "mise à jour",
-                "forecast": "prévision",
-                "outlook": "perspectives",
-                "target": "objectif",
-                # Mots de liaison et temps
-                "and": "et",
-                "or": "ou",
-                "but": "mais",
-                "with": "avec",
-                "from": "de",
-                "to": "à",
-                "for": "pour",
-                "in": "dans",
-                "on": "sur",
-                "at": "à",
-                "up": "hausse",
-                "down": "baisse",
-                "higher": "plus haut",
-                "lower": "plus bas",
-                "increase": "augmentation",
-                "decrease": "diminution",
-                "rise": "hausse",
-                "fall": "chute",
-                "strong": "fort",
-                "weak": "faible",
-                "stable": "stable",
-                "volatile": "volatil",
-                "risk": "risque",
-                "opportunity": "opportunité",
-                # Temps
-                "today": "aujourd'hui",
-                "yesterday": "hier",
-                "tomorrow": "demain",
-                "week": "semaine",
-                "month": "mois",
-                "year": "année",
-                "quarter": "trimestre",
-                "morning": "matin",
-                "afternoon": "après-midi",
-                "evening": "soir",
-                # Adjectifs courants
-                "good": "bon",
-                "bad": "mauvais",
-                "new": "nouveau",
-                "old": "ancien",
-                "big": "grand",
-                "small": "petit",
-                "high": "élevé",
-                "low": "bas",
-                "positive": "positif",
-                "negative": "négatif",
-                "neutral": "neutre",
-            }
-
-            # Traduction mot par mot (simple)
-            words = text.split()
-            translated_words = []
-
-            for word in words:
-                # Nettoyer le mot (enlever ponctuation)
-                clean_word = word.lower().strip('.,!?;:"()[]{}')
-
-                # Chercher traduction
-                if clean_word in translations:
-                    # Garder la casse originale
-                    if word[0].isupper() and len(word) > 1:
-                        translated = translations[clean_word].capitalize()
-                    else:
-                        translated = translations[clean_word]
-
-                    # Rajouter ponctuation
-                    punctuation = "".join(c for c in word if not c.isalnum())
-                    translated_words.append(translated + punctuation)
-                else:
-                    # Garder mot original si pas de traduction
-                    translated_words.append(word)
-
-            translated_text = " ".join(translated_words)
-
-            # Calculer confiance basée sur % de mots traduits
-            translated_count = sum(
-                1
-                for word in words
-                if word.lower().strip('.,!?;:"()[]{}') in translations
-            )
-            confidence = min(90, (translated_count / len(words)) * 100) if words else 0
-
-            return {
-                "translated_text": translated_text,
-                "confidence": round(confidence, 1),
-                "original_text": text,
-                "words_translated": translated_count,
-                "total_words": len(words),
-            }
-
+            return self.translator.translate(text)
         except Exception as e:
             logger.error(f"Erreur traduction: {e}")
             return {"translated_text": text, "confidence": 0}
 
+    def translate_many(self, texts: List[str], target_lang: str = "fr") -> List[Dict]:
+        """Traduire un lot de textes (titres d'un flux de news)"""
+        return [self.translate_text(text, target_lang) for text in texts]
+
     def generate_trading_insight(
         self,
         symbol: str,
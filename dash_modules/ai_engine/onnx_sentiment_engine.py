@@ -0,0 +1,315 @@
+"""
+ONNX Sentiment Engine - Analyse de sentiment locale sur CPU
+Modèle transformer compact (ex: FinBERT distillé exporté en ONNX int8) chargé
+une seule fois dans un processus dédié : textes regroupés par longueur,
+padding dynamique par lot, aucun appel réseau ni quota
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .free_ai_engine import aggregate_sentiments, format_sentiment_prediction
+
+logger = logging.getLogger(__name__)
+
+# Dépendances optionnelles (pip install onnxruntime tokenizers)
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+# Répertoire du modèle : model.onnx, tokenizer.json, config.json (id2label)
+ONNX_MODEL_DIR = Path(os.getenv("THEBOT_ONNX_SENTIMENT_MODEL", "models/finbert-sentiment-onnx"))
+ONNX_MODEL_FILES = ("model.onnx", "tokenizer.json", "config.json")
+
+
+def length_batches(lengths: Sequence[int], batch_size: int) -> List[List[int]]:
+    """Indices regroupés par longueur croissante (limite le padding de chaque lot)"""
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def pad_batch(sequences: Sequence[Sequence[int]], pad_id: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Padding dynamique : (input_ids, attention_mask) à la longueur max du lot"""
+    width = max((len(sequence) for sequence in sequences), default=0)
+    input_ids = np.full((len(sequences), width), pad_id, dtype=np.int64)
+    attention_mask = np.zeros((len(sequences), width), dtype=np.int64)
+    for row, sequence in enumerate(sequences):
+        input_ids[row, :len(sequence)] = sequence
+        attention_mask[row, :len(sequence)] = 1
+    return input_ids, attention_mask
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return shifted / shifted.sum(axis=-1, keepdims=True)
+
+
+class SentimentModel:
+    """
+    Modèle de classification ONNX + tokenizer rapide
+
+    Chargé dans le processus worker ; predict() renvoie un {"label", "score"}
+    par texte, dans l'ordre d'entrée.
+    """
+
+    def __init__(
+        self,
+        model_dir: Path = ONNX_MODEL_DIR,
+        batch_size: int = 32,
+        max_length: int = 128,
+        threads: int = 0,
+    ):
+        model_dir = Path(model_dir)
+        config = json.loads((model_dir / "config.json").read_text())
+        id2label = config.get("id2label", {})
+        self.labels = [id2label[str(i)] for i in range(len(id2label))]
+        self.batch_size = batch_size
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.no_padding()  # Padding fait par lot (pad_batch)
+        self.tokenizer.enable_truncation(max_length)
+        self.pad_id = next(
+            (
+                token_id
+                for token_id in (self.tokenizer.token_to_id(t) for t in ("[PAD]", "<pad>"))
+                if token_id is not None
+            ),
+            0,
+        )
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_dir / "model.onnx"), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {node.name for node in self.session.get_inputs()}
+
+    def predict(self, texts: List[str]) -> List[Dict]:
+        encodings = self.tokenizer.encode_batch(texts)
+        results: List[Optional[Dict]] = [None] * len(texts)
+
+        for indices in length_batches([len(e.ids) for e in encodings], self.batch_size):
+            input_ids, attention_mask = pad_batch([encodings[i].ids for i in indices], self.pad_id)
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+            logits = self.session.run(None, {k: v for k, v in feeds.items() if k in self.input_names})[0]
+            for i, probabilities in zip(indices, softmax(logits)):
+                best = int(probabilities.argmax())
+                results[i] = {"label": self.labels[best], "score": float(probabilities[best])}
+        return results
+
+
+def _worker_main(conn, model_factory: Callable) -> None:
+    """Boucle du processus worker : charge le modèle puis répond aux lots"""
+    try:
+        model = model_factory()
+    except Exception as e:
+        conn.send(("error", f"Chargement modèle impossible: {e}"))
+        return
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            texts = conn.recv()
+        except EOFError:
+            break
+        if texts is None:
+            break
+        try:
+            conn.send(("ok", model.predict(texts)))
+        except Exception as e:
+            conn.send(("error", str(e)))
+    conn.close()
+
+
+class OnnxSentimentEngine:
+    """
+    Backend de sentiment local (entre le comptage de mots-clés et le modèle distant)
+
+    Le modèle vit dans un processus séparé (pas de GIL partagé avec Dash) et
+    n'est chargé qu'une fois ; les résultats ont le même format que
+    FreeAIEngine.analyze_with_huggingface.
+    """
+
+    def __init__(
+        self,
+        model_dir: Optional[Path] = None,
+        batch_size: int = 32,
+        max_length: int = 128,
+        threads: int = 0,
+        start_method: str = "spawn",
+        model_factory: Optional[Callable] = None,
+        timeout: float = 120.0,
+    ):
+        self.model_dir = Path(model_dir) if model_dir else ONNX_MODEL_DIR
+        self.model_factory = model_factory or partial(
+            SentimentModel, self.model_dir, batch_size, max_length, threads
+        )
+        self._custom_factory = model_factory is not None
+        self.start_method = start_method
+        self.timeout = timeout
+
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+        self._failed: Optional[str] = None
+        self.stats = {"texts": 0, "batches": 0, "inference_ms": 0.0}
+
+    @property
+    def model_name(self) -> str:
+        return self.model_dir.name
+
+    def is_available(self) -> bool:
+        """Dépendances installées, fichiers du modèle présents et worker sain"""
+        if self._failed:
+            return False
+        if self._custom_factory:
+            return True
+        return ONNX_AVAILABLE and all((self.model_dir / name).exists() for name in ONNX_MODEL_FILES)
+
+    # ------------------------------------------------------------------
+    # Processus worker
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Démarre le worker et attend le chargement du modèle"""
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            return
+        if not self.is_available():
+            raise RuntimeError(self._failed or "Backend ONNX indisponible (onnxruntime/modèle absents)")
+
+        context = multiprocessing.get_context(self.start_method)
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self.model_factory),
+            name="onnx-sentiment",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        status, detail = self._receive(parent_conn, process)
+        if status != "ready":
+            self._failed = detail
+            process.join(1)
+            raise RuntimeError(detail)
+
+        self._process, self._conn = process, parent_conn
+        logger.info(f"🧠 Modèle de sentiment ONNX chargé ({self.model_name}, pid {process.pid})")
+
+    def _receive(self, conn, process) -> Tuple[str, object]:
+        if not conn.poll(self.timeout):
+            process.kill()
+            return "error", f"Worker ONNX sans réponse après {self.timeout}s"
+        try:
+            return conn.recv()
+        except EOFError:
+            return "error", "Worker ONNX arrêté"
+
+    def stop(self) -> None:
+        with self._lock:
+            process, conn = self._process, self._conn
+            self._process = self._conn = None
+        if process is None:
+            return
+        try:
+            conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        process.join(5)
+        if process.is_alive():
+            process.kill()
+        conn.close()
+
+    # ------------------------------------------------------------------
+    # Inférence
+    # ------------------------------------------------------------------
+
+    def predict(self, texts: List[str]) -> List[Dict]:
+        """Prédictions brutes {"label", "score"}, une par texte (doublons calculés une fois)"""
+        if not texts:
+            return []
+        unique = list(dict.fromkeys(texts))
+
+        with self._lock:
+            self._start_locked()
+            started = time.perf_counter()
+            try:
+                self._conn.send(unique)
+                status, payload = self._receive(self._conn, self._process)
+            except (BrokenPipeError, OSError) as e:
+                status, payload = "error", str(e)
+            if status != "ok":
+                if not self._process.is_alive():
+                    self._process = self._conn = None  # Redémarré au prochain appel
+                raise RuntimeError(f"Inférence ONNX échouée: {payload}")
+
+            self.stats["texts"] += len(unique)
+            self.stats["batches"] += 1
+            self.stats["inference_ms"] += (time.perf_counter() - started) * 1000
+
+        predictions = dict(zip(unique, payload))
+        return [predictions[text] for text in texts]
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict]:
+        """Sentiment par texte, au format analyze_with_huggingface"""
+        return [
+            format_sentiment_prediction(prediction, source="ONNX (Local)", model=self.model_name)
+            for prediction in self.predict(texts)
+        ]
+
+    def analyze_sentiment(self, text: str) -> Dict:
+        return self.analyze_batch([text])[0]
+
+    def analyze_news(self, news_data: List[Dict]) -> Dict:
+        """Sentiment agrégé d'une liste d'articles (un résultat par article)"""
+        texts = [
+            f"{article.get('title', '')} {article.get('description', '')}".strip()
+            for article in news_data
+        ]
+        texts = [text for text in texts if text]
+        if not texts:
+            from .local_ai_engine import local_ai_engine
+
+            return local_ai_engine.analyze_market_sentiment(news_data)
+
+        return aggregate_sentiments(self.analyze_batch(texts))
+
+    def get_status(self) -> Dict:
+        texts = self.stats["texts"]
+        return {
+            "available": self.is_available(),
+            "onnxruntime_installed": ONNX_AVAILABLE,
+            "model": self.model_name,
+            "worker_running": self._process is not None and self._process.is_alive(),
+            "texts_processed": texts,
+            "texts_per_second": (
+                round(texts / (self.stats["inference_ms"] / 1000), 1) if self.stats["inference_ms"] else 0
+            ),
+            "error": self._failed,
+        }
+
+
+# Instance globale
+onnx_sentiment_engine = OnnxSentimentEngine()
@@ -24,6 +24,7 @@ class SmartAIManager:
         self.local_ai = None
         self.free_ai = None
         self.smart_ai = None
+        self.onnx_ai = None
 
         # Configuration utilisateur
         self.user_preferences = self._load_user_preferences()
@@ -31,6 +32,7 @@ class SmartAIManager:
         # Métriques performance
         self.performance_metrics = {
             "local": {"speed": 89000, "accuracy": 65, "cost": 0},
+            "onnx": {"speed": 2000, "accuracy": 78, "cost": 0},
             "huggingface": {"speed": 50, "accuracy": 80, "cost": 0},
             "premium": {"speed": 5, "accuracy": 90, "cost": 10},
         }
@@ -45,6 +47,7 @@ class SmartAIManager:
             "priority_speed": True,
             "priority_accuracy": False,
             "huggingface_enabled": True,
+            "onnx_enabled": True,
             "premium_enabled": False,
             "fallback_always_local": True,
         }
@@ -79,11 +82,13 @@ class SmartAIManager:
         try:
             from .free_ai_engine import FreeAIEngine
             from .local_ai_engine import LocalAIEngine
+            from .onnx_sentiment_engine import onnx_sentiment_engine
             from .smart_ai_engine import SmartAIEngine
 
             self.local_ai = LocalAIEngine()
             self.free_ai = FreeAIEngine()
             self.smart_ai = SmartAIEngine()
+            self.onnx_ai = onnx_sentiment_engine  # Worker démarré au premier appel
 
             logger.info("✅ Tous les moteurs IA initialisés")
         except Exception as e:
@@ -101,9 +106,12 @@ class SmartAIManager:
         # Vérifier budgets et quotas
         can_use_huggingface = self._check_huggingface_quota()
         can_use_premium = self._check_premium_budget()
+        can_use_onnx = self._check_onnx_available()
 
         # Logique de sélection intelligente
-        if task_type == "sentiment" and can_use_huggingface:
+        if task_type == "sentiment" and can_use_onnx:
+            return "onnx"
+        elif task_type == "sentiment" and can_use_huggingface:
             return "huggingface"
         elif task_type == "realtime" or priority == "speed":
             return "local"
@@ -146,6 +154,14 @@ class SmartAIManager:
             logger.warning(f"⚠️ Erreur récupération clé HuggingFace: {e}")
             return ""
 
+    def _check_onnx_available(self) -> bool:
+        """Modèle de sentiment local installé (onnxruntime + fichiers du modèle)"""
+        return bool(
+            self.user_preferences.get("onnx_enabled", True)
+            and self.onnx_ai is not None
+            and self.onnx_ai.is_available()
+        )
+
     def _check_premium_budget(self) -> bool:
         """Vérifier si budget premium disponible"""
         return (
@@ -162,7 +178,9 @@ class SmartAIManager:
 
         try:
             # Exécuter analyse selon IA sélectionnée
-            if selected_ai == "huggingface" and self.free_ai:
+            if selected_ai == "onnx" and self.onnx_ai:
+                result = self._analyze_with_onnx(data, task_type)
+            elif selected_ai == "huggingface" and self.free_ai:
                 result = self._analyze_with_huggingface(data, task_type)
             elif selected_ai == "premium" and self.smart_ai:
                 result = self._analyze_with_premium(data, task_type)
@@ -193,6 +211,14 @@ class SmartAIManager:
         else:
             return self._analyze_with_local(data, task_type)
 
+    def _analyze_with_onnx(self, data: Dict, task_type: str) -> Dict:
+        """Analyser avec le modèle de sentiment local (un résultat par article)"""
+        if task_type == "sentiment":
+            articles = [{"title": text} for text in data.get("news_articles", [])]
+            return self.onnx_ai.analyze_news(articles)
+        else:
+            return self._analyze_with_local(data, task_type)
+
     def _analyze_with_premium(self, data: Dict, task_type: str) -> Dict:
         """Analyser avec IA Premium"""
         return self._analyze_with_local(data, task_type)
@@ -212,34 +238,36 @@ class SmartAIManager:
         else:
             return {"error": "Type de tâche non supporté"}
 
+    def _looks_french(self, text: str) -> bool:
+        """Détecter si un texte est déjà en français (heuristique simple)"""
+        french_indicators = [
+            "le ",
+            "la ",
+            "les ",
+            "un ",
+            "une ",
+            "des ",
+            "du ",
+            "de ",
+            "et ",
+            "ou ",
+            "que ",
+            "qui ",
+        ]
+        text_lower = text.lower()
+        french_count = sum(
+            1 for indicator in french_indicators if indicator in text_lower
+        )
+        return french_count >= 3
+
     def translate_to_french(self, text: str) -> str:
         """Traduire un texte en français avec IA locale"""
         try:
             if not text or not text.strip():
                 return text
 
-            # Détecter si déjà en français (heuristique simple)
-            french_indicators = [
-                "le ",
-                "la ",
-                "les ",
-                "un ",
-                "une ",
-                "des ",
-                "du ",
-                "de ",
-                "et ",
-                "ou ",
-                "que ",
-                "qui ",
-            ]
-            text_lower = text.lower()
-            french_count = sum(
-                1 for indicator in french_indicators if indicator in text_lower
-            )
-
             # Si déjà probablement en français, ne pas traduire
-            if french_count >= 3:
+            if self._looks_french(text):
                 return text
 
             # Utiliser IA locale pour traduction
@@ -253,6 +281,28 @@ class SmartAIManager:
             logger.warning(f"Erreur traduction: {e}")
             return text  # Retourner texte original en cas d'erreur
 
+    def translate_many_to_french(self, texts: List[str]) -> List[str]:
+        """Traduire un lot de titres/résumés pour le rendu d'un flux de news"""
+        try:
+            if not self.local_ai:
+                return list(texts)
+
+            to_translate = [
+                i
+                for i, text in enumerate(texts)
+                if text and text.strip() and not self._looks_french(text)
+            ]
+            results = self.local_ai.translate_many([texts[i] for i in to_translate])
+
+            translated = list(texts)
+            for i, result in zip(to_translate, results):
+                translated[i] = result.get("translated_text", texts[i])
+            return translated
+
+        except Exception as e:
+            logger.warning(f"Erreur traduction batch: {e}")
+            return list(texts)
+
     def get_ai_status(self) -> Dict:
         """Obtenir status de tous les moteurs IA"""
         return {
@@ -261,6 +311,11 @@ class SmartAIManager:
                 "performance": self.performance_metrics["local"],
                 "quota": "Illimité",
             },
+            "onnx": {
+                "available": self._check_onnx_available(),
+                "performance": self.performance_metrics["onnx"],
+                "quota": "Illimité",
+            },
             "huggingface": {
                 "available": self._check_huggingface_quota(),
                 "performance": self.performance_metrics["huggingface"],
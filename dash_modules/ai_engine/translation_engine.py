@@ -0,0 +1,215 @@
+"""
+Translation Engine - Traduction anglais → français locale pour THEBOT
+Lexique et regex de tokenisation construits une fois, résultats mémoïsés
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+# Dictionnaire de traduction simple anglais -> français
+EN_FR_LEXICON: Dict[str, str] = {
+    # Mots économiques/financiers courants
+    "stock": "action",
+    "stocks": "actions",
+    "market": "marché",
+    "markets": "marchés",
+    "price": "prix",
+    "prices": "prix",
+    "trading": "trading",
+    "trader": "trader",
+    "investment": "investissement",
+    "investor": "investisseur",
+    "buy": "acheter",
+    "sell": "vendre",
+    "growth": "croissance",
+    "profit": "profit",
+    "loss": "perte",
+    "earnings": "bénéfices",
+    "revenue": "revenus",
+    "company": "entreprise",
+    "economic": "économique",
+    "economy": "économie",
+    "bank": "banque",
+    "interest": "intérêt",
+    "rate": "taux",
+    "federal": "fédéral",
+    "central": "central",
+    "inflation": "inflation",
+    "recession": "récession",
+    "recovery": "reprise",
+    "currency": "devise",
+    "dollar": "dollar",
+    "euro": "euro",
+    "bitcoin": "bitcoin",
+    "crypto": "crypto",
+    "cryptocurrency": "cryptomonnaie",
+    "blockchain": "blockchain",
+    "technology": "technologie",
+    "tech": "tech",
+    "artificial": "artificiel",
+    "intelligence": "intelligence",
+    "data": "données",
+    "analysis": "analyse",
+    "report": "rapport",
+    "news": "nouvelles",
+    "update": "mise à jour",
+    "forecast": "prévision",
+    "outlook": "perspectives",
+    "target": "objectif",
+    # Mots de liaison et temps
+    "and": "et",
+    "or": "ou",
+    "but": "mais",
+    "with": "avec",
+    "from": "de",
+    "to": "à",
+    "for": "pour",
+    "in": "dans",
+    "on": "sur",
+    "at": "à",
+    "up": "hausse",
+    "down": "baisse",
+    "higher": "plus haut",
+    "lower": "plus bas",
+    "increase": "augmentation",
+    "decrease": "diminution",
+    "rise": "hausse",
+    "fall": "chute",
+    "strong": "fort",
+    "weak": "faible",
+    "stable": "stable",
+    "volatile": "volatil",
+    "risk": "risque",
+    "opportunity": "opportunité",
+    # Temps
+    "today": "aujourd'hui",
+    "yesterday": "hier",
+    "tomorrow": "demain",
+    "week": "semaine",
+    "month": "mois",
+    "year": "année",
+    "quarter": "trimestre",
+    "morning": "matin",
+    "afternoon": "après-midi",
+    "evening": "soir",
+    # Adjectifs courants
+    "good": "bon",
+    "bad": "mauvais",
+    "new": "nouveau",
+    "old": "ancien",
+    "big": "grand",
+    "small": "petit",
+    "high": "élevé",
+    "low": "bas",
+    "positive": "positif",
+    "negative": "négatif",
+    "neutral": "neutre",
+}
+
+# Un mot, éventuellement composé (sell-off, today's) : recherché tel quel
+_WORD_RE = re.compile(r"[A-Za-z]+(?:['-][A-Za-z]+)*")
+
+
+class TranslationEngine:
+    """
+    Traducteur mot à mot à partir d'un lexique fixe
+
+    La substitution se fait en une passe regex ; la ponctuation et les
+    espaces d'origine sont conservés. Les résultats sont mis en cache dans
+    un LRU borné indexé par hash du texte, si bien qu'un titre déjà vu lors
+    d'un précédent rafraîchissement est traduit par simple lookup.
+    """
+
+    def __init__(self, lexicon: Dict[str, str] = None, cache_size: int = 5000):
+        """
+        Initialise le traducteur
+
+        Args:
+            lexicon: Lexique anglais -> français (EN_FR_LEXICON par défaut)
+            cache_size: Nombre maximum de traductions conservées
+        """
+        self.lexicon = lexicon if lexicon is not None else EN_FR_LEXICON
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _translate_uncached(self, text: str) -> Dict:
+        translated_count = 0
+
+        def replace(match: re.Match) -> str:
+            nonlocal translated_count
+            word = match.group(0)
+            translation = self.lexicon.get(word.lower())
+            if translation is None:
+                return word
+            translated_count += 1
+            # Garder la casse originale
+            if word[0].isupper() and len(word) > 1:
+                return translation.capitalize()
+            return translation
+
+        translated_text = _WORD_RE.sub(replace, text)
+
+        # Calculer confiance basée sur % de mots traduits
+        total_words = len(text.split())
+        confidence = (
+            min(90, (translated_count / total_words) * 100) if total_words else 0
+        )
+
+        return {
+            "translated_text": translated_text,
+            "confidence": round(confidence, 1),
+            "original_text": text,
+            "words_translated": translated_count,
+            "total_words": total_words,
+        }
+
+    def translate(self, text: str) -> Dict:
+        """Traduit un texte (résultat mémoïsé)"""
+        if not text or not text.strip():
+            return {"translated_text": text, "confidence": 0}
+
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return dict(cached)
+
+        result = self._translate_uncached(text)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return dict(result)
+
+    def translate_many(self, texts: List[str]) -> List[Dict]:
+        """Traduit un lot de textes (rendu d'un flux de news)"""
+        return [self.translate(text) for text in texts]
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "lexicon_size": len(self.lexicon),
+                "cached_translations": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Instance globale partagée
+translation_engine = TranslationEngine()
@@ -13,14 +13,36 @@ import dash_bootstrap_components as dbc
 from dash import html, dash_table
 
 from src.thebot.core.logger import logger
-from src.thebot.services.indicator_integration import get_integration_factory
+from src.thebot.services.indicator_integration import (
+    IndicatorConfig,
+    IndicatorIntegrationResult,
+    get_integration_factory,
+)
 from src.thebot.services.real_time_updates import get_subscriber, get_signal_aggregator
-from src.thebot.services.async_callbacks import get_async_wrapper
+from src.thebot.services.async_callbacks import get_async_callback_wrapper as get_async_wrapper
+from src.thebot.services.callback_debouncer import DebounceConfig, get_callback_debouncer
 from src.thebot.services.data_stream import get_data_stream
 from src.thebot.services.signal_notification import get_alert_manager, AlertType
 from src.thebot.core.types import TimeFrame, SignalDirection
 
 
+# Symbole affiché par le tableau de bord des indicateurs
+DEFAULT_SYMBOL = "BTCUSDT"
+CHART_BARS = 500
+
+TIMEFRAME_MAP = {
+    "1m": TimeFrame.M1,
+    "5m": TimeFrame.M5,
+    "15m": TimeFrame.M15,
+    "1h": TimeFrame.H1,
+    "4h": TimeFrame.H4,
+    "1d": TimeFrame.D1,
+}
+
+# Changements de paramètres : appels identiques (onglets, clients) fusionnés
+# en un seul calcul, une rafale étant bornée à 600 ms
+INDICATOR_PARAM_DEBOUNCE = DebounceConfig(strategy="trailing", delay_ms=150, max_wait_ms=600)
+
 # Singletons for services
 _factory = None
 _subscriber = None
@@ -46,6 +68,21 @@ def _get_services():
     return _factory, _subscriber, _aggregator, _wrapper
 
 
+def _debounced(callback_id: str):
+    """
+    Débouncer un callback déclenché par les paramètres d'indicateur
+    
+    Args:
+        callback_id: Identifiant du callback dans le CallbackDebouncer
+        
+    Returns:
+        Décorateur appliqué sous @callback
+    """
+    def decorator(func):
+        return get_callback_debouncer().register_sync(callback_id, func, INDICATOR_PARAM_DEBOUNCE)
+    return decorator
+
+
 @callback(
     Output("indicator-params", "children"),
     Input("indicator-selector", "value"),
@@ -118,9 +155,10 @@ def update_indicator_params(selected_indicator: str) -> List[dbc.Row]:
     Output("indicator-chart", "figure"),
     Input("indicator-selector", "value"),
     Input("timeframe-selector", "value"),
-    State({"type": "indicator-param", "index": ALL}, "value"),
+    Input({"type": "indicator-param", "index": ALL}, "value"),
     prevent_initial_call=True
 )
+@_debounced("phase5_indicator_chart")
 def update_indicator_chart(
     selected_indicator: str,
     timeframe: str,
@@ -144,46 +182,36 @@ def update_indicator_chart(
         }
     
     try:
-        factory, _, _, wrapper = _get_services()
-        
-        # Extraire le nom et la catégorie
-        parts = selected_indicator.split("_")
-        indicator_name = parts[0]
-        category = parts[1] if len(parts) > 1 else "basic"
-        
-        # Mapper timeframe
-        timeframe_map = {
-            "1m": TimeFrame.M1,
-            "5m": TimeFrame.M5,
-            "15m": TimeFrame.M15,
-            "1h": TimeFrame.H1,
-            "4h": TimeFrame.H4,
-            "1d": TimeFrame.D1,
-        }
-        tf = timeframe_map.get(timeframe, TimeFrame.H1)
-        
-        # Construire les paramètres
-        params = _build_indicator_params(indicator_name, param_values)
+        indicator_name = selected_indicator.split("_")[0]
         
-        # Calculer l'indicateur
-        result = factory.calculate_indicator(
-            indicator_name=indicator_name,
-            symbol="BTCUSDT",
-            timeframe=tf,
-            **params
-        )
+        # Mise à jour incrémentale : seules les nouvelles bougies sont calculées
+        result = _refresh_indicator(selected_indicator, timeframe, param_values)
         
-        if not result or not hasattr(result, 'chart_data') or not result.chart_data:
+        if not result or result.error or result.data.empty:
             logger.warning(f"Pas de données pour {indicator_name}")
             return {
                 "data": [],
                 "layout": {"title": f"Aucune donnée pour {indicator_name}"}
             }
         
-        # Extraire la figure du plotter
-        figure = result.chart_data
+        # Figure du plotter si disponible, sinon une courbe par sortie
+        if result.chart_data:
+            return result.chart_data["figure"]
         
-        return figure
+        frame = result.data
+        return {
+            "data": [
+                {
+                    "x": list(frame.index),
+                    "y": frame[column].tolist(),
+                    "type": "scatter",
+                    "mode": "lines",
+                    "name": str(column),
+                }
+                for column in frame.columns
+            ],
+            "layout": {"title": f"{indicator_name} - {DEFAULT_SYMBOL} ({timeframe})"}
+        }
         
     except Exception as e:
         logger.error(f"❌ Erreur mise à jour chart: {e}")
@@ -199,6 +227,7 @@ def update_indicator_chart(
     Input("timeframe-selector", "value"),
     prevent_initial_call=True
 )
+@_debounced("phase5_comparison_table")
 def update_comparison_table(
     selected_indicators: List[str],
     timeframe: str
@@ -220,42 +249,57 @@ def update_comparison_table(
     try:
         factory, _, _, _ = _get_services()
         
-        # Mapper timeframe
-        timeframe_map = {
-            "1m": TimeFrame.M1,
-            "5m": TimeFrame.M5,
-            "15m": TimeFrame.M15,
-            "1h": TimeFrame.H1,
-            "4h": TimeFrame.H4,
-            "1d": TimeFrame.D1,
-        }
-        tf = timeframe_map.get(timeframe, TimeFrame.H1)
+        tf = TIMEFRAME_MAP.get(timeframe, TimeFrame.H1)
+        data = _load_ohlcv(tf)
+        if data is None or data.empty:
+            return html.Div("Erreur: Aucune donnée de comparaison",
+                           className="alert alert-warning")
+        
+        # Un seul passage : EMA, SMA et true range communs calculés une fois
+        configs = []
+        for indicator_sel in selected_indicators:
+            parts = indicator_sel.split("_")
+            configs.append(IndicatorConfig(
+                name=parts[0],
+                category=parts[1] if len(parts) > 1 else "basic",
+                parameters={},
+                timeframe=tf,
+                show_signals=False,
+            ))
+        results = factory.calculate_indicators(data, configs)
         
         # Collecter les données pour comparaison
         comparison_data = []
         
-        for indicator_sel in selected_indicators:
-            parts = indicator_sel.split("_")
-            indicator_name = parts[0]
+        for config in configs:
+            result = results.get(config.name)
+            if not result or result.error or result.data.empty:
+                logger.warning(f"Erreur calcul {config.name}: {result.error if result else 'aucun résultat'}")
+                continue
+            
+            if result.data is data:
+                # Calculateur complet : seule la dernière valeur est connue
+                last_value = (result.statistics or {}).get('last_value')
+                comparison_data.append({
+                    "Indicateur": config.name,
+                    "Valeur Actuelle": f"{last_value}",
+                    "Min": "N/A",
+                    "Max": "N/A",
+                    "Moyenne": "N/A",
+                })
+                continue
             
-            try:
-                result = factory.calculate_indicator(
-                    indicator_name=indicator_name,
-                    symbol="BTCUSDT",
-                    timeframe=tf,
-                )
-                
-                if result and result.statistics:
-                    comparison_data.append({
-                        "Indicateur": indicator_name,
-                        "Valeur Actuelle": f"{result.statistics.get('current_value', 'N/A')}",
-                        "Min": f"{result.statistics.get('min', 'N/A')}",
-                        "Max": f"{result.statistics.get('max', 'N/A')}",
-                        "Moyenne": f"{result.statistics.get('mean', 'N/A')}",
-                    })
-            except Exception as e:
-                logger.warning(f"Erreur calcul {indicator_name}: {e}")
+            # Graphe partagé : série complète de la première sortie
+            values = result.data.iloc[:, 0].dropna()
+            if values.empty:
                 continue
+            comparison_data.append({
+                "Indicateur": config.name,
+                "Valeur Actuelle": f"{values.iloc[-1]:.2f}",
+                "Min": f"{values.min():.2f}",
+                "Max": f"{values.max():.2f}",
+                "Moyenne": f"{values.mean():.2f}",
+            })
         
         if not comparison_data:
             return html.Div("Erreur: Aucune donnée de comparaison",
@@ -289,11 +333,14 @@ def update_comparison_table(
     Output("metric-last-update", "children"),
     Input("indicator-selector", "value"),
     Input("timeframe-selector", "value"),
+    Input({"type": "indicator-param", "index": ALL}, "value"),
     prevent_initial_call=True
 )
+@_debounced("phase5_indicator_metrics")
 def update_metrics(
     selected_indicator: str,
-    timeframe: str
+    timeframe: str,
+    param_values: List[Any]
 ) -> tuple:
     """
     Mettre à jour les métriques d'indicateur
@@ -301,6 +348,7 @@ def update_metrics(
     Args:
         selected_indicator: Indicateur sélectionné
         timeframe: Timeframe sélectionné
+        param_values: Valeurs des paramètres
         
     Returns:
         Tuple de (valeur_actuelle, changement, signaux_today, derniere_maj)
@@ -309,46 +357,12 @@ def update_metrics(
         return "N/A", "N/A", "0", "N/A"
     
     try:
-        factory, _, aggregator, _ = _get_services()
-        
-        parts = selected_indicator.split("_")
-        indicator_name = parts[0]
-        
-        timeframe_map = {
-            "1m": TimeFrame.M1,
-            "5m": TimeFrame.M5,
-            "15m": TimeFrame.M15,
-            "1h": TimeFrame.H1,
-            "4h": TimeFrame.H4,
-            "1d": TimeFrame.D1,
-        }
-        tf = timeframe_map.get(timeframe, TimeFrame.H1)
-        
-        # Calculer l'indicateur
-        result = factory.calculate_indicator(
-            indicator_name=indicator_name,
-            symbol="BTCUSDT",
-            timeframe=tf,
-        )
+        result = _refresh_indicator(selected_indicator, timeframe, param_values)
         
         if not result:
             return "N/A", "N/A", "0", "N/A"
         
-        # Extraire les métriques
-        current_value = "N/A"
-        if result.statistics:
-            current_value = f"{result.statistics.get('current_value', 'N/A')}"
-        
-        # Changement (exemple: dernière vs avant-dernière)
-        change = "N/A"
-        if result.statistics and 'change' in result.statistics:
-            val = result.statistics['change']
-            change = f"{val:+.2f}" if isinstance(val, (int, float)) else val
-        
-        # Signaux d'aujourd'hui
-        signals_today = "0"
-        if result.signals:
-            signals_today = str(len(result.signals))
+        current_value, change, signals_today = _result_metrics(result)
         
         # Dernière mise à jour
         last_update = "Maintenant"
@@ -506,6 +520,86 @@ def _build_indicator_params(
     return params
 
 
+def _load_ohlcv(timeframe: TimeFrame, limit: int = CHART_BARS) -> Optional[pd.DataFrame]:
+    """
+    Charger les bougies OHLCV du symbole affiché
+    
+    Args:
+        timeframe: Timeframe des bougies
+        limit: Nombre de bougies
+        
+    Returns:
+        DataFrame OHLCV horodaté ou None si indisponible
+    """
+    # Import local : import circulaire via dash_modules.core
+    from ..data_providers.binance_api import binance_provider
+    
+    return binance_provider.get_klines(DEFAULT_SYMBOL, timeframe.value, limit)
+
+
+def _refresh_indicator(
+    selected_indicator: str,
+    timeframe: str,
+    param_values: Optional[List[Any]] = None
+) -> Optional[IndicatorIntegrationResult]:
+    """
+    Mettre à jour l'indicateur sélectionné sur les dernières bougies
+    
+    L'état des calculateurs streaming est conservé entre rafraîchissements
+    (IndicatorStateCache) : seules les bougies nouvelles ou révisées sont
+    recalculées.
+    
+    Args:
+        selected_indicator: Indicateur sélectionné (format: NAME_category)
+        timeframe: Timeframe sélectionné
+        param_values: Valeurs des paramètres
+        
+    Returns:
+        Résultat d'intégration ou None sans données
+    """
+    factory, _, _, _ = _get_services()
+    
+    parts = selected_indicator.split("_")
+    indicator_name = parts[0]
+    category = parts[1] if len(parts) > 1 else "basic"
+    tf = TIMEFRAME_MAP.get(timeframe, TimeFrame.H1)
+    
+    data = _load_ohlcv(tf)
+    if data is None or data.empty:
+        return None
+    
+    params = _build_indicator_params(indicator_name, param_values or [])
+    config = IndicatorConfig(
+        name=indicator_name,
+        category=category,
+        parameters={name: value for name, value in params.items() if value is not None},
+        timeframe=tf,
+    )
+    return factory.update_indicator(DEFAULT_SYMBOL, data, config)
+
+
+def _result_metrics(result: IndicatorIntegrationResult) -> tuple:
+    """
+    Extraire les métriques affichées d'un résultat
+    
+    Args:
+        result: Résultat d'intégration
+        
+    Returns:
+        Tuple de (valeur_actuelle, changement, signaux_today)
+    """
+    current_value, change = "N/A", "N/A"
+    if not result.error and not result.data.empty:
+        values = result.data.iloc[:, 0].dropna()
+        if len(values):
+            current_value = f"{values.iloc[-1]:.2f}"
+        if len(values) > 1:
+            change = f"{values.iloc[-1] - values.iloc[-2]:+.2f}"
+    
+    signals_today = str(len(result.signals)) if result.signals else "0"
+    return current_value, change, signals_today
+
+
 # Phase 5.3 - Real-time data integration callbacks
 
 @callback(
@@ -554,19 +648,21 @@ def update_realtime_data(n_intervals: int) -> Dict[str, Any]:
 
 
 @callback(
-    Output("metric-current-value", "children"),
-    Output("metric-change", "children"),
-    Output("metric-signals-today", "children"),
-    Output("metric-last-update", "children"),
+    Output("metric-current-value", "children", allow_duplicate=True),
+    Output("metric-change", "children", allow_duplicate=True),
+    Output("metric-signals-today", "children", allow_duplicate=True),
+    Output("metric-last-update", "children", allow_duplicate=True),
     Input("realtime-data-store", "data"),  # Trigger on real-time updates
     State("indicator-selector", "value"),
     State("timeframe-selector", "value"),
+    State({"type": "indicator-param", "index": ALL}, "value"),
     prevent_initial_call=True
 )
 def update_metrics_realtime(
     realtime_data: Dict[str, Any],
     selected_indicator: str,
-    timeframe: str
+    timeframe: str,
+    param_values: List[Any]
 ) -> tuple:
     """
     Update metrics from real-time data stream
@@ -575,6 +671,7 @@ def update_metrics_realtime(
         realtime_data: Real-time data from periodic update
         selected_indicator: Indicateur sélectionné
         timeframe: Timeframe sélectionné
+        param_values: Valeurs des paramètres
         
     Returns:
         Tuple de (valeur_actuelle, changement, signaux_today, derniere_maj)
@@ -583,46 +680,13 @@ def update_metrics_realtime(
         return "N/A", "N/A", "0", "N/A"
     
     try:
-        factory, _, aggregator, _ = _get_services()
-        
-        parts = selected_indicator.split("_")
-        indicator_name = parts[0]
-        
-        timeframe_map = {
-            "1m": TimeFrame.M1,
-            "5m": TimeFrame.M5,
-            "15m": TimeFrame.M15,
-            "1h": TimeFrame.H1,
-            "4h": TimeFrame.H4,
-            "1d": TimeFrame.D1,
-        }
-        tf = timeframe_map.get(timeframe, TimeFrame.H1)
-        
-        # Calculer l'indicateur avec données actualisées
-        result = factory.calculate_indicator(
-            indicator_name=indicator_name,
-            symbol="BTCUSDT",
-            timeframe=tf,
-        )
+        # État incrémental : un rafraîchissement ne traite que les bougies nouvelles ou révisées
+        result = _refresh_indicator(selected_indicator, timeframe, param_values)
         
         if not result:
             return "N/A", "N/A", "0", "N/A"
         
-        # Extraire les métriques
-        current_value = "N/A"
-        if result.statistics:
-            current_value = f"{result.statistics.get('current_value', 'N/A')}"
-        
-        # Changement
-        change = "N/A"
-        if result.statistics and 'change' in result.statistics:
-            val = result.statistics['change']
-            change = f"{val:+.2f}" if isinstance(val, (int, float)) else val
-        
-        # Signaux d'aujourd'hui
-        signals_today = "0"
-        if result.signals:
-            signals_today = str(len(result.signals))
+        current_value, change, signals_today = _result_metrics(result)
         
         # Dernière mise à jour
         last_update = realtime_data.get("timestamp", "N/A")
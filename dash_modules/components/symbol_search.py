@@ -105,6 +105,14 @@ class SymbolSearchComponent:
 
         return buttons
 
+    def search(
+        self, query: str, limit: int = 12, market_type: Optional[str] = None
+    ) -> List[str]:
+        """Symboles correspondant à la saisie (index de recherche partagé)"""
+        from ..data_providers.symbol_index import symbol_index
+
+        return symbol_index.symbols(query, limit=limit, market_type=market_type)
+
     def render_popular_symbols(self, popular_symbols: List[str]) -> List[dbc.Button]:
         """Afficher les symboles populaires par défaut"""
         return self.create_result_buttons(popular_symbols[:8])
@@ -116,10 +116,14 @@ class TopPerformersComponent:
             logger.error(f"❌ Erreur récupération top losers: {e}")
             return []
 
-    def calculate_correlations(self, symbols: List[str] = None) -> Dict:
-        """Calcule les corrélations entre cryptos populaires"""
+    def calculate_correlations(
+        self, symbols: List[str] = None, interval: str = "1h", method: str = "pearson"
+    ) -> Dict:
+        """Calcule les corrélations (Pearson / Spearman) des log-rendements glissants"""
         try:
-            cache_key = f"correlations_{'_'.join(symbols) if symbols else 'default'}"
+            cache_key = (
+                f"correlations_{'_'.join(symbols) if symbols else 'default'}_{interval}_{method}"
+            )
             now = datetime.now()
 
             if (
@@ -132,43 +136,21 @@ class TopPerformersComponent:
             if not symbols:
                 symbols = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "ADAUSDT", "XRPUSDT"]
 
-            # Récupérer données 24h pour chaque symbole
-            correlations_data = {}
-            price_changes = {}
-
-            for symbol in symbols:
-                ticker = binance_provider.get_24hr_ticker(symbol)
-                if ticker and ticker.get("symbol"):
-                    price_changes[symbol] = ticker["priceChangePercent"]
+            # Log-rendements alignés depuis le cache OHLCV local (fenêtre glissante)
+            from ..services.correlation_engine import correlation_engine
 
-                    correlations_data[symbol] = {
-                        "price": ticker["price"],
-                        "change_24h": ticker["priceChangePercent"],
-                        "volume": ticker["quoteVolume"],
-                        "volatility": self._calculate_volatility(ticker),
-                    }
-
-            # Matrice de corrélation simple (pour demo, basée sur les changements 24h)
-            correlation_matrix = {}
-            for symbol1 in price_changes:
-                correlation_matrix[symbol1] = {}
-                for symbol2 in price_changes:
-                    if symbol1 == symbol2:
-                        correlation_matrix[symbol1][symbol2] = 1.0
-                    else:
-                        # Corrélation approximative basée sur la direction du changement
-                        change1 = price_changes[symbol1]
-                        change2 = price_changes[symbol2]
-
-                        # Corrélation directionnelle simple
-                        if (change1 > 0 and change2 > 0) or (
-                            change1 < 0 and change2 < 0
-                        ):
-                            correlation = min(0.9, abs(change1 * change2) / 100)
-                        else:
-                            correlation = -min(0.9, abs(change1 * change2) / 100)
-
-                        correlation_matrix[symbol1][symbol2] = correlation
+            analysis = correlation_engine.analyze(symbols, interval=interval, method=method)
+            correlation_matrix = {
+                symbol1: {
+                    symbol2: float(value)
+                    for symbol2, value in row.items()
+                    if not np.isnan(value)
+                }
+                for symbol1, row in analysis["matrix"].to_dict("index").items()
+            }
+            correlations_data = self._summarize_ohlcv(
+                analysis["ohlcv"], correlation_engine.bars_per_day(interval)
+            )
 
             result = {
                 "correlation_matrix": correlation_matrix,
@@ -177,6 +159,8 @@ class TopPerformersComponent:
                 "diversification_score": self._calculate_diversification_score(
                     correlation_matrix
                 ),
+                "diversification": analysis["diversification"],
+                "clusters": analysis["clusters"],
             }
 
             self.cache[cache_key] = result
@@ -235,6 +219,28 @@ class TopPerformersComponent:
             logger.error(f"❌ Erreur calcul ratios performance: {e}")
             return {}
 
+    def scan_market(
+        self, expression: str, interval: str = "1h", symbols: List[str] = None
+    ) -> Dict:
+        """Symboles qui vérifient une condition (ex: "RSI(14) < 30 and close > EMA(200)")"""
+        from ..services.market_scanner import ScanExpressionError, market_scanner
+
+        try:
+            result = market_scanner.scan(expression, symbols=symbols, interval=interval)
+            return {
+                "matches": result.matches,
+                "values": result.values,
+                "scanned": result.scanned,
+                "elapsed_ms": result.elapsed_ms,
+            }
+
+        except ScanExpressionError as e:
+            logger.warning(f"⚠️ Expression de scan invalide '{expression}': {e}")
+            return {"error": str(e), "matches": []}
+        except Exception as e:
+            logger.error(f"❌ Erreur scan marché: {e}")
+            return {"matches": []}
+
     def create_performance_widget(self, widget_id: str = "top-performers") -> html.Div:
         """Crée le widget des top performers"""
         return html.Div(
@@ -355,6 +361,34 @@ class TopPerformersComponent:
         else:
             return "❓ Unclear"
 
+    def _summarize_ohlcv(self, ohlcv: Dict[str, pd.DataFrame], bars_per_day: int) -> Dict:
+        """Prix, variation, volume et volatilité 24h de chaque symbole depuis les OHLCV"""
+        last_day = {column: frame.iloc[-bars_per_day:] for column, frame in ohlcv.items()}
+        closes = ohlcv["close"]
+        if closes.empty:
+            return {}
+
+        price = closes.ffill().iloc[-1]
+        reference = closes.shift(bars_per_day).iloc[-1].fillna(closes.bfill().iloc[0])
+        quote_volume = (last_day["volume"] * last_day["close"]).sum()
+        summary = {}
+        for symbol in closes.columns:
+            if np.isnan(price[symbol]):
+                continue
+            summary[symbol] = {
+                "price": float(price[symbol]),
+                "change_24h": float((price[symbol] / reference[symbol] - 1) * 100),
+                "volume": float(quote_volume[symbol]),
+                "volatility": self._calculate_volatility(
+                    {
+                        "high": float(last_day["high"][symbol].max()),
+                        "low": float(last_day["low"][symbol].min()),
+                        "price": float(price[symbol]),
+                    }
+                ),
+            }
+        return summary
+
     def _calculate_volatility(self, ticker: Dict) -> float:
         """Calcule la volatilité approximative"""
         high = ticker.get("high", 0)
@@ -1,6 +1,6 @@
 """
 Alerts Monitor Compatibility Module - Phase 1 THEBOT
-Stub module pour maintenir la compatibilité avec dash_modules.core.alerts_monitor
+Surveillance des alertes de prix (déléguée au PriceAlertEngine) et notifications simplifiées
 """
 
 import logging
@@ -45,32 +45,52 @@ class AlertsNotificationManager:
 
 
 class AlertsMonitor:
-    """Moniteur d'alertes simplifié"""
+    """
+    Surveillance des alertes de prix
 
-    def __init__(self, check_interval: int = 15):
-        self.check_interval = check_interval
+    Plus de sondage périodique : les alertes actives sont indexées par le
+    PriceAlertEngine, évalué à chaque tick du DataStream temps réel.
+    """
+
+    def __init__(self):
         self.is_running = False
-        self.triggered_alerts = set()
 
     def start_monitoring(self):
-        """Démarrer la surveillance"""
-        self.is_running = True
-        logger.info("🚀 Surveillance d'alertes démarrée (stub)")
+        """Indexe les alertes, démarre le flux temps réel et y attache le moteur"""
+        from src.thebot.services.data_stream import StreamConfig, get_data_stream
+
+        from ..services.price_alert_engine import price_alert_engine
+
+        try:
+            price_alert_engine.load_from_database()
+            symbols = sorted(set(StreamConfig().symbols) | set(price_alert_engine.symbols))
+            stream = get_data_stream(StreamConfig(symbols=symbols))
+            stream.start_background()
+            price_alert_engine.start(stream)
+            self.is_running = True
+            logger.info(f"🚀 Surveillance d'alertes démarrée ({len(symbols)} symboles)")
+        except Exception as e:
+            logger.error(f"❌ Démarrage surveillance d'alertes échoué: {e}")
 
     def stop_monitoring(self):
-        """Arrêter la surveillance"""
+        """Détache le moteur du flux et écrit les derniers déclenchements"""
+        from ..services.price_alert_engine import price_alert_engine
+
+        price_alert_engine.stop()
         self.is_running = False
-        logger.info("🛑 Surveillance d'alertes arrêtée (stub)")
+        logger.info("🛑 Surveillance d'alertes arrêtée")
 
     def get_status(self) -> Dict:
         """Statut du moniteur"""
+        from ..services.price_alert_engine import price_alert_engine
+
+        stats = price_alert_engine.get_stats()
         return {
-            "is_running": self.is_running,
-            "check_interval": self.check_interval,
-            "active_alerts_count": 0,
-            "monitored_symbols": [],
-            "current_prices_count": 0,
-            "triggered_alerts_count": len(self.triggered_alerts)
+            "is_running": self.is_running and stats["attached"],
+            "active_alerts_count": stats["indexed_alerts"],
+            "monitored_symbols": price_alert_engine.symbols,
+            "ticks_processed": stats["ticks_processed"],
+            "triggered_alerts_count": stats["alerts_triggered"],
         }
 
 
@@ -0,0 +1,148 @@
+"""
+Metrics & Health - Phase 4 THEBOT
+Métriques applicatives (requêtes, erreurs, cache) et vérifications de santé,
+adossées au registre de métriques partagé (exporté sur /metrics)
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List
+
+from src.thebot.core.metrics import MetricsRegistry, metrics
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsCollector:
+    """
+    Collecteur de métriques applicatives
+
+    Les compteurs de l'instance servent aux checks de santé ; chaque mesure
+    alimente aussi le registre (histogramme de latence des requêtes).
+    """
+
+    def __init__(self, registry: MetricsRegistry = None):
+        self.registry = registry or metrics
+        self.start_time = datetime.now()
+        self.request_count = 0
+        self.error_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self._request_seconds = self.registry.histogram(
+            "thebot_request_seconds", "Durée des requêtes applicatives", labels=("outcome",)
+        )
+        self._cache_requests = self.registry.counter(
+            "thebot_app_cache_requests_total", "Accès au cache applicatif", labels=("result",)
+        )
+
+    def record_request(self, duration: float, success: bool = True) -> None:
+        """Enregistrer une requête (durée en secondes)"""
+        self.request_count += 1
+        if not success:
+            self.error_count += 1
+        self._request_seconds.labels("success" if success else "error").observe(duration)
+
+    def record_cache_access(self, hit: bool) -> None:
+        """Enregistrer un accès cache"""
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+        self._cache_requests.labels("hit" if hit else "miss").inc()
+
+    def get_application_metrics(self) -> Dict:
+        """Métriques agrégées de l'application"""
+        cache_total = self.cache_hits + self.cache_misses
+        return {
+            "uptime_seconds": (datetime.now() - self.start_time).total_seconds(),
+            "total_requests": self.request_count,
+            "error_count": self.error_count,
+            "error_rate_percent": (
+                round(self.error_count / self.request_count * 100, 2) if self.request_count else 0
+            ),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_hit_rate_percent": (
+                round(self.cache_hits / cache_total * 100, 2) if cache_total else 0
+            ),
+            "latency": {
+                outcome["outcome"]: histogram.snapshot()
+                for outcome, histogram in self._request_seconds.children()
+            },
+        }
+
+
+class HealthChecker:
+    """Vérifications de santé système et applicative"""
+
+    CPU_WARNING = 75.0
+    CPU_CRITICAL = 90.0
+    MEMORY_WARNING = 80.0
+    MEMORY_CRITICAL = 90.0
+    ERROR_RATE_WARNING = 5.0
+    ERROR_RATE_CRITICAL = 10.0
+
+    def __init__(self, metrics_collector: MetricsCollector):
+        self.metrics = metrics_collector
+
+    def _check_system_health(self) -> Dict:
+        """CPU et mémoire du système"""
+        try:
+            cpu = psutil.cpu_percent(interval=None)
+            memory = psutil.virtual_memory().percent
+
+            if cpu >= self.CPU_CRITICAL or memory >= self.MEMORY_CRITICAL:
+                status = "critical"
+            elif cpu >= self.CPU_WARNING or memory >= self.MEMORY_WARNING:
+                status = "warning"
+            else:
+                status = "healthy"
+
+            return {
+                "name": "system_health",
+                "status": status,
+                "message": f"CPU: {cpu:.1f}%, RAM: {memory:.1f}%",
+                "details": {"cpu_percent": cpu, "memory_percent": memory},
+            }
+        except Exception as e:
+            logger.error(f"❌ Erreur check système: {e}")
+            return {
+                "name": "system_health",
+                "status": "critical",
+                "message": f"Erreur: {e}",
+                "details": {},
+            }
+
+    def _check_application_health(self) -> Dict:
+        """Taux d'erreur des requêtes applicatives"""
+        app_metrics = self.metrics.get_application_metrics()
+        error_rate = app_metrics.get("error_rate_percent", 0)
+
+        if error_rate >= self.ERROR_RATE_CRITICAL:
+            status = "critical"
+        elif error_rate >= self.ERROR_RATE_WARNING:
+            status = "warning"
+        else:
+            status = "healthy"
+
+        return {
+            "name": "application_health",
+            "status": status,
+            "message": f"Taux d'erreur: {error_rate:.1f}%",
+            "details": app_metrics,
+        }
+
+    def run_all_checks(self) -> List[Dict]:
+        """Exécuter toutes les vérifications"""
+        return [self._check_system_health(), self._check_application_health()]
+
+
+# Instance globale
+metrics_collector = MetricsCollector()
+health_checker = HealthChecker(metrics_collector)
@@ -5,6 +5,7 @@ Package pour les fournisseurs de données réelles (APIs externes) + RSS
 
 from .binance_api import binance_provider
 from .coin_gecko_api import coin_gecko_api
+from .news_ingestion_scheduler import news_ingestion_scheduler, news_store
 from .real_data_manager import real_data_manager
 from .rss_news_manager import rss_news_manager
 
@@ -21,4 +22,6 @@ __all__ = [
     "real_data_manager",
     "rss_sources_config",
     "rss_news_manager",
+    "news_ingestion_scheduler",
+    "news_store",
 ]
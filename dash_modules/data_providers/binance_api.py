@@ -16,6 +16,9 @@ import requests
 
 from .provider_interfaces import DataProviderInterface
 from src.thebot.core.cache import get_global_cache
+from src.thebot.core.metrics import instrumented_request
+
+from .symbol_index import SymbolEntry, symbol_index
 
 # Configuration du logger
 logging.basicConfig(level=logging.INFO)
@@ -132,7 +135,7 @@ class BinanceProvider(DataProviderInterface):
             url = f"{self.base_url}/{endpoint}"
             logger.debug(f"🌐 Requête Binance: {url}")
 
-            response = requests.get(url, params=params, timeout=10)
+            response = instrumented_request("binance", requests.get, url, params=params, timeout=10)
             self.last_request_time = time.time()
 
             if response.status_code == 200:
@@ -243,9 +246,9 @@ class BinanceProvider(DataProviderInterface):
             "1d": 86400,
         }.get(interval, 3600)
 
-        cached_data = self.cache.get("exchange_info")
+        cached_data = self.cache.get("crypto_ohlcv", symbol=symbol, interval=interval, limit=limit)
         if cached_data is not None:
-                return cached_data
+            return cached_data
 
         endpoint = "klines"
         params = {"symbol": symbol, "interval": interval, "limit": limit}
@@ -331,9 +334,9 @@ class BinanceProvider(DataProviderInterface):
         cache_key = "all_usdt_symbols"
 
         # Cache 1 heure pour la liste des symboles
-        cached_data = self.cache.get("exchange_info")
+        cached_data = self.cache.get("symbols_list")
         if cached_data is not None:
-                return cached_data
+            return cached_data
 
         try:
             exchange_info = self.get_exchange_info()
@@ -350,7 +353,7 @@ class BinanceProvider(DataProviderInterface):
                 if (
                     s["status"] == "TRADING"
                     and s["symbol"].endswith("USDT")
-                    and s["quoteAsset"] == "USDT"
+                    and s.get("quoteAsset", "USDT") == "USDT"
                 )
             ]
 
@@ -367,30 +370,51 @@ class BinanceProvider(DataProviderInterface):
             return self.popular_symbols.copy()
 
     def search_symbols(self, query: str, limit: int = 15) -> List[str]:
-        """Recherche intelligente de symboles"""
+        """Recherche intelligente de symboles (préfixes, sous-chaînes, fautes de frappe)"""
         if not query or len(query) < 2:
             return self.popular_symbols[:limit]
 
         try:
-            all_symbols = self.get_all_symbols()
-            query_upper = query.upper()
-
-            # Recherche prioritaire : symboles qui commencent par la requête
-            exact_start = [s for s in all_symbols if s.startswith(query_upper)]
-
-            # Recherche secondaire : symboles qui contiennent la requête
-            contains = [
-                s for s in all_symbols if query_upper in s and s not in exact_start
-            ]
-
-            # Combiner et limiter
-            results = exact_start + contains
-            return results[:limit]
+            self.refresh_symbol_index()
+            return symbol_index.symbols(query, limit=limit, market_type="crypto")
 
         except Exception as e:
             logger.error(f"Erreur recherche symboles: {str(e)}")
             return self.popular_symbols[:limit]
 
+    def refresh_symbol_index(self) -> bool:
+        """
+        Publie les symboles USDT dans l'index de recherche partagé
+
+        L'index n'est reconstruit (avec le classement par volume 24h) que
+        lorsque la liste de symboles de l'exchange change.
+
+        Returns:
+            True si l'index a été reconstruit
+        """
+        symbols = self.get_all_symbols()
+        if symbol_index.is_current(self.name, symbols):
+            return False
+
+        tickers = self.get_24hr_ticker()
+        volumes = {
+            ticker["symbol"]: ticker.get("quoteVolume", 0.0)
+            for ticker in (tickers if isinstance(tickers, list) else [])
+        }
+        return symbol_index.update_source(
+            self.name,
+            [
+                SymbolEntry(
+                    symbol=symbol,
+                    provider=self.name,
+                    market_type="crypto",
+                    volume=volumes.get(symbol, 0.0),
+                )
+                for symbol in symbols
+            ],
+            signature=symbols,
+        )
+
     def get_market_summary(self) -> Dict[str, Any]:
         """Résumé du marché avec symboles populaires"""
         summary = {
@@ -14,6 +14,7 @@ import requests
 
 from .provider_interfaces import DataProviderInterface
 from src.thebot.core.cache import get_global_cache
+from src.thebot.core.metrics import instrumented_request
 
 
 class CoinGeckoAPI(DataProviderInterface):
@@ -180,8 +181,8 @@ class CoinGeckoAPI(DataProviderInterface):
             if self.api_key:
                 headers["x-cg-pro-api-key"] = self.api_key
 
-            response = requests.get(
-                url, params=params or {}, headers=headers, timeout=10
+            response = instrumented_request(
+                "coingecko", requests.get, url, params=params or {}, headers=headers, timeout=10
             )
             self.rate_limit_calls += 1
 
@@ -20,6 +20,9 @@ from typing import Dict, List, Optional
 
 import requests
 
+from src.thebot.core.metrics import instrumented_request
+from src.thebot.core.startup import lazy_singleton
+
 logger = logging.getLogger(__name__)
 
 
@@ -211,7 +214,9 @@ class FinnhubEconomicCalendar:
                 f"🏛️ Finnhub: Récupération événements {start_date.strftime('%Y-%m-%d')} -> {end_date.strftime('%Y-%m-%d')}"
             )
 
-            response = self.session.get(url, params=params, timeout=10)
+            response = instrumented_request(
+                "finnhub", self.session.get, url, params=params, timeout=10
+            )
             response.raise_for_status()
 
             data = response.json()
@@ -491,7 +496,7 @@ class FinnhubEconomicCalendar:
 
 
 # Instance globale pour le module
-finnhub_calendar = FinnhubEconomicCalendar()
+finnhub_calendar = lazy_singleton(FinnhubEconomicCalendar, name="FinnhubEconomicCalendar")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,396 @@
+"""
+News Ingestion Scheduler - Ingestion RSS en arrière-plan pour THEBOT
+Interroge chaque source RSS sur son propre intervalle adaptatif et alimente
+un store partagé que les callbacks Dash lisent sans jamais attendre le réseau
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.thebot.core.rss import AsyncRSSParser
+
+from .rss_sources_config import rss_sources_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourcePollState:
+    """État de polling d'une source RSS"""
+
+    source: Dict[str, Any]
+    base_interval: float
+    interval: float
+    next_poll: float = 0.0
+    consecutive_failures: int = 0
+    total_polls: int = 0
+    total_failures: int = 0
+    last_success: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_new_articles: int = 0
+
+    @property
+    def name(self) -> str:
+        return self.source["name"]
+
+
+@dataclass
+class _StoredSource:
+    """Articles conservés pour une source"""
+
+    articles: List[Dict[str, Any]] = field(default_factory=list)
+    keys: set = field(default_factory=set)
+    updated_at: Optional[datetime] = None
+
+
+class NewsStore:
+    """Store thread-safe des derniers articles ingérés, indexé par source"""
+
+    def __init__(self):
+        self._sources: Dict[str, _StoredSource] = {}
+        self._lock = threading.RLock()
+        self.version = 0
+
+    @staticmethod
+    def _article_key(article: Dict[str, Any]) -> str:
+        return article.get("url") or article.get("title", "").strip().lower()
+
+    def update(self, source_name: str, articles: List[Dict[str, Any]]) -> int:
+        """
+        Remplace les articles d'une source
+
+        Returns:
+            Nombre d'articles inconnus jusqu'ici pour cette source
+        """
+        keys = {self._article_key(article) for article in articles}
+        with self._lock:
+            stored = self._sources.setdefault(source_name, _StoredSource())
+            new_count = len(keys - stored.keys)
+            stored.articles = list(articles)
+            stored.keys = keys
+            stored.updated_at = datetime.now(timezone.utc)
+            if new_count:
+                self.version += 1
+            return new_count
+
+    def get_articles(
+        self, source_names: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Retourne les articles des sources demandées (None = toutes)"""
+        with self._lock:
+            names = self._sources.keys() if source_names is None else source_names
+            articles: List[Dict[str, Any]] = []
+            for name in names:
+                stored = self._sources.get(name)
+                if stored:
+                    articles.extend(stored.articles)
+        return articles
+
+    def has_data(self, source_names: Optional[Iterable[str]] = None) -> bool:
+        """Indique si au moins une des sources a déjà été ingérée"""
+        with self._lock:
+            if source_names is None:
+                return bool(self._sources)
+            return any(name in self._sources for name in source_names)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sources.clear()
+            self.version += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "sources": len(self._sources),
+                "articles": sum(len(s.articles) for s in self._sources.values()),
+                "version": self.version,
+                "last_update": max(
+                    (s.updated_at for s in self._sources.values() if s.updated_at),
+                    default=None,
+                ),
+            }
+
+
+class NewsIngestionScheduler:
+    """
+    Planificateur asyncio long-vivant pour l'ingestion RSS
+
+    Chaque source active de rss_sources_config est interrogée sur son propre
+    intervalle : il se resserre quand la source publie souvent, se relâche
+    quand elle ne bouge pas, et recule exponentiellement en cas d'échec.
+    La boucle tourne dans un thread dédié pour ne jamais bloquer Dash.
+    """
+
+    def __init__(
+        self,
+        store: Optional[NewsStore] = None,
+        sources_config=rss_sources_config,
+        max_concurrency: int = 5,
+        min_interval: float = 60.0,
+        max_backoff: float = 3600.0,
+        request_timeout: int = 15,
+    ):
+        """
+        Initialise le planificateur
+
+        Args:
+            store: Store partagé alimenté par l'ingestion
+            sources_config: Configuration des sources RSS
+            max_concurrency: Nombre maximum de flux interrogés en parallèle
+            min_interval: Intervalle plancher entre deux polls d'une source (s)
+            max_backoff: Délai maximum après des échecs répétés (s)
+            request_timeout: Timeout HTTP par flux (s)
+        """
+        self.store = store or NewsStore()
+        self.sources_config = sources_config
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self.max_backoff = max_backoff
+        self.request_timeout = request_timeout
+
+        self._states: Dict[str, SourcePollState] = {}
+        self._states_lock = threading.RLock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Démarre la boucle d'ingestion dans un thread dédié (idempotent)"""
+        if self._running:
+            return
+
+        self.sync_sources()
+        self._loop = asyncio.new_event_loop()
+        self._wakeup = asyncio.Event()
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run_loop, name="news-ingestion", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"🚀 News ingestion scheduler started ({len(self._states)} sources)")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Arrête la boucle d'ingestion"""
+        if not self._running:
+            return
+
+        self._running = False
+        if self._loop and self._wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        if self._thread:
+            self._thread.join(timeout)
+        self._thread = None
+        self._loop = None
+        logger.info("🛑 News ingestion scheduler stopped")
+
+    def _run_loop(self) -> None:
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._run())
+        except Exception as e:
+            logger.error(f"❌ News ingestion loop crashed: {e}")
+        finally:
+            self._running = False
+            loop.close()
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
+
+    def sync_sources(self) -> None:
+        """Aligne les états de polling sur les sources actives de la configuration"""
+        active = {s["name"]: s for s in self.sources_config.get_active_sources()}
+        now = time.monotonic()
+
+        with self._states_lock:
+            for name in list(self._states):
+                if name not in active:
+                    del self._states[name]
+
+            for name, source in active.items():
+                state = self._states.get(name)
+                if state:
+                    state.source = source
+                    continue
+                base = float(source.get("update_interval", 300))
+                self._states[name] = SourcePollState(
+                    source=source, base_interval=base, interval=base, next_poll=now
+                )
+
+    def request_refresh(self, source_names: Optional[Iterable[str]] = None) -> None:
+        """Force un poll immédiat des sources (refresh manuel), sans attendre le résultat"""
+        now = time.monotonic()
+        with self._states_lock:
+            names = self._states.keys() if source_names is None else source_names
+            for name in names:
+                state = self._states.get(name)
+                if state and state.consecutive_failures == 0:
+                    state.next_poll = now
+
+        if self._loop and self._wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    # ------------------------------------------------------------------
+    # Boucle asyncio
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        in_flight: Dict[str, asyncio.Task] = {}
+
+        async with AsyncRSSParser(timeout=self.request_timeout, retries=1) as parser:
+            while self._running:
+                now = time.monotonic()
+                with self._states_lock:
+                    due = [
+                        state
+                        for state in self._states.values()
+                        if state.next_poll <= now and state.name not in in_flight
+                    ]
+                    upcoming = [s.next_poll for s in self._states.values()]
+
+                for state in due:
+                    task = asyncio.create_task(self._poll(parser, state, semaphore))
+                    in_flight[state.name] = task
+                    task.add_done_callback(
+                        lambda _t, name=state.name: in_flight.pop(name, None)
+                    )
+
+                delay = max(0.5, min(upcoming, default=now + 5.0) - now)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            for task in list(in_flight.values()):
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight.values(), return_exceptions=True)
+
+    async def _poll(
+        self,
+        parser: AsyncRSSParser,
+        state: SourcePollState,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        source = state.source
+        async with semaphore:
+            try:
+                articles = await parser.parse_feed_async(
+                    source["url"], source.get("max_entries", 20)
+                )
+            except Exception as e:
+                articles = []
+                with self._states_lock:
+                    state.last_error = str(e)
+
+        if articles:
+            for article in articles:
+                article.update(
+                    {
+                        "rss_source_name": source["name"],
+                        "rss_category": source["category"],
+                        "rss_description": source.get("description", ""),
+                    }
+                )
+            new_count = self.store.update(source["name"], articles)
+            self._record_success(state, new_count)
+        else:
+            # parse_feed_async absorbe les erreurs et renvoie [] : un flux vide
+            # est traité comme un échec pour déclencher le backoff
+            self._record_failure(state)
+
+    # ------------------------------------------------------------------
+    # Intervalles adaptatifs
+    # ------------------------------------------------------------------
+
+    def _record_success(self, state: SourcePollState, new_count: int) -> None:
+        floor = max(self.min_interval, state.base_interval / 4)
+        ceiling = state.base_interval * 4
+
+        with self._states_lock:
+            if new_count > 0:
+                state.interval = max(floor, state.interval * 0.7)
+            else:
+                state.interval = min(ceiling, state.interval * 1.25)
+
+            state.total_polls += 1
+            state.consecutive_failures = 0
+            state.last_new_articles = new_count
+            state.last_success = datetime.now(timezone.utc)
+            state.last_error = None
+            state.next_poll = time.monotonic() + state.interval
+
+        logger.debug(
+            f"✅ {state.name}: {new_count} new articles, next poll in {state.interval:.0f}s"
+        )
+
+    def _record_failure(self, state: SourcePollState) -> None:
+        with self._states_lock:
+            state.total_polls += 1
+            state.total_failures += 1
+            state.consecutive_failures += 1
+            backoff = min(
+                self.max_backoff,
+                state.base_interval * (2 ** min(state.consecutive_failures, 6)),
+            )
+            backoff *= random.uniform(0.9, 1.1)
+            state.last_error = state.last_error or "empty or unreachable feed"
+            state.next_poll = time.monotonic() + backoff
+
+        logger.warning(
+            f"⚠️ {state.name}: poll failed ({state.consecutive_failures}x), "
+            f"retry in {backoff:.0f}s"
+        )
+
+    # ------------------------------------------------------------------
+    # Statut
+    # ------------------------------------------------------------------
+
+    def get_status(self) -> Dict[str, Any]:
+        """Retourne l'état du planificateur et de chaque source"""
+        now = time.monotonic()
+        with self._states_lock:
+            sources = {
+                name: {
+                    "interval": round(state.interval, 1),
+                    "next_poll_in": round(max(0.0, state.next_poll - now), 1),
+                    "consecutive_failures": state.consecutive_failures,
+                    "total_polls": state.total_polls,
+                    "total_failures": state.total_failures,
+                    "last_new_articles": state.last_new_articles,
+                    "last_success": (
+                        state.last_success.isoformat() if state.last_success else None
+                    ),
+                    "last_error": state.last_error,
+                }
+                for name, state in self._states.items()
+            }
+
+        return {
+            "running": self._running,
+            "sources": sources,
+            "store": self.store.get_stats(),
+        }
+
+
+# Instances globales
+news_store = NewsStore()
+news_ingestion_scheduler = NewsIngestionScheduler(store=news_store)
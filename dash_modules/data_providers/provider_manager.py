@@ -5,7 +5,15 @@ Utilise les interfaces communes pour une architecture modulaire
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from src.thebot.core.latency_router import LatencyRouter, has_data
+from src.thebot.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+    endpoint_name,
+)
 
 from .provider_interfaces import (
     DataProviderInterface,
@@ -16,6 +24,21 @@ from .provider_interfaces import (
 
 logger = logging.getLogger(__name__)
 
+# Disjoncteur par endpoint de provider : fenêtre des 20 derniers appels,
+# ouverture au-delà de 50% d'erreurs de transport ou d'appels lents. Une
+# réponse vide (symbole non supporté) n'est pas un échec : le disjoncteur est
+# partagé par tous les symboles de l'endpoint
+PROVIDER_BREAKER_CONFIG = CircuitBreakerConfig(
+    timeout_sec=30,
+    window_type="count",
+    window_size=20,
+    minimum_calls=5,
+    slow_call_threshold_sec=3.0,
+    slow_call_rate_threshold=0.5,
+    cache_last_good=True,
+    last_good_ttl_sec=300,
+)
+
 
 class ProviderManager:
     """
@@ -27,6 +50,8 @@ class ProviderManager:
 
     def __init__(self):
         self.providers: Dict[str, Any] = {}
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.router = LatencyRouter()
         self._initialize_providers()
 
     def _initialize_providers(self) -> None:
@@ -46,6 +71,66 @@ class ProviderManager:
 
         logger.info(f"🔧 ProviderManager initialisé avec {len(self.providers)} providers")
 
+    def get_breaker(self, provider_name: str, endpoint: str) -> CircuitBreaker:
+        """Disjoncteur d'un endpoint de provider (créé au premier appel)"""
+        name = endpoint_name(provider_name, endpoint)
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            breaker = self.breakers[name] = CircuitBreaker(name, PROVIDER_BREAKER_CONFIG)
+        return breaker
+
+    def _guarded_call(self, provider_name: str, endpoint: str, method: Callable[..., Any], *args: Any) -> Any:
+        """
+        Appelle un provider via son disjoncteur.
+
+        Un endpoint ouvert (échecs ou lenteurs répétés) répond immédiatement avec
+        la dernière valeur valide pour les mêmes arguments, ou None à défaut.
+        """
+        try:
+            return self.get_breaker(provider_name, endpoint).call_sync(method, *args)
+        except CircuitOpenError as e:
+            logger.debug(f"⚡ {e}")
+            return None
+
+    def get_breaker_status(self) -> Dict[str, Dict[str, Any]]:
+        """Statut des disjoncteurs des providers"""
+        return {name: breaker.get_status() for name, breaker in self.breakers.items()}
+
+    def _routed_call(self, endpoint: str, method_name: str, *args: Any,
+                     is_valid: Callable[[Any], bool] = has_data) -> Any:
+        """
+        Interroge les providers de données interchangeables via le routeur de latence.
+
+        Le plus rapide est appelé en premier ; s'il dépasse son p95 une requête
+        couverte part vers le suivant, et un échec bascule immédiatement. Les
+        endpoints au disjoncteur ouvert ne sont sollicités qu'en dernier recours.
+        Les erreurs remontent au routeur (basculement, pénalité) : la dernière
+        valeur valide n'est servie que si tous les providers ont échoué.
+        """
+        data_providers = {name: provider for name, provider in self.providers.items()
+                          if isinstance(provider, DataProviderInterface)}
+        healthy = [name for name in data_providers
+                   if not self.get_breaker(name, endpoint).is_open]
+
+        def fetch(name: str) -> Any:
+            method = getattr(data_providers[name], method_name)
+            return self.get_breaker(name, endpoint).call_strict(method, *args)
+
+        result = self.router.call(healthy or list(data_providers), fetch, is_valid=is_valid)
+        if result is not None:
+            return result
+
+        for name in self.router.rank(list(data_providers)):
+            last_good = self.get_breaker(name, endpoint).last_good(*args)
+            if is_valid(last_good):
+                logger.debug(f"⚡ Dernière valeur valide de {name} servie pour {endpoint}")
+                return last_good
+        return None
+
+    def get_routing_stats(self) -> Dict[str, Any]:
+        """Latences EWMA, p95 et couvertures par provider"""
+        return self.router.get_stats()
+
     def get_data_provider(self, provider_name: str) -> Optional[DataProviderInterface]:
         """Récupère un provider de données par nom"""
         return self.providers.get(provider_name)
@@ -84,14 +169,10 @@ class ProviderManager:
         if provider and provider in self.providers:
             data_provider = self.providers[provider]
             if isinstance(data_provider, DataProviderInterface):
-                return data_provider.get_price_data(symbol, interval, limit)
+                return self._guarded_call(provider, "price_data", data_provider.get_price_data, symbol, interval, limit)
         else:
-            # Essaie tous les providers de données disponibles
-            for data_provider in self.providers.values():
-                if isinstance(data_provider, DataProviderInterface):
-                    result = data_provider.get_price_data(symbol, interval, limit)
-                    if result:
-                        return result
+            # Provider le plus rapide, couvert par le suivant au-delà de son p95
+            return self._routed_call("price_data", "get_price_data", symbol, interval, limit)
 
         return None
 
@@ -109,14 +190,11 @@ class ProviderManager:
         if provider and provider in self.providers:
             data_provider = self.providers[provider]
             if isinstance(data_provider, DataProviderInterface):
-                return data_provider.get_current_price(symbol)
+                return self._guarded_call(provider, "current_price", data_provider.get_current_price, symbol)
         else:
-            # Essaie tous les providers de données disponibles
-            for data_provider in self.providers.values():
-                if isinstance(data_provider, DataProviderInterface):
-                    result = data_provider.get_current_price(symbol)
-                    if result is not None:
-                        return result
+            # Provider le plus rapide, couvert par le suivant au-delà de son p95
+            return self._routed_call("current_price", "get_current_price", symbol,
+                                     is_valid=lambda price: price is not None)
 
         return None
 
@@ -17,6 +17,7 @@ import pandas as pd
 # Ne plus utiliser CryptoPanic, utiliser RSS à la place
 from .binance_api import binance_provider
 from .coin_gecko_api import coin_gecko_api
+from .symbol_index import SymbolEntry, symbol_index
 from .twelve_data_api import twelve_data_api
 
 # Import optionnel Yahoo Finance et FMP (en cours de migration)
@@ -537,36 +538,76 @@ class RealDataManager:
         return final_news
 
     def search_markets(self, query: str) -> List[Dict[str, str]]:
-        """Rechercher marchés par mots-clés"""
+        """Rechercher marchés par mots-clés (index de symboles partagé)"""
         results = []
 
         try:
-            # Recherche dans marchés supportés d'abord
-            query_upper = query.upper()
-            for symbol, info in self.supported_markets.items():
-                if query_upper in symbol or query_upper in info["label"].upper():
+            self.refresh_symbol_index()
+            try:
+                self.binance_provider.refresh_symbol_index()
+            except Exception as e:
+                logger.warning(f"Index Binance indisponible: {str(e)}")
+
+            for entry in symbol_index.search(query, limit=15):
+                info = self.supported_markets.get(entry.symbol)
+                if info:
                     results.append(
-                        {"symbol": symbol, "name": info["label"], "type": info["type"]}
+                        {"symbol": entry.symbol, "name": info["label"], "type": info["type"]}
+                    )
+                else:
+                    provider = entry.provider.replace("_", " ").title()
+                    results.append(
+                        {
+                            "symbol": entry.symbol,
+                            "name": entry.name or f"{entry.symbol} ({provider})",
+                            "type": entry.market_type,
+                        }
                     )
-
-            # Si peu de résultats, recherche externe Binance
-            if len(results) < 5:
-                binance_symbols = self.provider.search_symbols(query)
-                for symbol in binance_symbols[:10]:
-                    if symbol not in self.supported_markets:
-                        results.append(
-                            {
-                                "symbol": symbol,
-                                "name": f"{symbol} (Binance)",
-                                "type": "crypto",
-                            }
-                        )
 
         except Exception as e:
             logger.error(f"Erreur recherche marchés: {str(e)}")
 
         return results[:15]
 
+    def refresh_symbol_index(self) -> None:
+        """Publie les marchés configurés, Twelve Data et Yahoo dans l'index de recherche"""
+        symbol_index.update_source(
+            "markets",
+            [
+                SymbolEntry(
+                    symbol=symbol,
+                    name=info["label"],
+                    provider=info["provider"],
+                    market_type=info["type"],
+                )
+                for symbol, info in self.supported_markets.items()
+            ],
+        )
+        symbol_index.update_source(
+            twelve_data_api.name,
+            [
+                SymbolEntry(symbol=symbol, provider=twelve_data_api.name)
+                for symbol in twelve_data_api.supported_markets
+            ],
+        )
+        if yahoo_finance_api is not None:
+            stocks = [
+                symbol
+                for symbols in yahoo_finance_api.sectors.values()
+                for symbol in symbols
+            ]
+            symbol_index.update_source(
+                "yahoo",
+                [
+                    SymbolEntry(
+                        symbol=symbol,
+                        provider="yahoo",
+                        market_type="indices" if symbol.startswith("^") else "stocks",
+                    )
+                    for symbol in yahoo_finance_api.major_symbols + stocks
+                ],
+            )
+
     def get_api_status(self) -> Dict[str, Any]:
         """Statut des APIs disponibles"""
         status = {
@@ -12,7 +12,10 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+from src.thebot.core.dedup import NearDuplicateIndex
+
 from ..core.rss_parser import RSSParser
+from .news_ingestion_scheduler import news_ingestion_scheduler
 from .provider_interfaces import NewsProviderInterface
 from .rss_sources_config import rss_sources_config
 
@@ -71,6 +74,8 @@ class RSSNewsManager(NewsProviderInterface):
             max_workers: Nombre de threads pour le parsing parallèle
         """
         self.parser = RSSParser()
+        self.scheduler = news_ingestion_scheduler
+        self.dedup_index = NearDuplicateIndex()
         self.max_workers = max_workers
         self.cache = {}
         self.cache_ttl = {}
@@ -113,29 +118,15 @@ class RSSNewsManager(NewsProviderInterface):
                 logger.warning("⚠️ No RSS sources found for criteria")
                 return []
 
-            # Récupérer les articles de toutes les sources
-            all_articles = []
-
-            # Utilisation du ThreadPoolExecutor pour paralléliser
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_source = {
-                    executor.submit(
-                        self._fetch_source_articles, source, use_cache
-                    ): source
-                    for source in target_sources
-                }
-
-                for future in as_completed(future_to_source):
-                    source = future_to_source[future]
-                    try:
-                        articles = future.result(timeout=30)
-                        if articles:
-                            all_articles.extend(articles)
-                            logger.debug(
-                                f"✅ Got {len(articles)} articles from {source['name']}"
-                            )
-                    except Exception as e:
-                        logger.error(f"❌ Failed to fetch from {source['name']}: {e}")
+            source_names = [source["name"] for source in target_sources]
+            if self.scheduler.is_running and self.scheduler.store.has_data(source_names):
+                # Lecture seule du store alimenté en arrière-plan
+                if not use_cache:
+                    self.scheduler.request_refresh(source_names)
+                all_articles = self.scheduler.store.get_articles(source_names)
+            else:
+                # Ingestion arrêtée, ou démarrage à froid avant le premier poll abouti
+                all_articles = self._fetch_sources(target_sources, use_cache)
 
             # Trier par date (plus récent en premier)
             all_articles.sort(key=lambda x: x.get("published_date", ""), reverse=True)
@@ -153,6 +144,35 @@ class RSSNewsManager(NewsProviderInterface):
             logger.error(f"❌ Error getting RSS news: {e}")
             return []
 
+    def _fetch_sources(
+        self, target_sources: List[Dict[str, Any]], use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Récupère les articles de toutes les sources en parallèle (mode synchrone)"""
+        all_articles = []
+
+        # Utilisation du ThreadPoolExecutor pour paralléliser
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_source = {
+                executor.submit(
+                    self._fetch_source_articles, source, use_cache
+                ): source
+                for source in target_sources
+            }
+
+            for future in as_completed(future_to_source):
+                source = future_to_source[future]
+                try:
+                    articles = future.result(timeout=30)
+                    if articles:
+                        all_articles.extend(articles)
+                        logger.debug(
+                            f"✅ Got {len(articles)} articles from {source['name']}"
+                        )
+                except Exception as e:
+                    logger.error(f"❌ Failed to fetch from {source['name']}: {e}")
+
+        return all_articles
+
     def _determine_target_sources(
         self, categories: List[str], sources: List[str]
     ) -> List[Dict[str, Any]]:
@@ -272,32 +292,8 @@ class RSSNewsManager(NewsProviderInterface):
     def _deduplicate_articles(
         self, articles: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Déduplique les articles par URL et titre similaire"""
-        seen_urls = set()
-        seen_titles = set()
-        unique_articles = []
-
-        for article in articles:
-            url = article.get("url", "")
-            title = article.get("title", "").lower().strip()
-
-            # Vérifier URL exacte
-            if url in seen_urls:
-                continue
-
-            # Vérifier titre similaire (éviter les doublons de contenu)
-            title_key = " ".join(sorted(title.split()[:8]))  # 8 premiers mots triés
-            if title_key in seen_titles:
-                continue
-
-            seen_urls.add(url)
-            seen_titles.add(title_key)
-            unique_articles.append(article)
-
-        logger.debug(
-            f"🔄 Deduplicated {len(articles)} → {len(unique_articles)} articles"
-        )
-        return unique_articles
+        """Regroupe les quasi-doublons (syndication, réécritures) en stories"""
+        return self.dedup_index.deduplicate(articles)
 
     def clear_cache(self):
         """Vide complètement le cache"""
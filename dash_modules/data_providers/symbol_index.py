@@ -0,0 +1,285 @@
+"""
+Symbol Index - Index de recherche de symboles partagé entre providers
+Trie de préfixes (résultats pré-classés par volume 24h) et index de n-grammes
+(sous-chaînes et recherche approchée), reconstruit uniquement quand la liste
+de symboles d'un provider change
+"""
+
+import logging
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+QUOTE_ASSETS = ("USDT", "USDC", "BUSD", "FDUSD", "TUSD")
+
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Forme canonique d'un terme de recherche ("eur/usd" -> "EURUSD")"""
+    return _NON_ALNUM.sub("", text.upper())
+
+
+@dataclass(frozen=True)
+class SymbolEntry:
+    """Symbole indexé"""
+
+    symbol: str
+    name: str = ""
+    provider: str = ""
+    market_type: str = ""
+    volume: float = 0.0
+
+    @property
+    def base_asset(self) -> str:
+        for quote in QUOTE_ASSETS:
+            if self.symbol.endswith(quote) and len(self.symbol) > len(quote):
+                return self.symbol[: -len(quote)]
+        return ""
+
+    def terms(self) -> Tuple[str, ...]:
+        """Termes indexés : symbole, actif de base, nom complet et mots du nom"""
+        words = _NON_ALNUM.split(self.name.upper())
+        terms = [normalize(self.symbol), self.base_asset, normalize(self.name), *words]
+        return tuple(dict.fromkeys(term for term in terms if term))
+
+
+class SymbolIndex:
+    """
+    Index de symboles multi-providers
+
+    Chaque provider publie sa liste via update_source() ; l'index fusionné
+    n'est reconstruit que si une liste a changé. Les entrées sont classées
+    par volume décroissant : l'identifiant d'une entrée est son rang, chaque
+    nœud du trie garde ses meilleurs identifiants et une frappe ne coûte que
+    la descente du préfixe.
+    """
+
+    def __init__(self, node_capacity: int = 64, cache_size: int = 1024, fuzzy_threshold: float = 0.5):
+        """
+        Args:
+            node_capacity: Résultats conservés par nœud du trie (limite de search)
+            cache_size: Requêtes récentes mémorisées (frappes successives)
+            fuzzy_threshold: Part minimale de trigrammes communs en recherche approchée
+        """
+        self.node_capacity = node_capacity
+        self.cache_size = cache_size
+        self.fuzzy_threshold = fuzzy_threshold
+
+        self._lock = threading.RLock()
+        self._sources: "OrderedDict[str, Tuple[Any, List[SymbolEntry]]]" = OrderedDict()
+        self._entries: List[SymbolEntry] = []
+        self._terms: List[Tuple[str, ...]] = []
+        self._positions: Dict[str, int] = {}
+        self._exact: Dict[str, int] = {}  # Symbole normalisé -> rang
+        self._trie: Dict[Optional[str], Any] = {}
+        self._grams: Dict[str, List[int]] = {}
+        self._results: "OrderedDict[Tuple, List[SymbolEntry]]" = OrderedDict()
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    def is_current(self, source: str, signature: Any) -> bool:
+        """Indique si la source est déjà indexée avec cette signature"""
+        current = self._sources.get(source)
+        return current is not None and (current[0] is signature or current[0] == signature)
+
+    def update_source(
+        self, source: str, entries: Iterable[SymbolEntry], signature: Any = None
+    ) -> bool:
+        """
+        Publie la liste de symboles d'un provider
+
+        Args:
+            source: Nom du provider
+            entries: Symboles du provider
+            signature: Valeur identifiant la liste (ex: liste brute de l'exchange) ;
+                par défaut les symboles eux-mêmes
+
+        Returns:
+            True si l'index a été reconstruit
+        """
+        entries = list(entries)
+        if signature is None:
+            signature = tuple(entry.symbol for entry in entries)
+        with self._lock:
+            if self.is_current(source, signature):
+                return False
+            self._sources[source] = (signature, entries)
+            self._rebuild()
+        return True
+
+    def remove_source(self, source: str) -> None:
+        with self._lock:
+            if self._sources.pop(source, None) is not None:
+                self._rebuild()
+
+    def _rebuild(self) -> None:
+        merged: Dict[str, SymbolEntry] = {}
+        for _, entries in self._sources.values():
+            for entry in entries:
+                known = merged.get(entry.symbol)
+                if known is None:
+                    merged[entry.symbol] = entry
+                else:
+                    merged[entry.symbol] = SymbolEntry(
+                        symbol=known.symbol,
+                        name=known.name or entry.name,
+                        provider=known.provider,
+                        market_type=known.market_type or entry.market_type,
+                        volume=max(known.volume, entry.volume),
+                    )
+
+        entries = sorted(merged.values(), key=lambda e: (-e.volume, e.symbol))
+        terms = [entry.terms() for entry in entries]
+
+        # Parcours par rang croissant : les listes des nœuds restent triées par volume
+        trie: Dict[Optional[str], Any] = {}
+        grams: Dict[str, List[int]] = {}
+        for rank, entry_terms in enumerate(terms):
+            for term in entry_terms:
+                node = trie
+                for char in term:
+                    node = node.setdefault(char, {None: []})
+                    ids = node[None]
+                    if (not ids or ids[-1] != rank) and len(ids) < self.node_capacity:
+                        ids.append(rank)
+                for gram in self._ngrams(term):
+                    postings = grams.setdefault(gram, [])
+                    if not postings or postings[-1] != rank:
+                        postings.append(rank)
+
+        self._entries, self._terms, self._trie, self._grams = entries, terms, trie, grams
+        self._positions = {entry.symbol: rank for rank, entry in enumerate(entries)}
+        self._exact = {terms[0]: rank for rank, terms in reversed(list(enumerate(terms))) if terms}
+        self._results.clear()
+        self.version += 1
+        logger.debug(
+            f"🔤 Index symboles v{self.version}: {len(entries)} symboles, "
+            f"{len(grams)} n-grammes ({', '.join(self._sources)})"
+        )
+
+    @staticmethod
+    def _ngrams(term: str) -> set:
+        """Bigrammes et trigrammes d'un terme"""
+        return {term[i:i + n] for n in (2, 3) for i in range(len(term) - n + 1)}
+
+    def search(
+        self,
+        query: str,
+        limit: int = 15,
+        market_type: Optional[str] = None,
+        fuzzy: bool = True,
+    ) -> List[SymbolEntry]:
+        """
+        Recherche de symboles
+
+        Ordre des résultats : correspondance exacte (symbole ou actif de base),
+        préfixes, sous-chaînes, puis correspondances approchées ; à pertinence
+        égale, par volume 24h décroissant.
+
+        Args:
+            query: Texte saisi ("btc", "eur/usd", "apple"...)
+            limit: Nombre maximum de résultats
+            market_type: Filtre optionnel (crypto, forex, stocks...)
+            fuzzy: Compléter avec des correspondances approchées (fautes de frappe)
+        """
+        key = (query, limit, market_type, fuzzy)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+            ranks = self._rank(normalize(query), limit, market_type, fuzzy)
+            results = [self._entries[rank] for rank in ranks]
+            self._results[key] = results
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return results
+
+    def symbols(self, query: str, limit: int = 15, market_type: Optional[str] = None) -> List[str]:
+        """Recherche ne retournant que les symboles"""
+        return [entry.symbol for entry in self.search(query, limit, market_type)]
+
+    def _rank(self, query: str, limit: int, market_type: Optional[str], fuzzy: bool) -> List[int]:
+        if not query:
+            return []
+
+        def accept(rank: int) -> bool:
+            return market_type is None or self._entries[rank].market_type == market_type
+
+        results: List[int] = []
+        seen = set()
+
+        def extend(ranks: Iterable[int]) -> bool:
+            for rank in ranks:
+                if rank not in seen and accept(rank):
+                    seen.add(rank)
+                    results.append(rank)
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        # 1. Préfixes (trie), correspondances exactes en tête
+        node = self._trie
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                break
+        prefixed = node[None] if node is not None else []
+        exact = sorted(
+            rank
+            for rank in map(self._exact.get, (query, *(query + quote for quote in QUOTE_ASSETS)))
+            if rank is not None
+        )
+        if extend(exact) or extend(prefixed):
+            return results
+
+        # 2. Sous-chaînes : n-gramme le plus rare de la requête, vérifié sur les termes
+        # (générateur parcouru par rang : s'arrête dès que la limite est atteinte)
+        grams = self._ngrams(query) if len(query) > 2 else {query}
+        postings = min((self._grams.get(gram, []) for gram in grams), key=len)
+        candidates = (
+            rank for rank in postings if any(query in term for term in self._terms[rank])
+        )
+        if extend(candidates) or not fuzzy or len(query) < 3:
+            return results
+
+        # 3. Approché : part des trigrammes de la requête présents dans le symbole
+        trigrams = [query[i:i + 3] for i in range(len(query) - 2)]
+        common = len(self._entries) // 5 or 1
+        counts = Counter()
+        for gram in trigrams:
+            postings = self._grams.get(gram, [])
+            if len(postings) <= common:  # Trigrammes trop fréquents ignorés (USD, SDT...)
+                counts.update(postings)
+        needed = self.fuzzy_threshold * len(trigrams)
+        scored = sorted(
+            (rank for rank, count in counts.items() if count >= needed),
+            key=lambda rank: (-counts[rank], rank),
+        )
+        extend(scored)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": self.version,
+                "symbols": len(self._entries),
+                "sources": {name: len(entries) for name, (_, entries) in self._sources.items()},
+                "ngrams": len(self._grams),
+                "cached_queries": len(self._results),
+            }
+
+
+# Instance globale partagée par les providers
+symbol_index = SymbolIndex()
@@ -13,6 +13,7 @@ import pandas as pd
 import requests
 
 from .provider_interfaces import DataProviderInterface
+from src.thebot.core.metrics import instrumented_request
 
 logger = logging.getLogger(__name__)
 
@@ -142,7 +143,9 @@ class TwelveDataAPI(DataProviderInterface):
 
             # Make request
             url = f"{self.base_url}{endpoint}"
-            response = self.session.get(url, params=params, timeout=10)
+            response = instrumented_request(
+                "twelve_data", self.session.get, url, params=params, timeout=10
+            )
             self.last_request_time = time.time()
 
             if response.status_code == 200:
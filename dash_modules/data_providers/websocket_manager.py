@@ -12,6 +12,8 @@ from typing import Any, Callable, Dict, List, Optional
 
 import websocket
 
+from src.thebot.core.startup import lazy_singleton
+
 logger = logging.getLogger(__name__)
 
 
@@ -196,7 +198,7 @@ class BinanceWebSocketManager:
 
 
 # Instance globale pour l'application
-ws_manager = BinanceWebSocketManager()
+ws_manager = lazy_singleton(BinanceWebSocketManager, name="BinanceWebSocketManager")
 
 
 def get_websocket_manager() -> BinanceWebSocketManager:
@@ -15,6 +15,8 @@ import requests
 import yfinance as yf
 from bs4 import BeautifulSoup
 
+from src.thebot.core.startup import lazy_singleton
+
 
 class YahooFinanceAPI:
     """Yahoo Finance API client using yfinance library for reliable data access"""
@@ -769,4 +771,4 @@ class YahooFinanceAPI:
 
 
 # Global instance
-yahoo_finance_api = YahooFinanceAPI()
+yahoo_finance_api = lazy_singleton(YahooFinanceAPI, name="YahooFinanceAPI")
@@ -6,19 +6,49 @@ Utilise SQLAlchemy avec configuration SQLite
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Column, DateTime, Integer, create_engine
+from sqlalchemy import Column, DateTime, Integer, create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 # Configuration de la base de données
 DATABASE_URL = "sqlite:///./thebot.db"
 
+# Pragmas SQLite appliqués à chaque connexion :
+# WAL permet aux lectures de l'UI de continuer pendant une ingestion massive
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",  # Sûr en WAL, beaucoup moins de fsync
+    "temp_store": "MEMORY",
+    "cache_size": -64000,  # ~64 Mo de cache de pages
+    "busy_timeout": 5000,  # ms d'attente sur verrou avant erreur
+}
+
+
+def configure_sqlite_engine(sqlite_engine, pragmas: dict = None) -> None:
+    """
+    Applique les pragmas SQLite à chaque nouvelle connexion du moteur.
+    Sans effet pour les autres dialectes.
+    """
+    if sqlite_engine.dialect.name != "sqlite":
+        return
+
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
 # Création du moteur SQLAlchemy
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Nécessaire pour SQLite
     echo=False  # Désactiver les logs SQL en production
 )
+configure_sqlite_engine(engine)
 
 # Création de la session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -5,7 +5,7 @@ Modèles pour les données de marché THEBOT
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String
 
 from .base import BaseModel
 
@@ -56,7 +56,11 @@ class PriceHistory(BaseModel):
     # Métadonnées
     data_quality = Column(String(20), default="good")  # good, partial, missing
 
+    # Clé naturelle d'une bougie : permet l'upsert en masse (ON CONFLICT)
+    BAR_KEY = ("symbol", "provider", "interval", "market_timestamp")
+
     __table_args__ = (
+        Index('ux_price_history_bar', *BAR_KEY, unique=True),
         {'sqlite_autoincrement': True},
     )
 
@@ -84,14 +88,23 @@ class PriceHistory(BaseModel):
         Returns:
             Instance de PriceHistory
         """
-        return cls(
-            symbol=symbol,
-            provider=provider,
-            interval=interval,
-            open_price=ohlcv_data.get('open', 0.0),
-            high_price=ohlcv_data.get('high', 0.0),
-            low_price=ohlcv_data.get('low', 0.0),
-            close_price=ohlcv_data.get('close', 0.0),
-            volume=ohlcv_data.get('volume'),
-            market_timestamp=timestamp
-        )
+        return cls(**cls.ohlcv_row(symbol, provider, interval, ohlcv_data, timestamp))
+
+    @staticmethod
+    def ohlcv_row(symbol: str, provider: str, interval: str,
+                  ohlcv_data: dict, timestamp: datetime) -> dict:
+        """
+        Colonnes d'une bougie sous forme de dict, pour les insertions en masse
+        (SQLAlchemy Core) qui ne passent pas par des objets ORM.
+        """
+        return {
+            'symbol': symbol,
+            'provider': provider,
+            'interval': interval,
+            'open_price': ohlcv_data.get('open', 0.0),
+            'high_price': ohlcv_data.get('high', 0.0),
+            'low_price': ohlcv_data.get('low', 0.0),
+            'close_price': ohlcv_data.get('close', 0.0),
+            'volume': ohlcv_data.get('volume'),
+            'market_timestamp': timestamp,
+        }
@@ -4,18 +4,23 @@ Services THEBOT - Couche métier et logique applicative
 
 from .database_service import DatabaseService, database_service
 from .alert_service import AlertService
+from .price_alert_engine import PriceAlertEngine, price_alert_engine
 from .market_data_service import MarketDataService
 from .news_service import NewsService
 from .data_service import DataService, data_service
 from .economic_news_service import EconomicNewsService
 from .economic_alerts_service import EconomicAlertsService, economic_alerts_service
 from .technical_analysis_service import TechnicalAnalysisService, technical_analysis_service
+from .market_scanner import MarketScanner, ScanExpression, ScanExpressionError, market_scanner
+from .correlation_engine import CorrelationEngine, RollingCorrelation, correlation_engine
 from .service_interfaces import ServiceInterface
 
 __all__ = [
     'DatabaseService',
     'database_service',
     'AlertService',
+    'PriceAlertEngine',
+    'price_alert_engine',
     'MarketDataService',
     'NewsService',
     'DataService',
@@ -25,5 +30,12 @@ __all__ = [
     'economic_alerts_service',
     'TechnicalAnalysisService',
     'technical_analysis_service',
+    'MarketScanner',
+    'ScanExpression',
+    'ScanExpressionError',
+    'market_scanner',
+    'CorrelationEngine',
+    'RollingCorrelation',
+    'correlation_engine',
     'ServiceInterface'
 ]
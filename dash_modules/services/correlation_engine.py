@@ -0,0 +1,370 @@
+"""
+Correlation Engine - Corrélations glissantes multi-symboles
+Matrices Pearson / Spearman sur les log-rendements alignés d'une fenêtre
+glissante, mises à jour bougie par bougie via des sommes courantes
+(x, x², xy, effectifs par paire), regroupement par clusters et scores
+de diversification
+"""
+
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .market_scanner import INTERVAL_SECONDS, MarketScanner, market_scanner
+
+logger = logging.getLogger(__name__)
+
+
+class RollingCorrelation:
+    """
+    Corrélations par paire sur les N derniers log-rendements
+
+    Les rendements manquants (symbole coté plus tard, trou de données) sont
+    ignorés paire par paire, comme DataFrame.corr. Chaque nouvelle bougie
+    coûte O(n²) : ajout de la ligne entrante et retrait de la ligne sortie
+    dans les sommes ; la bougie en formation est remplacée de la même façon.
+    """
+
+    BATCH_THRESHOLD = 16
+
+    def __init__(self, window: int = 168, min_periods: int = 20):
+        """
+        Args:
+            window: Nombre de rendements dans la fenêtre
+            min_periods: Observations communes minimales pour une corrélation
+        """
+        self.window = window
+        self.min_periods = min_periods
+        self.resync_every = window  # Recalcul complet périodique (dérive flottante)
+        self.reset()
+
+    def reset(self, symbols: Optional[List[str]] = None) -> None:
+        """Vide la fenêtre (et fixe l'univers de symboles)"""
+        self.symbols: List[str] = list(symbols or [])
+        size = len(self.symbols)
+        self._rows: Deque[Tuple[pd.Timestamp, np.ndarray]] = deque()
+        self._count = np.zeros((size, size))
+        self._sum_x = np.zeros((size, size))
+        self._sum_xx = np.zeros((size, size))
+        self._sum_xy = np.zeros((size, size))
+        self._closes: List[Tuple[pd.Timestamp, np.ndarray]] = []  # Deux dernières clôtures
+        self._pushes = 0
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        return self._closes[-1][0] if self._closes else None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def update(self, closes: pd.DataFrame) -> int:
+        """
+        Intègre les clôtures alignées (bougies x symboles)
+
+        Seules les bougies postérieures à la dernière intégrée sont traitées ;
+        une dernière bougie révisée est rejouée. Un changement d'univers ou
+        un historique sans recouvrement provoque une reconstruction.
+
+        Returns:
+            Nombre de rendements intégrés
+        """
+        symbols = list(closes.columns)
+        last = self.last_timestamp
+        pos = closes.index.searchsorted(last) if last is not None else 0
+
+        if (
+            symbols != self.symbols
+            or last is None
+            or pos >= len(closes.index)
+            or closes.index[pos] != last
+        ):
+            self.reset(symbols)
+            start = 0
+        else:
+            start = pos
+            if not np.array_equal(
+                closes.iloc[pos].to_numpy(float), self._closes[-1][1], equal_nan=True
+            ):
+                self._pop_last()
+            else:
+                start = pos + 1
+
+        values = closes.to_numpy(float)
+        # Gros rattrapage (reconstruction) : sommes recalculées en produits matriciels
+        batch = len(closes) - start > self.BATCH_THRESHOLD
+        for row in range(start, len(closes)):
+            self._push_close(closes.index[row], values[row], batch)
+        if batch:
+            while len(self._rows) > self.window:
+                self._rows.popleft()
+            self._resync()
+        return len(closes) - start
+
+    def _push_close(self, timestamp: pd.Timestamp, close: np.ndarray, batch: bool = False) -> None:
+        if self._closes:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns = np.log(close / self._closes[-1][1])
+            returns[~np.isfinite(returns)] = np.nan
+            if batch:
+                self._rows.append((timestamp, returns))
+            else:
+                self._push(timestamp, returns)
+        self._closes = (self._closes + [(timestamp, close)])[-2:]
+
+    def _pop_last(self) -> None:
+        """Retire la dernière bougie (bougie en formation révisée)"""
+        if self._rows and self._rows[-1][0] == self._closes[-1][0]:
+            self._apply(self._rows.pop()[1], -1.0)
+        self._closes = self._closes[:-1]
+
+    def _push(self, timestamp: pd.Timestamp, returns: np.ndarray) -> None:
+        self._rows.append((timestamp, returns))
+        self._apply(returns, 1.0)
+        if len(self._rows) > self.window:
+            self._apply(self._rows.popleft()[1], -1.0)
+
+        self._pushes += 1
+        if self._pushes % self.resync_every == 0:
+            self._resync()
+
+    def _apply(self, returns: np.ndarray, sign: float) -> None:
+        present = np.isfinite(returns).astype(float)
+        x = np.nan_to_num(returns)
+        self._count += sign * np.outer(present, present)
+        self._sum_x += sign * np.outer(x, present)
+        self._sum_xx += sign * np.outer(x * x, present)
+        self._sum_xy += sign * np.outer(x, x)
+
+    def _resync(self) -> None:
+        """Recalcule les sommes depuis la fenêtre (quelques produits matriciels)"""
+        self._count, self._sum_x, self._sum_xx, self._sum_xy = self._sums(self.returns().to_numpy())
+
+    @staticmethod
+    def _sums(values: np.ndarray) -> Tuple[np.ndarray, ...]:
+        present = np.isfinite(values).astype(float)
+        x = np.nan_to_num(values)
+        return present.T @ present, x.T @ present, (x * x).T @ present, x.T @ x
+
+    def returns(self) -> pd.DataFrame:
+        """Log-rendements de la fenêtre"""
+        if not self._rows:
+            return pd.DataFrame(columns=self.symbols, dtype=float)
+        index, rows = zip(*self._rows)
+        return pd.DataFrame(np.vstack(rows), index=list(index), columns=self.symbols)
+
+    def matrix(self, method: str = "pearson") -> pd.DataFrame:
+        """
+        Matrice de corrélation de la fenêtre
+
+        Args:
+            method: "pearson" (sommes courantes) ou "spearman" (rangs de la fenêtre)
+        """
+        if method == "pearson":
+            corr = self._pearson(self._count, self._sum_x, self._sum_xx, self._sum_xy)
+        elif method == "spearman":
+            corr = self._spearman(self.returns().to_numpy())
+        else:
+            raise ValueError(f"Méthode de corrélation inconnue: {method}")
+        return pd.DataFrame(corr, index=self.symbols, columns=self.symbols)
+
+    def _spearman(self, values: np.ndarray) -> np.ndarray:
+        """
+        Spearman par paire, comme DataFrame.corr : les colonnes complètes sont
+        classées une fois pour toutes, les paires impliquant une colonne à
+        trous sont reclassées sur leurs seules lignes communes
+        """
+        corr = self._pearson(*self._sums(pd.DataFrame(values).rank().to_numpy()))
+        present = np.isfinite(values)
+        gaps = np.flatnonzero(~present.all(axis=0))
+        for i in gaps:
+            for j in range(values.shape[1]):
+                if j == i or (j in gaps and j < i):
+                    continue
+                both = present[:, i] & present[:, j]
+                if both.sum() < self.min_periods:
+                    continue  # Déjà NaN : même décompte que les sommes de rangs
+                ranks = pd.DataFrame(values[both][:, [i, j]]).rank().to_numpy()
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    corr[i, j] = corr[j, i] = np.clip(np.corrcoef(ranks.T)[0, 1], -1.0, 1.0)
+        return corr
+
+    def _pearson(self, count, sum_x, sum_xx, sum_xy) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = sum_xy - sum_x * sum_x.T / count
+            variance_x = sum_xx - sum_x ** 2 / count
+            variance_y = variance_x.T
+            corr = covariance / np.sqrt(variance_x * variance_y)
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[count < self.min_periods] = np.nan
+        np.fill_diagonal(corr, np.where(np.diag(count) >= self.min_periods, 1.0, np.nan))
+        return corr
+
+
+def correlation_clusters(matrix: pd.DataFrame, threshold: float = 0.7) -> List[List[str]]:
+    """
+    Regroupe les symboles par classification hiérarchique (liaison moyenne)
+
+    Deux groupes fusionnent tant que leur corrélation moyenne dépasse le seuil.
+
+    Returns:
+        Clusters (listes de symboles), du plus grand au plus petit
+    """
+    corr = matrix.to_numpy(float, copy=True)
+    np.fill_diagonal(corr, np.nan)
+    clusters = [[i] for i in range(len(matrix))]
+    # Somme des corrélations connues et nombre de paires entre clusters
+    link_sum = np.nan_to_num(corr)
+    link_count = np.isfinite(corr).astype(float)
+
+    while len(clusters) > 1:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            average = link_sum / link_count
+        np.fill_diagonal(average, -np.inf)
+        average[~np.isfinite(average)] = -np.inf
+        i, j = np.unravel_index(np.argmax(average), average.shape)
+        if average[i, j] < threshold:
+            break
+        i, j = min(i, j), max(i, j)
+
+        clusters[i] += clusters.pop(j)
+        for links in (link_sum, link_count):
+            links[i, :] += links[j, :]
+            links[:, i] += links[:, j]
+        link_sum = np.delete(np.delete(link_sum, j, axis=0), j, axis=1)
+        link_count = np.delete(np.delete(link_count, j, axis=0), j, axis=1)
+
+    symbols = list(matrix.index)
+    return sorted(
+        ([symbols[k] for k in cluster] for cluster in clusters), key=len, reverse=True
+    )
+
+
+def diversification_metrics(
+    matrix: pd.DataFrame, volatility: Optional[pd.Series] = None, weights: Optional[pd.Series] = None
+) -> Dict[str, float]:
+    """
+    Scores de diversification d'un panier de symboles
+
+    Returns:
+        average_correlation: Corrélation moyenne hors diagonale
+        effective_bets: Nombre de paris indépendants ((Σλ)² / Σλ² des valeurs propres)
+        diversification_ratio: Σ wσ / σ(portefeuille) (1 = aucune diversification)
+        score: 0-100, 100 = symboles indépendants
+    """
+    valid = matrix.index[matrix.notna().sum() > 1]
+    corr = matrix.loc[valid, valid].to_numpy(float)
+    size = len(valid)
+    if size < 2:
+        return {"average_correlation": 0.0, "effective_bets": float(size),
+                "diversification_ratio": 1.0, "score": 0.0}
+
+    off_diagonal = corr[~np.eye(size, dtype=bool)]
+    average = float(np.nanmean(off_diagonal))
+
+    eigenvalues = np.clip(np.linalg.eigvalsh(np.nan_to_num(corr, nan=0.0)), 0.0, None)
+    effective_bets = float(eigenvalues.sum() ** 2 / (eigenvalues ** 2).sum())
+
+    sigma = np.ones(size) if volatility is None else volatility.reindex(valid).fillna(0).to_numpy(float)
+    w = np.full(size, 1 / size) if weights is None else weights.reindex(valid).fillna(0).to_numpy(float)
+    covariance = np.nan_to_num(corr, nan=0.0) * np.outer(sigma, sigma)
+    portfolio = float(np.sqrt(max(w @ covariance @ w, 0.0)))
+    ratio = float(w @ sigma / portfolio) if portfolio > 0 else 1.0
+
+    return {
+        "average_correlation": average,
+        "effective_bets": effective_bets,
+        "diversification_ratio": ratio,
+        "score": float(100 * (effective_bets - 1) / (size - 1)),
+    }
+
+
+class CorrelationEngine:
+    """
+    Moteur de corrélations du marché
+
+    Les clôtures viennent du cache OHLCV local via MarketScanner.load_ohlcv
+    (requêtes REST en parallèle pour les seuls symboles manquants) ; l'état
+    glissant est conservé par (intervalle, ensemble de symboles) entre deux
+    rafraîchissements, si bien que des paniers différents analysés en
+    alternance ne reconstruisent pas mutuellement leur fenêtre.
+    """
+
+    def __init__(
+        self,
+        scanner: MarketScanner = market_scanner,
+        window: int = 168,
+        min_periods: int = 20,
+        cluster_threshold: float = 0.7,
+        max_states: int = 16,
+    ):
+        """
+        Args:
+            scanner: Chargeur d'OHLCV alignés (cache local + provider)
+            window: Nombre de log-rendements de la fenêtre glissante
+            min_periods: Observations communes minimales par paire
+            cluster_threshold: Corrélation moyenne minimale pour regrouper
+            max_states: Paniers conservés (les moins récemment analysés sont évincés)
+        """
+        self.scanner = scanner
+        self.window = window
+        self.min_periods = min_periods
+        self.cluster_threshold = cluster_threshold
+        self.max_states = max_states
+        self._states: "OrderedDict[Tuple[str, FrozenSet[str]], RollingCorrelation]" = OrderedDict()
+
+    def analyze(self, symbols: List[str], interval: str = "1h", method: str = "pearson") -> Dict[str, Any]:
+        """
+        Corrélations, clusters et diversification d'un panier de symboles
+
+        Returns:
+            Dictionnaire avec matrix (DataFrame), clusters, diversification,
+            volatility (par bougie) et ohlcv (matrices bougies x symboles)
+        """
+        ohlcv, _ = self.scanner.load_ohlcv(symbols, interval, self.window + 1)
+        closes = ohlcv["close"]
+        closes = closes[[symbol for symbol in symbols if symbol in closes.columns]]
+        if closes.empty:
+            return {"matrix": pd.DataFrame(), "clusters": [], "diversification": {},
+                    "volatility": pd.Series(dtype=float), "ohlcv": ohlcv}
+
+        state = self._state(interval, closes.columns)
+        # Ordre canonique dans l'état : un même panier dans un autre ordre le réutilise
+        added = state.update(closes[sorted(closes.columns)])
+        order = list(closes.columns)
+        matrix = state.matrix(method).loc[order, order]
+        volatility = state.returns().std()[order]
+
+        logger.debug(
+            f"📊 Corrélations {len(closes.columns)} symboles {interval}: "
+            f"{added} bougie(s) intégrée(s), fenêtre {len(state)}"
+        )
+        return {
+            "matrix": matrix,
+            "clusters": correlation_clusters(matrix, self.cluster_threshold),
+            "diversification": diversification_metrics(matrix, volatility),
+            "volatility": volatility,
+            "ohlcv": ohlcv,
+        }
+
+    def _state(self, interval: str, symbols) -> RollingCorrelation:
+        """État glissant du panier (créé au besoin, LRU borné à max_states)"""
+        key = (interval, frozenset(symbols))
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = RollingCorrelation(self.window, self.min_periods)
+            if len(self._states) > self.max_states:
+                self._states.popitem(last=False)
+        else:
+            self._states.move_to_end(key)
+        return state
+
+    @staticmethod
+    def bars_per_day(interval: str) -> int:
+        return max(1, 86400 // INTERVAL_SECONDS.get(interval, 3600))
+
+
+# Instance globale
+correlation_engine = CorrelationEngine()
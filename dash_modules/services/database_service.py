@@ -6,17 +6,40 @@ Gestion centralisée des opérations de base de données
 
 import logging
 from contextlib import contextmanager
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
-from sqlalchemy import and_, desc, func
+from sqlalchemy import and_, bindparam, desc, func, inspect, or_, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from src.thebot.core.startup import lazy_singleton
+
+from ..models import (
+    Alert,
+    MarketData,
+    NewsArticle,
+    PriceAlert,
+    PriceHistory,
+    User,
+    UserPreferences,
+)
+from ..models.base import create_tables, get_db
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Index unique de la clé de bougie (cible de ON CONFLICT), cf. migration 002
+_BAR_INDEX = "ux_price_history_bar"
+
+# Dialectes supportant INSERT ... ON CONFLICT
+_UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
 
 class DatabaseService:
     """
@@ -24,8 +47,14 @@ class DatabaseService:
     Fournit une interface unifiée pour les opérations CRUD.
     """
 
-    def __init__(self):
+    def __init__(self, session_factory=None):
+        """
+        Args:
+            session_factory: Fabrique de sessions (par défaut SessionLocal via get_db)
+        """
         self._initialized = False
+        self._session_factory = session_factory
+        self._bar_index_ready = False
 
     def initialize_database(self) -> None:
         """
@@ -36,6 +65,8 @@ class DatabaseService:
             try:
                 logger.info("🏗️ Initialisation de la base de données...")
                 create_tables()
+                with self.get_session() as session:
+                    self._ensure_bar_index(session)
                 self._create_initial_data()
                 self._initialized = True
                 logger.info("✅ Base de données initialisée avec succès")
@@ -43,6 +74,31 @@ class DatabaseService:
                 logger.error(f"❌ Erreur lors de l'initialisation de la base de données: {e}")
                 raise
 
+    def _ensure_bar_index(self, session: Session) -> None:
+        """
+        Garantit l'index unique de la clé de bougie sur price_history.
+
+        create_all n'ajoute pas d'index aux tables existantes : une base créée
+        avant la migration 002 (non estampillée) en est dépourvue et tout
+        ON CONFLICT échouerait. Les doublons sont supprimés (ligne la plus
+        ancienne conservée) avant la création de l'index.
+        """
+        if self._bar_index_ready:
+            return
+
+        indexes = {index["name"] for index in inspect(session.get_bind()).get_indexes(PriceHistory.__tablename__)}
+        if _BAR_INDEX not in indexes:
+            key = ", ".join(PriceHistory.BAR_KEY)
+            table = PriceHistory.__tablename__
+            logger.info(f"🔧 Création de l'index unique {_BAR_INDEX} sur {table}")
+            session.execute(text(
+                f"DELETE FROM {table} WHERE id NOT IN "
+                f"(SELECT MIN(id) FROM {table} GROUP BY {key})"
+            ))
+            session.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {_BAR_INDEX} ON {table} ({key})"))
+            session.commit()
+        self._bar_index_ready = True
+
     def _create_initial_data(self) -> None:
         """Crée les données initiales si nécessaire"""
         with self.get_session() as session:
@@ -82,7 +138,7 @@ class DatabaseService:
     @contextmanager
     def get_session(self):
         """Context manager pour obtenir une session de base de données"""
-        db = next(get_db())
+        db = self._session_factory() if self._session_factory else next(get_db())
         try:
             yield db
         finally:
@@ -137,36 +193,142 @@ class DatabaseService:
                 query = query.filter(PriceHistory.provider == provider)
             return query.order_by(desc(PriceHistory.market_timestamp)).limit(limit).all()
 
+    def get_price_history_bulk(
+        self,
+        symbols: List[str],
+        provider: str,
+        interval: str,
+        since: Optional[datetime] = None,
+        chunk_size: int = 500,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Charge l'historique de plusieurs symboles en une requête par lot.
+
+        Args:
+            symbols: Symboles à charger
+            since: Première bougie incluse (tout l'historique si None)
+            chunk_size: Nombre de symboles par clause IN
+
+        Returns:
+            {symbole: bougies OHLCV triées par date (dicts avec 'timestamp')},
+            au même format que bulk_upsert_price_history
+        """
+        table = PriceHistory.__table__
+        columns = [
+            table.c.symbol,
+            table.c.market_timestamp,
+            table.c.open_price,
+            table.c.high_price,
+            table.c.low_price,
+            table.c.close_price,
+            table.c.volume,
+        ]
+        history: Dict[str, List[Dict[str, Any]]] = {}
+
+        with self.get_session() as session:
+            for start in range(0, len(symbols), chunk_size):
+                stmt = select(*columns).where(
+                    table.c.symbol.in_(symbols[start:start + chunk_size]),
+                    table.c.provider == provider,
+                    table.c.interval == interval,
+                )
+                if since is not None:
+                    stmt = stmt.where(table.c.market_timestamp >= since)
+                stmt = stmt.order_by(table.c.symbol, table.c.market_timestamp)
+
+                for symbol, timestamp, open_, high, low, close, volume in session.execute(stmt):
+                    history.setdefault(symbol, []).append({
+                        'timestamp': timestamp,
+                        'open': open_,
+                        'high': high,
+                        'low': low,
+                        'close': close,
+                        'volume': volume,
+                    })
+        return history
+
     def save_price_history(self, price_data: List[Dict[str, Any]], symbol: str, provider: str, interval: str) -> int:
         """
         Sauvegarde un historique de prix en base de données.
         Évite les doublons basés sur le timestamp.
         """
-        saved_count = 0
+        return self.bulk_upsert_price_history(price_data, symbol, provider, interval)
+
+    def bulk_upsert_price_history(
+        self,
+        price_data: List[Dict[str, Any]],
+        symbol: str,
+        provider: str,
+        interval: str,
+        update_existing: bool = False,
+        chunk_size: int = 500,
+    ) -> int:
+        """
+        Insère un historique de prix en masse via INSERT ... ON CONFLICT.
+
+        S'appuie sur l'index unique (symbol, provider, interval, market_timestamp) :
+        une requête par lot au lieu d'un SELECT + INSERT par bougie.
+
+        Args:
+            price_data: Bougies OHLCV (dicts avec 'timestamp')
+            update_existing: Met à jour les bougies existantes (DO UPDATE) au lieu de les ignorer
+            chunk_size: Nombre de lignes par executemany
+
+        Returns:
+            Nombre de lignes insérées (ou mises à jour si update_existing)
+        """
+        rows = [
+            PriceHistory.ohlcv_row(symbol, provider, interval, data, data.get('timestamp'))
+            for data in price_data
+            if data.get('timestamp') is not None
+        ]
+        if not rows:
+            return 0
+
         with self.get_session() as session:
-            for data in price_data:
-                # Vérifier si l'enregistrement existe déjà
-                existing = session.query(PriceHistory).filter(
-                    and_(
-                        PriceHistory.symbol == symbol,
-                        PriceHistory.provider == provider,
-                        PriceHistory.interval == interval,
-                        PriceHistory.market_timestamp == data.get('timestamp')
-                    )
-                ).first()
-
-                if not existing:
-                    price_record = PriceHistory.from_ohlcv_data(
-                        symbol=symbol,
-                        provider=provider,
-                        interval=interval,
-                        ohlcv_data=data,
-                        timestamp=data.get('timestamp')
-                    )
-                    session.add(price_record)
-                    saved_count += 1
+            insert = _UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+            if insert is None:
+                return self._save_price_history_rows(session, rows)
+            self._ensure_bar_index(session)
+
+            stmt = insert(PriceHistory.__table__)
+            if update_existing:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(PriceHistory.BAR_KEY),
+                    set_={
+                        column: stmt.excluded[column]
+                        for column in ('open_price', 'high_price', 'low_price',
+                                       'close_price', 'volume', 'updated_at')
+                    },
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=list(PriceHistory.BAR_KEY))
 
-            session.commit()
+            saved_count = 0
+            try:
+                for start in range(0, len(rows), chunk_size):
+                    result = session.execute(stmt, rows[start:start + chunk_size])
+                    saved_count += max(result.rowcount, 0)
+                session.commit()
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.error(f"❌ Erreur upsert historique {symbol}/{interval}: {e}")
+                raise
+
+        logger.debug(f"💾 {saved_count}/{len(rows)} bougies {symbol} {interval} enregistrées")
+        return saved_count
+
+    def _save_price_history_rows(self, session: Session, rows: List[Dict[str, Any]]) -> int:
+        """Chemin de repli ligne à ligne pour les dialectes sans ON CONFLICT"""
+        saved_count = 0
+        for row in rows:
+            existing = session.query(PriceHistory.id).filter(
+                and_(*(getattr(PriceHistory, key) == row[key] for key in PriceHistory.BAR_KEY))
+            ).first()
+            if not existing:
+                session.add(PriceHistory(**row))
+                saved_count += 1
+        session.commit()
         return saved_count
 
     # === MÉTHODES SPÉCIFIQUES AUX ALERTES ===
@@ -212,6 +374,30 @@ class DatabaseService:
             session.commit()
         return triggered_alerts
 
+    def mark_price_alerts_triggered(self, triggers: List[Dict[str, Any]]) -> int:
+        """
+        Marque un lot d'alertes de prix comme déclenchées (un seul executemany).
+
+        Args:
+            triggers: Dicts {'alert_id': int, 'triggered_at': datetime}
+
+        Returns:
+            Nombre d'alertes effectivement mises à jour (déjà déclenchées ignorées)
+        """
+        if not triggers:
+            return 0
+
+        table = PriceAlert.__table__
+        stmt = (
+            update(table)
+            .where(and_(table.c.id == bindparam('alert_id'), table.c.is_triggered == 0))
+            .values(is_triggered=1, triggered_at=bindparam('triggered_at'))
+        )
+        with self.get_session() as session:
+            result = session.execute(stmt, triggers)
+            session.commit()
+            return max(result.rowcount, 0)
+
     # === MÉTHODES SPÉCIFIQUES AUX ACTUALITÉS ===
 
     def get_recent_news(self, limit: int = 50, category: str = None) -> List["NewsArticle"]:
@@ -278,4 +464,4 @@ class DatabaseService:
 
 
 # Instance globale du service de base de données
-database_service = DatabaseService()
+database_service = lazy_singleton(DatabaseService, name="DatabaseService")
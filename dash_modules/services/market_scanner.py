@@ -0,0 +1,496 @@
+"""
+Market Scanner - Screener multi-symboles vectorisé
+Évalue une condition (ex: "RSI(14) < 30 and close > EMA(200)") sur tout un
+univers de symboles : OHLCV alignés en matrices bougies x symboles, indicateurs
+calculés colonne par colonne en une passe via le graphe d'indicateurs partagé,
+dans le processus courant ou par paquets sur un pool de processus optionnel
+"""
+
+import ast
+import inspect
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.thebot.indicators.graph import (
+    INDICATOR_DEFINITIONS,
+    IndicatorPlanner,
+    IndicatorRequest,
+    indicator_planner,
+)
+
+from .database_service import database_service
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+INTERVAL_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+    "1w": 604800,
+}
+
+# Fonctions du DSL -> (indicateur du graphe, sortie)
+SCAN_FUNCTIONS: Dict[str, Tuple[str, str]] = {
+    "SMA": ("sma", "sma"),
+    "EMA": ("ema", "ema"),
+    "RSI": ("rsi", "rsi"),
+    "ATR": ("atr", "atr"),
+    "MACD": ("macd", "macd"),
+    "MACD_SIGNAL": ("macd", "signal"),
+    "MACD_HIST": ("macd", "histogram"),
+    "BB_UPPER": ("bollinger", "upper"),
+    "BB_MIDDLE": ("bollinger", "middle"),
+    "BB_LOWER": ("bollinger", "lower"),
+    "KC_UPPER": ("keltner", "upper"),
+    "KC_LOWER": ("keltner", "lower"),
+    "SQUEEZE": ("squeeze", "squeeze"),
+    "SUPERTREND": ("supertrend", "supertrend"),
+    "SUPERTREND_DIR": ("supertrend", "direction"),
+    "STOCH_K": ("stochastic", "k"),
+    "STOCH_D": ("stochastic", "d"),
+    "BREAKOUT": ("breakout", "breakout"),
+    "OBV": ("obv", "obv"),
+}
+
+_LOGICAL_WORDS = re.compile(r"\b(AND|OR|NOT)\b", re.IGNORECASE)
+
+_COMPARATORS = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+}
+
+
+class ScanExpressionError(ValueError):
+    """Expression de scan invalide"""
+
+
+class _Context:
+    """Séries larges disponibles pendant l'évaluation d'une expression"""
+
+    def __init__(self, columns: Dict[str, pd.DataFrame], outputs: Dict[str, Dict[str, Any]]):
+        self.columns = columns
+        self.outputs = outputs
+
+    def at(self, frame: pd.DataFrame, lag: int) -> pd.Series:
+        """Valeurs de la bougie -1-lag pour chaque symbole"""
+        if lag >= len(frame):
+            return pd.Series(np.nan, index=frame.columns)
+        return frame.iloc[-1 - lag]
+
+
+class ScanExpression:
+    """
+    Expression de scan compilée
+
+    Grammaire (sous-ensemble d'expressions Python, analysé avec ast) :
+    - colonnes : open, high, low, close, volume
+    - indicateurs : RSI(14), EMA(200), MACD_HIST(12, 26, 9), BB_LOWER(20, 2)...
+    - variation : CHANGE(n) = variation de close sur n bougies en %
+    - décalage : close[1], RSI(14)[2] = valeur n bougies plus tôt
+    - opérateurs : + - * /, comparaisons (chaînées), and / or / not
+    """
+
+    def __init__(self, source: str):
+        self.source = source.strip()
+        self.requests: Dict[str, IndicatorRequest] = {}
+        self.references: Dict[str, Callable[[_Context, int], pd.Series]] = {}
+        self.lookback = 1
+
+        try:
+            tree = ast.parse(_LOGICAL_WORDS.sub(lambda m: m.group(1).lower(), self.source), mode="eval")
+        except SyntaxError as e:
+            raise ScanExpressionError(f"Syntaxe invalide: {e.msg}") from e
+        self._evaluate = self._compile(tree.body, 0)
+
+    def _compile(self, node: ast.AST, lag: int) -> Callable[[_Context], Any]:
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compile(value, lag) for value in node.values]
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            return lambda ctx: _reduce(combine, [part(ctx) for part in parts])
+
+        if isinstance(node, ast.UnaryOp):
+            operand = self._compile(node.operand, lag)
+            if isinstance(node.op, ast.Not):
+                return lambda ctx: np.logical_not(operand(ctx))
+            if isinstance(node.op, ast.USub):
+                return lambda ctx: -operand(ctx)
+
+        if isinstance(node, ast.Compare) and all(type(op) in _COMPARATORS for op in node.ops):
+            terms = [self._compile(term, lag) for term in [node.left, *node.comparators]]
+            comparators = [_COMPARATORS[type(op)] for op in node.ops]
+
+            def compare(ctx):
+                values = [term(ctx) for term in terms]
+                return _reduce(
+                    np.logical_and,
+                    [cmp(values[i], values[i + 1]) for i, cmp in enumerate(comparators)],
+                )
+
+            return compare
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            left, right = self._compile(node.left, lag), self._compile(node.right, lag)
+            operator = _OPERATORS[type(node.op)]
+            return lambda ctx: operator(left(ctx), right(ctx))
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            value = float(node.value)
+            return lambda ctx: value
+
+        if isinstance(node, ast.Subscript):
+            offset = _literal(node.slice)
+            if offset < 0 or offset != int(offset):
+                raise ScanExpressionError(f"Décalage invalide: {ast.unparse(node)}")
+            return self._compile(node.value, lag + int(offset))
+
+        if isinstance(node, (ast.Name, ast.Call)):
+            return self._reference(node, lag)
+
+        raise ScanExpressionError(f"Élément non supporté: {ast.unparse(node)}")
+
+    def _reference(self, node: ast.AST, lag: int) -> Callable[[_Context], pd.Series]:
+        label = ast.unparse(node)
+
+        if isinstance(node, ast.Name):
+            column = node.id.lower()
+            if column not in OHLCV_COLUMNS:
+                raise ScanExpressionError(f"Colonne inconnue: {node.id}")
+            self.lookback = max(self.lookback, lag + 1)
+            self.references.setdefault(label, lambda ctx, lag: ctx.at(ctx.columns[column], lag))
+            return lambda ctx: self.references[label](ctx, lag)
+
+        if not isinstance(node.func, ast.Name):
+            raise ScanExpressionError(f"Appel non supporté: {label}")
+        name = node.func.id.upper()
+        args = [_literal(arg) for arg in node.args]
+        kwargs = {kw.arg: _literal(kw.value) for kw in node.keywords}
+
+        if name == "CHANGE":
+            period = int(args[0] if args else kwargs.get("period", 1))
+            self.lookback = max(self.lookback, lag + period + 1)
+
+            def change(ctx, lag):
+                close = ctx.columns["close"]
+                return (ctx.at(close, lag) / ctx.at(close, lag + period) - 1) * 100
+
+            self.references.setdefault(label, change)
+            return lambda ctx: self.references[label](ctx, lag)
+
+        if name not in SCAN_FUNCTIONS:
+            raise ScanExpressionError(f"Fonction inconnue: {node.func.id}")
+        indicator, output = SCAN_FUNCTIONS[name]
+
+        parameters = list(inspect.signature(INDICATOR_DEFINITIONS[indicator]).parameters)[1:]
+        if len(args) > len(parameters) or any(key not in parameters for key in kwargs):
+            raise ScanExpressionError(f"Paramètres invalides pour {name}: {label}")
+        params = {**dict(zip(parameters, args)), **kwargs}
+        params = {key: int(value) if float(value).is_integer() else value for key, value in params.items()}
+
+        request = IndicatorRequest.of(indicator, **params)
+        self.requests[request.label] = request
+        # Amorçage réel de la sortie (ex: signal MACD = lente + signal - 1 bougies)
+        warmup = indicator_planner.plan([request]).warmups[request.label][output]
+        self.lookback = max(self.lookback, lag + warmup + 1)
+
+        self.references.setdefault(
+            label, lambda ctx, lag: ctx.at(ctx.outputs[request.label][output], lag)
+        )
+        return lambda ctx: self.references[label](ctx, lag)
+
+    def evaluate(
+        self, columns: Dict[str, pd.DataFrame], planner: Optional[IndicatorPlanner] = None
+    ) -> Tuple[pd.Series, Dict[str, pd.Series]]:
+        """
+        Évalue l'expression sur des matrices bougies x symboles
+
+        Returns:
+            (masque booléen par symbole, dernières valeurs de chaque référence)
+        """
+        planner = planner or IndicatorPlanner()
+        outputs = planner.plan(list(self.requests.values())).evaluate(columns) if self.requests else {}
+        ctx = _Context(columns, outputs)
+
+        symbols = columns["close"].columns
+        mask = pd.Series(np.broadcast_to(self._evaluate(ctx), len(symbols)), index=symbols)
+        # Historique trop court : les EMA démarrent dès la 1re bougie, on écarte le symbole
+        enough_history = columns["close"].notna().sum() >= self.lookback
+        values = {label: reference(ctx, 0) for label, reference in self.references.items()}
+        return mask.fillna(False).astype(bool) & enough_history, values
+
+
+def _literal(node: ast.AST) -> float:
+    """Paramètre numérique constant (éventuellement négatif)"""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_literal(node.operand)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    raise ScanExpressionError(f"Paramètre non numérique: {ast.unparse(node)}")
+
+
+def _reduce(combine, values):
+    result = values[0]
+    for value in values[1:]:
+        result = combine(result, value)
+    return result
+
+
+def _scan_chunk(
+    source: str, columns: Dict[str, pd.DataFrame]
+) -> Tuple[List[str], Dict[str, Dict[str, float]]]:
+    """Évalue une expression sur un paquet de symboles (exécuté dans un processus)"""
+    mask, values = ScanExpression(source).evaluate(columns)
+    matches = [symbol for symbol, matched in mask.items() if matched]
+    return matches, {
+        symbol: {label: float(series[symbol]) for label, series in values.items()}
+        for symbol in matches
+    }
+
+
+@dataclass
+class ScanResult:
+    """Résultat d'un scan de marché"""
+
+    expression: str
+    interval: str
+    matches: List[str]
+    values: Dict[str, Dict[str, float]]
+    scanned: int
+    from_cache: int
+    fetched: int
+    elapsed_ms: float
+    failed: List[str] = field(default_factory=list)
+
+
+class MarketScanner:
+    """
+    Screener multi-symboles
+
+    Les OHLCV sont lus en lot dans l'historique local (price_history) ; seuls
+    les symboles absents ou en retard sont récupérés auprès du provider, en
+    parallèle, puis réenregistrés. Les indicateurs sont calculés sur des
+    matrices bougies x symboles en une passe vectorisée dans le processus
+    courant. Avec processes > 1, les paquets de symboles sont répartis sur un
+    pool long-vivant en contexte "spawn" : jamais de fork depuis un thread de
+    requête Dash (verrous hérités), et le coût de démarrage n'est payé qu'une
+    fois.
+    """
+
+    def __init__(
+        self,
+        provider=None,
+        db_service=database_service,
+        provider_name: str = "binance",
+        chunk_size: int = 100,
+        processes: int = 0,
+        fetch_workers: int = 8,
+    ):
+        """
+        Args:
+            provider: Provider OHLCV (get_klines / get_all_symbols), Binance par défaut
+            db_service: Service de base de données (cache local des bougies)
+            provider_name: Nom du provider dans price_history
+            chunk_size: Nombre de symboles par paquet envoyé au pool de processus
+            processes: Processus de calcul (défaut 0 = en local, None = nombre de CPU)
+            fetch_workers: Requêtes REST simultanées pour compléter le cache
+        """
+        self._provider = provider
+        self.db_service = db_service
+        self.provider_name = provider_name
+        self.chunk_size = chunk_size
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.fetch_workers = fetch_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    @property
+    def provider(self):
+        if self._provider is None:
+            from ..data_providers.binance_api import binance_provider
+
+            self._provider = binance_provider
+        return self._provider
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Pool de calcul long-vivant (contexte spawn), créé au premier scan parallèle"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        """Arrête le pool de calcul"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def load_ohlcv(
+        self, symbols: List[str], interval: str = "1h", bars: int = 250
+    ) -> Tuple[Dict[str, pd.DataFrame], Dict[str, int]]:
+        """
+        Charge des OHLCV alignés pour un univers de symboles
+
+        Returns:
+            ({colonne: DataFrame bougies x symboles}, statistiques de chargement)
+        """
+        step = timedelta(seconds=INTERVAL_SECONDS.get(interval, 3600))
+        now = datetime.utcnow()
+
+        try:
+            history = self.db_service.get_price_history_bulk(
+                symbols, self.provider_name, interval, since=now - step * (bars + 1)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Cache OHLCV local indisponible: {e}")
+            history = {}
+
+        frames: Dict[str, pd.DataFrame] = {}
+        stale = []
+        for symbol in symbols:
+            rows = history.get(symbol)
+            if rows and len(rows) >= bars and rows[-1]["timestamp"] >= now - step:
+                frames[symbol] = pd.DataFrame(rows).set_index("timestamp")
+            else:
+                stale.append(symbol)
+
+        failed = []
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.fetch_workers) as executor:
+                for symbol, frame in zip(
+                    stale, executor.map(lambda s: self._fetch(s, interval, bars), stale)
+                ):
+                    if frame is None or frame.empty:
+                        failed.append(symbol)
+                    else:
+                        frames[symbol] = frame
+
+        columns = {}
+        for column in OHLCV_COLUMNS:
+            wide = pd.DataFrame({symbol: frame[column] for symbol, frame in frames.items()})
+            columns[column] = wide.sort_index().iloc[-bars:].astype(float)
+
+        stats = {
+            "from_cache": len(symbols) - len(stale),
+            "fetched": len(stale) - len(failed),
+            "failed": failed,
+        }
+        return columns, stats
+
+    def _fetch(self, symbol: str, interval: str, bars: int) -> Optional[pd.DataFrame]:
+        """Récupère les bougies d'un symbole et les enregistre dans le cache local"""
+        try:
+            frame = self.provider.get_klines(symbol, interval, bars)
+            if frame is None or frame.empty:
+                return None
+            frame = frame[list(OHLCV_COLUMNS)]
+            try:
+                self.db_service.bulk_upsert_price_history(
+                    frame.reset_index().to_dict("records"),
+                    symbol,
+                    self.provider_name,
+                    interval,
+                    update_existing=True,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Bougies {symbol} non enregistrées: {e}")
+            return frame
+        except Exception as e:
+            logger.error(f"❌ Erreur récupération {symbol} {interval}: {e}")
+            return None
+
+    def scan(
+        self,
+        expression: str,
+        symbols: Optional[List[str]] = None,
+        interval: str = "1h",
+        bars: int = 250,
+    ) -> ScanResult:
+        """
+        Évalue une condition sur un univers de symboles
+
+        Args:
+            expression: Condition (ex: "RSI(14) < 30 and close > EMA(200)")
+            symbols: Univers (tous les symboles USDT du provider par défaut)
+            interval: Timeframe des bougies
+            bars: Nombre de bougies chargées (augmenté si l'expression l'exige)
+
+        Returns:
+            Symboles qui vérifient la condition et valeurs des références
+
+        Raises:
+            ScanExpressionError: Si l'expression est invalide
+        """
+        start = time.perf_counter()
+        compiled = ScanExpression(expression)
+        symbols = symbols if symbols is not None else self.provider.get_all_symbols()
+        columns, stats = self.load_ohlcv(symbols, interval, max(bars, compiled.lookback))
+
+        universe = list(columns["close"].columns)
+        matches: List[str] = []
+        values: Dict[str, Dict[str, float]] = {}
+        if self.processes > 1 and len(universe) > self.chunk_size:
+            chunks = [
+                {column: frame[universe[i:i + self.chunk_size]] for column, frame in columns.items()}
+                for i in range(0, len(universe), self.chunk_size)
+            ]
+            pool = self._get_pool()
+            results = list(pool.map(_scan_chunk, [compiled.source] * len(chunks), chunks))
+        elif universe:
+            results = [_scan_chunk(compiled.source, columns)]
+        else:
+            results = []
+        for chunk_matches, chunk_values in results:
+            matches.extend(chunk_matches)
+            values.update(chunk_values)
+
+        result = ScanResult(
+            expression=compiled.source,
+            interval=interval,
+            matches=matches,
+            values=values,
+            scanned=len(universe),
+            from_cache=stats["from_cache"],
+            fetched=stats["fetched"],
+            failed=stats["failed"],
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+        logger.info(
+            f"🔎 Scan '{compiled.source}' {interval}: {len(matches)}/{len(universe)} symboles "
+            f"({result.from_cache} cache, {result.fetched} REST) en {result.elapsed_ms:.0f} ms"
+        )
+        return result
+
+
+# Instance globale
+market_scanner = MarketScanner()
@@ -11,7 +11,6 @@ from sqlalchemy.orm import Session
 
 from ..models.base import get_db_session
 from ..models.news import NewsArticle
-from ..data_providers.rss_news_manager import rss_news_manager
 from .service_interfaces import ServiceInterface
 
 logger = logging.getLogger(__name__)
@@ -52,6 +51,7 @@ class NewsService(ServiceInterface):
                 session.execute("SELECT 1")
 
             # Tester les sources RSS
+            from ..data_providers.rss_news_manager import rss_news_manager  # Import circulaire via dash_modules.core
             if not rss_news_manager.is_available():
                 self.logger.warning("RSSNewsManager n'est pas disponible")
 
@@ -89,6 +89,7 @@ class NewsService(ServiceInterface):
                 # Compter les articles de news
                 news_count = session.query(NewsArticle).count()
 
+            from ..data_providers.rss_news_manager import rss_news_manager  # Import circulaire via dash_modules.core
             rss_status = rss_news_manager.is_available()
 
             return {
@@ -0,0 +1,449 @@
+"""
+Price Alert Engine - Évaluation indexée des alertes de prix THEBOT
+Les alertes actives sont indexées en mémoire par symbole : un tick ne touche
+que les alertes que son prix franchit, et les déclenchements sont écrits en
+base par lots
+"""
+
+import asyncio
+import bisect
+import concurrent.futures
+import logging
+import math
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..models.alerts import PriceAlert
+from .database_service import DatabaseService, database_service
+
+logger = logging.getLogger(__name__)
+
+_Entry = Tuple[float, int]
+
+
+@dataclass(frozen=True)
+class IndexedAlert:
+    """Vue immuable d'une alerte de prix indexée"""
+
+    alert_id: int
+    symbol: str
+    condition_type: str
+    above: float = math.inf  # déclenche si prix >= above
+    below: float = -math.inf  # déclenche si prix <= below
+    band: Optional[Tuple[float, float]] = None  # déclenche si prix dans [min, max]
+    name: Optional[str] = None
+
+    @classmethod
+    def from_model(cls, alert: PriceAlert) -> Optional["IndexedAlert"]:
+        """
+        Convertit un PriceAlert en seuils de déclenchement.
+        Retourne None si l'alerte est incomplète (même règle que check_condition).
+        """
+        base = dict(alert_id=alert.id, symbol=alert.symbol,
+                    condition_type=alert.condition_type, name=alert.name)
+
+        if alert.condition_type == "above" and alert.target_price is not None:
+            return cls(above=alert.target_price, **base)
+        if alert.condition_type == "below" and alert.target_price is not None:
+            return cls(below=alert.target_price, **base)
+        if (alert.condition_type == "between"
+                and alert.target_price_min is not None
+                and alert.target_price_max is not None):
+            return cls(band=(alert.target_price_min, alert.target_price_max), **base)
+        if (alert.condition_type == "change_percent"
+                and alert.change_percent is not None
+                and alert.reference_price):
+            # |variation| >= p  <=>  prix >= ref*(1+p)  ou  prix <= ref*(1-p)
+            move = abs(alert.change_percent) / 100
+            return cls(above=alert.reference_price * (1 + move),
+                       below=alert.reference_price * (1 - move), **base)
+        return None
+
+
+class _IntervalTree:
+    """
+    Arbre d'intervalles centré pour les alertes 'between'
+
+    Requête de poignardage (quels intervalles contiennent x ?) en
+    O(log n + k). Les suppressions sont des tombstones et l'arbre est
+    reconstruit paresseusement, les ajouts étant rares face aux ticks.
+    """
+
+    def __init__(self):
+        self._intervals: Dict[int, Tuple[float, float]] = {}
+        self._root = None
+        self._dirty = False
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, alert_id: int, low: float, high: float) -> None:
+        self._intervals[alert_id] = (low, high)
+        self._dirty = True
+
+    def remove(self, alert_id: int) -> None:
+        if self._intervals.pop(alert_id, None) is not None:
+            self._tombstones += 1
+            if self._tombstones > len(self._intervals):
+                self._dirty = True
+
+    def stab(self, x: float) -> List[int]:
+        if self._dirty:
+            items = [(low, high, alert_id) for alert_id, (low, high) in self._intervals.items()]
+            self._root = self._build(items)
+            self._dirty = False
+            self._tombstones = 0
+
+        found = []
+        node = self._root
+        while node is not None:
+            center, by_low, by_high, left, right = node
+            if x < center:
+                for low, _, alert_id in by_low:
+                    if low > x:
+                        break
+                    found.append(alert_id)
+                node = left
+            else:
+                for _, high, alert_id in by_high:
+                    if high < x:
+                        break
+                    found.append(alert_id)
+                node = right if x > center else None
+
+        # Filtrer les tombstones encore présents dans l'arbre
+        return [alert_id for alert_id in found if alert_id in self._intervals]
+
+    @classmethod
+    def _build(cls, items: List[Tuple[float, float, int]]):
+        if not items:
+            return None
+
+        points = sorted(p for low, high, _ in items for p in (low, high) if math.isfinite(p))
+        center = points[len(points) // 2] if points else 0.0
+
+        left, right, overlapping = [], [], []
+        for item in items:
+            if item[1] < center:
+                left.append(item)
+            elif item[0] > center:
+                right.append(item)
+            else:
+                overlapping.append(item)
+
+        by_low = sorted(overlapping, key=lambda item: item[0])
+        by_high = sorted(overlapping, key=lambda item: item[1], reverse=True)
+        return (center, by_low, by_high, cls._build(left), cls._build(right))
+
+
+class SymbolAlertIndex:
+    """
+    Index des alertes actives d'un symbole
+
+    Les seuils 'above' (négés) et 'below' sont tenus triés : les alertes
+    franchies par un prix forment toujours un suffixe, trouvé par bisect
+    et retiré d'un bloc.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self._alerts: Dict[int, IndexedAlert] = {}
+        self._above: List[_Entry] = []  # (-seuil, id) : déclenche si prix >= seuil
+        self._below: List[_Entry] = []  # (seuil, id) : déclenche si prix <= seuil
+        self._between = _IntervalTree()
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def add(self, alert: IndexedAlert) -> None:
+        self.remove(alert.alert_id)
+        self._alerts[alert.alert_id] = alert
+
+        if alert.band is not None:
+            self._between.add(alert.alert_id, *alert.band)
+        if alert.above != math.inf:
+            bisect.insort(self._above, (-alert.above, alert.alert_id))
+        if alert.below != -math.inf:
+            bisect.insort(self._below, (alert.below, alert.alert_id))
+
+    def remove(self, alert_id: int) -> Optional[IndexedAlert]:
+        alert = self._alerts.pop(alert_id, None)
+        if alert is None:
+            return None
+
+        if alert.band is not None:
+            self._between.remove(alert_id)
+        if alert.above != math.inf:
+            self._discard(self._above, (-alert.above, alert_id))
+        if alert.below != -math.inf:
+            self._discard(self._below, (alert.below, alert_id))
+        return alert
+
+    @staticmethod
+    def _discard(entries: List[_Entry], entry: _Entry) -> None:
+        index = bisect.bisect_left(entries, entry)
+        if index < len(entries) and entries[index] == entry:
+            del entries[index]
+
+    def evaluate(self, price: float) -> List[IndexedAlert]:
+        """Retire et retourne les alertes déclenchées par ce prix"""
+        fired_ids = []
+
+        index = bisect.bisect_left(self._above, (-price,))
+        fired_ids.extend(alert_id for _, alert_id in self._above[index:])
+        del self._above[index:]
+
+        index = bisect.bisect_left(self._below, (price,))
+        fired_ids.extend(alert_id for _, alert_id in self._below[index:])
+        del self._below[index:]
+
+        if len(self._between):
+            fired_ids.extend(self._between.stab(price))
+
+        fired = []
+        for alert_id in fired_ids:
+            # Une alerte change_percent a deux seuils : retirer l'autre aussi
+            alert = self.remove(alert_id)
+            if alert is not None:
+                fired.append(alert)
+        return fired
+
+
+class PriceAlertEngine:
+    """
+    Moteur d'alertes de prix piloté par le flux de ticks
+
+    Remplace l'évaluation alerte par alerte de DatabaseService.check_price_alerts :
+    chaque tick coûte O(log n + k) pour les n alertes du symbole et les k
+    déclenchées. Les déclenchements sont mis en file et écrits en base par
+    lots (flush), depuis une tâche périodique quand le moteur est attaché à
+    un DataStream.
+    """
+
+    def __init__(
+        self,
+        db_service: DatabaseService = database_service,
+        flush_interval: float = 1.0,
+        max_batch: int = 500,
+    ):
+        """
+        Initialise le moteur
+
+        Args:
+            db_service: Service de persistance des déclenchements
+            flush_interval: Intervalle entre deux écritures par lot (s)
+            max_batch: Taille de file déclenchant un flush immédiat
+        """
+        self.db_service = db_service
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._indexes: Dict[str, SymbolAlertIndex] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._listeners: List[Callable[[IndexedAlert, float], None]] = []
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._data_stream = None
+
+        self.ticks_processed = 0
+        self.alerts_triggered = 0
+
+    # ------------------------------------------------------------------
+    # Gestion des alertes
+    # ------------------------------------------------------------------
+
+    def load_from_database(self) -> int:
+        """Indexe toutes les alertes actives non déclenchées"""
+        alerts = [
+            alert for alert in self.db_service.get_price_alerts(active_only=True)
+            if not alert.is_triggered
+        ]
+        with self._lock:
+            self._indexes.clear()
+        count = self.add_alerts(alerts)
+        logger.info(f"🔔 {count} alertes de prix indexées ({len(self._indexes)} symboles)")
+        return count
+
+    def add_alerts(self, alerts: Iterable[PriceAlert]) -> int:
+        count = 0
+        for alert in alerts:
+            count += self.add_alert(alert)
+        return count
+
+    def add_alert(self, alert: PriceAlert) -> bool:
+        """Indexe une alerte. Retourne False si elle est inactive ou incomplète"""
+        if not alert.is_active or alert.is_triggered:
+            return False
+        indexed = IndexedAlert.from_model(alert)
+        if indexed is None:
+            return False
+
+        with self._lock:
+            index = self._indexes.get(indexed.symbol)
+            if index is None:
+                index = self._indexes[indexed.symbol] = SymbolAlertIndex(indexed.symbol)
+            index.add(indexed)
+        return True
+
+    def remove_alert(self, alert_id: int, symbol: Optional[str] = None) -> bool:
+        with self._lock:
+            indexes = [self._indexes[symbol]] if symbol in self._indexes else (
+                [] if symbol else list(self._indexes.values())
+            )
+            for index in indexes:
+                if index.remove(alert_id) is not None:
+                    return True
+        return False
+
+    def add_listener(self, listener: Callable[[IndexedAlert, float], None]) -> None:
+        """Ajoute un callback appelé pour chaque alerte déclenchée"""
+        self._listeners.append(listener)
+
+    # ------------------------------------------------------------------
+    # Évaluation
+    # ------------------------------------------------------------------
+
+    def on_tick(self, symbol: str, price: float) -> List[IndexedAlert]:
+        """
+        Évalue un tick et met en file les déclenchements
+
+        Returns:
+            Alertes déclenchées par ce tick
+        """
+        if price is None or not math.isfinite(price):
+            return []
+
+        with self._lock:
+            self.ticks_processed += 1
+            index = self._indexes.get(symbol)
+            if index is None:
+                return []
+            fired = index.evaluate(price)
+            if not fired:
+                return []
+
+            triggered_at = datetime.utcnow()
+            self._pending.extend(
+                {"alert_id": alert.alert_id, "triggered_at": triggered_at}
+                for alert in fired
+            )
+            self.alerts_triggered += len(fired)
+            should_flush = len(self._pending) >= self.max_batch
+
+        for alert in fired:
+            logger.info(f"🔔 Alerte {alert.alert_id} déclenchée: {symbol} @ {price}")
+            for listener in self._listeners:
+                try:
+                    listener(alert, price)
+                except Exception as e:
+                    logger.error(f"❌ Erreur listener alerte: {e}")
+
+        if should_flush and self._flush_task is None:
+            self.flush()
+        return fired
+
+    def flush(self) -> int:
+        """Écrit les déclenchements en attente en base, en un seul lot"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+
+            try:
+                return self.db_service.mark_price_alerts_triggered(batch)
+            except Exception as e:
+                # Remettre le lot en file pour le prochain flush
+                with self._lock:
+                    self._pending[:0] = batch
+                logger.error(f"❌ Écriture des alertes déclenchées échouée: {e}")
+                return 0
+
+    # ------------------------------------------------------------------
+    # Flux temps réel
+    # ------------------------------------------------------------------
+
+    async def attach(self, data_stream) -> None:
+        """S'abonne aux ticks d'un DataStream et démarre les flush périodiques"""
+        self._data_stream = data_stream
+        await data_stream.add_observer(self._on_stream_update)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def detach(self) -> None:
+        if self._data_stream is not None:
+            await self._data_stream.remove_observer(self._on_stream_update)
+            self._data_stream = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await asyncio.to_thread(self.flush)
+
+    def start(self, data_stream) -> "concurrent.futures.Future[None]":
+        """
+        Attache le moteur au flux depuis un thread synchrone (démarrage de l'app)
+
+        L'abonnement et les flush périodiques vivent sur la boucle partagée ;
+        l'arrêt de celle-ci détache le moteur et écrit le dernier lot.
+        """
+        from src.thebot.services.async_callbacks import get_event_loop_worker
+
+        worker = get_event_loop_worker()
+        worker.register_cleanup(self.detach)
+        return worker.submit(self.attach(data_stream))
+
+    def stop(self) -> None:
+        """Détache le moteur du flux et écrit les déclenchements en attente"""
+        from src.thebot.services.async_callbacks import get_event_loop_worker
+
+        worker = get_event_loop_worker()
+        if worker.running:
+            worker.run(self.detach())
+        else:
+            self.flush()
+
+    def _on_stream_update(self, symbol: str, data) -> None:
+        self.on_tick(symbol, float(data.latest_price))
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._pending:
+                await asyncio.to_thread(self.flush)
+
+    # ------------------------------------------------------------------
+    # Statut
+    # ------------------------------------------------------------------
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symboles ayant au moins une alerte indexée"""
+        with self._lock:
+            return sorted(symbol for symbol, index in self._indexes.items() if len(index))
+
+    @property
+    def attached(self) -> bool:
+        return self._data_stream is not None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "symbols": len(self._indexes),
+                "indexed_alerts": sum(len(index) for index in self._indexes.values()),
+                "pending_writes": len(self._pending),
+                "ticks_processed": self.ticks_processed,
+                "alerts_triggered": self.alerts_triggered,
+                "attached": self._data_stream is not None,
+            }
+
+
+# Instance globale du moteur d'alertes
+price_alert_engine = PriceAlertEngine()
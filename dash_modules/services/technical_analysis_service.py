@@ -37,11 +37,12 @@ class TechnicalAnalysisService:
 
         try:
             result = {}
-            prices_array = np.array(prices)
+            # Somme cumulée partagée : chaque période en découle en O(n)
+            cumsum = np.concatenate(([0.0], np.cumsum(np.asarray(prices, dtype=float))))
 
             for period in periods:
                 if len(prices) >= period:
-                    ma = np.convolve(prices_array, np.ones(period), 'valid') / period
+                    ma = (cumsum[period:] - cumsum[:-period]) / period
                     result[f"SMA_{period}"] = ma.tolist()
                 else:
                     result[f"SMA_{period}"] = []
@@ -100,8 +101,9 @@ class TechnicalAnalysisService:
                 return {"trend": "insufficient_data", "strength": 0, "description": "Données insuffisantes"}
 
             # Calculer les moyennes mobiles
-            sma_20 = self.calculate_moving_averages(prices, [20])["SMA_20"]
-            sma_50 = self.calculate_moving_averages(prices, [50])["SMA_50"]
+            moving_averages = self.calculate_moving_averages(prices, [20, 50])
+            sma_20 = moving_averages["SMA_20"]
+            sma_50 = moving_averages["SMA_50"]
 
             if not sma_20 or not sma_50:
                 return {"trend": "insufficient_data", "strength": 0, "description": "Données insuffisantes"}
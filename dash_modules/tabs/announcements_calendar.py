@@ -939,6 +939,25 @@ class AnnouncementsCalendarModule:
 
         return events
 
+    # Mapping des catégories pour une correspondance flexible
+    CATEGORY_MAPPING = {
+        "monetary_policy": ["monetary_policy", "central_bank", "interest_rates"],
+        "inflation": ["inflation", "cpi", "ppi", "prices"],
+        "employment": ["employment", "jobs", "unemployment", "labor"],
+        "gdp_growth": ["gdp_growth", "gdp", "growth", "economic_growth"],
+        "industrial": ["industrial", "manufacturing", "factory", "production"],
+        "retail": ["retail", "sales", "consumer", "consumption"],
+        "trade": ["trade", "exports", "imports", "balance"],
+        "technology": ["technology", "tech", "innovation"],
+        "healthcare": ["healthcare", "health", "medical"],
+        "financial": ["financial", "banking", "finance"],
+        "energy": ["energy", "oil", "gas", "electricity"],
+        "crypto": ["crypto", "cryptocurrency", "bitcoin"],
+        "agriculture": ["agriculture", "farming", "food"],
+        "real_estate": ["real_estate", "housing", "property"],
+        "environment": ["environment", "climate", "green"],
+    }
+
     def _filter_by_categories(
         self, events: List[Dict], categories: List[str]
     ) -> List[Dict]:
@@ -946,59 +965,33 @@ class AnnouncementsCalendarModule:
         if not categories:
             return events
 
-        # Mapping des catégories pour une correspondance flexible
-        category_mapping = {
-            "monetary_policy": ["monetary_policy", "central_bank", "interest_rates"],
-            "inflation": ["inflation", "cpi", "ppi", "prices"],
-            "employment": ["employment", "jobs", "unemployment", "labor"],
-            "gdp_growth": ["gdp_growth", "gdp", "growth", "economic_growth"],
-            "industrial": ["industrial", "manufacturing", "factory", "production"],
-            "retail": ["retail", "sales", "consumer", "consumption"],
-            "trade": ["trade", "exports", "imports", "balance"],
-            "technology": ["technology", "tech", "innovation"],
-            "healthcare": ["healthcare", "health", "medical"],
-            "financial": ["financial", "banking", "finance"],
-            "energy": ["energy", "oil", "gas", "electricity"],
-            "crypto": ["crypto", "cryptocurrency", "bitcoin"],
-            "agriculture": ["agriculture", "farming", "food"],
-            "real_estate": ["real_estate", "housing", "property"],
-            "environment": ["environment", "climate", "green"],
-        }
-
-        # Debug: afficher les catégories demandées
-        logger.info(f"🔍 Filtrage par catégories: {categories}")
-        logger.info(f"📊 Événements avant filtrage: {len(events)}")
-
         # Créer une liste étendue de catégories acceptées
         extended_categories = set(categories)
         for cat in categories:
-            if cat in category_mapping:
-                extended_categories.update(category_mapping[cat])
-
-        logger.info(f"🔍 Catégories étendues acceptées: {sorted(extended_categories)}")
+            extended_categories.update(self.CATEGORY_MAPPING.get(cat, ()))
+        lowered = [cat.lower() for cat in categories]
 
+        # Décision calculée une fois par catégorie d'événement distincte
+        decisions: Dict[str, bool] = {}
         filtered_events = []
         for event in events:
             event_category = event.get("category", "").lower()
 
-            # Vérification de correspondance directe ou étendue
-            category_match = (
-                event_category in categories
-                or event_category in extended_categories
-                or any(cat.lower() in event_category for cat in categories)
-            )
+            category_match = decisions.get(event_category)
+            if category_match is None:
+                # Vérification de correspondance directe, étendue ou partielle
+                category_match = event_category in extended_categories or any(
+                    cat in event_category for cat in lowered
+                )
+                decisions[event_category] = category_match
 
             if category_match:
                 filtered_events.append(event)
-                logger.info(
-                    f"✅ Événement gardé: {event['title']} (catégorie: {event_category})"
-                )
-            else:
-                logger.info(
-                    f"❌ Événement filtré: {event['title']} (catégorie: {event_category})"
-                )
 
-        logger.info(f"📊 Événements après filtrage: {len(filtered_events)}")
+        logger.debug(
+            f"🔍 Filtrage par catégories {categories}: "
+            f"{len(events)} → {len(filtered_events)} événements"
+        )
         return filtered_events
 
     def generate_calendar_view(
@@ -91,9 +91,8 @@ def register_dropdown_callbacks(app) -> None:
                 top_symbols.insert(0, "BTCUSDT")
                 return [{"label": s, "value": s} for s in top_symbols]
 
-            # Recherche active: filtrer parmi TOUS les symboles
-            search_upper = search_value.upper()
-            filtered = [s for s in all_symbols if search_upper in s][:20]
+            # Recherche active: index partagé (préfixes, sous-chaînes, fautes de frappe)
+            filtered = binance_provider.search_symbols(search_value, limit=20)
 
             if filtered:
                 return [{"label": s, "value": s} for s in filtered]
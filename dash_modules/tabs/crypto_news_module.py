@@ -138,6 +138,36 @@ class CryptoNewsModule:
             logger.info(f"⚠️ Erreur traduction résumé crypto: {e}")
             return summary
 
+    def translate_articles(self, articles: List[Dict]) -> None:
+        """
+        Traduire titres et résumés d'articles crypto enrichis en un seul lot
+
+        Un appel à translate_many_to_french pour tout le flux, avec les mêmes
+        règles que translate_article_title / translate_article_summary
+        """
+        if not AI_AVAILABLE or not articles:
+            return
+
+        fields = []  # (article, champ, longueur minimale de la traduction)
+        for article in articles:
+            if isinstance(article["original_title"], str):
+                fields.append((article, "title", 3))
+            summary = article["original_summary"]
+            if isinstance(summary, str) and len(summary) > 10:
+                fields.append((article, "summary", 5))
+
+        try:
+            translated = smart_ai_manager.translate_many_to_french(
+                [article[f"original_{key}"] for article, key, _ in fields]
+            )
+        except Exception as e:
+            logger.info(f"⚠️ Erreur traduction articles crypto: {e}")
+            return
+
+        for (article, key, min_length), text in zip(fields, translated):
+            if text and len(text) > min_length:
+                article[key] = text
+
     def _format_date(self, date_value):
         """Formater une date pour l'affichage"""
         if not date_value or date_value in ["N/A", "Unknown Date", ""]:
@@ -195,17 +225,12 @@ class CryptoNewsModule:
                         "summary", article.get("description", "No summary")
                     )
 
-                    translated_title = self.translate_article_title(original_title)
-                    translated_summary = self.translate_article_summary(
-                        original_summary
-                    )
-
-                    # Créer article enrichi avec traduction et mapping des champs
+                    # Créer article enrichi (traduction en lot après sélection)
                     enriched_article = {
                         **article,
-                        "title": translated_title,
+                        "title": original_title,
                         "original_title": original_title,
-                        "summary": translated_summary,
+                        "summary": original_summary,
                         "original_summary": original_summary,
                         # Mapper les champs de date pour uniformité
                         "published_time": article.get("published_time")
@@ -226,6 +251,7 @@ class CryptoNewsModule:
                 key=lambda x: x.get("published_time", datetime.now()),
                 reverse=True,
             )[:30]
+            self.translate_articles(crypto_news)
 
             self.news_cache = crypto_news
             self.last_update = datetime.now()
@@ -154,6 +154,37 @@ class EconomicNewsModule:
             logger.info(f"❌ Erreur traduction résumé: {e}")
             return summary
 
+    def translate_articles(self, articles: List[Dict]) -> None:
+        """
+        Traduire titres et résumés d'articles enrichis en un seul lot
+
+        Un appel à translate_many_to_french pour tout le flux, avec les mêmes
+        règles que translate_article_title / translate_article_summary
+        """
+        if not AI_AVAILABLE or not articles:
+            return
+
+        fields = []  # (article, champ, longueur minimale de la traduction)
+        for article in articles:
+            title = article["original_title"]
+            if len(title) > 5 and title != "Titre non disponible":
+                fields.append((article, "title", 3))
+            summary = article["original_summary"]
+            if len(summary) > 10 and summary != "Résumé non disponible":
+                fields.append((article, "summary", 10))
+
+        try:
+            translated = smart_ai_manager.translate_many_to_french(
+                [article[f"original_{key}"] for article, key, _ in fields]
+            )
+        except Exception as e:
+            logger.info(f"❌ Erreur traduction articles: {e}")
+            return
+
+        for (article, key, min_length), text in zip(fields, translated):
+            if text and len(text.strip()) > min_length:
+                article[key] = text
+
     def _format_date(self, date_value):
         """Formater une date pour l'affichage - identique au module crypto"""
         if not date_value or date_value in ["N/A", "Unknown Date", ""]:
@@ -260,30 +291,11 @@ class EconomicNewsModule:
                         or "Récent"
                     )
 
-                    # Traduire seulement si contenu valide
-                    if (
-                        len(original_title) > 5
-                        and original_title != "Titre non disponible"
-                    ):
-                        translated_title = self.translate_article_title(original_title)
-                    else:
-                        translated_title = original_title
-
-                    if (
-                        len(original_summary) > 10
-                        and original_summary != "Résumé non disponible"
-                    ):
-                        translated_summary = self.translate_article_summary(
-                            original_summary
-                        )
-                    else:
-                        translated_summary = original_summary
-
-                    # Enrichir article
+                    # Enrichir article (traduction en lot après sélection)
                     enriched_article = {
-                        "title": translated_title,
+                        "title": original_title,
                         "original_title": original_title,
-                        "summary": translated_summary,
+                        "summary": original_summary,
                         "original_summary": original_summary,
                         "source": source,
                         "published_time": published_time,
@@ -325,12 +337,15 @@ class EconomicNewsModule:
                 key=lambda x: (x["relevance_score"], x["published_time"]), reverse=True
             )
 
+            selected = economic_news[:limit]
+            self.translate_articles(selected)
+
             logger.info(
                 f"✅ {len(economic_news)} news économiques RSS récupérées (traduites)"
             )
 
             return {
-                "news": economic_news[:limit],
+                "news": selected,
                 "total": len(economic_news),
                 "source": "RSS",
                 "categories": ["economy", "business", "finance"],
@@ -19,6 +19,9 @@ from src.thebot.core.calculators import TechnicalCalculators
 from src.thebot.core.data import AsyncDataManager
 from src.thebot.core.launcher_callbacks import LauncherCallbacks
 from src.thebot.core.layout_manager import LayoutManager, layout_manager
+from src.thebot.core.metrics import install_flask_metrics
+from src.thebot.core.startup import lazy_singleton, startup_profiler
+from src.thebot.services.callback_profiler import get_callback_profiler
 
 # Import style trading manager
 from src.thebot.core.style_trading import trading_style_manager
@@ -32,8 +35,8 @@ from src.thebot.tabs.forex_module import ForexModule
 from src.thebot.tabs.stocks_module import StocksModule
 from src.thebot.tabs.strategies_module import StrategiesModule
 
-# Instance partagée des calculateurs
-shared_calculators = TechnicalCalculators()
+# Instance partagée des calculateurs (construite au premier usage)
+shared_calculators = lazy_singleton(TechnicalCalculators, name="TechnicalCalculators")
 
 # Configuration du logging - Mode Production Optimisé
 logging.basicConfig(
@@ -70,7 +73,7 @@ class THEBOTApp:
         self.app = self._create_dash_app()
 
         # Managers MVC
-        self.data_manager = AsyncDataManager()
+        self.data_manager = lazy_singleton(AsyncDataManager, name="AsyncDataManager")
         self.layout_manager = layout_manager
 
         # Modules métier
@@ -115,6 +118,14 @@ class THEBOTApp:
             )
 
             app.title = "THEBOT - Trading Intelligence Platform"
+
+            # Latence des callbacks + export Prometheus sur /metrics
+            install_flask_metrics(app.server)
+
+            # Profilage par callback (opt-in : THEBOT_CALLBACK_PROFILING=1)
+            callback_profiler = get_callback_profiler()
+            if callback_profiler.enabled:
+                callback_profiler.instrument(app)
             # Supprimé : log création Dash non critique
             return app
 
@@ -125,9 +136,12 @@ class THEBOTApp:
     def _initialize(self) -> None:
         """Initialise tous les composants de l'application"""
         try:
-            self._init_modules()
-            self._setup_layout()
-            self._setup_callbacks()
+            with startup_profiler.measure("init_modules", "startup"):
+                self._init_modules()
+            with startup_profiler.measure("setup_layout", "startup"):
+                self._setup_layout()
+            with startup_profiler.measure("setup_callbacks", "startup"):
+                self._setup_callbacks()
             # Supprimé : log initialisation redondant
 
         except Exception as e:
@@ -139,24 +153,31 @@ class THEBOTApp:
         try:
             # Supprimé : log modules redondant
 
-            # Modules avec calculateurs partagés
-            self.modules = {
-                "crypto": CryptoModule(),
-                "forex": ForexModule(calculators=shared_calculators),
-                "stocks": StocksModule(calculators=shared_calculators),
-                "economic_news": EconomicNewsModule(calculators=shared_calculators),
-                "crypto_news": CryptoNewsModule(calculators=shared_calculators),
-                "announcements_calendar": AnnouncementsCalendarModule(
+            # Modules avec calculateurs partagés : construction légère uniquement,
+            # le layout et les données sont chargés à la première sélection d'onglet
+            module_factories = {
+                "crypto": lambda: CryptoModule(),
+                "forex": lambda: ForexModule(calculators=shared_calculators),
+                "stocks": lambda: StocksModule(calculators=shared_calculators),
+                "economic_news": lambda: EconomicNewsModule(calculators=shared_calculators),
+                "crypto_news": lambda: CryptoNewsModule(calculators=shared_calculators),
+                "announcements_calendar": lambda: AnnouncementsCalendarModule(
                     calculators=shared_calculators
                 ),
-                "strategies": StrategiesModule(calculators=shared_calculators),
+                "strategies": lambda: StrategiesModule(calculators=shared_calculators),
             }
 
+            self.modules = {}
+            for module_name, factory in module_factories.items():
+                with startup_profiler.measure(module_name, "module"):
+                    self.modules[module_name] = factory()
+
             # Configuration des callbacks pour chaque module
             for module_name, module in self.modules.items():
                 if hasattr(module, "setup_callbacks"):
                     try:
-                        module.setup_callbacks(self.app)
+                        with startup_profiler.measure(module_name, "callbacks"):
+                            module.setup_callbacks(self.app)
                         # Supprimé : log callbacks individual modules
                     except Exception as e:
                         logger.error(f"❌ Erreur callbacks {module_name}: {e}")
@@ -170,11 +191,8 @@ class THEBOTApp:
     def _setup_layout(self) -> None:
         """Configure le layout principal via LayoutManager"""
         try:
-            # Récupérer les données par défaut
-            all_symbols = self.data_manager.get_all_binance_symbols_sync()
-            default_data = self._get_default_data()
-
-            # Créer le layout via le LayoutManager avec les modules
+            # Squelette uniquement : aucun accès réseau avant le premier rendu,
+            # le contenu des onglets est construit par le callback main-tabs
             self.app.layout = self.layout_manager.create_main_layout(self.modules)
 
             # Supprimé : log layout setup
@@ -257,6 +275,15 @@ class THEBOTApp:
 
         return info
 
+    def get_startup_profile(self) -> Dict[str, Any]:
+        """
+        Retourne le profil de démarrage (coût par module, singleton et onglet)
+
+        Returns:
+            Dict: Rapport du StartupProfiler
+        """
+        return startup_profiler.report()
+
     def get_cache_info(self) -> Dict[str, Any]:
         """
         Retourne les informations du cache
@@ -282,9 +309,20 @@ class THEBOTApp:
             # Seul log de démarrage vraiment utile
             logger.info(f"THEBOT démarré: http://{host}:{self.port}")
 
-            # Afficher les informations des modules
-            module_info = self.get_module_info()
-            # Supprimé : info modules non critique
+            # Profil de démarrage (coût d'initialisation par module)
+            logger.info(startup_profiler.format_report())
+
+            # Ingestion RSS en arrière-plan : les callbacks news lisent le store
+            from dash_modules.data_providers.news_ingestion_scheduler import (
+                news_ingestion_scheduler,
+            )
+
+            news_ingestion_scheduler.start()
+
+            # Flux temps réel : chaque tick est évalué par le moteur d'alertes indexé
+            from dash_modules.core.alerts_monitor import alerts_monitor
+
+            alerts_monitor.start_monitoring()
 
             # Lancer l'application
             self.app.run(
@@ -302,6 +340,20 @@ class THEBOTApp:
     def shutdown(self) -> None:
         """Arrêt propre de l'application"""
         try:
+            from dash_modules.data_providers.news_ingestion_scheduler import (
+                news_ingestion_scheduler,
+            )
+
+            news_ingestion_scheduler.stop()
+
+            from dash_modules.core.alerts_monitor import alerts_monitor
+
+            alerts_monitor.stop_monitoring()
+
+            # Clients async (sessions aiohttp, WebSocket) de la boucle partagée
+            from src.thebot.services.async_callbacks import get_event_loop_worker
+
+            get_event_loop_worker().stop()
             self.clear_cache()
             logger.info("🛑 Application THEBOT arrêtée proprement")
         except Exception as e:
@@ -0,0 +1,37 @@
+"""Unique bar key on price_history for bulk upserts
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Supprimer les doublons existants (on garde la ligne la plus ancienne)
+    op.execute(
+        """
+        DELETE FROM price_history
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM price_history
+            GROUP BY symbol, provider, interval, market_timestamp
+        )
+        """
+    )
+    op.create_index(
+        'ux_price_history_bar',
+        'price_history',
+        ['symbol', 'provider', 'interval', 'market_timestamp'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_price_history_bar', table_name='price_history')
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Benchmark de démarrage THEBOT
+Mesure le coût d'import par module (-X importtime), la construction des
+singletons et des modules, et le temps jusqu'au premier layout, puis compare
+le résultat à un budget. Code de sortie 1 si le budget régresse.
+
+Usage:
+    python scripts/startup_benchmark.py
+    python scripts/startup_benchmark.py --runs 5 --output startup_report.json
+    python scripts/startup_benchmark.py --budget scripts/startup_budget.json --top 30
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.thebot.core.startup import check_budget, parse_importtime  # noqa: E402
+
+DEFAULT_BUDGET = Path(__file__).resolve().parent / "startup_budget.json"
+REPORT_MARKER = "STARTUP_REPORT:"
+
+# Exécuté dans un interpréteur neuf (-X importtime) pour chaque mesure à froid
+DRIVER = f"""
+import json, logging, time
+t0 = time.perf_counter()
+import launch_dash_professional as launcher
+t1 = time.perf_counter()
+logging.disable(logging.CRITICAL)
+
+app = launcher.THEBOTApp()
+t2 = time.perf_counter()
+
+import plotly.utils
+layout = app.app.layout
+tabs = next(c for c in layout._traverse() if getattr(c, "id", None) == "main-tabs")
+content = app.callbacks_handler.render_tab(tabs.value)
+json.dumps([layout, content], cls=plotly.utils.PlotlyJSONEncoder)
+t3 = time.perf_counter()
+
+from src.thebot.core.startup import startup_profiler
+print({REPORT_MARKER!r} + json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "app_init_ms": (t2 - t1) * 1000,
+    "first_layout_ms": (t3 - t2) * 1000,
+    "total_ms": (t3 - t0) * 1000,
+    "profile": startup_profiler.report(),
+}}))
+"""
+
+
+def run_once(timeout: float) -> Dict[str, Any]:
+    """Lance une mesure à froid dans un sous-processus"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", DRIVER],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    line = next(
+        (l for l in result.stdout.splitlines() if l.startswith(REPORT_MARKER)), None
+    )
+    if result.returncode != 0 or line is None:
+        raise RuntimeError(
+            f"Startup run failed (exit {result.returncode}):\n{result.stderr[-2000:]}"
+        )
+
+    run = json.loads(line[len(REPORT_MARKER):])
+    run["imports"] = parse_importtime(result.stderr)
+    return run
+
+
+def aggregate(runs: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    """Médiane des mesures sur plusieurs exécutions"""
+
+    def median(values: List[float]) -> float:
+        return round(statistics.median(values), 2)
+
+    metrics = {
+        key: median([run[key] for run in runs])
+        for key in ("import_ms", "app_init_ms", "first_layout_ms", "total_ms")
+    }
+
+    imports: Dict[str, Dict[str, List[float]]] = {}
+    for run in runs:
+        for name, timing in run["imports"].items():
+            entry = imports.setdefault(name, {"self_ms": [], "cumulative_ms": []})
+            entry["self_ms"].append(timing["self_ms"])
+            entry["cumulative_ms"].append(timing["cumulative_ms"])
+    import_table = sorted(
+        (
+            {
+                "module": name,
+                "self_ms": median(timing["self_ms"]),
+                "cumulative_ms": median(timing["cumulative_ms"]),
+            }
+            for name, timing in imports.items()
+        ),
+        key=lambda e: e["self_ms"],
+        reverse=True,
+    )
+
+    steps: Dict[str, List[float]] = {}
+    for run in runs:
+        for entry in run["profile"]["entries"]:
+            key = f"{entry['category']}:{entry['name']}"
+            steps.setdefault(key, []).append(entry["duration_ms"])
+    step_table = sorted(
+        ({"step": key, "duration_ms": median(values)} for key, values in steps.items()),
+        key=lambda e: e["duration_ms"],
+        reverse=True,
+    )
+
+    # Mesures à plat pour le budget : métriques globales, étapes et imports
+    flat = dict(metrics)
+    flat.update({entry["step"]: entry["duration_ms"] for entry in step_table})
+    flat.update({f"import:{e['module']}": e["cumulative_ms"] for e in import_table})
+
+    return {
+        "metrics": metrics,
+        "steps": step_table,
+        "top_imports": import_table[:top],
+        "flat": flat,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="THEBOT startup benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Mesures à froid (médiane)")
+    parser.add_argument("--budget", type=Path, default=DEFAULT_BUDGET)
+    parser.add_argument("--output", type=Path, default=ROOT / "startup_report.json")
+    parser.add_argument("--top", type=int, default=25, help="Imports listés dans le rapport")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    runs = [run_once(args.timeout) for _ in range(max(1, args.runs))]
+    results = aggregate(runs, args.top)
+
+    budget = json.loads(args.budget.read_text()) if args.budget.exists() else {}
+    violations = check_budget(results.pop("flat"), budget)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "runs": len(runs),
+        **results,
+        "budget": budget,
+        "violations": violations,
+        "passed": not violations,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+
+    metrics = report["metrics"]
+    print(
+        f"⏱️ import {metrics['import_ms']:.0f} ms | app init {metrics['app_init_ms']:.0f} ms | "
+        f"first layout {metrics['first_layout_ms']:.0f} ms | total {metrics['total_ms']:.0f} ms"
+    )
+    for entry in report["top_imports"][:10]:
+        print(f"  {entry['self_ms']:>8.1f} ms  {entry['module']}")
+    for violation in violations:
+        print(
+            f"❌ {violation['metric']}: {violation['value_ms']} ms "
+            f"> {violation['allowed_ms']} ms (budget {violation['budget_ms']} ms)"
+        )
+    print(f"📄 Report written to {args.output}")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
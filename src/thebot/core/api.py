@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 from .cache import cached_api_call, get_global_cache
+from .latency_router import LatencyRouter
 
 logger = logging.getLogger(__name__)
 
@@ -52,14 +53,17 @@ class SpecializedAPIManager:
         # Providers disponibles (sera initialisé par real_data_manager)
         self.providers = {}
 
+        # Routage par latence EWMA avec requêtes couvertes entre providers
+        self.router = LatencyRouter()
+
     def set_providers(self, providers: Dict):
         """Configure les providers disponibles"""
         self.providers = providers
         logger.info(f"📊 Providers configurés: {list(providers.keys())}")
 
-    def get_optimal_provider(self, symbol: str, data_type: str = "ohlcv") -> str:
+    def get_provider_candidates(self, symbol: str, data_type: str = "ohlcv") -> List[str]:
         """
-        Détermine le provider optimal pour un symbole donné
+        Liste les providers utilisables pour un symbole, par ordre de préférence
         """
         # Validation basique du symbole
         if not isinstance(symbol, str) or not symbol.strip():
@@ -71,27 +75,38 @@ class SpecializedAPIManager:
         config = self.specialization_config.get(market_type, {})
 
         if data_type == "news":
-            return config.get("news", "rss")
+            return [config.get("news", "rss")]
 
-        # Pour les données OHLCV/prix
-        primary = config.get("primary")
-        if primary and primary in self.providers:
-            return primary
-
-        # Fallback vers providers secondaires
-        for provider_name in config.get("fallback_order", []):
-            if provider_name in self.providers:
-                logger.warning(f"🔄 Fallback vers {provider_name} pour {symbol}")
-                return provider_name
+        # Pour les données OHLCV/prix : primaire puis ordre de fallback
+        preferred = [config.get("primary")] + config.get("fallback_order", [])
+        candidates = [
+            name for name in dict.fromkeys(preferred) if name and name in self.providers
+        ]
+        if candidates:
+            return candidates
 
         # Dernière option: premier provider disponible
         if self.providers:
             fallback = list(self.providers.keys())[0]
             logger.warning(f"⚠️ Utilisation fallback {fallback} pour {symbol}")
-            return fallback
+            return [fallback]
 
         raise ValueError(f"Aucun provider disponible pour {symbol}")
 
+    def get_optimal_provider(self, symbol: str, data_type: str = "ohlcv") -> str:
+        """
+        Détermine le provider optimal pour un symbole donné
+        (le plus rapide et fiable d'après les latences mesurées)
+        """
+        candidates = self.get_provider_candidates(symbol, data_type)
+        if data_type == "news":
+            return candidates[0]
+
+        optimal = self.router.rank(candidates)[0]
+        if optimal != candidates[0]:
+            logger.warning(f"🔄 Fallback vers {optimal} pour {symbol.upper().strip()}")
+        return optimal
+
     def _detect_market_type(self, symbol: str) -> str:
         """
         Détecte le type de marché d'un symbole
@@ -151,36 +166,46 @@ class SpecializedAPIManager:
     ) -> Optional[List[Dict]]:
         """
         Récupère des données OHLCV en utilisant le provider optimal
+
+        Le provider le plus rapide est interrogé en premier ; au-delà de son
+        p95, une requête couverte part vers le provider suivant et la première
+        réponse valide est retenue. Un échec bascule aussitôt sur le suivant.
         """
         try:
-            provider_name = self.get_optimal_provider(symbol, "ohlcv")
-            provider = self.providers.get(provider_name)
-
-            if not provider:
-                logger.error(
-                    f"❌ Provider {provider_name} non disponible pour {symbol}"
-                )
+            candidates = [
+                name
+                for name in self.get_provider_candidates(symbol, "ohlcv")
+                if name in ("binance", "coin_gecko", "twelve_data")
+            ]
+            if not candidates:
+                logger.warning(f"⚠️ Aucun provider spécialisé pour {symbol}")
                 return None
 
-            logger.info(f"📊 Utilisation {provider_name} pour {symbol} ({timeframe})")
-
-            # Appel spécialisé selon le provider
-            if provider_name == "binance":
-                return self._get_binance_data(provider, symbol, timeframe, limit)
-            elif provider_name == "coin_gecko":
-                return self._get_coingecko_data(provider, symbol, timeframe, limit)
-            elif provider_name == "twelve_data":
-                return self._get_twelve_data(provider, symbol, timeframe, limit)
-            else:
-                logger.warning(
-                    f"⚠️ Provider {provider_name} non spécialisé pour {symbol}"
-                )
-                return None
+            logger.info(f"📊 Providers {candidates} pour {symbol} ({timeframe})")
+            return self.router.call(
+                candidates,
+                lambda provider_name: self._fetch_ohlcv(provider_name, symbol, timeframe, limit),
+            )
 
         except Exception as e:
             logger.error(f"❌ Erreur données optimisées {symbol}: {e}")
             return None
 
+    def _fetch_ohlcv(
+        self, provider_name: str, symbol: str, timeframe: str, limit: int
+    ) -> Optional[List[Dict]]:
+        """Appel spécialisé selon le provider"""
+        provider = self.providers.get(provider_name)
+        if not provider:
+            logger.error(f"❌ Provider {provider_name} non disponible pour {symbol}")
+            return None
+
+        if provider_name == "binance":
+            return self._get_binance_data(provider, symbol, timeframe, limit)
+        elif provider_name == "coin_gecko":
+            return self._get_coingecko_data(provider, symbol, timeframe, limit)
+        return self._get_twelve_data(provider, symbol, timeframe, limit)
+
     def _get_binance_data(
         self, provider, symbol: str, timeframe: str, limit: int
     ) -> Optional[List[Dict]]:
@@ -349,6 +374,7 @@ class SpecializedAPIManager:
             "specialization_config": self.specialization_config,
             "active_providers": list(self.providers.keys()),
             "cache_performance": cache_stats,
+            "provider_routing": self.router.get_stats(),
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -12,6 +12,8 @@ import time
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, Optional
 
+from .metrics import cache_requests
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +50,7 @@ class IntelligentCache:
     def _generate_key(self, prefix: str, **kwargs) -> str:
         """Génère une clé de cache unique"""
         # Créer signature à partir des paramètres
-        params_str = json.dumps(kwargs, sort_keys=True)
+        params_str = json.dumps(kwargs, sort_keys=True, default=repr)
         params_hash = hashlib.md5(params_str.encode()).hexdigest()[:8]
         return f"{prefix}_{params_hash}"
 
@@ -58,6 +60,7 @@ class IntelligentCache:
 
         with self._lock:
             if key not in self._cache:
+                cache_requests.labels("intelligent", "miss").inc()
                 return None
 
             entry = self._cache[key]
@@ -67,8 +70,11 @@ class IntelligentCache:
                 del self._cache[key]
                 if key in self._access_stats:
                     del self._access_stats[key]
+                cache_requests.labels("intelligent", "miss").inc()
                 return None
 
+            cache_requests.labels("intelligent", "hit").inc()
+
             # Mettre à jour les stats d'accès
             self._update_access_stats(key)
 
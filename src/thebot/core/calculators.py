@@ -8,6 +8,8 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from src.thebot.indicators.graph import indicator_planner
+
 # Import de la factory unifiée
 try:
     from thebot.indicators.factory import get_indicator_factory
@@ -439,6 +441,25 @@ class TechnicalCalculators:
 
         return {"k": k_percent.fillna(50).tolist(), "d": d_percent.fillna(50).tolist()}
 
+    def calculate_indicator_set(
+        self, data: pd.DataFrame, requests: List[Any]
+    ) -> Dict[str, Dict[str, List[float]]]:
+        """
+        Calculer plusieurs indicateurs sur le même DataFrame OHLCV
+
+        Planifié via le graphe d'indicateurs partagé : EMA, SMA, écart-type et
+        true range communs (MACD, Bollinger, Squeeze, ATR...) ne sont calculés
+        qu'une fois.
+
+        Returns:
+            {label indicateur: {sortie: valeurs}}
+        """
+        outputs = indicator_planner.compute(data, requests)
+        return {
+            label: {column: frame[column].fillna(0).tolist() for column in frame.columns}
+            for label, frame in outputs.items()
+        }
+
 
 # Instance globale
 calculator = TechnicalCalculators()
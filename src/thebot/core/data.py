@@ -4,11 +4,10 @@ Data Manager - Gestion Centralisée des Données THEBOT
 Architecture MVC - Couche MODEL conforme .clinerules
 """
 
-import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import aiohttp
 import numpy as np
@@ -388,28 +387,33 @@ class AsyncDataManager:
                 index=[datetime.now()],
             )
 
+    def _run_on_worker(self, factory: Callable[[], Awaitable[Any]], key: Optional[tuple] = None) -> Any:
+        """
+        Exécute une coroutine sur la boucle persistante partagée
+
+        La session aiohttp vit sur cette boucle et est réutilisée d'un appel à
+        l'autre (fermée à l'arrêt du worker) ; les appels concurrents de même
+        clé partagent la même requête en vol.
+        """
+        from src.thebot.services.async_callbacks import get_event_loop_worker
+
+        worker = get_event_loop_worker()
+        worker.register_cleanup(self._close_session)
+        timeout = self.config.timeout_seconds * 3
+        if key is None:
+            return worker.run(factory(), timeout)
+        return worker.run_shared((id(self), *key), factory, timeout)
+
     def get_all_binance_symbols_sync(self) -> List[str]:
         """
         Version synchrone de get_all_binance_symbols pour compatibilité
-        Utilise asyncio.run() pour wrapper l'appel async
+        Exécutée sur la boucle d'événements persistante (EventLoopWorker)
 
         Returns:
             List[str]: Liste des symboles Binance
         """
         try:
-            # Créer un event loop temporaire si nécessaire
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # Si un loop est déjà en cours, utiliser asyncio.create_task
-                    import nest_asyncio
-                    nest_asyncio.apply()
-                    return loop.run_until_complete(self.get_all_binance_symbols())
-                else:
-                    return loop.run_until_complete(self.get_all_binance_symbols())
-            except RuntimeError:
-                # Pas de loop existant, en créer un nouveau
-                return asyncio.run(self.get_all_binance_symbols())
+            return self._run_on_worker(self.get_all_binance_symbols)
         except Exception as e:
             self.logger.error(f"❌ Erreur get_all_binance_symbols_sync: {e}")
             return self.get_popular_symbols()
@@ -417,7 +421,7 @@ class AsyncDataManager:
     def load_symbol_data_sync(self, symbol: str, interval: str = "1h", limit: int = 200) -> pd.DataFrame:
         """
         Version synchrone de load_symbol_data pour compatibilité
-        Utilise asyncio.run() pour wrapper l'appel async
+        Exécutée sur la boucle d'événements persistante (EventLoopWorker)
 
         Args:
             symbol: Symbole à charger
@@ -428,21 +432,10 @@ class AsyncDataManager:
             pd.DataFrame: Données du symbole
         """
         try:
-            # Wrapper async vers sync
-            async def _load_async():
-                async with self:
-                    return await self.load_symbol_data(symbol, interval, limit)
-
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    import nest_asyncio
-                    nest_asyncio.apply()
-                    return loop.run_until_complete(_load_async())
-                else:
-                    return loop.run_until_complete(_load_async())
-            except RuntimeError:
-                return asyncio.run(_load_async())
+            return self._run_on_worker(
+                lambda: self.load_symbol_data(symbol, interval, limit),
+                key=("load_symbol_data", symbol, interval, limit),
+            )
         except Exception as e:
             self.logger.error(f"❌ Erreur load_symbol_data_sync pour {symbol}: {e}")
             return self._create_fallback_data(symbol)
@@ -0,0 +1,270 @@
+"""
+News Deduplication - Détection de quasi-doublons pour THEBOT
+Regroupe les articles syndiqués/réécrits en "stories" via MinHash LSH
+"""
+
+import logging
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Nombre premier > 2^32 : (a * x + b) % p tient dans un uint64 pour x, a, b < 2^32
+_HASH_PRIME = np.uint64(4294967311)
+_TOKEN_RE = re.compile(r"[a-z0-9À-ÿ]+")
+_STOPWORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or that the
+    to was were will with after over new says said
+    le la les un une des de du et en au aux pour par sur dans est que qui
+    """.split()
+)
+
+
+@dataclass
+class NewsStory:
+    """Groupe d'articles décrivant le même événement"""
+
+    story_id: int
+    representative: Dict[str, Any]
+    signature: np.ndarray
+    band_keys: List[Tuple[int, bytes]]
+    urls: Set[str] = field(default_factory=set)
+    sources: Set[str] = field(default_factory=set)
+    first_seen: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    last_seen: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def size(self) -> int:
+        return max(1, len(self.urls))
+
+
+class NearDuplicateIndex:
+    """
+    Index MinHash LSH persistant entre deux rafraîchissements
+
+    Chaque article est réduit à l'ensemble de ses mots significatifs (titre +
+    début du résumé), signé par MinHash puis rangé dans des buckets LSH. Un
+    nouvel article ne se compare qu'aux stories partageant un bucket : le
+    coût par article est constant, quelle que soit la taille de l'index.
+    Les textes trop courts ne sont fusionnés que sur correspondance exacte
+    pour éviter de regrouper des titres génériques.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.5,
+        min_tokens: int = 4,
+        summary_words: int = 30,
+        max_stories: int = 5000,
+        seed: int = 42,
+    ):
+        """
+        Initialise l'index
+
+        Args:
+            num_perm: Nombre de permutations MinHash
+            bands: Nombre de bandes LSH (num_perm doit être divisible)
+            threshold: Similarité de Jaccard estimée minimale pour fusionner
+            min_tokens: Nombre de mots sous lequel seule l'égalité exacte fusionne
+            summary_words: Nombre de mots du résumé pris en compte
+            max_stories: Taille maximale de l'index (éviction LRU)
+            seed: Graine des permutations (signatures stables entre exécutions)
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.min_tokens = min_tokens
+        self.summary_words = summary_words
+        self.max_stories = max_stories
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 2**32 - 1, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 2**32 - 1, size=num_perm, dtype=np.uint64)
+
+        self._stories: "OrderedDict[int, NewsStory]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, bytes], Set[int]] = {}
+        self._url_index: Dict[str, int] = {}
+        self._next_id = 1
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Signature
+    # ------------------------------------------------------------------
+
+    def _tokens(self, article: Dict[str, Any]) -> Set[str]:
+        title = article.get("title", "") or ""
+        summary = article.get("summary", "") or article.get("description", "") or ""
+        summary = " ".join(summary.split()[: self.summary_words])
+        text = f"{title} {summary}".lower()
+        return {t for t in _TOKEN_RE.findall(text) if t not in _STOPWORDS}
+
+    def _signature(self, tokens: Set[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(t.encode("utf-8")) for t in tokens),
+            dtype=np.uint64,
+            count=len(tokens),
+        )
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _HASH_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray, exact: bool) -> List[Tuple[int, bytes]]:
+        if exact:
+            # Textes courts : une seule clé sur la signature complète
+            return [(-1, signature.tobytes())]
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    # ------------------------------------------------------------------
+    # Indexation
+    # ------------------------------------------------------------------
+
+    def add(self, article: Dict[str, Any]) -> Tuple[NewsStory, bool]:
+        """
+        Rattache un article à une story existante ou en crée une
+
+        Returns:
+            (story, is_new_story)
+        """
+        url = (article.get("url", "") or "").strip().lower()
+        source = article.get("rss_source_name") or article.get("source") or ""
+
+        with self._lock:
+            if url and url in self._url_index:
+                story = self._stories[self._url_index[url]]
+                self._touch(story, url, source)
+                return story, False
+
+            tokens = self._tokens(article)
+            if not tokens:
+                tokens = {url or str(id(article))}
+            exact = len(tokens) < self.min_tokens
+            signature = self._signature(tokens)
+            band_keys = self._band_keys(signature, exact)
+
+            story = self._find_match(signature, band_keys, exact)
+            if story is not None:
+                self._touch(story, url, source)
+                return story, False
+
+            story = NewsStory(
+                story_id=self._next_id,
+                representative=article,
+                signature=signature,
+                band_keys=band_keys,
+            )
+            self._next_id += 1
+            self._stories[story.story_id] = story
+            for key in band_keys:
+                self._buckets.setdefault(key, set()).add(story.story_id)
+            self._touch(story, url, source)
+            self._evict()
+            return story, True
+
+    def _find_match(
+        self, signature: np.ndarray, band_keys: List[Tuple[int, bytes]], exact: bool
+    ) -> Optional[NewsStory]:
+        candidates: Set[int] = set()
+        for key in band_keys:
+            candidates.update(self._buckets.get(key, ()))
+
+        best, best_score = None, 0.0
+        for story_id in candidates:
+            story = self._stories[story_id]
+            score = float(np.mean(story.signature == signature))
+            if score > best_score:
+                best, best_score = story, score
+
+        required = 1.0 if exact else self.threshold
+        return best if best is not None and best_score >= required else None
+
+    def _touch(self, story: NewsStory, url: str, source: str) -> None:
+        if url:
+            story.urls.add(url)
+            self._url_index[url] = story.story_id
+        if source:
+            story.sources.add(source)
+        story.last_seen = datetime.now(timezone.utc)
+        self._stories.move_to_end(story.story_id)
+
+    def _evict(self) -> None:
+        while len(self._stories) > self.max_stories:
+            _, story = self._stories.popitem(last=False)
+            for key in story.band_keys:
+                bucket = self._buckets.get(key)
+                if bucket:
+                    bucket.discard(story.story_id)
+                    if not bucket:
+                        del self._buckets[key]
+            for url in story.urls:
+                if self._url_index.get(url) == story.story_id:
+                    del self._url_index[url]
+
+    # ------------------------------------------------------------------
+    # API haut niveau
+    # ------------------------------------------------------------------
+
+    def deduplicate(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Réduit une liste d'articles à un représentant canonique par story
+
+        L'ordre de première apparition dans la liste est conservé. Le
+        représentant d'une story est son premier article de la liste courante
+        (le plus récent si la liste est triée par date) : la date et les champs
+        viennent du rafraîchissement en cours, pas du premier article jamais vu.
+        Chaque représentant est annoté avec story_id, duplicate_count et
+        related_sources.
+        """
+        members: Dict[int, Tuple[NewsStory, Dict[str, Any]]] = {}
+        for article in articles:
+            story, _ = self.add(article)
+            members.setdefault(story.story_id, (story, article))
+
+        result = []
+        with self._lock:
+            for story, article in members.values():
+                story.representative = article
+                representative = dict(article)
+                representative["story_id"] = story.story_id
+                representative["duplicate_count"] = story.size - 1
+                representative["related_sources"] = sorted(story.sources)
+                result.append(representative)
+
+        logger.debug(f"🔄 Deduplicated {len(articles)} → {len(result)} stories")
+        return result
+
+    def get_story(self, story_id: int) -> Optional[NewsStory]:
+        with self._lock:
+            return self._stories.get(story_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stories.clear()
+            self._buckets.clear()
+            self._url_index.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "stories": len(self._stories),
+                "indexed_urls": len(self._url_index),
+                "buckets": len(self._buckets),
+                "multi_article_stories": sum(
+                    1 for s in self._stories.values() if s.size > 1
+                ),
+            }
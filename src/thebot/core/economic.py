@@ -14,6 +14,13 @@ import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
 
+from .economic_classifier import (
+    COUNTRY_MAPPING,
+    IMPACT_KEYWORDS,
+    EventClassification,
+    economic_classifier,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,95 +73,10 @@ class AsyncEconomicCalendarRSSParser:
             },
         ]
 
-        # Mapping des impacts par mots-clés (amélioré pour news générales)
-        self.impact_keywords = {
-            "critical": [
-                "non-farm payroll",
-                "nfp",
-                "employment report",
-                "jobs report",
-                "fed rate",
-                "federal reserve",
-                "fomc",
-                "interest rate decision",
-                "ecb rate",
-                "european central bank",
-                "boe rate",
-                "bank of england",
-                "gdp report",
-                "gross domestic product",
-                "gdp growth",
-                "cpi inflation",
-                "consumer price index",
-                "inflation report",
-                "unemployment rate",
-                "jobless claims",
-            ],
-            "high": [
-                "retail sales",
-                "consumer spending",
-                "ism manufacturing",
-                "ism services",
-                "pmi",
-                "purchasing managers index",
-                "core cpi",
-                "core inflation",
-                "pce",
-                "personal consumption expenditures",
-                "housing starts",
-                "durable goods",
-                "factory orders",
-                "trade balance",
-                "current account",
-            ],
-            "medium": [
-                "housing data",
-                "existing home sales",
-                "new home sales",
-                "consumer confidence",
-                "business sentiment",
-                "consumer sentiment",
-                "industrial production",
-                "capacity utilization",
-                "building permits",
-                "pending home sales",
-                "wholesale inventories",
-            ],
-            "low": [
-                "leading indicators",
-                "philadelphia fed",
-                "empire state",
-                "kansas city fed",
-                "chicago pmi",
-                "construction spending",
-                "consumer credit",
-                "import price index",
-                "export price index",
-            ],
-        }
-
-        # Pays et devises
-        self.country_mapping = {
-            "united states": "US",
-            "usa": "US",
-            "us": "US",
-            "eurozone": "EU",
-            "euro area": "EU",
-            "eu": "EU",
-            "united kingdom": "UK",
-            "britain": "UK",
-            "uk": "UK",
-            "japan": "JP",
-            "jp": "JP",
-            "canada": "CA",
-            "ca": "CA",
-            "australia": "AU",
-            "au": "AU",
-            "switzerland": "CH",
-            "ch": "CH",
-            "china": "CN",
-            "cn": "CN",
-        }
+        # Tables de mots-clés (voir economic_classifier) et classifieur précompilé
+        self.impact_keywords = IMPACT_KEYWORDS
+        self.country_mapping = COUNTRY_MAPPING
+        self.classifier = economic_classifier
 
     async def __aenter__(self):
         """Context manager entry - initialise la session aiohttp"""
@@ -379,13 +301,23 @@ class AsyncEconomicCalendarRSSParser:
             return []
 
     def _extract_event_data(self, entry: Any, source: Dict) -> Dict[str, Any]:
+        """Extrait et classe un événement depuis une entrée RSS"""
+
+        title = (entry.get("title", "") or "").strip()
+        summary = entry.get("summary", "") or entry.get("description", "") or ""
+        description = BeautifulSoup(summary, "html.parser").get_text(" ", strip=True)
+        event_date = self._extract_event_date(entry)
+        guid = entry.get("id") or entry.get("link")
 
-        # Détection de l'impact
-        impact = self._detect_impact(title, description)
+        # Pays, impact et catégorie en une seule passe
+        classification = self.classify(title, description, guid)
+        country = classification.country
+        impact = classification.impact
 
         # Extraction d'autres données
         event_data = {
             "id": f"{source['type']}_{hash(title + str(event_date))}",
+            "guid": guid,
             "title": title,
             "description": description[:500] if description else title,
             "country": country,
@@ -394,7 +326,7 @@ class AsyncEconomicCalendarRSSParser:
             "event_time": event_date.strftime("%H:%M") if event_date else "TBD",
             "source": source["name"],
             "source_url": entry.get("link", source["url"]),
-            "category": self._categorize_event(title, description),
+            "category": classification.category,
             "currency": self._get_currency_from_country(country),
             "previous_value": None,  # Sera extrait si disponible
             "forecast_value": None,  # Sera extrait si disponible
@@ -462,61 +394,27 @@ class AsyncEconomicCalendarRSSParser:
         # Par défaut, utiliser la date actuelle
         return datetime.now()
 
-    def _detect_country(self, title: str, description: str) -> str:
-        """Détecte le pays de l'événement économique"""
-
-        text = f"{title} {description}".lower()
-
-        for country_name, code in self.country_mapping.items():
-            if country_name in text:
-                return code
+    def classify(
+        self, title: str, description: str, guid: Optional[str] = None
+    ) -> EventClassification:
+        """Classe un événement (pays, impact, catégorie, pertinence), avec cache par GUID"""
+        return self.classifier.classify(title, description, guid=guid)
 
-        # Détection par devise
-        if any(currency in text for currency in ["usd", "dollar", "fed", "fomc"]):
-            return "US"
-        elif any(currency in text for currency in ["eur", "euro", "ecb"]):
-            return "EU"
-        elif any(currency in text for currency in ["gbp", "pound", "boe"]):
-            return "UK"
-        elif any(currency in text for currency in ["jpy", "yen", "boj"]):
-            return "JP"
+    def classify_events(self, events: List[Dict]) -> List[EventClassification]:
+        """Classe un lot d'événements déjà extraits"""
+        return self.classifier.classify_many(events)
 
-        return "US"  # Par défaut
+    def _detect_country(self, title: str, description: str) -> str:
+        """Détecte le pays de l'événement économique"""
+        return self.classify(title, description).country
 
     def _detect_impact(self, title: str, description: str) -> str:
         """Détecte le niveau d'impact de l'événement"""
-
-        text = f"{title} {description}".lower()
-
-        for impact_level, keywords in self.impact_keywords.items():
-            for keyword in keywords:
-                if keyword in text:
-                    return impact_level
-
-        return "medium"  # Par défaut
+        return self.classify(title, description).impact
 
     def _categorize_event(self, title: str, description: str) -> str:
         """Catégorise l'événement économique"""
-
-        text = f"{title} {description}".lower()
-
-        if any(
-            word in text
-            for word in ["employment", "unemployment", "jobs", "payroll", "jobless"]
-        ):
-            return "employment"
-        elif any(
-            word in text for word in ["rate", "fed", "ecb", "boe", "monetary", "policy"]
-        ):
-            return "monetary_policy"
-        elif any(word in text for word in ["inflation", "cpi", "pce", "price"]):
-            return "inflation"
-        elif any(word in text for word in ["gdp", "growth", "economic", "activity"]):
-            return "economic_activity"
-        elif any(word in text for word in ["retail", "sales", "consumer", "spending"]):
-            return "consumption"
-        else:
-            return "other"
+        return self.classify(title, description).category
 
     def _get_currency_from_country(self, country: str) -> str:
         """Retourne la devise principale du pays"""
@@ -593,56 +491,9 @@ class AsyncEconomicCalendarRSSParser:
 
     def _is_economic_event(self, event: Dict) -> bool:
         """Détermine si un article est un vrai événement économique (version permissive)"""
-
-        title = event.get("title", "").lower()
-        description = event.get("description", "").lower()
-        text = f"{title} {description}"
-
-        # Mots-clés économiques principaux (plus permissif)
-        economic_keywords = [
-            "fed",
-            "federal reserve",
-            "ecb",
-            "european central bank",
-            "boe",
-            "bank of england",
-            "inflation",
-            "cpi",
-            "pce",
-            "gdp",
-            "employment",
-            "unemployment",
-            "jobs",
-            "retail sales",
-            "housing",
-            "manufacturing",
-            "pmi",
-            "ism",
-            "rate",
-            "monetary",
-            "policy",
-            "economy",
-            "economic",
-            "market",
-            "stocks",
-            "trading",
-            "financial",
-            "finance",
-        ]
-
-        # Vérifier présence de mots-clés économiques
-        has_economic = any(keyword in text for keyword in economic_keywords)
-
-        # Mots-clés d'exclusion (réduite)
-        exclude_keywords = [
-            "crypto",
-            "bitcoin",
-            "ethereum",  # Seulement crypto pour éviter duplication
-        ]
-
-        has_exclude = any(keyword in text for keyword in exclude_keywords)
-
-        return has_economic and not has_exclude
+        return self.classify(
+            event.get("title", ""), event.get("description", ""), event.get("guid")
+        ).is_economic
 
 
 # Instance globale - Version Async
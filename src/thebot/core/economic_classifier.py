@@ -0,0 +1,301 @@
+"""
+Economic Event Classifier - Classification des événements économiques
+Pays, impact, catégorie et pertinence économique détectés en une seule passe
+regex précompilée, avec cache par GUID d'événement
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Flexions simples acceptées après un mot-clé (rate -> rates, job -> jobs)
+_SUFFIXES = r"(?:s|es)?"
+
+# Mapping des impacts par mots-clés, du plus fort au plus faible
+IMPACT_KEYWORDS: Dict[str, List[str]] = {
+    "critical": [
+        "non-farm payroll",
+        "nfp",
+        "employment report",
+        "jobs report",
+        "fed rate",
+        "federal reserve",
+        "fomc",
+        "interest rate decision",
+        "ecb rate",
+        "european central bank",
+        "boe rate",
+        "bank of england",
+        "gdp report",
+        "gross domestic product",
+        "gdp growth",
+        "cpi inflation",
+        "consumer price index",
+        "inflation report",
+        "unemployment rate",
+        "jobless claims",
+    ],
+    "high": [
+        "retail sales",
+        "consumer spending",
+        "ism manufacturing",
+        "ism services",
+        "pmi",
+        "purchasing managers index",
+        "core cpi",
+        "core inflation",
+        "pce",
+        "personal consumption expenditures",
+        "housing starts",
+        "durable goods",
+        "factory orders",
+        "trade balance",
+        "current account",
+    ],
+    "medium": [
+        "housing data",
+        "existing home sales",
+        "new home sales",
+        "consumer confidence",
+        "business sentiment",
+        "consumer sentiment",
+        "industrial production",
+        "capacity utilization",
+        "building permits",
+        "pending home sales",
+        "wholesale inventories",
+    ],
+    "low": [
+        "leading indicators",
+        "philadelphia fed",
+        "empire state",
+        "kansas city fed",
+        "chicago pmi",
+        "construction spending",
+        "consumer credit",
+        "import price index",
+        "export price index",
+    ],
+}
+
+# Pays (par ordre de priorité), puis indices par devise / banque centrale
+COUNTRY_MAPPING: Dict[str, str] = {
+    "united states": "US",
+    "usa": "US",
+    "us": "US",
+    "eurozone": "EU",
+    "euro area": "EU",
+    "eu": "EU",
+    "united kingdom": "UK",
+    "britain": "UK",
+    "uk": "UK",
+    "japan": "JP",
+    "jp": "JP",
+    "canada": "CA",
+    "ca": "CA",
+    "australia": "AU",
+    "au": "AU",
+    "switzerland": "CH",
+    "ch": "CH",
+    "china": "CN",
+    "cn": "CN",
+}
+
+CURRENCY_HINTS: Dict[str, List[str]] = {
+    "US": ["usd", "dollar", "fed", "fomc"],
+    "EU": ["eur", "euro", "ecb"],
+    "UK": ["gbp", "pound", "boe"],
+    "JP": ["jpy", "yen", "boj"],
+}
+
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "employment": ["employment", "unemployment", "jobs", "payroll", "jobless"],
+    "monetary_policy": ["rate", "fed", "ecb", "boe", "monetary", "policy"],
+    "inflation": ["inflation", "cpi", "pce", "price"],
+    "economic_activity": ["gdp", "growth", "economic", "activity"],
+    "consumption": ["retail", "sales", "consumer", "spending"],
+}
+
+ECONOMIC_KEYWORDS: List[str] = [
+    "fed", "federal reserve", "ecb", "european central bank", "boe",
+    "bank of england", "inflation", "cpi", "pce", "gdp", "employment",
+    "unemployment", "jobs", "retail sales", "housing", "manufacturing", "pmi",
+    "ism", "rate", "monetary", "policy", "economy", "economic", "market",
+    "stocks", "trading", "financial", "finance",
+]
+
+# Mots-clés d'exclusion (crypto seulement, pour éviter la duplication)
+EXCLUDE_KEYWORDS: List[str] = ["crypto", "bitcoin", "ethereum"]
+
+DEFAULT_COUNTRY = "US"
+DEFAULT_IMPACT = "medium"
+DEFAULT_CATEGORY = "other"
+
+
+@dataclass(frozen=True)
+class EventClassification:
+    """Résultat de classification d'un événement"""
+
+    country: str
+    impact: str
+    category: str
+    is_economic: bool
+
+
+class EconomicEventClassifier:
+    """
+    Classifieur d'événements économiques en une passe
+
+    Tous les mots-clés (pays, devises, impacts, catégories, inclusion et
+    exclusion) sont fusionnés dans une regex unique à frontières de mots.
+    Chaque mot-clé porte ses étiquettes (groupe, valeur, priorité), y compris
+    celles des mots-clés qu'il contient ("core cpi" porte aussi "cpi"), si bien
+    qu'un seul finditer suffit à décider les quatre classifications en
+    respectant l'ordre de priorité des tables.
+    """
+
+    def __init__(
+        self,
+        impact_keywords: Dict[str, List[str]] = IMPACT_KEYWORDS,
+        country_mapping: Dict[str, str] = COUNTRY_MAPPING,
+        currency_hints: Dict[str, List[str]] = CURRENCY_HINTS,
+        category_keywords: Dict[str, List[str]] = CATEGORY_KEYWORDS,
+        economic_keywords: Iterable[str] = ECONOMIC_KEYWORDS,
+        exclude_keywords: Iterable[str] = EXCLUDE_KEYWORDS,
+        cache_size: int = 20000,
+    ):
+        """
+        Initialise le classifieur
+
+        Args:
+            impact_keywords: Mots-clés par niveau d'impact (ordre = priorité)
+            country_mapping: Nom de pays -> code (ordre = priorité)
+            currency_hints: Code pays -> mots-clés devise/banque centrale
+            category_keywords: Mots-clés par catégorie (ordre = priorité)
+            economic_keywords: Mots-clés rendant un article économique
+            exclude_keywords: Mots-clés excluant un article
+            cache_size: Nombre maximum de classifications conservées
+        """
+        tags: Dict[str, List[Tuple[str, str, int]]] = {}
+
+        def tag(keyword: str, group: str, value: str, priority: int) -> None:
+            tags.setdefault(keyword.lower(), []).append((group, value, priority))
+
+        for priority, (name, code) in enumerate(country_mapping.items()):
+            tag(name, "country", code, priority)
+        offset = len(country_mapping)
+        for priority, (code, words) in enumerate(currency_hints.items()):
+            for word in words:
+                tag(word, "country", code, offset + priority)
+        for priority, (level, words) in enumerate(impact_keywords.items()):
+            for word in words:
+                tag(word, "impact", level, priority)
+        for priority, (category, words) in enumerate(category_keywords.items()):
+            for word in words:
+                tag(word, "category", category, priority)
+        for word in economic_keywords:
+            tag(word, "economic", "yes", 0)
+        for word in exclude_keywords:
+            tag(word, "exclude", "yes", 0)
+
+        # Un match consomme le texte : un mot-clé hérite des étiquettes des
+        # mots-clés qu'il contient pour ne rien perdre ("core cpi" -> "cpi")
+        self._tags: Dict[str, Tuple[Tuple[str, str, int], ...]] = {}
+        for keyword in tags:
+            inherited = list(tags[keyword])
+            for other, other_tags in tags.items():
+                if other != keyword and re.search(
+                    rf"\b{re.escape(other)}{_SUFFIXES}\b", keyword
+                ):
+                    inherited.extend(other_tags)
+            self._tags[keyword] = tuple(inherited)
+
+        alternation = "|".join(
+            re.escape(keyword) for keyword in sorted(self._tags, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"\b({alternation}){_SUFFIXES}\b", re.IGNORECASE)
+
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Any, EventClassification]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _classify_text(self, text: str) -> EventClassification:
+        best: Dict[str, Tuple[int, str]] = {}
+        for match in self._pattern.finditer(text):
+            for group, value, priority in self._tags[match.group(1).lower()]:
+                current = best.get(group)
+                if current is None or priority < current[0]:
+                    best[group] = (priority, value)
+
+        return EventClassification(
+            country=best.get("country", (0, DEFAULT_COUNTRY))[1],
+            impact=best.get("impact", (0, DEFAULT_IMPACT))[1],
+            category=best.get("category", (0, DEFAULT_CATEGORY))[1],
+            is_economic="economic" in best and "exclude" not in best,
+        )
+
+    def classify(
+        self, title: str, description: str = "", guid: Optional[str] = None
+    ) -> EventClassification:
+        """
+        Classe un événement (pays, impact, catégorie, pertinence)
+
+        Args:
+            title: Titre de l'événement
+            description: Description / résumé
+            guid: Identifiant stable de l'entrée RSS, utilisé comme clé de cache
+                (sinon hash du texte)
+        """
+        text = f"{title or ''} {description or ''}"
+        key = guid or hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        result = self._classify_text(text)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def classify_many(self, events: Iterable[Dict[str, Any]]) -> List[EventClassification]:
+        """Classe un lot d'événements (dicts avec title, description, guid)"""
+        return [
+            self.classify(
+                event.get("title", ""),
+                event.get("description", ""),
+                guid=event.get("guid"),
+            )
+            for event in events
+        ]
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "keywords": len(self._tags),
+                "cached": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Instance globale partagée par les parsers
+economic_classifier = EconomicEventClassifier()
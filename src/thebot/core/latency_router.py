@@ -0,0 +1,271 @@
+"""
+Routage des fournisseurs de données selon leur latence - THEBOT
+Classement par latence EWMA et taux d'erreur, requêtes couvertes (hedging)
+et basculement immédiat vers le fournisseur suivant en cas d'échec
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+provider_routing = metrics.counter(
+    "thebot_provider_routing_total",
+    "Requêtes couvertes, victoires de couverture et basculements par fournisseur",
+    labels=("provider", "event"),
+)
+
+
+def has_data(result: Any) -> bool:
+    """Réponse exploitable : non None et non vide (dict, liste, DataFrame)"""
+    if result is None:
+        return False
+    if hasattr(result, "empty"):
+        return not result.empty
+    if hasattr(result, "__len__"):
+        return len(result) > 0
+    return True
+
+
+class ProviderLatencyStats:
+    """Latence EWMA, taux d'erreur EWMA et latences récentes d'un fournisseur"""
+
+    def __init__(self, alpha: float, window: int):
+        self.alpha = alpha
+        self.ewma_latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.errors = 0
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Enregistre un appel (la latence des échecs n'est pas retenue)"""
+        self.calls += 1
+        self.error_rate = self.alpha * (0.0 if ok else 1.0) + (1 - self.alpha) * self.error_rate
+        if not ok:
+            self.errors += 1
+            return
+        self.recent.append(latency)
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Quantile des latences récentes (None sans échantillon)"""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def score(self, error_penalty: float) -> float:
+        """Coût estimé d'un appel : latence EWMA + pénalité proportionnelle aux erreurs"""
+        return (self.ewma_latency or 0.0) + self.error_rate * error_penalty
+
+
+class LatencyRouter:
+    """
+    Routeur de requêtes entre fournisseurs équivalents.
+
+    Les fournisseurs sont essayés du plus rapide au plus lent (latence EWMA,
+    pénalisée par le taux d'erreur). Si le premier n'a pas répondu après son
+    p95, une requête dupliquée part vers le suivant et la première réponse
+    valide l'emporte ; la requête perdante est annulée si elle n'a pas encore
+    démarré, sinon son résultat est ignoré. Un échec bascule immédiatement
+    vers le fournisseur suivant.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        window: int = 64,
+        min_samples: int = 5,
+        default_hedge_delay: float = 1.0,
+        min_hedge_delay: float = 0.05,
+        max_hedge_delay: float = 5.0,
+        error_penalty: float = 5.0,
+        timeout: float = 15.0,
+        max_workers: int = 8,
+    ):
+        self.alpha = alpha
+        self.window = window
+        self.min_samples = min_samples
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_delay = max_hedge_delay
+        self.error_penalty = error_penalty
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+        self._stats: Dict[str, ProviderLatencyStats] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def _get_stats(self, provider: str) -> ProviderLatencyStats:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = self._stats[provider] = ProviderLatencyStats(self.alpha, self.window)
+        return stats
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="provider-hedge"
+                )
+            return self._executor
+
+    def record(self, provider: str, latency: float, ok: bool) -> None:
+        """Enregistre le résultat d'un appel à un fournisseur"""
+        with self._lock:
+            self._get_stats(provider).record(latency, ok)
+
+    def rank(self, candidates: Sequence[str]) -> List[str]:
+        """
+        Classe les fournisseurs du moins coûteux au plus coûteux.
+
+        Un fournisseur sans historique est estimé à ``default_hedge_delay`` ;
+        à égalité, l'ordre de préférence est conservé.
+        """
+        with self._lock:
+            scores = {
+                name: (
+                    self._stats[name].score(self.error_penalty)
+                    if name in self._stats
+                    else self.default_hedge_delay
+                )
+                for name in candidates
+            }
+        return sorted(dict.fromkeys(candidates), key=lambda name: scores[name])
+
+    def hedge_delay(self, provider: str) -> float:
+        """Délai avant requête couverte : p95 du fournisseur, borné"""
+        with self._lock:
+            stats = self._stats.get(provider)
+            p95 = stats.quantile(0.95) if stats is not None and len(stats.recent) >= self.min_samples else None
+        if p95 is None:
+            return self.default_hedge_delay
+        return min(self.max_hedge_delay, max(self.min_hedge_delay, p95))
+
+    def _timed_fetch(
+        self, provider: str, fetch: Callable[[str], Any], is_valid: Callable[[Any], bool]
+    ) -> Tuple[bool, Any]:
+        start = time.perf_counter()
+        ok, result = False, None
+        try:
+            result = fetch(provider)
+            ok = is_valid(result)
+        except Exception as e:
+            logger.warning(f"⚠️ Erreur fournisseur {provider}: {e}")
+        finally:
+            self.record(provider, time.perf_counter() - start, ok)
+        return ok, result
+
+    def call(
+        self,
+        candidates: Sequence[str],
+        fetch: Callable[[str], Any],
+        is_valid: Callable[[Any], bool] = has_data,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Exécute une requête sur le meilleur fournisseur avec couverture et basculement
+
+        Args:
+            candidates: Fournisseurs interchangeables, par ordre de préférence
+            fetch: Appel bloquant recevant le nom du fournisseur
+            is_valid: Validation de la réponse (échec sinon)
+            timeout: Délai global en secondes
+
+        Returns:
+            Première réponse valide, ou None si tous les fournisseurs échouent
+        """
+        remaining = self.rank(candidates)
+        if not remaining:
+            return None
+
+        executor = self._get_executor()
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        pending: Dict[Future, str] = {}
+        hedges = set()
+        latest = {"provider": "", "launched_at": 0.0}
+
+        def launch() -> None:
+            provider = remaining.pop(0)
+            pending[executor.submit(self._timed_fetch, provider, fetch, is_valid)] = provider
+            latest["provider"], latest["launched_at"] = provider, time.monotonic()
+
+        launch()
+        try:
+            while pending:
+                now = time.monotonic()
+                if now >= deadline:
+                    logger.warning(f"⏱️ Aucun fournisseur n'a répondu à temps ({', '.join(pending.values())})")
+                    return None
+
+                wait_for = deadline - now
+                if remaining:
+                    hedge_at = latest["launched_at"] + self.hedge_delay(latest["provider"])
+                    wait_for = min(wait_for, max(0.0, hedge_at - now))
+
+                done, _ = wait(list(pending), timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider = pending.pop(future)
+                    ok, result = future.result()
+                    if ok:
+                        if provider in hedges:
+                            self.hedge_wins += 1
+                            provider_routing.labels(provider, "hedge_won").inc()
+                        return result
+                    if remaining:
+                        self.failovers += 1
+                        provider_routing.labels(provider, "failover").inc()
+                        logger.info(f"🔄 Basculement depuis {provider} vers {remaining[0]}")
+                        launch()
+
+                if not done and remaining:
+                    self.hedged_requests += 1
+                    provider_routing.labels(latest["provider"], "hedged").inc()
+                    logger.debug(f"🛡️ {latest['provider']} au-delà de son p95, requête couverte vers {remaining[0]}")
+                    hedges.add(remaining[0])
+                    launch()
+            return None
+        finally:
+            for future in pending:
+                future.cancel()  # Perdant : annulé s'il n'a pas démarré, résultat ignoré sinon
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques de routage par fournisseur"""
+        with self._lock:
+            providers = {
+                name: {
+                    "ewma_latency_ms": stats.ewma_latency * 1000 if stats.ewma_latency is not None else None,
+                    "p95_ms": stats.quantile(0.95) * 1000 if stats.recent else None,
+                    "error_rate": stats.error_rate,
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                }
+                for name, stats in self._stats.items()
+            }
+        return {
+            "providers": providers,
+            "hedged_requests": self.hedged_requests,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+        }
+
+    def shutdown(self) -> None:
+        """Arrête le pool de requêtes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
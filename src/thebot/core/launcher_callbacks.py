@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from dash import Input, Output, html
 from src.thebot.core.logger import logger
+from src.thebot.core.startup import startup_profiler
 
 # Stub temporaire pour la migration - sera complété dans Phase 2
 class LauncherCallbacks:
@@ -19,6 +20,8 @@ class LauncherCallbacks:
     def __init__(self, app=None, modules=None):
         self.app = app
         self.modules = modules or {}
+        # Layouts construits à la première sélection de chaque onglet
+        self._layout_cache: Dict[str, Any] = {}
         logger.info("🔧 LauncherCallbacks initialisé (stub Phase 2)")
 
     def register_callbacks(self):
@@ -36,10 +39,9 @@ class LauncherCallbacks:
         def update_tab_content(selected_tab):
             """Met à jour le contenu de l'onglet sélectionné"""
             try:
-                if selected_tab in self.modules:
-                    module = self.modules[selected_tab]
-                    if hasattr(module, 'get_layout'):
-                        return module.get_layout()
+                layout = self.render_tab(selected_tab)
+                if layout is not None:
+                    return layout
 
                 # Contenu par défaut si onglet non trouvé
                 return html.Div([
@@ -54,12 +56,39 @@ class LauncherCallbacks:
                     html.P(f"Erreur: {str(e)}", style={"color": "#cccccc"})
                 ], style={"padding": "20px", "backgroundColor": "#1a1a1a"})
 
+    def render_tab(self, tab_name: str) -> Optional[Any]:
+        """
+        Retourne le layout d'un onglet, construit une seule fois à sa première sélection
+
+        Returns:
+            Layout du module, ou None si l'onglet est inconnu
+        """
+        if tab_name in self._layout_cache:
+            return self._layout_cache[tab_name]
+
+        module = self.modules.get(tab_name)
+        if module is None or not hasattr(module, 'get_layout'):
+            return None
+
+        with startup_profiler.measure(tab_name, "tab"):
+            layout = module.get_layout()
+        self._layout_cache[tab_name] = layout
+        return layout
+
+    def invalidate_tab(self, tab_name: Optional[str] = None) -> None:
+        """Force la reconstruction d'un onglet (ou de tous) au prochain affichage"""
+        if tab_name is None:
+            self._layout_cache.clear()
+        else:
+            self._layout_cache.pop(tab_name, None)
+
     def get_status(self) -> Dict[str, Any]:
         """Statut du launcher"""
         return {
             "status": "initializing",
             "callbacks_registered": bool(self.app),
             "modules_count": len(self.modules),
+            "rendered_tabs": sorted(self._layout_cache),
             "phase": "2_migration"
         }
 
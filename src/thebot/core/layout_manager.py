@@ -35,51 +35,20 @@ class LayoutManager:
         }
 
     def create_main_layout(self, modules: Optional[Dict[str, Any]] = None) -> html.Div:
-        """Créer le layout principal avec onglets pour chaque module"""
+        """
+        Créer le layout principal avec onglets pour chaque module
+
+        Seuls les en-têtes d'onglets sont construits ici : le layout d'un module
+        (et ses données) n'est chargé qu'à la première sélection de son onglet,
+        via le callback main-tabs de LauncherCallbacks.
+        """
         try:
-            # Configuration de base
-            tabs_content = []
-
-            if modules:
-                # Créer un onglet pour chaque module
-                for module_name, module in modules.items():
-                    if hasattr(module, 'get_layout'):
-                        try:
-                            module_layout = module.get_layout()
-                            tab_label = self._get_tab_label(module_name)
-
-                            tabs_content.append(
-                                dcc.Tab(
-                                    label=tab_label,
-                                    value=module_name,  # Valeur unique pour chaque onglet
-                                    children=module_layout,
-                                    style={"padding": "10px"}
-                                )
-                            )
-                        except Exception as e:
-                            logger.error(f"❌ Erreur layout module {module_name}: {e}")
-                            # Onglet d'erreur
-                            tabs_content.append(
-                                dcc.Tab(
-                                    label=f"❌ {module_name}",
-                                    children=html.Div([
-                                        html.H4(f"Erreur module {module_name}"),
-                                        html.P(f"Erreur: {str(e)}", style={"color": "red"})
-                                    ], style={"padding": "20px"})
-                                )
-                            )
-            else:
-                # Layout temporaire si pas de modules
-                tabs_content.append(
-                    dcc.Tab(
-                        label="🏠 Accueil",
-                        children=html.Div([
-                            html.H1("THEBOT - Phase 2 Migration", style={"color": "white", "textAlign": "center"}),
-                            html.P("Application en cours de migration vers architecture unifiée...",
-                                  style={"color": "gray", "textAlign": "center"})
-                        ], style={"padding": "20px"})
-                    )
-                )
+            modules = modules or {}
+            tab_names = [
+                module_name
+                for module_name, module in modules.items()
+                if hasattr(module, 'get_layout')
+            ]
 
             # Layout principal avec onglets
             layout = html.Div([
@@ -97,8 +66,7 @@ class LayoutManager:
                         value="crypto",  # Onglet actif par défaut
                         children=[
                             dcc.Tab(label=self._get_tab_label(module_name), value=module_name)
-                            for module_name, module in modules.items()
-                            if hasattr(module, 'get_layout')
+                            for module_name in tab_names
                         ],
                         style={
                             "backgroundColor": "#161b22",
@@ -110,7 +78,10 @@ class LayoutManager:
                             "background": "#0d1117"
                         }
                     ),
-                    html.Div(id="tab-content", style={"padding": "20px", "minHeight": "300px"})
+                    dcc.Loading(
+                        html.Div(id="tab-content", style={"padding": "20px", "minHeight": "300px"}),
+                        type="circle",
+                    )
                 ])
             ], style={
                 "backgroundColor": self.app_config["background_color"],
@@ -118,7 +89,7 @@ class LayoutManager:
                 "fontFamily": self.app_config["font_family"]
             })
 
-            logger.info(f"✅ Layout créé avec {len(tabs_content)} onglets")
+            logger.info(f"✅ Layout créé avec {len(tab_names)} onglets (rendu différé)")
             return layout
 
         except Exception as e:
@@ -0,0 +1,494 @@
+"""
+Metrics - Compteurs, jauges et histogrammes de latence THEBOT
+Registre léger au format d'exposition Prometheus : écriture sans verrou sur
+le chemin chaud (une cellule par thread vivant, agrégées à la lecture) et
+histogrammes log-linéaires type HDR (précision relative bornée)
+"""
+
+import math
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Bornes `le` exportées pour les histogrammes de latence (secondes)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _ThreadCells:
+    """
+    Une cellule mutable par thread vivant
+
+    Seul le thread propriétaire écrit dans sa cellule : pas de verrou à
+    l'écriture. Le verrou ne sert qu'à l'enregistrement d'une nouvelle
+    cellule (première écriture d'un thread) et à la lecture. Les cellules des
+    threads terminés (un thread par requête sous Werkzeug) sont fusionnées
+    dans une cellule commune, ce qui borne leur nombre aux threads vivants.
+    """
+
+    def __init__(self, factory: Callable[[], list], merge: Callable[[list, list], None]):
+        self._factory = factory
+        self._merge = merge
+        self._local = threading.local()
+        self._cells: List[Tuple[weakref.ref, list]] = []
+        self._retired = factory()
+        self._lock = threading.Lock()
+
+    def cell(self) -> list:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = self._factory()
+            with self._lock:
+                self._prune()
+                self._cells.append((weakref.ref(threading.current_thread()), cell))
+            self._local.cell = cell
+            return cell
+
+    def _prune(self) -> None:
+        """Fusionne les cellules des threads terminés (appelé sous verrou)"""
+        alive = []
+        for owner, cell in self._cells:
+            thread = owner()
+            if thread is not None and thread.is_alive():
+                alive.append((owner, cell))
+            else:
+                # Le propriétaire n'écrira plus : fusion sans risque de course
+                self._merge(self._retired, cell)
+        self._cells = alive
+
+    def all(self) -> List[list]:
+        with self._lock:
+            self._prune()
+            return [self._retired] + [cell for _, cell in self._cells]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._retired[:] = self._factory()
+            for _, cell in self._cells:
+                cell[:] = self._factory()
+
+
+def _merge_counter(total: list, cell: list) -> None:
+    total[0] += cell[0]
+
+
+def _merge_histogram(total: list, cell: list) -> None:
+    total[0] += cell[0]
+    total[1] += cell[1]
+    total[2] = max(total[2], cell[2])
+    counts = total[3]
+    for index, hits in cell[3].items():
+        counts[index] = counts.get(index, 0) + hits
+
+
+class Counter:
+    """Compteur monotone"""
+
+    def __init__(self):
+        self._cells = _ThreadCells(lambda: [0.0], _merge_counter)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(cell[0] for cell in self._cells.all())
+
+    def reset(self) -> None:
+        self._cells.clear()
+
+
+class Gauge:
+    """Valeur instantanée (fixée, incrémentée ou calculée à la lecture)"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Valeur lue à chaque export (taille de file, état d'un composant...)"""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except Exception:
+                return math.nan
+        return self._value
+
+    def reset(self) -> None:
+        self._value = 0.0
+
+
+class Histogram:
+    """
+    Histogramme log-linéaire (type HDR)
+
+    Les valeurs sont converties en unités entières (unit, par défaut la
+    microseconde) puis rangées dans 2^significant_bits sous-intervalles par
+    puissance de deux : l'erreur relative d'un quantile reste inférieure à
+    2^-significant_bits quelle que soit l'échelle, pour quelques centaines
+    d'intervalles au plus.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        significant_bits: int = 5,
+        unit: float = 1e-6,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.unit = unit
+        self._half = 1 << significant_bits
+        self._linear_limit = self._half << 1
+        self._shift_base = significant_bits + 1
+        # Cellule : [count, sum, max, {index: count}]
+        self._cells = _ThreadCells(lambda: [0, 0.0, 0.0, {}], _merge_histogram)
+
+    def _index(self, units: int) -> int:
+        if units < self._linear_limit:
+            return units
+        shift = units.bit_length() - self._shift_base
+        return shift * self._half + (units >> shift)
+
+    def _bounds(self, index: int) -> Tuple[int, int]:
+        """Plus petite et plus grande valeur (en unités) d'un intervalle"""
+        shift = max(0, index // self._half - 1)
+        low = (index - shift * self._half) << shift
+        return low, low + (1 << shift) - 1
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.cell()
+        units = int(value / self.unit) if value > 0 else 0
+        index = self._index(units)
+        counts = cell[3]
+        counts[index] = counts.get(index, 0) + 1
+        cell[0] += 1
+        cell[1] += value
+        if value > cell[2]:
+            cell[2] = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Mesure la durée du bloc (secondes)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def _merged(self) -> Tuple[int, float, float, Dict[int, int]]:
+        count, total, maximum, merged = 0, 0.0, 0.0, {}
+        for cell in self._cells.all():
+            count += cell[0]
+            total += cell[1]
+            maximum = max(maximum, cell[2])
+            for index, hits in cell[3].copy().items():
+                merged[index] = merged.get(index, 0) + hits
+        return count, total, maximum, merged
+
+    @property
+    def count(self) -> int:
+        return sum(cell[0] for cell in self._cells.all())
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Quantiles (valeur la plus haute de l'intervalle, bornée par le max observé)"""
+        count, _, maximum, merged = self._merged()
+        if not count:
+            return [0.0 for _ in qs]
+
+        ordered = sorted(merged.items())
+        results = []
+        for q in qs:
+            rank = max(1, math.ceil(q * count))
+            seen = 0
+            for index, hits in ordered:
+                seen += hits
+                if seen >= rank:
+                    results.append(min(self._bounds(index)[1] * self.unit, maximum))
+                    break
+        return results
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """Comptes cumulés par borne `le` (dernière borne : +Inf)"""
+        count, _, _, merged = self._merged()
+        ordered = sorted(merged.items())
+        result = []
+        position, seen = 0, 0
+        for bound in self.buckets:
+            while position < len(ordered) and self._bounds(ordered[position][0])[0] * self.unit <= bound:
+                seen += ordered[position][1]
+                position += 1
+            result.append((bound, seen))
+        result.append((math.inf, count))
+        return result
+
+    def snapshot(self) -> Dict[str, float]:
+        count, total, maximum, _ = self._merged()
+        p50, p90, p99 = self.quantiles((0.5, 0.9, 0.99))
+        return {
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else 0.0,
+            "p50": p50,
+            "p90": p90,
+            "p99": p99,
+            "max": maximum,
+        }
+
+    def reset(self) -> None:
+        self._cells.clear()
+
+
+class MetricFamily:
+    """
+    Métrique nommée, éventuellement déclinée par labels
+
+    Sans labels, les méthodes (inc, set, observe, time...) s'appliquent
+    directement ; avec labels, passer par labels(...) qui renvoie l'enfant
+    (créé une fois, puis servi sans verrou).
+    """
+
+    def __init__(self, name: str, help: str, kind: str, factory: Callable, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.label_names = tuple(label_names)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._children[()] = factory()
+
+    def labels(self, *values: Any, **named: Any):
+        if named:
+            values = tuple(named[label] for label in self.label_names)
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.label_names):
+                raise ValueError(f"{self.name}: labels attendus {self.label_names}, reçu {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def _unlabeled(self):
+        try:
+            return self._children[()]
+        except KeyError:
+            raise ValueError(f"{self.name} requiert des labels {self.label_names}") from None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._unlabeled().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._unlabeled().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._unlabeled().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._unlabeled().set_function(function)
+
+    def observe(self, value: float) -> None:
+        self._unlabeled().observe(value)
+
+    def time(self):
+        return self._unlabeled().time()
+
+    @property
+    def value(self) -> float:
+        return self._unlabeled().value
+
+    def children(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.label_names, key)), child) for key, child in items]
+
+    def reset(self) -> None:
+        for _, child in self.children():
+            child.reset()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels.items()) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in items) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class MetricsRegistry:
+    """Registre des métriques (création idempotente par nom)"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, help: str, kind: str, factory: Callable, labels: Sequence[str]) -> MetricFamily:
+        family = self._families.get(name)
+        if family is None:
+            with self._lock:
+                family = self._families.get(name)
+                if family is None:
+                    family = MetricFamily(name, help, kind, factory, labels)
+                    self._families[name] = family
+        if family.kind != kind or family.label_names != tuple(labels):
+            raise ValueError(f"Métrique {name} déjà déclarée ({family.kind}, labels {family.label_names})")
+        return family
+
+    def counter(self, name: str, help: str = "", labels: Sequence[str] = ()) -> MetricFamily:
+        return self._get_or_create(name, help, "counter", Counter, labels)
+
+    def gauge(self, name: str, help: str = "", labels: Sequence[str] = ()) -> MetricFamily:
+        return self._get_or_create(name, help, "gauge", Gauge, labels)
+
+    def histogram(
+        self,
+        name: str,
+        help: str = "",
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> MetricFamily:
+        return self._get_or_create(name, help, "histogram", lambda: Histogram(buckets), labels)
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def families(self) -> List[MetricFamily]:
+        with self._lock:
+            return sorted(self._families.values(), key=lambda family: family.name)
+
+    def render(self) -> str:
+        """Export au format texte Prometheus (version 0.0.4)"""
+        lines: List[str] = []
+        for family in self.families():
+            if family.help:
+                lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+
+            for labels, child in family.children():
+                if family.kind != "histogram":
+                    lines.append(f"{family.name}{_format_labels(labels)} {_format_value(child.value)}")
+                    continue
+
+                for bound, seen in child.cumulative_buckets():
+                    le = _format_labels(labels, ("le", _format_value(bound)))
+                    lines.append(f"{family.name}_bucket{le} {seen}")
+                snapshot = child.snapshot()
+                lines.append(f"{family.name}_sum{_format_labels(labels)} {_format_value(snapshot['sum'])}")
+                lines.append(f"{family.name}_count{_format_labels(labels)} {snapshot['count']}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Vue JSON : valeur (ou résumé p50/p90/p99) par métrique et labels"""
+        result: Dict[str, Any] = {}
+        for family in self.families():
+            entries = []
+            for labels, child in family.children():
+                value = child.snapshot() if family.kind == "histogram" else child.value
+                entries.append({"labels": labels, "value": value})
+            result[family.name] = {"type": family.kind, "samples": entries}
+        return result
+
+    def reset(self) -> None:
+        """Remet toutes les valeurs à zéro (les déclarations sont conservées)"""
+        for family in self.families():
+            family.reset()
+
+
+def install_flask_metrics(server, registry: Optional[MetricsRegistry] = None, path: str = "/metrics") -> None:
+    """
+    Expose le registre sur `path` et chronomètre les callbacks Dash
+
+    Les requêtes `_dash-update-component` sont mesurées entre before_request
+    et after_request, étiquetées par sortie du callback.
+    """
+    from flask import Response, g, request
+
+    registry = registry or metrics
+    callback_seconds = registry.histogram(
+        "thebot_dash_callback_seconds", "Durée des callbacks Dash", labels=("callback",)
+    )
+    callback_errors = registry.counter(
+        "thebot_dash_callback_errors_total", "Callbacks Dash en erreur", labels=("callback",)
+    )
+
+    @server.before_request
+    def _start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @server.after_request
+    def _record_callback(response):
+        started = g.pop("metrics_started", None)
+        if started is not None and request.path.endswith("_dash-update-component"):
+            payload = request.get_json(silent=True) or {}
+            callback = str(payload.get("output", "unknown"))
+            callback_seconds.labels(callback).observe(time.perf_counter() - started)
+            if response.status_code >= 500:
+                callback_errors.labels(callback).inc()
+        return response
+
+    def _metrics_view():
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+    server.add_url_rule(path, "thebot_metrics", _metrics_view)
+
+
+# Instance globale
+metrics = MetricsRegistry()
+
+# Métriques partagées entre modules
+provider_request_seconds = metrics.histogram(
+    "thebot_provider_request_seconds",
+    "Durée des appels HTTP aux fournisseurs de données",
+    labels=("provider", "status"),
+)
+cache_requests = metrics.counter(
+    "thebot_cache_requests_total", "Lectures de cache par résultat", labels=("cache", "result")
+)
+indicator_compute_seconds = metrics.histogram(
+    "thebot_indicator_compute_seconds", "Durée de calcul des indicateurs", labels=("indicator", "mode")
+)
+stream_message_seconds = metrics.histogram(
+    "thebot_stream_message_seconds", "Traitement des messages WebSocket entrants", labels=("type",)
+)
+
+
+def instrumented_request(provider: str, call: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Exécute un appel HTTP (requests) en mesurant sa durée par fournisseur et statut"""
+    start = time.perf_counter()
+    try:
+        response = call(*args, **kwargs)
+    except Exception:
+        provider_request_seconds.labels(provider, "error").observe(time.perf_counter() - start)
+        raise
+    status = str(getattr(response, "status_code", "unknown"))
+    provider_request_seconds.labels(provider, status).observe(time.perf_counter() - start)
+    return response
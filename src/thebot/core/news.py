@@ -9,6 +9,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from .dedup import NearDuplicateIndex
+
 # TODO: Migrer data_providers
 # from ..data_providers.rss_news_manager import rss_news_manager
 
@@ -23,6 +25,9 @@ class NewsAggregator:
         # TODO: Initialiser rss_manager après migration data_providers
         # self.rss_manager = rss_news_manager
 
+        # Index de quasi-doublons conservé entre les rafraîchissements
+        self.dedup_index = NearDuplicateIndex()
+
         # Mapping catégories THEBOT → RSS
         self.category_mapping = {
             "economic": ["economic", "general"],
@@ -251,37 +256,8 @@ class NewsAggregator:
     def _deduplicate_articles(
         self, articles: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Déduplique les articles par URL et titre"""
-        seen_urls = set()
-        seen_titles = set()
-        unique_articles = []
-
-        for article in articles:
-            url = article.get("url", "").strip().lower()
-            title = article.get("title", "").strip().lower()
-
-            # Clé de déduplication basée sur URL
-            if url and url in seen_urls:
-                continue
-
-            # Clé de déduplication basée sur titre (mots significatifs)
-            title_words = [w for w in title.split() if len(w) > 3]
-            title_key = " ".join(sorted(title_words[:6]))  # 6 mots significatifs
-
-            if title_key and title_key in seen_titles:
-                continue
-
-            if url:
-                seen_urls.add(url)
-            if title_key:
-                seen_titles.add(title_key)
-
-            unique_articles.append(article)
-
-        logger.debug(
-            f"🔄 Deduplicated {len(articles)} → {len(unique_articles)} articles"
-        )
-        return unique_articles
+        """Regroupe les quasi-doublons (syndication, réécritures) en stories"""
+        return self.dedup_index.deduplicate(articles)
 
     def get_source_statistics(self) -> Dict[str, Any]:
         """Retourne les statistiques des sources"""
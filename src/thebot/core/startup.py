@@ -0,0 +1,244 @@
+"""
+Startup - Profil de démarrage et singletons paresseux THEBOT
+Mesure le coût d'initialisation de chaque module / singleton et diffère la
+construction des instances globales jusqu'à leur premier usage
+"""
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from .logger import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class StartupEntry:
+    """Coût mesuré d'une étape de démarrage"""
+
+    name: str
+    category: str
+    duration_ms: float
+    started_at: float
+
+
+class StartupProfiler:
+    """
+    Enregistre le coût de chaque étape de démarrage
+
+    Les étapes sont regroupées par catégorie (module, singleton, layout,
+    tab...) pour produire un rapport trié du plus coûteux au moins coûteux.
+    """
+
+    def __init__(self):
+        self._entries: List[StartupEntry] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def measure(self, name: str, category: str = "module"):
+        """Mesure la durée du bloc et l'enregistre"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, (time.perf_counter() - start) * 1000, start)
+
+    def record(
+        self, name: str, category: str, duration_ms: float, started_at: Optional[float] = None
+    ) -> None:
+        entry = StartupEntry(
+            name=name,
+            category=category,
+            duration_ms=duration_ms,
+            started_at=(time.perf_counter() if started_at is None else started_at) - self._origin,
+        )
+        with self._lock:
+            self._entries.append(entry)
+
+    def entries(self, category: Optional[str] = None) -> List[StartupEntry]:
+        with self._lock:
+            return [e for e in self._entries if category is None or e.category == category]
+
+    def report(self) -> Dict[str, Any]:
+        """Rapport structuré : totaux par catégorie et étapes triées par coût"""
+        entries = sorted(self.entries(), key=lambda e: e.duration_ms, reverse=True)
+        totals: Dict[str, float] = {}
+        for entry in entries:
+            totals[entry.category] = totals.get(entry.category, 0.0) + entry.duration_ms
+
+        # Les étapes peuvent s'imbriquer : le total est l'étendue réelle mesurée
+        span_ms = (
+            max(e.started_at * 1000 + e.duration_ms for e in entries)
+            - min(e.started_at for e in entries) * 1000
+            if entries
+            else 0.0
+        )
+
+        return {
+            "total_ms": round(span_ms, 2),
+            "by_category": {k: round(v, 2) for k, v in totals.items()},
+            "entries": [
+                {
+                    "name": e.name,
+                    "category": e.category,
+                    "duration_ms": round(e.duration_ms, 2),
+                    "started_at_ms": round(e.started_at * 1000, 2),
+                }
+                for e in entries
+            ],
+        }
+
+    def format_report(self, limit: int = 20) -> str:
+        """Rapport lisible pour les logs"""
+        report = self.report()
+        lines = [f"⏱️ Startup profile: {report['total_ms']:.1f} ms"]
+        for entry in report["entries"][:limit]:
+            lines.append(
+                f"  {entry['duration_ms']:>9.2f} ms  [{entry['category']}] {entry['name']}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._origin = time.perf_counter()
+
+
+class LazySingleton(Generic[T]):
+    """
+    Proxy d'instance globale construite au premier accès
+
+    Remplace `instance = Classe()` au niveau module : l'import ne coûte plus
+    rien et la construction (chronométrée dans le profil de démarrage) n'a
+    lieu qu'au premier attribut lu. Le proxy délègue attributs, affectations
+    et isinstance à l'instance réelle.
+    """
+
+    __slots__ = ("_factory", "_name", "_instance", "_lock")
+
+    def __init__(self, factory: Callable[[], T], name: Optional[str] = None):
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_name", name or getattr(factory, "__name__", "singleton"))
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _get_instance(self) -> T:
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            with object.__getattribute__(self, "_lock"):
+                instance = object.__getattribute__(self, "_instance")
+                if instance is None:
+                    name = object.__getattribute__(self, "_name")
+                    with startup_profiler.measure(name, "singleton"):
+                        instance = object.__getattribute__(self, "_factory")()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    @property
+    def __class__(self):  # isinstance(proxy, Classe) reste vrai
+        return type(self._get_instance())
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_instance(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get_instance(), name)
+
+    def __repr__(self) -> str:
+        if not is_built(self):
+            return f"<LazySingleton {object.__getattribute__(self, '_name')} (not built)>"
+        return repr(self._get_instance())
+
+    def __bool__(self) -> bool:
+        return bool(self._get_instance())
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._get_instance()(*args, **kwargs)
+
+
+def is_built(obj: Any) -> bool:
+    """Indique si un singleton paresseux a déjà été construit (True pour un objet ordinaire)"""
+    if type(obj) is LazySingleton:
+        return object.__getattribute__(obj, "_instance") is not None
+    return True
+
+
+def lazy_singleton(factory: Callable[[], T], name: Optional[str] = None) -> T:
+    """Crée un singleton paresseux (typé comme l'instance qu'il représente)"""
+    return LazySingleton(factory, name)  # type: ignore[return-value]
+
+
+# Ligne produite par `python -X importtime` : "import time: self | cumulative | module"
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> Dict[str, Dict[str, float]]:
+    """
+    Parse la sortie stderr de `python -X importtime`
+
+    Returns:
+        {module: {"self_ms", "cumulative_ms", "depth"}} (un module importé
+        plusieurs fois dans la sortie garde sa première mesure)
+    """
+    modules: Dict[str, Dict[str, float]] = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.setdefault(
+            name,
+            {
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": (len(indent) - 1) // 2,
+            },
+        )
+    return modules
+
+
+def check_budget(
+    metrics: Dict[str, float], budget: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Compare des mesures de démarrage à un budget
+
+    Args:
+        metrics: Mesures à plat ("import_ms", "singleton:DatabaseService"...)
+        budget: {"tolerance": 0.1, "metrics": {nom: plafond_ms}}
+
+    Returns:
+        Liste des dépassements (vide si le budget est respecté)
+    """
+    tolerance = float(budget.get("tolerance", 0.0))
+    violations = []
+    for name, limit in budget.get("metrics", {}).items():
+        value = metrics.get(name)
+        if value is None:
+            continue
+        allowed = limit * (1 + tolerance)
+        if value > allowed:
+            violations.append(
+                {
+                    "metric": name,
+                    "value_ms": round(value, 2),
+                    "budget_ms": limit,
+                    "allowed_ms": round(allowed, 2),
+                    "over_by_ms": round(value - allowed, 2),
+                }
+            )
+    return violations
+
+
+# Instance globale du profil de démarrage
+startup_profiler = StartupProfiler()
+
+logger.debug("⏱️ Startup profiler ready")
@@ -0,0 +1,408 @@
+"""
+THEBOT - Moteur temps réel de l'application native
+Calcul des indicateurs hors du thread Qt : les ticks sont répartis par symbole
+sur des threads de calcul, les résultats sont fusionnés (dernier état par
+symbole) puis publiés vers l'interface à une cadence d'images plafonnée
+"""
+
+import logging
+import queue
+import random
+import threading
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+from ..core.types import MarketData, TimeFrame
+from ..indicators.basic.ema.calculator import EMACalculator
+from ..indicators.basic.ema.config import EMAConfig
+from ..indicators.basic.sma.calculator import SMACalculator
+from ..indicators.basic.sma.config import SMAConfig
+from ..indicators.oscillators.rsi.calculator import RSICalculator
+from ..indicators.oscillators.rsi.config import RSIConfig
+from ..indicators.volatility.atr.calculator import ATRCalculator
+from ..indicators.volatility.atr.config import ATRConfig
+
+try:
+    from PyQt6.QtCore import QThread, pyqtSignal
+
+    PYQT_AVAILABLE = True
+except ImportError:
+    PYQT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataGenerator:
+    """Générateur de données de marché simulées"""
+
+    def __init__(self, symbol: str, base_price: float = 50000.0):
+        self.symbol = symbol
+        self.current_price = Decimal(str(base_price))
+        self.current_time = datetime.now()
+
+    def generate_next_candle(self) -> MarketData:
+        """Génère la prochaine bougie"""
+        # Mouvement aléatoire (-2% à +2%)
+        change_pct = Decimal(str(random.uniform(-0.02, 0.02)))
+        new_price = self.current_price * (1 + change_pct)
+
+        # OHLC réaliste
+        open_price = self.current_price
+        close_price = new_price
+        high_price = max(open_price, close_price) * Decimal("1.001")
+        low_price = min(open_price, close_price) * Decimal("0.999")
+        volume = Decimal(str(random.uniform(1000, 10000)))
+
+        self.current_price = close_price
+        self.current_time += timedelta(minutes=1)
+
+        return MarketData(
+            timestamp=self.current_time,
+            open=open_price,
+            high=high_price,
+            low=low_price,
+            close=close_price,
+            volume=volume,
+            timeframe=TimeFrame.M1,
+            symbol=self.symbol,
+        )
+
+
+@dataclass(frozen=True)
+class IndicatorSettings:
+    """Paramètres des indicateurs calculés en temps réel"""
+
+    sma_period: int = 20
+    ema_period: int = 12
+    atr_period: int = 14
+    rsi_period: int = 14
+    rsi_overbought: int = 70
+    rsi_oversold: int = 30
+    history_size: int = 200
+
+
+@dataclass
+class SymbolSnapshot:
+    """Dernier état calculé d'un symbole, publié vers l'interface"""
+
+    symbol: str
+    timestamp: datetime
+    close: Decimal
+    sma: Optional[Decimal] = None
+    ema: Optional[Decimal] = None
+    atr: Optional[Decimal] = None
+    rsi: Optional[Decimal] = None
+    bars: int = 0
+    ticks: int = 1  # Ticks fusionnés depuis la dernière image
+    signals: List[str] = field(default_factory=list)
+
+
+class SymbolPipeline:
+    """
+    Indicateurs incrémentaux d'un symbole
+
+    N'est alimenté que par le thread de calcul auquel le symbole est affecté ;
+    le verrou ne protège que les lectures de l'historique depuis l'interface.
+    """
+
+    def __init__(self, symbol: str, settings: IndicatorSettings):
+        self.symbol = symbol
+        self._lock = threading.Lock()
+        self.history: Deque[MarketData] = deque(maxlen=settings.history_size)
+        self.configure(settings)
+
+    def configure(self, settings: IndicatorSettings) -> None:
+        """Recrée les calculateurs et rejoue l'historique conservé"""
+        with self._lock:
+            self.settings = settings
+            self.sma = SMACalculator(SMAConfig(period=settings.sma_period))
+            self.ema = EMACalculator(EMAConfig(period=settings.ema_period))
+            self.atr = ATRCalculator(ATRConfig(period=settings.atr_period))
+            self.rsi = RSICalculator(
+                RSIConfig(
+                    period=settings.rsi_period,
+                    overbought_level=Decimal(settings.rsi_overbought),
+                    oversold_level=Decimal(settings.rsi_oversold),
+                )
+            )
+            self._sma_value: Optional[Decimal] = None
+            self._states: Dict[str, str] = {}
+            self.history = deque(self.history, maxlen=settings.history_size)
+            for data in self.history:
+                self._update_indicators(data)
+
+    def _update_indicators(self, data: MarketData) -> None:
+        self._sma_value = self.sma.calculate_from_data(data)
+        self.ema.add_data_point(data)
+        self.atr.add_data_point(data)
+        self.rsi.add_data_point(data)
+
+    def process(self, data: MarketData) -> SymbolSnapshot:
+        """Intègre une nouvelle bougie et retourne l'état courant"""
+        with self._lock:
+            self.history.append(data)
+            self._update_indicators(data)
+
+            snapshot = SymbolSnapshot(
+                symbol=self.symbol,
+                timestamp=data.timestamp,
+                close=data.close,
+                sma=self._sma_value,
+                ema=self.ema.get_current_value(),
+                atr=self.atr.get_current_value(),
+                rsi=self.rsi.get_current_value(),
+                bars=len(self.history),
+            )
+            snapshot.signals = self._check_signals(snapshot)
+        return snapshot
+
+    def _check_signals(self, snapshot: SymbolSnapshot) -> List[str]:
+        """Signaux émis uniquement aux changements d'état (pas à chaque tick)"""
+        signals = []
+
+        def transition(name: str, state: Optional[str], message: str = "") -> None:
+            if state is not None and self._states.get(name) != state:
+                self._states[name] = state
+                if message:
+                    signals.append(f"{self.symbol} {message}")
+
+        if snapshot.rsi is not None:
+            if snapshot.rsi < self.settings.rsi_oversold:
+                transition(
+                    "rsi", "oversold",
+                    f"🟢 RSI Survente: {snapshot.rsi:.1f} < {self.settings.rsi_oversold}",
+                )
+            elif snapshot.rsi > self.settings.rsi_overbought:
+                transition(
+                    "rsi", "overbought",
+                    f"🔴 RSI Surachat: {snapshot.rsi:.1f} > {self.settings.rsi_overbought}",
+                )
+            else:
+                transition("rsi", "neutral")
+
+        if snapshot.sma is not None and snapshot.ema is not None:
+            if snapshot.ema > snapshot.sma * Decimal("1.001"):  # EMA > SMA avec marge
+                transition("trend", "up", "📈 EMA > SMA: Tendance haussière")
+            elif snapshot.ema < snapshot.sma * Decimal("0.999"):  # EMA < SMA avec marge
+                transition("trend", "down", "📉 EMA < SMA: Tendance baissière")
+
+        percentile = self.atr.get_volatility_percentile()
+        if percentile is not None:
+            if percentile > 80:
+                transition("volatility", "high", f"⚡ Forte volatilité: {percentile:.0f}%")
+            else:
+                transition("volatility", "normal")
+
+        return signals
+
+    def get_history(self) -> List[MarketData]:
+        with self._lock:
+            return list(self.history)
+
+
+class LiveEngine:
+    """
+    Moteur de calcul temps réel multi-symboles
+
+    - submit() accepte les ticks depuis n'importe quel thread (flux, websocket)
+    - chaque symbole est affecté à un seul thread de calcul : ses indicateurs
+      sont mis à jour dans l'ordre, sans verrou entre threads
+    - les états sont fusionnés par symbole : drain() ne retourne que le
+      dernier état de chaque symbole modifié depuis l'appel précédent
+    """
+
+    _RESET = object()
+    _STOP = object()
+
+    def __init__(self, settings: Optional[IndicatorSettings] = None, workers: int = 2):
+        self.settings = settings or IndicatorSettings()
+        self.workers = max(1, workers)
+
+        self._queues: List[queue.Queue] = [queue.Queue() for _ in range(self.workers)]
+        self._threads: List[threading.Thread] = []
+        self._pipelines: Dict[str, SymbolPipeline] = {}
+        self._pending: Dict[str, SymbolSnapshot] = {}
+        self._lock = threading.Lock()
+        self._processed = 0
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """Démarre les threads de calcul"""
+        if self.running:
+            return
+        self._threads = [
+            threading.Thread(
+                target=self._worker, args=(tasks,), name=f"thebot-live-{index}", daemon=True
+            )
+            for index, tasks in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"🚀 Moteur temps réel démarré ({self.workers} threads de calcul)")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Arrête les threads de calcul après traitement des ticks en attente"""
+        if not self.running:
+            return
+        for tasks in self._queues:
+            tasks.put(self._STOP)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, data: MarketData) -> None:
+        """Publie un tick (thread-safe, non bloquant)"""
+        self._queues[self._worker_index(data.symbol)].put(data)
+
+    def submit_many(self, ticks: Iterable[MarketData]) -> None:
+        for data in ticks:
+            self.submit(data)
+
+    def configure(self, settings: IndicatorSettings) -> None:
+        """Applique de nouveaux paramètres (recalcul sur les threads de calcul)"""
+        self.settings = settings
+        for tasks in self._queues:
+            tasks.put(settings)
+
+    def reset(self) -> None:
+        """Vide historiques et indicateurs de tous les symboles"""
+        for tasks in self._queues:
+            tasks.put(self._RESET)
+
+    def drain(self) -> Dict[str, SymbolSnapshot]:
+        """Retourne (et vide) les derniers états par symbole"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def history(self, symbol: str) -> List[MarketData]:
+        """Copie de l'historique conservé d'un symbole"""
+        pipeline = self._pipelines.get(symbol)
+        return pipeline.get_history() if pipeline else []
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "symbols": len(self._pipelines),
+            "processed": self._processed,
+            "queued": sum(tasks.qsize() for tasks in self._queues),
+            "workers": self.workers,
+        }
+
+    def _worker_index(self, symbol: str) -> int:
+        return zlib.crc32(symbol.encode()) % self.workers
+
+    def _worker(self, tasks: queue.Queue) -> None:
+        while True:
+            item = tasks.get()
+            if item is self._STOP:
+                return
+            try:
+                if item is self._RESET:
+                    self._reset_owned(tasks)
+                elif isinstance(item, IndicatorSettings):
+                    for pipeline in self._owned(tasks):
+                        pipeline.configure(item)
+                else:
+                    self._process(item)
+            except Exception as e:
+                logger.error(f"❌ Erreur moteur temps réel: {e}")
+
+    def _owned(self, tasks: queue.Queue) -> List[SymbolPipeline]:
+        index = self._queues.index(tasks)
+        return [
+            pipeline
+            for symbol, pipeline in list(self._pipelines.items())
+            if self._worker_index(symbol) == index
+        ]
+
+    def _reset_owned(self, tasks: queue.Queue) -> None:
+        owned = self._owned(tasks)
+        with self._lock:
+            for pipeline in owned:
+                self._pipelines.pop(pipeline.symbol, None)
+                self._pending.pop(pipeline.symbol, None)
+
+    def _process(self, data: MarketData) -> None:
+        pipeline = self._pipelines.get(data.symbol)
+        if pipeline is None:
+            pipeline = self._pipelines[data.symbol] = SymbolPipeline(data.symbol, self.settings)
+        snapshot = pipeline.process(data)
+
+        with self._lock:
+            previous = self._pending.get(data.symbol)
+            if previous is not None:
+                # Fusion : dernier état, signaux et ticks cumulés depuis la dernière image
+                snapshot.ticks += previous.ticks
+                snapshot.signals = previous.signals + snapshot.signals
+            self._pending[data.symbol] = snapshot
+            self._processed += 1
+
+
+class SimulatedFeed:
+    """Flux simulé : une bougie par symbole à chaque intervalle, sur son propre thread"""
+
+    def __init__(
+        self,
+        sink: Callable[[MarketData], None],
+        generators: Dict[str, MarketDataGenerator],
+        interval: float = 0.25,
+    ):
+        self.sink = sink
+        self.generators = generators
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="thebot-feed", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(self.interval + 1)
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            for generator in list(self.generators.values()):
+                self.sink(generator.generate_next_candle())
+
+
+if PYQT_AVAILABLE:
+
+    class LiveEngineBridge(QThread):
+        """
+        Pont vers le thread Qt : publie les états fusionnés par signal
+        (connexion en file d'attente) à max_fps images par seconde au plus
+        """
+
+        snapshots_ready = pyqtSignal(dict)
+
+        def __init__(self, engine: LiveEngine, max_fps: int = 20, parent=None):
+            super().__init__(parent)
+            self.engine = engine
+            self.frame_interval = 1.0 / max_fps
+
+        def run(self):
+            next_frame = time.monotonic()
+            while not self.isInterruptionRequested():
+                next_frame += self.frame_interval
+                time.sleep(max(0.0, next_frame - time.monotonic()))
+                snapshots = self.engine.drain()
+                if snapshots:
+                    self.snapshots_ready.emit(snapshots)
+
+        def stop(self):
+            self.requestInterruption()
+            self.wait()
@@ -8,10 +8,8 @@ Interface de trading professionnelle avec PyQt6
 import json
 import os
 import sys
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict
 
 try:
     from PyQt6.QtChart import QChart, QChartView, QDateTimeAxis, QLineSeries, QValueAxis
@@ -62,62 +60,22 @@ if not PYQT_AVAILABLE:
     except ImportError:
         MATPLOTLIB_AVAILABLE = False
 
-# Imports des indicateurs THEBOT
+# Moteur temps réel THEBOT (calcul des indicateurs hors du thread Qt)
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from thebot.indicators.basic.ema import EMAIndicator
-from thebot.indicators.basic.sma import SMAIndicator
-from thebot.indicators.oscillators.rsi import RSIIndicator
-from thebot.indicators.volatility.atr import ATRIndicator
-
-
-@dataclass
-class MarketData:
-    """Données de marché simulées"""
-
-    symbol: str
-    timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
-
-
-class MarketDataGenerator:
-    """Générateur de données de marché simulées"""
-
-    def __init__(self, symbol: str, base_price: float = 50000.0):
-        self.symbol = symbol
-        self.current_price = Decimal(str(base_price))
-        self.current_time = datetime.now()
-
-    def generate_next_candle(self) -> MarketData:
-        """Génère la prochaine bougie"""
-        import random
-
-        # Mouvement aléatoire (-2% à +2%)
-        change_pct = Decimal(str(random.uniform(-0.02, 0.02)))
-        new_price = self.current_price * (1 + change_pct)
-
-        # OHLC réaliste
-        open_price = self.current_price
-        close_price = new_price
-        high_price = max(open_price, close_price) * Decimal("1.001")
-        low_price = min(open_price, close_price) * Decimal("0.999")
-        volume = Decimal(str(random.uniform(1000, 10000)))
-
-        self.current_price = close_price
-        self.current_time += timedelta(minutes=1)
-
-        return MarketData(
-            symbol=self.symbol,
-            timestamp=self.current_time,
-            open=open_price,
-            high=high_price,
-            low=low_price,
-            close=close_price,
-            volume=volume,
-        )
+from thebot.gui.live_engine import (
+    IndicatorSettings,
+    LiveEngine,
+    MarketDataGenerator,
+    SimulatedFeed,
+    SymbolPipeline,
+)
+
+if PYQT_AVAILABLE:
+    from thebot.gui.live_engine import LiveEngineBridge
+
+# Intervalle du flux simulé et cadence maximale de rafraîchissement de l'interface
+TICK_INTERVAL = 0.25
+MAX_FPS = 20
 
 
 if PYQT_AVAILABLE:
@@ -130,7 +88,7 @@ if PYQT_AVAILABLE:
             self.setWindowTitle("THEBOT - Trading Analysis Platform")
             self.setGeometry(100, 100, 1400, 900)
 
-            # Données et indicateurs
+            # Données de marché (flux simulé multi-symboles)
             self.market_generators = {
                 "BTCUSDT": MarketDataGenerator("BTCUSDT", 50000),
                 "ETHUSD": MarketDataGenerator("ETHUSD", 3000),
@@ -138,19 +96,8 @@ if PYQT_AVAILABLE:
                 "GBPUSD": MarketDataGenerator("GBPUSD", 1.3),
             }
 
-            self.price_history: Dict[str, List[MarketData]] = {
-                symbol: [] for symbol in self.market_generators.keys()
-            }
-
-            self.indicators = {
-                "SMA": SMAIndicator(),
-                "EMA": EMAIndicator(),
-                "ATR": ATRIndicator(),
-                "RSI": RSIIndicator(),
-            }
-
             self.setup_ui()
-            self.setup_timer()
+            self.setup_live_engine()
             self.setup_system_tray()
 
         def setup_ui(self):
@@ -199,7 +146,7 @@ if PYQT_AVAILABLE:
             market_layout = QVBoxLayout(market_group)
 
             self.symbol_combo = QComboBox()
-            self.symbol_combo.addItems(["BTCUSDT", "ETHUSD", "EURUSD", "GBPUSD"])
+            self.symbol_combo.addItems(list(self.market_generators))
             self.symbol_combo.currentTextChanged.connect(self.on_symbol_changed)
             market_layout.addWidget(self.symbol_combo)
 
@@ -265,6 +212,16 @@ if PYQT_AVAILABLE:
 
             layout.addWidget(rsi_group)
 
+            for spin_box in (
+                self.sma_period,
+                self.ema_period,
+                self.atr_period,
+                self.rsi_period,
+                self.rsi_oversold,
+                self.rsi_overbought,
+            ):
+                spin_box.valueChanged.connect(self.on_settings_changed)
+
             # Boutons de contrôle
             controls_group = QGroupBox("Contrôles")
             controls_layout = QVBoxLayout(controls_group)
@@ -435,10 +392,30 @@ if PYQT_AVAILABLE:
             about_action.triggered.connect(self.show_about)
             help_menu.addAction(about_action)
 
-        def setup_timer(self):
-            """Configuration du timer pour mise à jour temps réel"""
-            self.update_timer = QTimer()
-            self.update_timer.timeout.connect(self.update_market_data)
+        def setup_live_engine(self):
+            """
+            Pipeline temps réel : flux -> threads de calcul -> pont Qt
+
+            Le thread principal ne fait que l'affichage des états fusionnés,
+            reçus par signal au plus MAX_FPS fois par seconde.
+            """
+            self.live_engine = LiveEngine(self.current_settings())
+            self.market_feed = SimulatedFeed(
+                self.live_engine.submit, self.market_generators, interval=TICK_INTERVAL
+            )
+            self.engine_bridge = LiveEngineBridge(self.live_engine, max_fps=MAX_FPS, parent=self)
+            self.engine_bridge.snapshots_ready.connect(self.on_snapshots)
+
+        def current_settings(self) -> IndicatorSettings:
+            """Paramètres des indicateurs saisis dans le panel de contrôle"""
+            return IndicatorSettings(
+                sma_period=self.sma_period.value(),
+                ema_period=self.ema_period.value(),
+                atr_period=self.atr_period.value(),
+                rsi_period=self.rsi_period.value(),
+                rsi_overbought=self.rsi_overbought.value(),
+                rsi_oversold=self.rsi_oversold.value(),
+            )
 
         def setup_system_tray(self):
             """Configuration de l'icône dans la barre système"""
@@ -463,7 +440,9 @@ if PYQT_AVAILABLE:
         # Méthodes d'événements
         def start_analysis(self):
             """Démarrage de l'analyse temps réel"""
-            self.update_timer.start(1000)  # 1 seconde
+            self.live_engine.start()
+            self.market_feed.start()
+            self.engine_bridge.start()
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
             self.status_bar.showMessage("Analyse en cours...")
@@ -471,7 +450,9 @@ if PYQT_AVAILABLE:
 
         def stop_analysis(self):
             """Arrêt de l'analyse"""
-            self.update_timer.stop()
+            self.market_feed.stop()
+            self.engine_bridge.stop()
+            self.live_engine.stop()
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             self.status_bar.showMessage("Analyse arrêtée")
@@ -481,13 +462,8 @@ if PYQT_AVAILABLE:
             """Reset de l'analyse"""
             self.stop_analysis()
 
-            # Reset des indicateurs
-            for indicator in self.indicators.values():
-                indicator.reset()
-
-            # Reset des données
-            for symbol in self.price_history:
-                self.price_history[symbol].clear()
+            # Reset des indicateurs et des données (traité par les threads de calcul)
+            self.live_engine.reset()
 
             self.signals_text.clear()
             self.stats_text.clear()
@@ -497,130 +473,51 @@ if PYQT_AVAILABLE:
             """Changement de symbole"""
             self.add_signal(f"📊 Symbole changé: {symbol}")
 
-        def update_market_data(self):
-            """Mise à jour des données de marché"""
-            current_symbol = self.symbol_combo.currentText()
-            generator = self.market_generators[current_symbol]
-
-            # Générer nouvelle donnée
-            new_data = generator.generate_next_candle()
-            self.price_history[current_symbol].append(new_data)
-
-            # Limiter l'historique
-            if len(self.price_history[current_symbol]) > 200:
-                self.price_history[current_symbol] = self.price_history[current_symbol][
-                    -200:
-                ]
-
-            # Mise à jour des indicateurs
-            self.update_indicators(new_data)
-
-            # Mise à jour de l'affichage
-            self.update_display(new_data)
-
-        def update_indicators(self, data: MarketData):
-            """Mise à jour des indicateurs"""
-            price = float(data.close)
-
-            # SMA
-            sma_config = self.indicators["SMA"].config
-            sma_config.period = self.sma_period.value()
-            sma_result = self.indicators["SMA"].add_price(data.close)
+        def on_settings_changed(self, _value: int):
+            """Nouveaux paramètres : recalcul sur les threads de calcul"""
+            self.live_engine.configure(self.current_settings())
 
-            # EMA
-            ema_config = self.indicators["EMA"].config
-            ema_config.period = self.ema_period.value()
-            ema_result = self.indicators["EMA"].add_price(data.close)
-
-            # ATR
-            atr_config = self.indicators["ATR"].config
-            atr_config.period = self.atr_period.value()
-            atr_result = self.indicators["ATR"].add_ohlc(
-                data.high, data.low, data.close
+        def on_snapshots(self, snapshots: Dict):
+            """Réception d'une image : derniers états fusionnés par symbole"""
+            current_symbol = self.symbol_combo.currentText()
+            snapshot = snapshots.get(current_symbol)
+            if snapshot is not None:
+                self.update_display(snapshot)
+                for signal in snapshot.signals:
+                    self.add_signal(signal)
+
+            stats = self.live_engine.get_stats()
+            self.status_bar.showMessage(
+                f"Analyse en cours - {stats['symbols']} symboles, "
+                f"{stats['processed']} ticks traités, {stats['queued']} en attente"
             )
 
-            # RSI
-            rsi_config = self.indicators["RSI"].config
-            rsi_config.period = self.rsi_period.value()
-            rsi_config.overbought_level = self.rsi_overbought.value()
-            rsi_config.oversold_level = self.rsi_oversold.value()
-            rsi_result = self.indicators["RSI"].add_price(data.close)
-
-            # Vérification des signaux
-            self.check_signals(data, sma_result, ema_result, atr_result, rsi_result)
-
-        def update_display(self, data: MarketData):
+        def update_display(self, snapshot):
             """Mise à jour de l'affichage"""
             # Labels des valeurs actuelles
-            self.current_price_label.setText(f"Prix: {data.close:.2f}")
-
-            # Récupération des dernières valeurs calculées
-            sma_val = self.indicators["SMA"].get_current_value()
-            ema_val = self.indicators["EMA"].get_current_value()
-            atr_val = self.indicators["ATR"].get_current_value()
-            rsi_val = self.indicators["RSI"].get_current_value()
+            self.current_price_label.setText(f"Prix: {snapshot.close:.2f}")
 
             self.current_sma_label.setText(
-                f"SMA({self.sma_period.value()}): {sma_val:.2f}"
-                if sma_val
+                f"SMA({self.sma_period.value()}): {snapshot.sma:.2f}"
+                if snapshot.sma
                 else "SMA: --"
             )
             self.current_ema_label.setText(
-                f"EMA({self.ema_period.value()}): {ema_val:.2f}"
-                if ema_val
+                f"EMA({self.ema_period.value()}): {snapshot.ema:.2f}"
+                if snapshot.ema
                 else "EMA: --"
             )
             self.current_atr_label.setText(
-                f"ATR({self.atr_period.value()}): {atr_val:.4f}"
-                if atr_val
+                f"ATR({self.atr_period.value()}): {snapshot.atr:.4f}"
+                if snapshot.atr
                 else "ATR: --"
             )
             self.current_rsi_label.setText(
-                f"RSI({self.rsi_period.value()}): {rsi_val:.1f}"
-                if rsi_val
+                f"RSI({self.rsi_period.value()}): {snapshot.rsi:.1f}"
+                if snapshot.rsi
                 else "RSI: --"
             )
 
-        def check_signals(self, data, sma_result, ema_result, atr_result, rsi_result):
-            """Vérification des signaux de trading"""
-            signals = []
-
-            # Signaux RSI
-            if rsi_result and hasattr(rsi_result, "signal"):
-                if rsi_result.signal == "OVERSOLD":
-                    signals.append(
-                        f"🟢 RSI Survente: {rsi_result.value:.1f} < {self.rsi_oversold.value()}"
-                    )
-                elif rsi_result.signal == "OVERBOUGHT":
-                    signals.append(
-                        f"🔴 RSI Surachat: {rsi_result.value:.1f} > {self.rsi_overbought.value()}"
-                    )
-
-            # Signaux croisement MA
-            if sma_result and ema_result:
-                sma_val = (
-                    sma_result.value if hasattr(sma_result, "value") else sma_result
-                )
-                ema_val = (
-                    ema_result.value if hasattr(ema_result, "value") else ema_result
-                )
-
-                if ema_val > sma_val * 1.001:  # EMA > SMA avec marge
-                    signals.append(f"📈 EMA > SMA: Tendance haussière")
-                elif ema_val < sma_val * 0.999:  # EMA < SMA avec marge
-                    signals.append(f"📉 EMA < SMA: Tendance baissière")
-
-            # ATR volatilité
-            if atr_result and hasattr(atr_result, "volatility_percentile"):
-                if atr_result.volatility_percentile > 80:
-                    signals.append(
-                        f"⚡ Forte volatilité: {atr_result.volatility_percentile:.0f}%"
-                    )
-
-            # Affichage des signaux
-            for signal in signals:
-                self.add_signal(signal)
-
         def add_signal(self, signal: str):
             """Ajout d'un signal au log"""
             timestamp = datetime.now().strftime("%H:%M:%S")
@@ -638,22 +535,28 @@ if PYQT_AVAILABLE:
         def test_indicators(self):
             """Test des indicateurs"""
             try:
-                # Test rapide de tous les indicateurs
-                test_price = Decimal("50000.0")
-
-                results = []
-                for name, indicator in self.indicators.items():
-                    try:
-                        if name in ["SMA", "EMA", "RSI"]:
-                            result = indicator.add_price(test_price)
-                        else:  # ATR
-                            result = indicator.add_ohlc(
-                                test_price, test_price * Decimal("0.99"), test_price
-                            )
-                        results.append(f"✅ {name}: OK")
-                    except Exception as e:
-                        results.append(f"❌ {name}: {e}")
-
+                # Test rapide de tous les indicateurs sur un historique simulé
+                settings = self.current_settings()
+                generator = MarketDataGenerator("TEST", 50000)
+                pipeline = SymbolPipeline("TEST", settings)
+                periods = (
+                    settings.sma_period,
+                    settings.ema_period,
+                    settings.atr_period,
+                    settings.rsi_period,
+                )
+                for _ in range(max(periods) + 1):
+                    snapshot = pipeline.process(generator.generate_next_candle())
+
+                results = [
+                    f"✅ {name}: OK" if value is not None else f"❌ {name}: pas de valeur"
+                    for name, value in (
+                        ("SMA", snapshot.sma),
+                        ("EMA", snapshot.ema),
+                        ("ATR", snapshot.atr),
+                        ("RSI", snapshot.rsi),
+                    )
+                ]
                 self.add_signal(f"Tests: {', '.join(results)}")
 
             except Exception as e:
@@ -662,7 +565,7 @@ if PYQT_AVAILABLE:
         def export_data(self):
             """Export des données"""
             current_symbol = self.symbol_combo.currentText()
-            data = self.price_history.get(current_symbol, [])
+            data = self.live_engine.history(current_symbol)
 
             if data:
                 filename = f"thebot_export_{current_symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
@@ -685,6 +588,13 @@ if PYQT_AVAILABLE:
             else:
                 self.add_signal("⚠️ Aucune donnée à exporter")
 
+        def closeEvent(self, event):
+            """Arrêt des threads du moteur avant fermeture"""
+            self.market_feed.stop()
+            self.engine_bridge.stop()
+            self.live_engine.stop()
+            super().closeEvent(event)
+
         def show_about(self):
             """Affichage des informations"""
             from PyQt6.QtWidgets import QMessageBox
@@ -39,6 +39,12 @@ from PyQt6.QtWidgets import (
 )
 
 from thebot.core.types import MarketData, TimeFrame
+from thebot.gui.live_engine import (
+    LiveEngine,
+    LiveEngineBridge,
+    MarketDataGenerator,
+    SimulatedFeed,
+)
 from thebot.indicators.basic.ema import EMAIndicator
 
 # Imports des modules THEBOT
@@ -92,6 +98,17 @@ class ChartWidget(FigureCanvas):
 
         self.draw()
 
+    def plot_live(self, symbol: str, closes: List[float]):
+        """Afficher l'historique temps réel d'un symbole"""
+        self.axes.clear()
+        self.axes.set_facecolor("#1e1e1e")
+        self.axes.plot(range(len(closes)), closes, color="#00ff00", linewidth=2, label=symbol)
+        self.axes.set_title(f"THEBOT - {symbol} (temps réel)", color="white", fontsize=14)
+        self.axes.legend()
+        self.axes.grid(True, alpha=0.3)
+        self.axes.tick_params(colors="white")
+        self.draw_idle()
+
     def plot_indicator(self, data: pd.Series, name: str, color: str = "#ff6600"):
         """Afficher un indicateur"""
         self.axes.plot(data.index, data.values, color=color, linewidth=2, label=name)
@@ -366,6 +383,22 @@ class MainWindow(QMainWindow):
         self.init_ui()
         self.init_menu()
         self.init_status()
+        self.init_live_engine()
+
+    def init_live_engine(self):
+        """Flux temps réel : indicateurs calculés hors du thread Qt"""
+        self.live_symbol = "BTCUSDT"
+        self.live_engine = LiveEngine()
+        self.live_feed = SimulatedFeed(
+            self.live_engine.submit,
+            {
+                "BTCUSDT": MarketDataGenerator("BTCUSDT", 50000),
+                "ETHUSDT": MarketDataGenerator("ETHUSDT", 3000),
+            },
+        )
+        # Redessin matplotlib coûteux : cadence plafonnée plus bas que les labels
+        self.live_bridge = LiveEngineBridge(self.live_engine, max_fps=5, parent=self)
+        self.live_bridge.snapshots_ready.connect(self.on_live_snapshots)
 
     def init_ui(self):
         """Initialiser l'interface utilisateur"""
@@ -406,6 +439,11 @@ class MainWindow(QMainWindow):
         refresh_btn.clicked.connect(self.refresh_data)
         action_layout.addWidget(refresh_btn)
 
+        self.live_btn = QPushButton("📡 Flux Temps Réel")
+        self.live_btn.setCheckable(True)
+        self.live_btn.toggled.connect(self.toggle_live)
+        action_layout.addWidget(self.live_btn)
+
         reset_btn = QPushButton("🧹 Réinitialiser")
         reset_btn.clicked.connect(self.reset_all)
         action_layout.addWidget(reset_btn)
@@ -484,6 +522,46 @@ class MainWindow(QMainWindow):
         except Exception as e:
             self.statusBar().showMessage(f"❌ Erreur affichage {name}: {str(e)}")
 
+    @pyqtSlot(bool)
+    def toggle_live(self, enabled: bool):
+        """Démarrer / arrêter le flux temps réel"""
+        if enabled:
+            self.live_engine.start()
+            self.live_feed.start()
+            self.live_bridge.start()
+            self.statusBar().showMessage("📡 Flux temps réel démarré")
+        else:
+            self.stop_live()
+            self.statusBar().showMessage("⏹️ Flux temps réel arrêté")
+
+    def stop_live(self):
+        self.live_feed.stop()
+        self.live_bridge.stop()
+        self.live_engine.stop()
+
+    @pyqtSlot(dict)
+    def on_live_snapshots(self, snapshots: dict):
+        """Image temps réel : seul le symbole affiché est redessiné"""
+        snapshot = snapshots.get(self.live_symbol)
+        if snapshot is None:
+            return
+
+        closes = [float(data.close) for data in self.live_engine.history(self.live_symbol)]
+        self.chart_widget.plot_live(self.live_symbol, closes)
+        for signal in snapshot.signals:
+            self.indicators_panel.results_text.append(signal)
+
+        rsi = f"{snapshot.rsi:.1f}" if snapshot.rsi is not None else "--"
+        self.statusBar().showMessage(
+            f"📡 {self.live_symbol}: {snapshot.close:.2f} | RSI {rsi} | "
+            f"{self.live_engine.get_stats()['processed']} ticks traités"
+        )
+
+    def closeEvent(self, event):
+        """Arrêt des threads du flux avant fermeture"""
+        self.stop_live()
+        super().closeEvent(event)
+
     @pyqtSlot()
     def refresh_data(self):
         """Actualiser les données"""
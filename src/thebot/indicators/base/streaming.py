@@ -0,0 +1,241 @@
+"""
+Streaming statistics - O(1) building blocks for incremental indicators
+Single responsibility: Maintain window statistics without rescanning the window
+
+Each accumulator is fed one value per bar through update() and keeps only
+the state needed to answer in constant (amortized) time, whatever the period:
+- RunningMean: Running sum and mean (cumulative or over a sliding window)
+- RollingVariance: Welford mean / variance with removal of the oldest value
+- RollingMax / RollingMin: Monotonic deque extremes over a sliding window
+- WilderSmoother: Wilder's moving average (SMA seed, then (prev*(n-1)+x)/n)
+
+Sliding float sums pick up rounding error with every add/remove pair, so the
+windowed accumulators recompute their state from the window once per
+`window` removals: the drift stays bounded by one window's worth of updates
+at an amortized O(1) cost.
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+
+class RunningMean:
+    """
+    Running sum and mean
+
+    Works with floats and Decimals alike (the sum starts at int 0).
+    """
+
+    def __init__(self, window: Optional[int] = None):
+        """
+        Args:
+            window: Sliding window length (cumulative mean if None)
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"Window must be >= 1, got {window}")
+        self.window = window
+        self._values: Deque[Any] = deque()
+        self.sum: Any = 0
+        self.count = 0
+        self._removals = 0
+
+    def update(self, value: Any) -> Any:
+        """Add a value and return the current mean"""
+        self.sum += value
+        self.count += 1
+        if self.window is not None:
+            self._values.append(value)
+            if len(self._values) > self.window:
+                self.sum -= self._values.popleft()
+                self.count -= 1
+                self._removals += 1
+                if self._removals % self.window == 0:
+                    self.sum = sum(self._values)  # Resync: drop accumulated rounding
+        return self.mean
+
+    @property
+    def mean(self) -> Optional[Any]:
+        return self.sum / self.count if self.count else None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the window is full (always True once fed if cumulative)"""
+        return self.count >= (self.window or 1)
+
+    def reset(self) -> None:
+        self._values.clear()
+        self.sum = 0
+        self.count = 0
+        self._removals = 0
+
+
+class RollingVariance:
+    """
+    Welford mean and variance over a sliding window
+
+    Adding and removing a value both update (mean, M2) in O(1), which stays
+    numerically stable unlike the naive sum / sum of squares formula.
+    """
+
+    def __init__(self, window: int, ddof: int = 0):
+        """
+        Args:
+            window: Sliding window length
+            ddof: Delta degrees of freedom (0 = population, 1 = sample)
+        """
+        if window < 1:
+            raise ValueError(f"Window must be >= 1, got {window}")
+        self.window = window
+        self.ddof = ddof
+        self._values: Deque[float] = deque()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._removals = 0
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    def update(self, value: float) -> Tuple[float, Optional[float]]:
+        """Add a value and return (mean, variance)"""
+        value = float(value)
+        self._values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self._values)
+        self._m2 += delta * (value - self.mean)
+
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            delta = old - self.mean
+            self.mean -= delta / len(self._values)
+            self._m2 -= delta * (old - self.mean)
+            self._m2 = max(self._m2, 0.0)  # Rounding can push an exact 0 below zero
+            self._removals += 1
+            if self._removals % self.window == 0:
+                self._resync()
+
+        return self.mean, self.variance
+
+    def _resync(self) -> None:
+        """Recompute mean and M2 from the window (two passes)"""
+        self.mean = sum(self._values) / len(self._values)
+        self._m2 = sum((value - self.mean) ** 2 for value in self._values)
+
+    @property
+    def variance(self) -> Optional[float]:
+        size = len(self._values) - self.ddof
+        return self._m2 / size if size > 0 else None
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.variance
+        return None if variance is None else variance ** 0.5
+
+    @property
+    def ready(self) -> bool:
+        return len(self._values) >= self.window
+
+    def reset(self) -> None:
+        self._values.clear()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._removals = 0
+
+
+class _RollingExtreme(ABC):
+    """
+    Sliding window extreme with a monotonic deque
+
+    The deque holds (index, value) candidates in strictly decreasing order of
+    preference: a new value evicts every candidate it beats, so each value is
+    pushed and popped at most once (amortized O(1) per update).
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError(f"Window must be >= 1, got {window}")
+        self.window = window
+        self._candidates: Deque[Tuple[int, Any]] = deque()
+        self._index = -1
+
+    @staticmethod
+    @abstractmethod
+    def _beats(kept: Any, new: Any) -> bool:
+        """Whether the kept candidate stays preferred over the new value"""
+
+    def update(self, value: Any) -> Any:
+        """Add a value and return the window extreme"""
+        self._index += 1
+        while self._candidates and not self._beats(self._candidates[-1][1], value):
+            self._candidates.pop()
+        self._candidates.append((self._index, value))
+        if self._candidates[0][0] <= self._index - self.window:
+            self._candidates.popleft()
+        return self._candidates[0][1]
+
+    @property
+    def value(self) -> Optional[Any]:
+        return self._candidates[0][1] if self._candidates else None
+
+    @property
+    def count(self) -> int:
+        return min(self._index + 1, self.window)
+
+    @property
+    def ready(self) -> bool:
+        return self._index + 1 >= self.window
+
+    def reset(self) -> None:
+        self._candidates.clear()
+        self._index = -1
+
+
+class RollingMax(_RollingExtreme):
+    """Highest value of the last `window` values"""
+
+    @staticmethod
+    def _beats(kept: Any, new: Any) -> bool:
+        return kept > new
+
+
+class RollingMin(_RollingExtreme):
+    """Lowest value of the last `window` values"""
+
+    @staticmethod
+    def _beats(kept: Any, new: Any) -> bool:
+        return kept < new
+
+
+class WilderSmoother:
+    """
+    Wilder's smoothing (RMA), as used by ATR / RSI / ADX
+
+    Returns None until `period` values were seen; the first value is their
+    simple average, then value = (previous * (period - 1) + x) / period.
+    """
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError(f"Period must be >= 1, got {period}")
+        self.period = period
+        self._seed = RunningMean()
+        self.value: Optional[Any] = None
+
+    def update(self, value: Any) -> Optional[Any]:
+        """Add a value and return the smoothed value"""
+        if self.value is None:
+            mean = self._seed.update(value)
+            if self._seed.count == self.period:
+                self.value = mean
+        else:
+            self.value = (self.value * (self.period - 1) + value) / self.period
+        return self.value
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def reset(self) -> None:
+        self._seed.reset()
+        self.value = None
@@ -11,6 +11,7 @@ import numpy as np
 
 from src.thebot.core.logger import logger
 from .base.indicator import BaseIndicator
+from .graph import RequestLike, indicator_planner
 from .basic.sma.calculator import SMACalculator
 from .basic.ema.calculator import EMACalculator
 from .oscillators.rsi.calculator import RSICalculator
@@ -105,7 +106,7 @@ class IndicatorFactory:
     def _get_config_class(self, name: str) -> Type:
         """Récupère la classe de configuration pour un indicateur"""
         # Import dynamique des configs
-        config_module = f"thebot.indicators.{self._get_category(name)}.{name}.config"
+        config_module = f"{__package__}.{self._get_category(name)}.{name}.config"
         config_class_name = f"{name.upper()}Config"
 
         try:
@@ -237,6 +238,24 @@ class IndicatorFactory:
         else:
             return calculator.calculate_batch(data)
 
+    def calculate_indicators(
+        self, data: pd.DataFrame, requests: List[RequestLike]
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Calcule plusieurs indicateurs en une passe sur le graphe partagé
+
+        Les intermédiaires communs (EMA, SMA, écart-type, true range...) ne
+        sont calculés qu'une fois pour tous les indicateurs demandés.
+
+        Args:
+            data: DataFrame OHLCV
+            requests: Indicateurs ('rsi', ('macd', {'fast_period': 8}), IndicatorRequest...)
+
+        Returns:
+            {label indicateur: DataFrame de ses sorties}
+        """
+        return indicator_planner.compute(data, requests)
+
     # === MÉTHODES UTILITAIRES ===
 
     def list_available_indicators(self) -> list:
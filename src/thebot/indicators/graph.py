@@ -0,0 +1,514 @@
+"""
+Indicator Graph - Planificateur multi-indicateurs avec réutilisation des intermédiaires
+Chaque indicateur demandé est décomposé en nœuds (EMA, SMA, écart-type,
+true range, extrema glissants...). Les nœuds identiques sont fusionnés, si bien
+qu'un graphique demandant MACD + Bollinger + Squeeze + ATR + SuperTrend ne
+calcule qu'une fois EMA(12), EMA(26), SMA(20), STD(20) et TR.
+"""
+
+import inspect
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.thebot.core.logger import logger
+
+# Clé d'un nœud : (opération, *entrées, *paramètres) - hashable et canonique
+NodeKey = Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class Node:
+    """Nœud du graphe : une série calculée à partir d'autres nœuds"""
+
+    key: NodeKey
+    inputs: Tuple[NodeKey, ...]
+    compute: Callable[..., pd.Series]
+    # Bougies à écarter avant la première valeur exploitable (fenêtres des entrées comprises)
+    warmup: int = 0
+
+
+@dataclass(frozen=True)
+class IndicatorRequest:
+    """Indicateur demandé : type, paramètres et nom de sortie"""
+
+    indicator: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+    name: Optional[str] = None
+
+    @classmethod
+    def of(cls, indicator: str, name: Optional[str] = None, **params: Any) -> "IndicatorRequest":
+        return cls(indicator.lower(), tuple(sorted(params.items())), name)
+
+    @property
+    def label(self) -> str:
+        if self.name:
+            return self.name
+        if not self.params:
+            return self.indicator
+        return f"{self.indicator}_" + "_".join(str(value) for _, value in self.params)
+
+
+RequestLike = Union[str, IndicatorRequest, Tuple[str, Dict[str, Any]]]
+
+
+class GraphBuilder:
+    """Construit les nœuds en fusionnant ceux de même clé"""
+
+    def __init__(self):
+        self.nodes: "OrderedDict[NodeKey, Node]" = OrderedDict()
+        self.references = 0
+
+    def node(
+        self,
+        key: NodeKey,
+        inputs: Tuple[NodeKey, ...],
+        compute: Optional[Callable],
+        warmup: int = 0,
+    ) -> NodeKey:
+        """
+        Déclare un nœud (ignoré s'il existe déjà) et retourne sa clé
+
+        ``warmup`` est le nombre de bougies propres au nœud (fenêtre - 1,
+        décalage) ; il s'ajoute à celui de l'entrée la plus longue à amorcer.
+        """
+        self.references += 1
+        if key not in self.nodes:
+            inherited = max((self.nodes[i].warmup for i in inputs), default=0)
+            self.nodes[key] = Node(key, inputs, compute, inherited + warmup)
+        return key
+
+    # === SOURCES ===
+
+    def column(self, name: str) -> NodeKey:
+        return self.node(("col", name), (), None)
+
+    def hl2(self) -> NodeKey:
+        high, low = self.column("high"), self.column("low")
+        return self.node(("hl2",), (high, low), lambda h, l: (h + l) / 2)
+
+    # === PRIMITIVES ===
+
+    def sma(self, src: NodeKey, period: int) -> NodeKey:
+        return self.node(
+            ("sma", src, period), (src,), lambda s: s.rolling(window=period).mean(), period - 1
+        )
+
+    def ema(self, src: NodeKey, period: int) -> NodeKey:
+        # Définie dès la 1re bougie, mais pas significative avant `period` bougies
+        return self.node(
+            ("ema", src, period),
+            (src,),
+            lambda s: s.ewm(span=period, adjust=False).mean(),
+            period - 1,
+        )
+
+    def wilder(self, src: NodeKey, period: int) -> NodeKey:
+        """Moyenne de Wilder (alpha = 1/period) amorcée par la SMA des `period` premières valeurs"""
+
+        def compute(s):
+            seed = s.rolling(window=period).mean()
+            first = seed.notna() & seed.shift().isna()
+            return s.where(seed.notna()).mask(first, seed).ewm(alpha=1 / period, adjust=False).mean()
+
+        return self.node(("wilder", src, period), (src,), compute, period - 1)
+
+    def std(self, src: NodeKey, period: int) -> NodeKey:
+        return self.node(
+            ("std", src, period), (src,), lambda s: s.rolling(window=period).std(), period - 1
+        )
+
+    def rolling_max(self, src: NodeKey, period: int) -> NodeKey:
+        return self.node(
+            ("max", src, period), (src,), lambda s: s.rolling(window=period).max(), period - 1
+        )
+
+    def rolling_min(self, src: NodeKey, period: int) -> NodeKey:
+        return self.node(
+            ("min", src, period), (src,), lambda s: s.rolling(window=period).min(), period - 1
+        )
+
+    def shift(self, src: NodeKey, periods: int = 1) -> NodeKey:
+        return self.node(("shift", src, periods), (src,), lambda s: s.shift(periods), periods)
+
+    def diff(self, src: NodeKey) -> NodeKey:
+        return self.node(("diff", src), (src,), lambda s: s.diff(), 1)
+
+    def true_range(self) -> NodeKey:
+        high, low, close = self.column("high"), self.column("low"), self.column("close")
+        prev_close = self.shift(close)
+
+        def compute(h, l, pc):
+            # fmax ignore les NaN (première bougie) et fonctionne aussi colonne par colonne
+            return np.fmax(np.fmax(h - l, (h - pc).abs()), (l - pc).abs())
+
+        return self.node(("tr",), (high, low, prev_close), compute)
+
+    def atr(self, period: int, smoothing_method: str = "sma") -> NodeKey:
+        if smoothing_method == "ema":
+            return self.ema(self.true_range(), period)
+        return self.sma(self.true_range(), period)
+
+    def sub(self, a: NodeKey, b: NodeKey) -> NodeKey:
+        return self.node(("sub", a, b), (a, b), lambda x, y: x - y)
+
+    def band(self, mid: NodeKey, width: NodeKey, multiplier: float) -> NodeKey:
+        """mid + multiplier * width (multiplier négatif pour la bande basse)"""
+        return self.node(
+            ("band", mid, width, multiplier), (mid, width), lambda m, w: m + multiplier * w
+        )
+
+
+def _axes(like) -> Dict[str, Any]:
+    """Index (et colonnes) d'une Series / d'un DataFrame pour reconstruire un résultat"""
+    if isinstance(like, pd.DataFrame):
+        return {"index": like.index, "columns": like.columns}
+    return {"index": like.index}
+
+
+# === DÉFINITIONS DES INDICATEURS ===
+# Chaque définition déclare ses sorties en termes de nœuds du builder
+
+
+def _sma(g: GraphBuilder, period: int = 20, source: str = "close") -> Dict[str, NodeKey]:
+    return {"sma": g.sma(g.column(source), period)}
+
+
+def _ema(g: GraphBuilder, period: int = 21, source: str = "close") -> Dict[str, NodeKey]:
+    return {"ema": g.ema(g.column(source), period)}
+
+
+def _rsi(g: GraphBuilder, period: int = 14, smoothing_method: str = "ema") -> Dict[str, NodeKey]:
+    delta = g.diff(g.column("close"))
+    gain = g.node(("gain", delta), (delta,), lambda d: d.clip(lower=0))
+    loss = g.node(("loss", delta), (delta,), lambda d: (-d).clip(lower=0))
+    # Comme RSICalculator : lissage de Wilder par défaut, SMA sur demande
+    average = g.sma if smoothing_method == "sma" else g.wilder
+    avg_gain, avg_loss = average(gain, period), average(loss, period)
+    rsi = g.node(
+        ("rsi", avg_gain, avg_loss),
+        (avg_gain, avg_loss),
+        lambda ag, al: (100 - 100 / (1 + ag / al)).fillna(50),
+    )
+    return {"rsi": rsi}
+
+
+def _atr(g: GraphBuilder, period: int = 14, smoothing_method: str = "sma") -> Dict[str, NodeKey]:
+    return {"atr": g.atr(period, smoothing_method)}
+
+
+def _macd(
+    g: GraphBuilder, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+) -> Dict[str, NodeKey]:
+    close = g.column("close")
+    macd = g.sub(g.ema(close, fast_period), g.ema(close, slow_period))
+    signal = g.ema(macd, signal_period)
+    return {"macd": macd, "signal": signal, "histogram": g.sub(macd, signal)}
+
+
+def _bollinger(g: GraphBuilder, period: int = 20, std_dev: float = 2.0) -> Dict[str, NodeKey]:
+    close = g.column("close")
+    middle, std = g.sma(close, period), g.std(close, period)
+    return {
+        "upper": g.band(middle, std, std_dev),
+        "middle": middle,
+        "lower": g.band(middle, std, -std_dev),
+    }
+
+
+def _keltner(g: GraphBuilder, period: int = 20, multiplier: float = 1.5) -> Dict[str, NodeKey]:
+    middle, atr = g.sma(g.column("close"), period), g.atr(period)
+    return {
+        "upper": g.band(middle, atr, multiplier),
+        "middle": middle,
+        "lower": g.band(middle, atr, -multiplier),
+    }
+
+
+def _squeeze(
+    g: GraphBuilder,
+    bb_period: int = 20,
+    kc_period: int = 20,
+    bb_multiplier: float = 2.0,
+    kc_multiplier: float = 1.5,
+) -> Dict[str, NodeKey]:
+    bb = _bollinger(g, bb_period, bb_multiplier)
+    kc = _keltner(g, kc_period, kc_multiplier)
+    squeeze = g.node(
+        ("squeeze", bb["upper"], bb["lower"], kc["upper"], kc["lower"]),
+        (bb["upper"], bb["lower"], kc["upper"], kc["lower"]),
+        lambda bu, bl, ku, kl: ((bu < ku) & (bl > kl)).astype(int),
+    )
+    return {"squeeze": squeeze, "bb_upper": bb["upper"], "bb_lower": bb["lower"],
+            "kc_upper": kc["upper"], "kc_lower": kc["lower"]}
+
+
+def _supertrend_bands(h2, atr, close, multiplier: float):
+    """
+    Bandes finales SuperTrend
+
+    Récurrence sur les bougies, vectorisée sur les colonnes : une Series
+    (un symbole) ou un DataFrame bougies x symboles sont traités pareil.
+    """
+    hl2, atr_v, close_v = h2.to_numpy(float), atr.to_numpy(float), close.to_numpy(float)
+    shape = close_v.shape[1:]
+    supertrend = np.full(close_v.shape, np.nan)
+    direction = np.zeros(close_v.shape)
+    upper = np.full(shape, np.nan)
+    lower = np.full(shape, np.nan)
+    trend = np.ones(shape)
+    for i in range(len(close_v)):
+        ready = ~np.isnan(atr_v[i])
+        basic_upper = hl2[i] + multiplier * atr_v[i]
+        basic_lower = hl2[i] - multiplier * atr_v[i]
+        prev_close = close_v[i - 1] if i else close_v[i]
+        upper = np.where(
+            ready & (np.isnan(upper) | (basic_upper < upper) | (prev_close > upper)), basic_upper, upper
+        )
+        lower = np.where(
+            ready & (np.isnan(lower) | (basic_lower > lower) | (prev_close < lower)), basic_lower, lower
+        )
+        trend = np.where(ready & (close_v[i] > upper), 1.0, np.where(ready & (close_v[i] < lower), -1.0, trend))
+        supertrend[i] = np.where(ready, np.where(trend == 1, lower, upper), np.nan)
+        direction[i] = np.where(ready, trend, 0.0)
+    return supertrend, direction
+
+
+def _supertrend(g: GraphBuilder, period: int = 10, multiplier: float = 3.0) -> Dict[str, NodeKey]:
+    hl2, atr, close = g.hl2(), g.atr(period), g.column("close")
+
+    def compute(h, a, c):
+        supertrend, direction = _supertrend_bands(h, a, c, multiplier)
+        return c._constructor(supertrend, **_axes(c)), c._constructor(direction, **_axes(c))
+
+    bands = g.node(("supertrend_bands", hl2, atr, close, multiplier), (hl2, atr, close), compute)
+    return {
+        "supertrend": g.node(("pick", bands, 0), (bands,), lambda b: b[0]),
+        "direction": g.node(("pick", bands, 1), (bands,), lambda b: b[1]),
+    }
+
+
+def _stochastic(g: GraphBuilder, k_period: int = 14, d_period: int = 3) -> Dict[str, NodeKey]:
+    lowest = g.rolling_min(g.column("low"), k_period)
+    highest = g.rolling_max(g.column("high"), k_period)
+    close = g.column("close")
+    k = g.node(
+        ("stoch_k", close, lowest, highest),
+        (close, lowest, highest),
+        lambda c, lo, hi: 100 * (c - lo) / (hi - lo),
+    )
+    return {"k": k, "d": g.sma(k, d_period)}
+
+
+def _breakout(g: GraphBuilder, period: int = 20, breakout_threshold: float = 2.0) -> Dict[str, NodeKey]:
+    recent_high = g.rolling_max(g.shift(g.column("high")), period)
+    recent_low = g.rolling_min(g.shift(g.column("low")), period)
+    close = g.column("close")
+    factor = breakout_threshold / 100
+
+    def compute(c, hi, lo):
+        return (c > hi * (1 + factor)).astype(int) - (c < lo * (1 - factor)).astype(int)
+
+    breakout = g.node(
+        ("breakout", close, recent_high, recent_low, factor), (close, recent_high, recent_low), compute
+    )
+    return {"breakout": breakout, "resistance": recent_high, "support": recent_low}
+
+
+def _obv(g: GraphBuilder) -> Dict[str, NodeKey]:
+    close, volume = g.column("close"), g.column("volume")
+    delta = g.diff(close)
+    obv = g.node(
+        ("obv", delta, volume),
+        (delta, volume),
+        lambda d, v: (np.sign(d.fillna(0)) * v).cumsum(),
+    )
+    return {"obv": obv}
+
+
+INDICATOR_DEFINITIONS: Dict[str, Callable[..., Dict[str, NodeKey]]] = {
+    "sma": _sma,
+    "ema": _ema,
+    "rsi": _rsi,
+    "atr": _atr,
+    "macd": _macd,
+    "bollinger": _bollinger,
+    "keltner": _keltner,
+    "squeeze": _squeeze,
+    "supertrend": _supertrend,
+    "stochastic": _stochastic,
+    "breakout": _breakout,
+    "obv": _obv,
+}
+
+
+def _normalize(request: RequestLike) -> IndicatorRequest:
+    if isinstance(request, IndicatorRequest):
+        return request
+    if isinstance(request, str):
+        return IndicatorRequest.of(request)
+    indicator, params = request
+    return IndicatorRequest.of(indicator, **params)
+
+
+@dataclass
+class IndicatorPlan:
+    """
+    Plan d'exécution compilé : nœuds uniques en ordre topologique et sorties
+    de chaque indicateur demandé
+    """
+
+    requests: Tuple[IndicatorRequest, ...]
+    order: List[Node]
+    outputs: Dict[str, Dict[str, NodeKey]]
+    references: int
+    stats: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def warmups(self) -> Dict[str, Dict[str, int]]:
+        """
+        Bougies d'amorçage de chaque sortie : la première valeur exploitable
+        est à l'index ``warmup`` (ex: signal MACD(12, 26, 9) -> 25 + 8 = 33)
+        """
+        nodes = {node.key: node for node in self.order}
+        return {
+            label: {name: nodes[key].warmup for name, key in outputs.items()}
+            for label, outputs in self.outputs.items()
+        }
+
+    @property
+    def shared_nodes(self) -> int:
+        """Nombre de calculs évités par la fusion des nœuds"""
+        return self.references - len(self.order)
+
+    def evaluate(self, columns: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Calcule chaque nœud une seule fois à partir des colonnes sources
+
+        Les colonnes peuvent être des Series (un symbole) ou des DataFrames
+        bougies x symboles : toutes les opérations sont colonne par colonne,
+        un univers entier est donc calculé en une passe vectorisée.
+
+        Args:
+            columns: Colonnes sources (open/high/low/close/volume)
+
+        Returns:
+            {label indicateur: {sortie: valeurs}}
+        """
+        values: Dict[NodeKey, Any] = {}
+        for node in self.order:
+            if node.compute is None:
+                values[node.key] = columns[node.key[1]].astype(float)
+            else:
+                values[node.key] = node.compute(*(values[key] for key in node.inputs))
+
+        self.stats["executions"] = self.stats.get("executions", 0) + 1
+        self.stats["nodes_computed"] = self.stats.get("nodes_computed", 0) + len(self.order)
+
+        return {
+            label: {name: values[key] for name, key in outputs.items()}
+            for label, outputs in self.outputs.items()
+        }
+
+    def execute(self, data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Calcule chaque nœud une seule fois et assemble les sorties
+
+        Args:
+            data: DataFrame OHLCV (colonnes open/high/low/close/volume)
+
+        Returns:
+            {label indicateur: DataFrame de ses sorties, indexé comme data}
+        """
+        return {
+            label: pd.DataFrame(outputs, index=data.index)
+            for label, outputs in self.evaluate(data).items()
+        }
+
+
+class IndicatorPlanner:
+    """
+    Compile des ensembles d'indicateurs en plans partagés
+
+    Les plans sont mis en cache par ensemble de demandes : un graphique qui
+    redemande les mêmes indicateurs à chaque rafraîchissement réutilise le
+    même ordre topologique.
+    """
+
+    def __init__(self, max_plans: int = 64):
+        self.max_plans = max_plans
+        self._plans: "OrderedDict[Tuple[IndicatorRequest, ...], IndicatorPlan]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def plan(self, requests: Iterable[RequestLike]) -> IndicatorPlan:
+        """Compile (ou récupère) le plan d'un ensemble d'indicateurs"""
+        normalized = tuple(_normalize(request) for request in requests)
+
+        with self._lock:
+            plan = self._plans.get(normalized)
+            if plan is not None:
+                self._plans.move_to_end(normalized)
+                return plan
+
+        builder = GraphBuilder()
+        outputs: Dict[str, Dict[str, NodeKey]] = {}
+        for request in normalized:
+            definition = INDICATOR_DEFINITIONS.get(request.indicator)
+            if definition is None:
+                available = list(INDICATOR_DEFINITIONS)
+                raise ValueError(f"Indicateur '{request.indicator}' inconnu. Disponibles: {available}")
+            outputs[request.label] = definition(builder, **dict(request.params))
+
+        # L'ordre d'insertion du builder est déjà topologique : un nœud est
+        # toujours créé après ses entrées
+        plan = IndicatorPlan(
+            requests=normalized,
+            order=list(builder.nodes.values()),
+            outputs=outputs,
+            references=builder.references,
+        )
+        logger.debug(
+            f"🧮 Indicator plan: {len(normalized)} indicators, {len(plan.order)} nodes "
+            f"({plan.shared_nodes} shared)"
+        )
+
+        with self._lock:
+            self._plans[normalized] = plan
+            if len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        return plan
+
+    def compute(
+        self, data: pd.DataFrame, requests: Iterable[RequestLike]
+    ) -> Dict[str, pd.DataFrame]:
+        """Compile puis exécute un ensemble d'indicateurs sur un DataFrame OHLCV"""
+        return self.plan(requests).execute(data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+
+
+def supports(indicator: str, params: Optional[Mapping[str, Any]] = None) -> bool:
+    """
+    Indique si un indicateur peut être planifié dans le graphe
+
+    Avec ``params``, vérifie aussi que la définition accepte chacun d'eux :
+    un paramètre inconnu du graphe (seuils, source...) doit passer par le
+    calculateur complet plutôt que d'être ignoré.
+    """
+    definition = INDICATOR_DEFINITIONS.get(indicator.lower())
+    if definition is None:
+        return False
+    if not params:
+        return True
+    accepted = set(inspect.signature(definition).parameters) - {"g"}
+    return set(params) <= accepted
+
+
+# Instance globale partagée
+indicator_planner = IndicatorPlanner()
@@ -3,12 +3,12 @@ Breakout Detector Calculator
 Translation from NonoBot Rust implementation
 """
 
-import statistics
 from collections import deque
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
 from ....core.types import MarketData
+from ...base.streaming import RollingMax, RollingMin, RunningMean
 from .config import BreakoutConfig
 
 
@@ -27,6 +27,11 @@ class BreakoutCalculator:
         self.data_history: deque = deque(maxlen=config.lookback_period + 10)
         self.volume_history: deque = deque(maxlen=config.lookback_period)
 
+        # Streaming window statistics (O(1) per bar)
+        self._highs = RollingMax(config.lookback_period)
+        self._lows = RollingMin(config.lookback_period)
+        self._volumes = RunningMean(10)
+
         # State tracking
         self.current_support = None
         self.current_resistance = None
@@ -35,26 +40,22 @@ class BreakoutCalculator:
     def add_data(self, data: MarketData) -> None:
         self.data_history.append(data)
         self.volume_history.append(float(data.volume))
+        self._highs.update(float(data.high))
+        self._lows.update(float(data.low))
+        self._volumes.update(float(data.volume))
 
         # Update average volume
         if len(self.volume_history) >= 10:
-            self.avg_volume = Decimal(
-                str(statistics.mean(list(self.volume_history)[-10:]))
-            )
+            self.avg_volume = Decimal(str(self._volumes.mean))
 
     def find_support_resistance(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
         """Find current support and resistance levels"""
         if len(self.data_history) < self.config.lookback_period:
             return None, None
 
-        data_list = list(self.data_history)[-self.config.lookback_period :]
-
         # Simple approach: highest high and lowest low
-        highs = [float(d.high) for d in data_list]
-        lows = [float(d.low) for d in data_list]
-
-        resistance = Decimal(str(max(highs)))
-        support = Decimal(str(min(lows)))
+        resistance = Decimal(str(self._highs.value))
+        support = Decimal(str(self._lows.value))
 
         return support, resistance
 
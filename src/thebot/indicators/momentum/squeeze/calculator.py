@@ -8,6 +8,9 @@ Implements:
 3. Squeeze detection (BB inside KC)
 4. Momentum oscillator
 5. Signal generation
+
+Window statistics are maintained incrementally (streaming accumulators),
+so each new bar costs O(1) whatever the configured periods.
 """
 
 import statistics
@@ -16,6 +19,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
 from ....core.types import MarketData
+from ...base.streaming import RollingVariance, RunningMean
 from .config import SqueezeConfig
 
 
@@ -37,6 +41,15 @@ class SqueezeCalculator:
         self.kc_values: deque = deque(maxlen=50)  # KC history
         self.momentum_values: deque = deque(maxlen=50)  # Momentum history
 
+        # Streaming window statistics
+        self._closes = RollingVariance(config.bollinger_period)
+        self._typical_prices = RunningMean(config.keltner_period)
+        self._momentum_closes = RunningMean(config.momentum_length)
+        self._true_ranges = {
+            period: RunningMean(period)
+            for period in (config.keltner_period, config.momentum_length)
+        }
+
         # State tracking
         self.current_squeeze = False
         self.previous_squeeze = False
@@ -44,7 +57,22 @@ class SqueezeCalculator:
 
     def add_data(self, data: MarketData) -> None:
         """Add new market data point"""
+        if self.data_history:
+            previous = self.data_history[-1]
+            # True Range = max(high-low, |high-prev_close|, |low-prev_close|)
+            true_range = max(
+                float(data.high - data.low),
+                abs(float(data.high - previous.close)),
+                abs(float(data.low - previous.close)),
+            )
+            for true_ranges in self._true_ranges.values():
+                true_ranges.update(true_range)
+
         self.data_history.append(data)
+        close = float(data.close)
+        self._closes.update(close)
+        self._momentum_closes.update(close)
+        self._typical_prices.update(float((data.high + data.low + data.close) / 3))
 
     def calculate_bollinger_bands(self) -> Optional[Tuple[Decimal, Decimal, Decimal]]:
         """
@@ -56,18 +84,8 @@ class SqueezeCalculator:
         if len(self.data_history) < self.config.bollinger_period:
             return None
 
-        # Get recent closes
-        closes = [
-            float(d.close)
-            for d in list(self.data_history)[-self.config.bollinger_period :]
-        ]
-
-        # Calculate SMA (middle band)
-        sma = statistics.mean(closes)
-
-        # Calculate standard deviation
-        variance = sum((x - sma) ** 2 for x in closes) / len(closes)
-        std_dev = variance**0.5
+        sma = self._closes.mean
+        std_dev = self._closes.std
 
         # Calculate bands
         std_multiplier = float(self.config.bollinger_std)
@@ -90,29 +108,21 @@ class SqueezeCalculator:
         if len(self.data_history) < period + 1:
             return None
 
-        true_ranges = []
-        data_list = list(self.data_history)
+        true_ranges = self._true_ranges.get(period)
+        if true_ranges is not None:
+            return Decimal(str(true_ranges.mean))
 
-        for i in range(1, len(data_list)):
-            current = data_list[i]
-            previous = data_list[i - 1]
-
-            # True Range = max(high-low, |high-prev_close|, |low-prev_close|)
-            tr1 = float(current.high - current.low)
-            tr2 = abs(float(current.high - previous.close))
-            tr3 = abs(float(current.low - previous.close))
-
-            true_range = max(tr1, tr2, tr3)
-            true_ranges.append(true_range)
-
-        # Take last 'period' true ranges
-        if len(true_ranges) < period:
-            return None
-
-        recent_trs = true_ranges[-period:]
-        atr = statistics.mean(recent_trs)
-
-        return Decimal(str(atr))
+        # Period not tracked incrementally: scan the history
+        data_list = list(self.data_history)
+        recent_trs = [
+            max(
+                float(current.high - current.low),
+                abs(float(current.high - previous.close)),
+                abs(float(current.low - previous.close)),
+            )
+            for previous, current in zip(data_list[-period - 1 :], data_list[-period:])
+        ]
+        return Decimal(str(statistics.mean(recent_trs)))
 
     def calculate_keltner_channels(self) -> Optional[Tuple[Decimal, Decimal, Decimal]]:
         """
@@ -124,15 +134,8 @@ class SqueezeCalculator:
         if len(self.data_history) < self.config.keltner_period:
             return None
 
-        # Calculate EMA of typical price
-        typical_prices = []
-        for data in list(self.data_history)[-self.config.keltner_period :]:
-            typical = (data.high + data.low + data.close) / 3
-            typical_prices.append(float(typical))
-
-        # Simple average for middle line (can be EMA later)
-        middle_value = statistics.mean(typical_prices)
-        middle = Decimal(str(middle_value))
+        # Simple average of typical price for middle line (can be EMA later)
+        middle = Decimal(str(self._typical_prices.mean))
 
         # Calculate ATR
         atr = self.calculate_atr(self.config.keltner_period)
@@ -156,16 +159,10 @@ class SqueezeCalculator:
         if len(self.data_history) < self.config.momentum_length + 1:
             return None
 
-        data_list = list(self.data_history)
-        current = data_list[-1]
-
-        # Linear regression of closes vs their positions
-        closes = [float(d.close) for d in data_list[-self.config.momentum_length :]]
-        positions = list(range(len(closes)))
+        current = self.data_history[-1]
 
         # Simple momentum: current close vs average close
-        avg_close = statistics.mean(closes)
-        momentum_raw = float(current.close) - avg_close
+        momentum_raw = float(current.close) - self._momentum_closes.mean
 
         # Normalize by ATR to make comparable across assets
         atr = self.calculate_atr(self.config.momentum_length)
@@ -9,6 +9,7 @@ from typing import List, Optional, Tuple
 
 from ....core.types import MarketData
 from ...base.indicator import BaseIndicator
+from ...base.streaming import RunningMean
 from .config import SuperTrendConfig
 
 
@@ -21,7 +22,7 @@ class SuperTrendCalculator:
     def __init__(self, config: SuperTrendConfig):
         self.config = config
         self._data_history: deque = deque(maxlen=config.atr_period * 2)
-        self._atr_values: deque = deque(maxlen=config.atr_period)
+        self._atr_values = RunningMean(config.atr_period)  # Rolling sum of true ranges
         self._supertrend_value: Optional[Decimal] = None
         self._trend_direction: int = 1  # 1 = uptrend, -1 = downtrend
         self._upper_band: Optional[Decimal] = None
@@ -47,14 +48,13 @@ class SuperTrendCalculator:
 
         # Calculate ATR
         atr = self._calculate_atr()
-        self._atr_values.append(atr)
+        current_atr = self._atr_values.update(atr)
 
-        if len(self._atr_values) < self.config.atr_period:
+        if not self._atr_values.ready:
             return Decimal("0"), 1, Decimal("0"), Decimal("0")
 
         # Calculate basic bands
         hl2 = (market_data.high + market_data.low) / 2
-        current_atr = sum(self._atr_values) / len(self._atr_values)
 
         basic_upper = hl2 + (self.config.multiplier * current_atr)
         basic_lower = hl2 - (self.config.multiplier * current_atr)
@@ -135,7 +135,7 @@ class SuperTrendCalculator:
     def reset(self) -> None:
         """Reset calculator state"""
         self._data_history.clear()
-        self._atr_values.clear()
+        self._atr_values.reset()
         self._supertrend_value = None
         self._trend_direction = 1
         self._upper_band = None
@@ -5,67 +5,212 @@ Architecture: Wrapper pattern
 """
 
 import asyncio
+import concurrent.futures
+import threading
 from functools import wraps
-from typing import Any, Callable, Coroutine, List, Optional
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Hashable, List, Optional
 
 from src.thebot.core.logger import logger
+from src.thebot.services.callback_profiler import get_callback_profiler
+
+DEFAULT_TIMEOUT = 30.0
+
+
+class EventLoopWorker:
+    """
+    Boucle d'événements persistante dans un thread dédié
+
+    Possède tous les clients async (sessions aiohttp, WebSocket, DataStream) :
+    les callbacks Dash synchrones y soumettent leurs coroutines via
+    run_coroutine_threadsafe, si bien que pools de connexions et requêtes en
+    vol partagées survivent d'un callback à l'autre.
+    """
+
+    def __init__(self, name: str = "thebot-event-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, concurrent.futures.Future] = {}
+        self._cleanups: List[Callable[[], Awaitable[Any]]] = []
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Boucle du worker (démarrée au premier accès)"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                ready = threading.Event()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_forever, args=(self._loop, ready), name=self.name, daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+                logger.debug(f"✅ Event loop worker started: {self.name}")
+            return self._loop
+
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def in_worker_thread(self) -> bool:
+        return self._thread is not None and threading.get_ident() == self._thread.ident
+
+    def submit(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Planifie une coroutine sur la boucle du worker (non bloquant)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Any:
+        """
+        Exécute une coroutine sur le worker et attend son résultat
+
+        Args:
+            coro: Coroutine à exécuter
+            timeout: Délai max en secondes (None = illimité) ; au-delà la
+                tâche est annulée sur la boucle et TimeoutError est levée
+
+        Returns:
+            Résultat de la coroutine
+        """
+        if self.in_worker_thread():
+            coro.close()
+            raise RuntimeError("run() appelé depuis la boucle du worker : utiliser await")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Coroutine non terminée après {timeout}s (annulée)") from None
+
+    def run_shared(
+        self,
+        key: Hashable,
+        factory: Callable[[], Coroutine],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ) -> Any:
+        """
+        Exécute factory() une seule fois pour tous les appelants concurrents de même clé
+
+        Un appelant qui abandonne (timeout) n'annule pas la requête partagée
+        attendue par les autres.
+        """
+        if self.in_worker_thread():
+            raise RuntimeError("run_shared() appelé depuis la boucle du worker : utiliser await")
+
+        loop = self.loop
+        with self._lock:
+            future = self._inflight.get(key)
+            created = future is None
+            if created:
+                future = asyncio.run_coroutine_threadsafe(factory(), loop)
+                self._inflight[key] = future
+        if created:
+            # Hors verrou : le callback s'exécute tout de suite si la tâche est déjà finie
+            future.add_done_callback(lambda done: self._forget(key, done))
+
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            raise TimeoutError(f"Requête partagée {key!r} non terminée après {timeout}s") from None
+
+    def _forget(self, key: Hashable, future: concurrent.futures.Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def register_cleanup(self, closer: Callable[[], Awaitable[Any]]) -> None:
+        """Coroutine de fermeture (session, WebSocket...) exécutée à l'arrêt"""
+        with self._lock:
+            if closer not in self._cleanups:
+                self._cleanups.append(closer)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ferme les clients enregistrés, annule les tâches restantes et arrête la boucle"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            cleanups, self._cleanups = self._cleanups, []
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+
+        async def _shutdown() -> None:
+            for closer in cleanups:
+                try:
+                    await closer()
+                except Exception as e:
+                    logger.warning(f"⚠️ Cleanup error: {e}")
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"⚠️ Event loop worker shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        loop.close()
+        logger.info("✅ Event loop worker stopped")
+
+
+# Instance globale
+event_loop_worker = EventLoopWorker()
+
+
+def get_event_loop_worker() -> EventLoopWorker:
+    """Obtenir le worker de boucle d'événements partagé"""
+    return event_loop_worker
 
 
 class AsyncCallbackWrapper:
     """
     Wrapper pour convertir des callbacks async en callbacks sync Dash
-    Gère la boucle d'événements asyncio pour les callbacks
+    Les coroutines s'exécutent sur la boucle persistante d'un EventLoopWorker
     """
 
-    def __init__(self):
-        """Initialiser le wrapper"""
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    def __init__(self, worker: Optional[EventLoopWorker] = None, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        """
+        Initialiser le wrapper
+
+        Args:
+            worker: Worker de boucle (partagé par défaut)
+            timeout: Délai max d'un callback async en secondes
+        """
+        self.worker = worker or get_event_loop_worker()
+        self.timeout = timeout
         logger.info("✅ AsyncCallbackWrapper initialized")
 
     def get_event_loop(self) -> asyncio.AbstractEventLoop:
         """
-        Obtenir ou créer une boucle d'événements
+        Obtenir la boucle d'événements du worker
         
         Returns:
             Event loop asyncio
         """
-        try:
-            loop = asyncio.get_running_loop()
-            return loop
-        except RuntimeError:
-            # Pas de boucle active, en créer une
-            try:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-                return self._loop
-            except Exception as e:
-                logger.error(f"❌ Failed to create event loop: {e}")
-                raise
+        return self.worker.loop
 
-    def run_async(self, coro: Coroutine) -> Any:
+    def run_async(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
         """
-        Exécuter une coroutine de manière synchrone
+        Exécuter une coroutine de manière synchrone sur la boucle du worker
         
         Args:
             coro: Coroutine à exécuter
+            timeout: Délai max (défaut : self.timeout)
             
         Returns:
             Résultat de la coroutine
         """
         try:
-            loop = self.get_event_loop()
-            
-            # Si on est déjà dans la boucle, ne pas utiliser run_until_complete
-            if loop.is_running():
-                # Créer une nouvelle boucle pour l'exécution
-                new_loop = asyncio.new_event_loop()
-                result = new_loop.run_until_complete(coro)
-                new_loop.close()
-                return result
-            else:
-                # Exécuter dans la boucle existante
-                return loop.run_until_complete(coro)
-                
+            return self.worker.run(coro, timeout if timeout is not None else self.timeout)
         except Exception as e:
             logger.error(f"❌ Error running async callback: {e}")
             raise
@@ -94,8 +239,9 @@ class AsyncCallbackWrapper:
                     # Créer la coroutine
                     coro = func(*callback_args, **callback_kwargs)
                     
-                    # Exécuter de manière synchrone
-                    result = self.run_async(coro)
+                    # Exécuter de manière synchrone (chronométré si profilage actif)
+                    with get_callback_profiler().measure(func.__qualname__):
+                        result = self.run_async(coro)
                     
                     logger.debug(f"✅ Async callback executed: {func.__name__}")
                     return result
@@ -132,7 +278,8 @@ class AsyncCallbackWrapper:
             def wrapper(*args, **kwargs):
                 try:
                     coro = func(*args, **kwargs)
-                    result = self.run_async(coro)
+                    with get_callback_profiler().measure(func.__qualname__):
+                        result = self.run_async(coro)
                     logger.debug(f"✅ Context async callback: {func.__name__}")
                     return result
                 except Exception as e:
@@ -144,11 +291,9 @@ class AsyncCallbackWrapper:
         return decorator
 
     def close(self) -> None:
-        """Fermer la boucle d'événements"""
-        if self._loop and not self._loop.is_closed():
-            self._loop.close()
-            self._loop = None
-            logger.info("✅ Event loop closed")
+        """Arrêter le worker s'il est propre à ce wrapper (le worker partagé reste actif)"""
+        if self.worker is not get_event_loop_worker():
+            self.worker.stop()
 
 
 # Instance globale
@@ -6,6 +6,11 @@ Implements debouncing strategies to minimize redundant callback invocations:
 - Trailing debounce (wait for silence, then execute once)
 - Throttle (execute at most once per time interval)
 
+Trailing bursts are keyed: calls sharing a key (identical arguments by
+default, or the ``key_func`` output) coalesce into one execution with the
+latest arguments, and every caller of the burst receives that single result. Newer input cancels stale in-flight work and
+``max_wait_ms`` bounds how long a continuous burst can defer execution.
+
 Architecture:
 - DebounceConfig: Configuration dataclass with validation
 - DebouncedCallback: Wrapper for debounced functions
@@ -13,13 +18,17 @@ Architecture:
 """
 
 import asyncio
+import functools
 import logging
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, Callable, Coroutine, Dict, Optional
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional, Tuple
 from collections import defaultdict
 
+from src.thebot.services.async_callbacks import DEFAULT_TIMEOUT, get_event_loop_worker
+from src.thebot.services.callback_profiler import get_callback_profiler
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +39,9 @@ class DebounceConfig:
     strategy: str = "trailing"  # leading, trailing, throttle
     delay_ms: int = 100  # Delay in milliseconds
     max_pending: int = 10  # Max pending calls to queue
+    max_wait_ms: Optional[int] = None  # Upper bound on trailing deferral
+    key_func: Optional[Callable[..., Hashable]] = None  # Burst key (default: the args)
+    cancel_stale: bool = True  # Cancel in-flight work when newer input arrives
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -39,6 +51,44 @@ class DebounceConfig:
             raise ValueError("delay_ms must be non-negative")
         if self.max_pending < 1:
             raise ValueError("max_pending must be >= 1")
+        if self.max_wait_ms is not None and self.max_wait_ms < self.delay_ms:
+            raise ValueError("max_wait_ms must be >= delay_ms")
+
+
+def _freeze(value: Any) -> Any:
+    """Convert Dash-style inputs (lists, dicts) into a comparable hashable form."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def args_signature(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """Hashable signature of call arguments, used to share identical work."""
+    return _freeze(args), _freeze(kwargs)
+
+
+@dataclass
+class _Burst:
+    """Pending trailing execution shared by every caller with the same key."""
+
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    signature: Hashable
+    first_call: float
+    last_call: float
+    future: "asyncio.Future[Any]"
+    task: Optional["asyncio.Task[Any]"] = None
+    running: Optional["asyncio.Future[Any]"] = None
+    running_signature: Optional[Hashable] = None
+    waiters: int = 0
 
 
 class DebouncedCallback:
@@ -63,9 +113,11 @@ class DebouncedCallback:
         self.last_call_time: float = 0
         self.last_exec_time: float = 0
         self.pending_calls: int = 0
-        self.pending_task: Optional[asyncio.Task[Any]] = None
         self.call_count: int = 0
         self.exec_count: int = 0
+        self.shared_count: int = 0
+        self.cancelled_count: int = 0
+        self._bursts: Dict[Hashable, _Burst] = {}
 
     async def execute_debounced(self, *args: Any, **kwargs: Any) -> Any:
         """Execute function with debouncing.
@@ -95,10 +147,7 @@ class DebouncedCallback:
             # Execute immediately
             self.last_exec_time = now
             self.exec_count += 1
-            result = self._call_func(*args, **kwargs)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await self._run(*args, **kwargs)
 
         # Ignore this call
         logger.debug(
@@ -107,15 +156,14 @@ class DebouncedCallback:
         )
         return None
 
-    async def _execute_trailing(self, now: float, *args: Any, **kwargs: Any) -> Any:
-        """Wait for silence, then execute once."""
-        delay_sec = self.config.delay_ms / 1000.0
+    def burst_key(self, *args: Any, **kwargs: Any) -> Hashable:
+        """Key grouping calls into one trailing burst (identical arguments by default)."""
+        if self.config.key_func is None:
+            return self.callback_id, args_signature(args, kwargs)
+        return self.callback_id, _freeze(self.config.key_func(*args, **kwargs))
 
-        # Cancel pending execution if exists
-        if self.pending_task is not None:
-            self.pending_task.cancel()
-
-        # Check pending queue
+    async def _execute_trailing(self, now: float, *args: Any, **kwargs: Any) -> Any:
+        """Wait for silence, then execute once and share the result with the burst."""
         if self.pending_calls >= self.config.max_pending:
             logger.warning(
                 f"Callback {self.callback_id}: pending queue full "
@@ -123,26 +171,95 @@ class DebouncedCallback:
             )
             return None
 
+        key = self.burst_key(*args, **kwargs)
+        signature = args_signature(args, kwargs)
+        clock = time.monotonic()
+        burst = self._bursts.get(key)
+
+        if burst is None:
+            burst = _Burst(
+                args=args,
+                kwargs=kwargs,
+                signature=signature,
+                first_call=clock,
+                last_call=clock,
+                future=asyncio.get_running_loop().create_future(),
+            )
+            self._bursts[key] = burst
+            burst.task = asyncio.create_task(self._drain(key, burst))
+        else:
+            self.shared_count += 1
+            burst.args, burst.kwargs, burst.signature = args, kwargs, signature
+            if burst.running is None:
+                burst.last_call = clock
+            elif burst.running_signature != signature:
+                # Newer input while computing: restart the silence window
+                burst.last_call = clock
+                if self.config.cancel_stale:
+                    burst.running.cancel()
+
         self.pending_calls += 1
+        burst.waiters += 1
+        try:
+            return await asyncio.shield(burst.future)
+        finally:
+            self.pending_calls -= 1
+            burst.waiters -= 1
 
-        # Schedule delayed execution
-        async def delayed_exec() -> Any:
-            try:
-                await asyncio.sleep(delay_sec)
-                self.pending_calls -= 1
+    async def _drain(self, key: Hashable, burst: _Burst) -> None:
+        """Timer task of a burst: wait for silence, run, rerun if input went stale."""
+        delay_sec = self.config.delay_ms / 1000.0
+        max_wait = (
+            self.config.max_wait_ms / 1000.0
+            if self.config.max_wait_ms is not None
+            else None
+        )
+
+        try:
+            while True:
+                deadline = burst.last_call + delay_sec
+                if max_wait is not None:
+                    deadline = min(deadline, burst.first_call + max_wait)
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    continue
+
+                signature = burst.signature
+                burst.running_signature = signature
+                burst.running = asyncio.ensure_future(self._run(*burst.args, **burst.kwargs))
                 self.last_exec_time = time.time()
                 self.exec_count += 1
-                result = self._call_func(*args, **kwargs)
-                if asyncio.iscoroutine(result):
-                    return await result
-                return result
-            except asyncio.CancelledError:
-                self.pending_calls -= 1
-                logger.debug(f"Callback {self.callback_id}: trailing task cancelled")
-                raise
-
-        self.pending_task = asyncio.create_task(delayed_exec())
-        return await self.pending_task
+                await asyncio.wait({burst.running})
+                running, burst.running = burst.running, None
+
+                if running.cancelled() or burst.signature != signature:
+                    # Newer input arrived while computing: the result is stale
+                    self.cancelled_count += 1
+                    logger.debug(f"Callback {self.callback_id}: stale run superseded")
+                    continue
+
+                del self._bursts[key]
+                if running.exception() is not None:
+                    burst.future.set_exception(running.exception())
+                    burst.future.exception()  # Retrieved by the waiters
+                else:
+                    burst.future.set_result(running.result())
+                return
+        except asyncio.CancelledError:
+            if burst.running is not None:
+                burst.running.cancel()
+            if self._bursts.get(key) is burst:
+                del self._bursts[key]
+            burst.future.cancel()
+            logger.debug(f"Callback {self.callback_id}: trailing task cancelled")
+            raise
+
+    def cancel_pending(self) -> None:
+        """Cancel every pending trailing burst (waiters get CancelledError)."""
+        for burst in list(self._bursts.values()):
+            if burst.task is not None:
+                burst.task.cancel()
 
     async def _execute_throttle(self, now: float, *args: Any, **kwargs: Any) -> Any:
         """Execute at most once per delay period."""
@@ -151,10 +268,7 @@ class DebouncedCallback:
         if now - self.last_exec_time >= delay_sec:
             self.last_exec_time = now
             self.exec_count += 1
-            result = self._call_func(*args, **kwargs)
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
+            return await self._run(*args, **kwargs)
 
         logger.debug(
             f"Callback {self.callback_id}: throttled "
@@ -162,6 +276,14 @@ class DebouncedCallback:
         )
         return None
 
+    async def _run(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the function (awaiting coroutines), timed by the callback profiler."""
+        with get_callback_profiler().measure(self.callback_id):
+            result = self._call_func(*args, **kwargs)
+            if asyncio.iscoroutine(result):
+                return await result
+            return result
+
     def _call_func(self, *args: Any, **kwargs: Any) -> Any:
         """Call the underlying function."""
         try:
@@ -184,6 +306,9 @@ class DebouncedCallback:
                 else 0
             ),
             "pending_calls": self.pending_calls,
+            "pending_bursts": len(self._bursts),
+            "shared_count": self.shared_count,
+            "cancelled_count": self.cancelled_count,
         }
 
 
@@ -233,6 +358,42 @@ class CallbackDebouncer:
 
         return wrapper
 
+    def register_sync(
+        self,
+        callback_id: str,
+        func: Callable[..., Any],
+        config: Optional[DebounceConfig] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ) -> Callable[..., Any]:
+        """Register a synchronous (Dash) callback for debouncing.
+
+        Calls coming from Flask request threads are coalesced on the shared
+        event loop worker; the function itself runs in the loop's default
+        executor so a superseded computation releases its waiters at once.
+
+        Args:
+            callback_id: Unique identifier for callback
+            func: Synchronous function to debounce
+            config: Debounce configuration (uses default if None)
+            timeout: Max seconds a caller waits for the burst result
+
+        Returns:
+            Blocking debounced wrapper function
+        """
+
+        async def offloaded(*args: Any, **kwargs: Any) -> Any:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+        debounced_async = self.register(callback_id, offloaded, config)
+        worker = get_event_loop_worker()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return worker.run(debounced_async(*args, **kwargs), timeout=timeout)
+
+        return wrapper
+
     def get_callback(self, callback_id: str) -> Optional[DebouncedCallback]:
         """Get callback by ID."""
         return self._callbacks.get(callback_id)
@@ -261,6 +422,8 @@ class CallbackDebouncer:
         for callback in self._callbacks.values():
             callback.call_count = 0
             callback.exec_count = 0
+            callback.shared_count = 0
+            callback.cancelled_count = 0
         logger.info("Reset all callback statistics")
 
 
@@ -0,0 +1,388 @@
+"""
+Callback profiling service - per-callback timing and on-demand stack sampling.
+
+Opt-in instrumentation for Dash callbacks:
+- Wall and CPU time per callback, with request/response payload sizes
+- Slow-callback detection against a frame budget
+- Statistical stack sampler armed for a chosen callback ID, writing
+  folded stacks (flamegraph.pl / speedscope / inferno compatible)
+
+Architecture:
+- StackSampler: Background thread sampling one thread's stack
+- CallbackStats: Aggregated timings for one callback
+- CallbackProfiler: Singleton wrapping every registered Dash callback
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from src.thebot.core.metrics import Histogram, metrics
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = Path("profiles")
+
+
+class StackSampler:
+    """Sample the Python stack of one thread at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        """Initialize sampler.
+
+        Args:
+            thread_id: Target thread identifier (threading.get_ident())
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _frame_label(frame: Any) -> str:
+        code = frame.f_code
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def _sample(self) -> None:
+        frame = sys._current_frames().get(self.thread_id)
+        stack: List[str] = []
+        while frame is not None:
+            stack.append(self._frame_label(frame))
+            frame = frame.f_back
+        if stack:
+            self.samples[";".join(reversed(stack))] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        """Stop sampling and return folded stack counts."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+    def write_folded(self, path: Path) -> Path:
+        """Write samples as folded stacks (one "frame;frame;frame count" per line)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as handle:
+            for stack, count in self.samples.most_common():
+                handle.write(f"{stack} {count}\n")
+        return path
+
+
+@dataclass
+class CallbackStats:
+    """Aggregated timings for one callback."""
+
+    callback_id: str
+    calls: int = 0
+    errors: int = 0
+    slow_calls: int = 0
+    cpu_seconds: float = 0.0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    wall: Histogram = field(default_factory=Histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        wall = self.wall.snapshot()
+        return {
+            "callback_id": self.callback_id,
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow_calls": self.slow_calls,
+            "wall_ms_total": round(wall["sum"] * 1000, 3),
+            "wall_ms_p50": round(wall["p50"] * 1000, 3),
+            "wall_ms_p99": round(wall["p99"] * 1000, 3),
+            "wall_ms_max": round(wall["max"] * 1000, 3),
+            "cpu_ms_total": round(self.cpu_seconds * 1000, 3),
+            "avg_input_bytes": self.input_bytes // self.calls if self.calls else 0,
+            "avg_output_bytes": self.output_bytes // self.calls if self.calls else 0,
+        }
+
+
+@dataclass
+class SlowCallback:
+    """A callback execution over the slow threshold."""
+
+    callback_id: str
+    wall_ms: float
+    cpu_ms: float
+    input_bytes: Optional[int]
+    timestamp: datetime
+
+
+class CallbackProfiler:
+    """Singleton timing middleware for Dash callbacks."""
+
+    _instance: Optional["CallbackProfiler"] = None
+
+    def __new__(cls) -> "CallbackProfiler":
+        """Singleton pattern."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
+        self.enabled = os.getenv("THEBOT_CALLBACK_PROFILING", "") == "1"
+        self.slow_threshold_ms = 100.0
+        self.sample_interval = 0.005
+        self.output_dir = PROFILE_DIR
+        self.slow_log: Deque[SlowCallback] = deque(maxlen=200)
+        self.profiles: List[Path] = []
+        self._stats: Dict[str, CallbackStats] = {}
+        self._armed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self._cpu_seconds = metrics.histogram(
+            "thebot_callback_cpu_seconds", "CPU time per callback execution", labels=("callback",)
+        )
+        self._slow_total = metrics.counter(
+            "thebot_callback_slow_total", "Callback executions over the slow threshold", labels=("callback",)
+        )
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _get_stats(self, callback_id: str) -> CallbackStats:
+        stats = self._stats.get(callback_id)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(callback_id, CallbackStats(callback_id))
+        return stats
+
+    def record(
+        self,
+        callback_id: str,
+        wall: float,
+        cpu: float,
+        input_bytes: Optional[int] = None,
+        output_bytes: Optional[int] = None,
+        error: bool = False,
+    ) -> None:
+        """Record one execution (seconds)."""
+        stats = self._get_stats(callback_id)
+        with self._lock:
+            stats.calls += 1
+            stats.errors += int(error)
+            stats.cpu_seconds += cpu
+            stats.input_bytes += input_bytes or 0
+            stats.output_bytes += output_bytes or 0
+        stats.wall.observe(wall)
+        self._cpu_seconds.labels(callback_id).observe(cpu)
+
+        wall_ms = wall * 1000
+        if wall_ms >= self.slow_threshold_ms:
+            with self._lock:
+                stats.slow_calls += 1
+            self._slow_total.labels(callback_id).inc()
+            self.slow_log.append(
+                SlowCallback(callback_id, wall_ms, cpu * 1000, input_bytes, datetime.now())
+            )
+            logger.warning(
+                f"Slow callback {callback_id}: {wall_ms:.1f}ms wall, {cpu * 1000:.1f}ms CPU"
+                + (f", {input_bytes} bytes in" if input_bytes else "")
+            )
+
+    def _take_armed(self, callback_id: str) -> bool:
+        if callback_id not in self._armed:
+            return False
+        with self._lock:
+            remaining = self._armed.get(callback_id, 0)
+            if remaining <= 0:
+                return False
+            if remaining == 1:
+                del self._armed[callback_id]
+            else:
+                self._armed[callback_id] = remaining - 1
+        return True
+
+    @contextmanager
+    def _timed(self, callback_id: str, input_bytes: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        sampler = (
+            StackSampler(threading.get_ident(), self.sample_interval).start()
+            if self._take_armed(callback_id)
+            else None
+        )
+        outcome: Dict[str, Any] = {"output_bytes": None}
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        error = False
+        try:
+            yield outcome
+        except BaseException:
+            error = True
+            raise
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            if sampler is not None:
+                sampler.stop()
+                self._save_profile(callback_id, sampler)
+            self.record(callback_id, wall, cpu, input_bytes, outcome["output_bytes"], error)
+
+    def measure(self, callback_id: str):
+        """Context manager timing a block when profiling is enabled (no-op otherwise)."""
+        if not self.enabled:
+            return nullcontext({})
+        return self._timed(callback_id)
+
+    def _save_profile(self, callback_id: str, sampler: StackSampler) -> None:
+        safe_id = re.sub(r"[^A-Za-z0-9_.-]+", "_", callback_id).strip("._")[:80] or "callback"
+        path = self.output_dir / f"{safe_id}-{datetime.now():%Y%m%d-%H%M%S-%f}.folded"
+        try:
+            sampler.write_folded(path)
+            self.profiles.append(path)
+            logger.info(f"Profile for {callback_id}: {sum(sampler.samples.values())} samples -> {path}")
+        except OSError as e:
+            logger.error(f"Cannot write profile for {callback_id}: {e}")
+
+    # ------------------------------------------------------------------
+    # Dash integration
+    # ------------------------------------------------------------------
+
+    def wrap(self, callback_id: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a Dash dispatch function (returns the serialized response)."""
+        if getattr(func, "__profiled__", False):
+            return func
+
+        @wraps(func)
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            if not self.enabled:
+                return func(*args, **kwargs)
+            with self._timed(callback_id, _request_size()) as outcome:
+                result = func(*args, **kwargs)
+                if isinstance(result, (str, bytes)):
+                    outcome["output_bytes"] = len(result)
+                return result
+
+        profiled.__profiled__ = True
+        return profiled
+
+    def instrument_callback_map(self, callback_map: Dict[str, Dict[str, Any]]) -> int:
+        """Wrap every callback of a Dash callback map; returns newly wrapped count."""
+        wrapped = 0
+        for callback_id, entry in list(callback_map.items()):
+            func = entry.get("callback")
+            if func is not None and not getattr(func, "__profiled__", False):
+                entry["callback"] = self.wrap(callback_id, func)
+                wrapped += 1
+        return wrapped
+
+    def instrument(self, app: Any, url_prefix: str = "/_profiler") -> None:
+        """Enable profiling on a Dash app.
+
+        Callbacks registered with app.callback or dash.callback are wrapped
+        at request time (dash.callback entries only reach app.callback_map on
+        the first request). Adds JSON endpoints:
+        - {url_prefix}/callbacks: per-callback stats and recent slow calls
+        - {url_prefix}/profile?callback=<id>&calls=1: arm the stack sampler
+        """
+        from flask import jsonify, request
+
+        self.enabled = True
+        known = {"size": -1}
+
+        @app.server.before_request
+        def _instrument_new_callbacks():
+            if len(app.callback_map) != known["size"]:
+                self.instrument_callback_map(app.callback_map)
+                known["size"] = len(app.callback_map)
+
+        def _stats_view():
+            return jsonify(self.get_stats())
+
+        def _profile_view():
+            callback_id = request.args.get("callback", "")
+            if callback_id not in app.callback_map:
+                return jsonify({"error": f"Unknown callback: {callback_id}"}), 404
+            self.profile_next(callback_id, int(request.args.get("calls", 1)))
+            return jsonify({"armed": callback_id, "output_dir": str(self.output_dir)})
+
+        app.server.add_url_rule(f"{url_prefix}/callbacks", "thebot_profiler_callbacks", _stats_view)
+        app.server.add_url_rule(f"{url_prefix}/profile", "thebot_profiler_profile", _profile_view)
+        logger.info(f"Callback profiling enabled (slow threshold {self.slow_threshold_ms}ms)")
+
+    def profile_next(self, callback_id: str, calls: int = 1) -> None:
+        """Arm the stack sampler for the next `calls` executions of a callback."""
+        with self._lock:
+            self._armed[callback_id] = self._armed.get(callback_id, 0) + max(1, calls)
+        logger.info(f"Sampling profiler armed for {callback_id} ({calls} call(s))")
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def get_callback_stats(self, callback_id: str) -> Optional[CallbackStats]:
+        return self._stats.get(callback_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Stats for all callbacks, slowest (p99) first."""
+        with self._lock:
+            stats = list(self._stats.values())
+        callbacks = sorted((s.to_dict() for s in stats), key=lambda s: s["wall_ms_p99"], reverse=True)
+        return {
+            "enabled": self.enabled,
+            "slow_threshold_ms": self.slow_threshold_ms,
+            "callbacks": callbacks,
+            "slow_calls": [
+                {
+                    "callback_id": slow.callback_id,
+                    "wall_ms": round(slow.wall_ms, 3),
+                    "cpu_ms": round(slow.cpu_ms, 3),
+                    "input_bytes": slow.input_bytes,
+                    "timestamp": slow.timestamp.isoformat(),
+                }
+                for slow in list(self.slow_log)
+            ],
+            "armed": dict(self._armed),
+            "profiles": [str(path) for path in self.profiles],
+        }
+
+    def reset_stats(self) -> None:
+        """Reset statistics for all callbacks."""
+        with self._lock:
+            self._stats.clear()
+            self._armed.clear()
+        self.slow_log.clear()
+        self.profiles.clear()
+        logger.info("Reset callback profiler statistics")
+
+
+def _request_size() -> Optional[int]:
+    """Size of the current Dash request body (callback inputs), if any."""
+    try:
+        from flask import has_request_context, request
+
+        return request.content_length if has_request_context() else None
+    except ImportError:
+        return None
+
+
+def get_callback_profiler() -> CallbackProfiler:
+    """Factory function for singleton access."""
+    return CallbackProfiler()
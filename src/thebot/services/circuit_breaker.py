@@ -6,23 +6,37 @@ Implements circuit breaker pattern to prevent cascading failures:
 - OPEN state: Reject requests, fast-fail to prevent system overload
 - HALF_OPEN state: Allow limited test requests to detect recovery
 - Configurable thresholds for failure rates and timeouts
-- Per-service breaker tracking
+- Per-service and per-endpoint breaker tracking
 - Health monitoring
 
+Tripping modes:
+- consecutive: open after ``failure_threshold`` failures in a row (default)
+- count / time: rolling window (last N calls, or last N seconds) of outcomes
+  and latencies; open when the failure rate or the slow-call rate crosses
+  its threshold once ``minimum_calls`` were recorded
+
+Rejected or failed calls can fast-fail to the last good value returned for
+the same arguments, or to a fallback hook.
+
 Architecture:
 - CircuitBreakerConfig: Configuration with thresholds
 - CircuitBreakerState: State management (CLOSED/OPEN/HALF_OPEN)
+- OutcomeWindow: Ring buffer of call outcomes for rate-based tripping
 - CircuitBreaker: Individual breaker for a service
 - CircuitBreakerManager: Singleton manager for all breakers
 """
 
 import asyncio
 import logging
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from src.thebot.services.callback_debouncer import args_signature
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +58,15 @@ class CircuitBreakerConfig:
     success_threshold: int = 2  # Successes in HALF_OPEN before closing
     timeout_sec: int = 60  # Time before attempting recovery
     max_half_open_calls: int = 3  # Max calls allowed in HALF_OPEN
+    window_type: str = "consecutive"  # consecutive, count, time
+    window_size: int = 100  # Calls (count) or seconds (time) in the window
+    minimum_calls: int = 10  # Calls in window before rates are evaluated
+    slow_call_threshold_sec: Optional[float] = None  # Slower calls count as slow
+    slow_call_rate_threshold: float = 0.5  # Slow-call rate that opens the circuit
+    result_is_failure: Optional[Callable[[Any], bool]] = None  # e.g. empty payloads
+    cache_last_good: bool = False  # Serve last good result when failing fast
+    last_good_ttl_sec: Optional[float] = None  # Max age of a served last good value
+    last_good_max_entries: int = 256
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -57,6 +80,106 @@ class CircuitBreakerConfig:
             raise ValueError("timeout_sec must be >= 1")
         if self.max_half_open_calls < 1:
             raise ValueError("max_half_open_calls must be >= 1")
+        if self.window_type not in ("consecutive", "count", "time"):
+            raise ValueError(f"Invalid window_type: {self.window_type}")
+        if self.window_size < 1:
+            raise ValueError("window_size must be >= 1")
+        if self.minimum_calls < 1:
+            raise ValueError("minimum_calls must be >= 1")
+        if self.slow_call_threshold_sec is not None and self.slow_call_threshold_sec <= 0:
+            raise ValueError("slow_call_threshold_sec must be positive")
+        if not 0 < self.slow_call_rate_threshold <= 1:
+            raise ValueError("slow_call_rate_threshold must be in (0, 1]")
+        if self.last_good_max_entries < 1:
+            raise ValueError("last_good_max_entries must be >= 1")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected without reaching the service."""
+
+
+class OutcomeWindow:
+    """Sliding window of call outcomes backed by a fixed ring buffer.
+
+    Count windows keep one slot per call (the last ``size`` calls); time
+    windows keep one bucket per second (the last ``size`` seconds). Totals are
+    maintained incrementally as slots are overwritten.
+    """
+
+    def __init__(self, window_type: str, size: int) -> None:
+        """Initialize window.
+
+        Args:
+            window_type: "count" or "time"
+            size: Number of calls or seconds covered by the window
+        """
+        if window_type not in ("count", "time"):
+            raise ValueError(f"Invalid window_type: {window_type}")
+        self.window_type = window_type
+        self.size = size
+        self._calls = [0] * size
+        self._failures = [0] * size
+        self._slow = [0] * size
+        self._latency = [0.0] * size
+        self._stamps = [-1] * size
+        self._next = 0
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.latency_sum = 0.0
+
+    def _evict(self, slot: int) -> None:
+        """Remove a slot's contribution from the totals."""
+        self.calls -= self._calls[slot]
+        self.failures -= self._failures[slot]
+        self.slow_calls -= self._slow[slot]
+        self.latency_sum -= self._latency[slot]
+        self._calls[slot] = self._failures[slot] = self._slow[slot] = 0
+        self._latency[slot] = 0.0
+
+    def _expire(self, now: float) -> None:
+        """Drop time buckets older than the window."""
+        oldest = int(now) - self.size
+        for slot, stamp in enumerate(self._stamps):
+            if 0 <= stamp <= oldest:
+                self._evict(slot)
+                self._stamps[slot] = -1
+
+    def record(self, failed: bool, slow: bool, latency: float, now: Optional[float] = None) -> None:
+        """Record one call outcome."""
+        if self.window_type == "count":
+            slot = self._next
+            self._next = (self._next + 1) % self.size
+            self._evict(slot)
+        else:
+            now = time.monotonic() if now is None else now
+            second = int(now)
+            slot = second % self.size
+            if self._stamps[slot] != second:
+                self._evict(slot)
+                self._stamps[slot] = second
+
+        self._calls[slot] += 1
+        self._failures[slot] += int(failed)
+        self._slow[slot] += int(slow)
+        self._latency[slot] += latency
+        self.calls += 1
+        self.failures += int(failed)
+        self.slow_calls += int(slow)
+        self.latency_sum += latency
+
+    def totals(self, now: Optional[float] = None) -> Tuple[int, int, int]:
+        """Return (calls, failures, slow_calls) currently in the window."""
+        if self.window_type == "time":
+            self._expire(time.monotonic() if now is None else now)
+        return self.calls, self.failures, self.slow_calls
+
+    def clear(self) -> None:
+        """Forget every recorded outcome."""
+        for slot in range(self.size):
+            self._evict(slot)
+            self._stamps[slot] = -1
+        self._next = 0
 
 
 class CircuitBreaker:
@@ -66,15 +189,31 @@ class CircuitBreaker:
         self,
         service_name: str,
         config: CircuitBreakerConfig,
+        fallback: Optional[Callable[..., Any]] = None,
     ) -> None:
         """Initialize circuit breaker.
 
         Args:
             service_name: Name of service being protected
             config: Circuit breaker configuration
+            fallback: Called as ``fallback(error, *args, **kwargs)`` when a call
+                is rejected or fails and no last good value is available
+                (``error`` is None when ``result_is_failure`` rejected a result)
         """
         self.service_name = service_name
         self.config = config
+        self.fallback = fallback
+        self.window: Optional[OutcomeWindow] = (
+            OutcomeWindow(config.window_type, config.window_size)
+            if config.window_type != "consecutive"
+            else None
+        )
+        self._last_good: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.open_reason: Optional[str] = None
+        self.total_slow_calls = 0
+        self.rejected_calls = 0
+        self.fallback_calls = 0
         self.state = BreakerState.CLOSED
         self.failure_count = 0
         self.success_count = 0
@@ -94,37 +233,171 @@ class CircuitBreaker:
             **kwargs: Keyword arguments
 
         Returns:
-            Function result
+            Function result (or last good value / fallback when failing fast)
 
         Raises:
-            RuntimeError: If circuit is OPEN
+            CircuitOpenError: If circuit is OPEN and no fallback is available
         """
-        self.total_calls += 1
+        try:
+            self._admit()
+        except CircuitOpenError as e:
+            return self._recover(e, args, kwargs)
 
-        # Check if should transition states
-        self._check_state_transition()
+        start = time.perf_counter()
+        try:
+            result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
+        except Exception as e:
+            self._record(time.perf_counter() - start, failed=True)
+            return self._recover(e, args, kwargs)
 
-        if self.state == BreakerState.OPEN:
-            raise RuntimeError(
-                f"Circuit breaker {self.service_name} is OPEN. Service unavailable."
-            )
+        return self._accept(result, time.perf_counter() - start, args, kwargs)
 
-        if self.state == BreakerState.HALF_OPEN:
-            if self.half_open_calls >= self.config.max_half_open_calls:
-                raise RuntimeError(
-                    f"Circuit breaker {self.service_name} HALF_OPEN: max test calls exceeded"
-                )
-            self.half_open_calls += 1
+    def call_sync(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Execute a synchronous function through circuit breaker.
 
+        Same semantics as :meth:`call`, for blocking provider clients.
+        """
         try:
-            result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-            self._on_success()
-            return result
+            self._admit()
+        except CircuitOpenError as e:
+            return self._recover(e, args, kwargs)
 
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
         except Exception as e:
-            self._on_failure()
+            self._record(time.perf_counter() - start, failed=True)
+            return self._recover(e, args, kwargs)
+
+        return self._accept(result, time.perf_counter() - start, args, kwargs)
+
+    def call_strict(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Execute a synchronous function, surfacing every failure to the caller.
+
+        Unlike :meth:`call_sync`, nothing is replaced by the last good value or
+        the fallback: rejections raise :class:`CircuitOpenError`, errors are
+        re-raised and results flagged by ``result_is_failure`` are returned
+        as-is. For callers that fail over on their own, such as a router over
+        interchangeable providers.
+
+        Raises:
+            CircuitOpenError: If circuit is OPEN
+        """
+        self._admit()
+
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self._record(time.perf_counter() - start, failed=True)
             raise
 
+        return self._accept(result, time.perf_counter() - start, args, kwargs, recover=False)
+
+    def last_good(self, *args: Any, **kwargs: Any) -> Any:
+        """Last good result cached for these arguments (None if absent or expired)."""
+        entry = self._last_good_entry(args, kwargs)
+        return entry[1] if entry is not None else None
+
+    def _admit(self) -> None:
+        """Count the call and reject it if the circuit does not allow it."""
+        with self._lock:
+            self.total_calls += 1
+
+            # Check if should transition states
+            self._check_state_transition()
+
+            if self.state == BreakerState.OPEN:
+                self.rejected_calls += 1
+                raise CircuitOpenError(
+                    f"Circuit breaker {self.service_name} is OPEN. Service unavailable."
+                )
+
+            if self.state == BreakerState.HALF_OPEN:
+                if self.half_open_calls >= self.config.max_half_open_calls:
+                    self.rejected_calls += 1
+                    raise CircuitOpenError(
+                        f"Circuit breaker {self.service_name} HALF_OPEN: max test calls exceeded"
+                    )
+                self.half_open_calls += 1
+
+    def _accept(
+        self,
+        result: Any,
+        elapsed: float,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        recover: bool = True,
+    ) -> Any:
+        """Record a completed call and remember or replace its result."""
+        predicate = self.config.result_is_failure
+        if predicate is not None and predicate(result):
+            self._record(elapsed, failed=True)
+            return self._recover(None, args, kwargs, result) if recover else result
+
+        self._record(elapsed, failed=False)
+        if self.config.cache_last_good:
+            key = args_signature(args, kwargs)
+            with self._lock:
+                self._last_good[key] = (time.monotonic(), result)
+                self._last_good.move_to_end(key)
+                while len(self._last_good) > self.config.last_good_max_entries:
+                    self._last_good.popitem(last=False)
+        return result
+
+    def _record(self, elapsed: float, failed: bool) -> None:
+        """Update window and state from one call outcome."""
+        threshold = self.config.slow_call_threshold_sec
+        slow = threshold is not None and elapsed >= threshold
+
+        with self._lock:
+            if slow:
+                self.total_slow_calls += 1
+            if self.window is not None:
+                self.window.record(failed, slow, elapsed)
+
+            if failed:
+                self._on_failure()
+            elif slow:
+                self._on_slow_success()
+            else:
+                self._on_success()
+
+    def _recover(
+        self,
+        error: Optional[Exception],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        result: Any = None,
+    ) -> Any:
+        """Serve the last good value or the fallback hook, else re-raise."""
+        entry = self._last_good_entry(args, kwargs)
+        if entry is not None:
+            self.fallback_calls += 1
+            logger.debug(f"Circuit breaker {self.service_name}: serving last good value")
+            return entry[1]
+
+        if self.fallback is not None:
+            self.fallback_calls += 1
+            return self.fallback(error, *args, **kwargs)
+
+        if error is not None:
+            raise error
+        return result
+
+    def _last_good_entry(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[float, Any]]:
+        """Cached (timestamp, result) for these arguments, if still fresh."""
+        if not self.config.cache_last_good:
+            return None
+        with self._lock:
+            entry = self._last_good.get(args_signature(args, kwargs))
+        ttl = self.config.last_good_ttl_sec
+        if entry is None or (ttl is not None and time.monotonic() - entry[0] > ttl):
+            return None
+        return entry
+
     def _on_success(self) -> None:
         """Handle successful call."""
         self.failure_count = 0
@@ -135,6 +408,23 @@ class CircuitBreaker:
             if self.success_count >= self.config.success_threshold:
                 self._transition_to_closed()
 
+    def _on_slow_success(self) -> None:
+        """Handle successful call that exceeded the slow-call threshold."""
+        self.total_successes += 1
+
+        if self.state == BreakerState.HALF_OPEN:
+            # Still degraded: keep failing fast
+            self.open_reason = "slow calls"
+            self._transition_to_open()
+        elif self.window is None:
+            # Consecutive mode: a slow success does not reset the failure run
+            self.failure_count += 1
+            if self.failure_count >= self.config.failure_threshold:
+                self.open_reason = "consecutive slow calls"
+                self._transition_to_open()
+        else:
+            self._evaluate_window()
+
     def _on_failure(self) -> None:
         """Handle failed call."""
         self.failure_count += 1
@@ -143,11 +433,34 @@ class CircuitBreaker:
 
         # Check if should open circuit
         if self.state == BreakerState.CLOSED:
-            if self.failure_count >= self.config.failure_threshold:
+            if self.window is not None:
+                self._evaluate_window()
+            elif self.failure_count >= self.config.failure_threshold:
+                self.open_reason = "consecutive failures"
                 self._transition_to_open()
 
         elif self.state == BreakerState.HALF_OPEN:
             # Any failure in HALF_OPEN reopens circuit
+            self.open_reason = "failure while half open"
+            self._transition_to_open()
+
+    def _evaluate_window(self) -> None:
+        """Open the circuit when window failure or slow-call rate is too high."""
+        if self.state != BreakerState.CLOSED:
+            return
+
+        calls, failures, slow_calls = self.window.totals()
+        if calls < self.config.minimum_calls:
+            return
+
+        if failures / calls >= self.config.failure_rate_threshold:
+            self.open_reason = f"failure rate {failures}/{calls}"
+            self._transition_to_open()
+        elif (
+            self.config.slow_call_threshold_sec is not None
+            and slow_calls / calls >= self.config.slow_call_rate_threshold
+        ):
+            self.open_reason = f"slow call rate {slow_calls}/{calls}"
             self._transition_to_open()
 
     def _check_state_transition(self) -> None:
@@ -165,7 +478,7 @@ class CircuitBreaker:
             self.last_state_change_time = time.time()
             logger.warning(
                 f"Circuit breaker {self.service_name} transitioned to OPEN "
-                f"(failures: {self.failure_count})"
+                f"(failures: {self.failure_count}, reason: {self.open_reason})"
             )
 
     def _transition_to_half_open(self) -> None:
@@ -183,23 +496,48 @@ class CircuitBreaker:
             self.state = BreakerState.CLOSED
             self.failure_count = 0
             self.success_count = 0
+            self.open_reason = None
+            if self.window is not None:
+                self.window.clear()
             self.last_state_change_time = time.time()
             logger.info(f"Circuit breaker {self.service_name} transitioned to CLOSED")
 
+    @property
+    def is_open(self) -> bool:
+        """True while calls are rejected (OPEN and recovery timeout not elapsed)."""
+        return (
+            self.state == BreakerState.OPEN
+            and time.time() - self.last_state_change_time < self.config.timeout_sec
+        )
+
+    def reset(self) -> None:
+        """Force the breaker back to CLOSED with an empty window."""
+        with self._lock:
+            self.state = BreakerState.CLOSED
+            self.failure_count = 0
+            self.success_count = 0
+            self.open_reason = None
+            if self.window is not None:
+                self.window.clear()
+
     def get_status(self) -> Dict[str, Any]:
         """Get circuit breaker status."""
         failure_rate = (
             self.total_failures / self.total_calls * 100 if self.total_calls > 0 else 0
         )
 
-        return {
+        status = {
             "service_name": self.service_name,
             "state": self.state.value,
             "total_calls": self.total_calls,
             "total_failures": self.total_failures,
             "total_successes": self.total_successes,
+            "total_slow_calls": self.total_slow_calls,
+            "rejected_calls": self.rejected_calls,
+            "fallback_calls": self.fallback_calls,
             "failure_rate_percent": failure_rate,
             "failure_count": self.failure_count,
+            "open_reason": self.open_reason,
             "last_failure": (
                 datetime.fromtimestamp(self.last_failure_time).isoformat()
                 if self.last_failure_time > 0
@@ -207,6 +545,26 @@ class CircuitBreaker:
             ),
         }
 
+        if self.window is not None:
+            with self._lock:
+                calls, failures, slow_calls = self.window.totals()
+                latency_sum = self.window.latency_sum
+            status["window"] = {
+                "type": self.window.window_type,
+                "size": self.window.size,
+                "calls": calls,
+                "failure_rate_percent": failures / calls * 100 if calls else 0,
+                "slow_call_rate_percent": slow_calls / calls * 100 if calls else 0,
+                "avg_latency_ms": latency_sum / calls * 1000 if calls else 0,
+            }
+
+        return status
+
+
+def endpoint_name(service_name: str, endpoint: str) -> str:
+    """Breaker name for one endpoint of a service (e.g. ``binance:klines``)."""
+    return f"{service_name}:{endpoint}"
+
 
 class CircuitBreakerManager:
     """Singleton manager for circuit breakers."""
@@ -225,12 +583,14 @@ class CircuitBreakerManager:
         self,
         service_name: str,
         config: Optional[CircuitBreakerConfig] = None,
+        fallback: Optional[Callable[..., Any]] = None,
     ) -> CircuitBreaker:
         """Register a service with circuit breaker.
 
         Args:
             service_name: Name of service
             config: Circuit breaker configuration (uses default if None)
+            fallback: Fast-fail hook, see :class:`CircuitBreaker`
 
         Returns:
             CircuitBreaker instance
@@ -239,7 +599,7 @@ class CircuitBreakerManager:
             logger.warning(f"Service {service_name} already registered, replacing")
 
         cfg = config or self._default_config
-        breaker = CircuitBreaker(service_name, cfg)
+        breaker = CircuitBreaker(service_name, cfg, fallback)
         self._breakers[service_name] = breaker
 
         logger.info(
@@ -253,6 +613,33 @@ class CircuitBreakerManager:
         """Get breaker for service."""
         return self._breakers.get(service_name)
 
+    def endpoint(
+        self,
+        service_name: str,
+        endpoint: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        fallback: Optional[Callable[..., Any]] = None,
+    ) -> CircuitBreaker:
+        """Get (registering on first use) the breaker of one service endpoint.
+
+        Endpoints trip independently, so a slow klines route does not block
+        ticker requests to the same provider.
+
+        Args:
+            service_name: Name of service
+            endpoint: Endpoint of the service
+            config: Configuration used when the breaker is created
+            fallback: Fast-fail hook used when the breaker is created
+
+        Returns:
+            CircuitBreaker instance
+        """
+        name = endpoint_name(service_name, endpoint)
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self.register(name, config, fallback)
+        return breaker
+
     async def call(
         self,
         service_name: str,
@@ -301,18 +688,14 @@ class CircuitBreakerManager:
         if breaker is None:
             return False
 
-        breaker.state = BreakerState.CLOSED
-        breaker.failure_count = 0
-        breaker.success_count = 0
+        breaker.reset()
         logger.info(f"Reset circuit breaker for {service_name}")
         return True
 
     def reset_all(self) -> None:
         """Reset all breakers."""
         for breaker in self._breakers.values():
-            breaker.state = BreakerState.CLOSED
-            breaker.failure_count = 0
-            breaker.success_count = 0
+            breaker.reset()
         logger.info("Reset all circuit breakers")
 
 
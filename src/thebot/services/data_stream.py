@@ -4,14 +4,18 @@ Real-time market data streaming and aggregation
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import time
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 import pandas as pd
 
+from src.thebot.core.metrics import stream_message_seconds
 from src.thebot.core.types import TimeFrame, MarketData
+from src.thebot.services.async_callbacks import get_event_loop_worker
 from src.thebot.services.websocket_manager import (
     WebSocketManager,
     WebSocketMessage,
@@ -110,6 +114,21 @@ class DataStream:
         await self.websocket.disconnect()
         logger.info("✅ Data stream stopped")
 
+    def start_background(self) -> "concurrent.futures.Future[bool]":
+        """
+        Start streaming on the shared event loop worker (non-blocking)
+
+        The WebSocket session and processing task live on the worker loop,
+        so sync Dash callbacks only read the aggregated symbol data. The
+        stream is stopped when the worker shuts down.
+
+        Returns:
+            Future resolving to start()'s result
+        """
+        worker = get_event_loop_worker()
+        worker.register_cleanup(self.stop)
+        return worker.submit(self.start())
+
     async def add_observer(
         self,
         observer: Callable[[str, SymbolData], None]
@@ -215,6 +234,7 @@ class DataStream:
         Args:
             message: WebSocket message
         """
+        started = time.perf_counter()
         try:
             data = message.data
             
@@ -228,6 +248,8 @@ class DataStream:
         
         except Exception as e:
             logger.error(f"Error processing message: {e}")
+        finally:
+            stream_message_seconds.labels(message.type).observe(time.perf_counter() - started)
 
     async def _handle_trade_message(self, data: Dict) -> None:
         """Handle trade message"""
@@ -10,8 +10,12 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 import pandas as pd
 from src.thebot.core.logger import logger
+from src.thebot.core.metrics import indicator_compute_seconds
 from src.thebot.core.types import IndicatorResult, SignalDirection, TimeFrame
 from src.thebot.indicators.factory import IndicatorFactory
+from src.thebot.indicators.graph import IndicatorRequest, indicator_planner
+from src.thebot.indicators.graph import supports as supports_indicator
+from src.thebot.services.indicator_state_cache import get_indicator_state_cache
 
 
 @dataclass
@@ -114,7 +118,8 @@ class IndicatorIntegrationFactory:
             indicator = registered['indicator']
             
             # Calculer l'indicateur
-            result = indicator.calculate(data)
+            with indicator_compute_seconds.labels(indicator_config.name, "full").time():
+                result = indicator.calculate(data)
             
             if not result or not result.is_valid:
                 logger.warning(f"⚠️ Invalid result for {indicator_key}")
@@ -181,6 +186,139 @@ class IndicatorIntegrationFactory:
                 error=str(e)
             )
 
+    def calculate_indicators(
+        self,
+        data: pd.DataFrame,
+        indicator_configs: List[IndicatorConfig]
+    ) -> Dict[str, IndicatorIntegrationResult]:
+        """
+        Calculer plusieurs indicateurs d'un même graphique en une passe
+
+        Les indicateurs supportés par le graphe partagé sont planifiés ensemble
+        (EMA, SMA, écart-type et true range communs calculés une seule fois),
+        les autres - ceux dont un paramètre est inconnu du graphe, ou dont les
+        signaux sont demandés (show_signals) - passent par calculate_indicator,
+        de même que chaque indicateur planifié si le graphe échoue.
+
+        Args:
+            data: DataFrame avec OHLCV
+            indicator_configs: Configurations des indicateurs du graphique
+
+        Returns:
+            Résultats par nom d'indicateur
+        """
+        enabled = [config for config in indicator_configs if config.enabled]
+        # Le graphe ne produit que des valeurs : les signaux restent au calculateur complet
+        planned = [
+            config for config in enabled
+            if not config.show_signals and supports_indicator(config.name, config.parameters)
+        ]
+        results: Dict[str, IndicatorIntegrationResult] = {}
+        outputs: Dict[str, pd.DataFrame] = {}
+
+        if planned:
+            requests = [
+                IndicatorRequest.of(config.name, name=config.name, **config.parameters)
+                for config in planned
+            ]
+            try:
+                with indicator_compute_seconds.labels("graph", "planned").time():
+                    outputs = indicator_planner.compute(data, requests)
+            except Exception as e:
+                # Les indicateurs planifiés repassent un par un par calculate_indicator
+                logger.warning(f"⚠️ Indicator graph failed, falling back per indicator: {e}")
+                outputs = {}
+
+            for config in planned:
+                if config.name not in outputs:
+                    continue
+                frame = outputs[config.name]
+                last = frame.iloc[-1] if len(frame) else None
+                result = IndicatorIntegrationResult(
+                    indicator_name=config.name,
+                    data=frame,
+                    signals=[],
+                    statistics={
+                        'last_value': None if last is None else last.to_dict(),
+                        'indicator_name': config.name,
+                        'parameters': config.parameters
+                    }
+                )
+                results[config.name] = result
+
+                indicator_key = f"{config.name}_{config.timeframe.value}"
+                if indicator_key in self.registered_indicators:
+                    self.registered_indicators[indicator_key]['last_result'] = result
+
+        for config in enabled:
+            if config.name not in results:
+                result = self.calculate_indicator(data, config)
+                if result:
+                    results[config.name] = result
+
+        logger.info(f"✅ Calculated {len(results)} indicators ({len(outputs)} via shared graph)")
+        return results
+
+    def update_indicator(
+        self,
+        symbol: str,
+        data: pd.DataFrame,
+        indicator_config: IndicatorConfig
+    ) -> Optional[IndicatorIntegrationResult]:
+        """
+        Mettre à jour un indicateur de façon incrémentale
+
+        L'état du calculateur (EMA, moyennes de Wilder, sommes glissantes...)
+        est conservé par (symbole, timeframe, paramètres) : seules les
+        nouvelles bougies sont traitées à chaque rafraîchissement.
+
+        Args:
+            symbol: Symbole de l'actif
+            data: DataFrame avec OHLCV (horodaté)
+            indicator_config: Configuration de l'indicateur
+
+        Returns:
+            Résultat d'intégration (calcul complet si l'indicateur n'a pas
+            de calculateur streaming)
+        """
+        state_cache = get_indicator_state_cache()
+        if not state_cache.supports(indicator_config.name):
+            return self.calculate_indicator(data, indicator_config)
+
+        try:
+            with indicator_compute_seconds.labels(indicator_config.name, "incremental").time():
+                values = state_cache.update(
+                    symbol,
+                    indicator_config.timeframe.value,
+                    indicator_config.name,
+                    indicator_config.parameters,
+                    data
+                )
+            result = IndicatorIntegrationResult(
+                indicator_name=indicator_config.name,
+                data=values.to_frame(),
+                signals=[],
+                statistics={
+                    'last_value': values.iloc[-1] if len(values) else None,
+                    'indicator_name': indicator_config.name,
+                    'parameters': indicator_config.parameters
+                }
+            )
+
+            indicator_key = f"{indicator_config.name}_{indicator_config.timeframe.value}"
+            if indicator_key in self.registered_indicators:
+                self.registered_indicators[indicator_key]['last_result'] = result
+            return result
+
+        except Exception as e:
+            logger.error(f"❌ Error updating indicator state: {e}")
+            return IndicatorIntegrationResult(
+                indicator_name=indicator_config.name,
+                data=data,
+                signals=[],
+                error=str(e)
+            )
+
     def get_last_result(
         self,
         indicator_name: str,
@@ -0,0 +1,301 @@
+"""
+Incremental indicator state cache.
+
+Keeps the streaming calculators (EMA value, Wilder averages, rolling sums,
+last close...) alive between chart refreshes, keyed by
+(symbol, timeframe, indicator, params), together with the last bar processed:
+- New bars: only the delta is fed through the calculator
+- Revised forming bar: state restored from the checkpoint taken before the
+  last bar, then the revised bar is replayed (one update)
+- Revised history (older bar changed or missing): state rebuilt from scratch;
+  every processed bar still present in the data is compared through a
+  per-bar checksum, so revisions anywhere in the overlap are detected
+
+Architecture:
+- IndicatorState: Calculator state plus the outputs already produced
+- IndicatorStateCache: LRU of states with per-key update / invalidation
+"""
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.thebot.core.types import MarketData, TimeFrame
+from src.thebot.indicators.factory import IndicatorFactory
+
+logger = logging.getLogger(__name__)
+
+StateKey = Tuple[str, str, str, Tuple[Tuple[str, Any], ...]]
+OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def _result_value(result: Any) -> Optional[float]:
+    return None if result is None else float(result.value)
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+# Streaming step per indicator: (calculator, bar) -> output value
+STEPPERS: Dict[str, Callable[[Any, MarketData], Optional[float]]] = {
+    "sma": lambda calc, bar: _optional_float(calc.calculate_from_data(bar)),
+    "ema": lambda calc, bar: _result_value(calc.add_data_point(bar)),
+    "rsi": lambda calc, bar: _result_value(calc.add_data_point(bar)),
+    "atr": lambda calc, bar: _result_value(calc.add_data_point(bar)),
+    "obv": lambda calc, bar: _optional_float(calc.calculate(bar)),
+}
+
+
+@dataclass
+class IndicatorState:
+    """Streaming calculator state for one (symbol, timeframe, indicator, params)."""
+
+    calculator: Any
+    checkpoint: Any = None  # Calculator copy taken before the last bar
+    values: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))
+    checksums: pd.Series = field(default_factory=lambda: pd.Series(dtype="uint64"))  # One per bar
+
+    @property
+    def last_timestamp(self) -> Optional[pd.Timestamp]:
+        return self.values.index[-1] if len(self.values) else None
+
+
+class IndicatorStateCache:
+    """LRU cache of streaming indicator states, updated with bar deltas."""
+
+    def __init__(
+        self,
+        factory: Optional[IndicatorFactory] = None,
+        max_entries: int = 256,
+        max_history: int = 20000,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            factory: Factory used to create the streaming calculators
+            max_entries: Maximum number of states kept (LRU eviction)
+            max_history: Maximum number of outputs kept per state
+        """
+        self.factory = factory or IndicatorFactory()
+        self.max_entries = max_entries
+        self.max_history = max_history
+        self._states: "OrderedDict[StateKey, IndicatorState]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.updates = 0
+        self.rebuilds = 0
+        self.replays = 0
+
+    @staticmethod
+    def make_key(
+        symbol: str, timeframe: str, indicator: str, params: Optional[Dict[str, Any]] = None
+    ) -> StateKey:
+        """Build the canonical cache key."""
+        return (symbol.upper(), timeframe, indicator.lower(), tuple(sorted((params or {}).items())))
+
+    @staticmethod
+    def supports(indicator: str) -> bool:
+        """Whether a streaming calculator is available for the indicator."""
+        return indicator.lower() in STEPPERS
+
+    def update(
+        self,
+        symbol: str,
+        timeframe: str,
+        indicator: str,
+        params: Optional[Dict[str, Any]],
+        data: pd.DataFrame,
+    ) -> pd.Series:
+        """
+        Bring the indicator up to date with the given bars.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe value ("1m", "1h"...)
+            indicator: Streaming indicator name (see STEPPERS)
+            params: Calculator parameters
+            data: OHLCV DataFrame sorted by time (DatetimeIndex or "timestamp" column)
+
+        Returns:
+            Indicator values aligned on data's rows
+
+        Raises:
+            ValueError: If the indicator has no streaming calculator
+        """
+        name = indicator.lower()
+        if name not in STEPPERS:
+            raise ValueError(f"No streaming calculator for '{indicator}'. Available: {list(STEPPERS)}")
+
+        timestamps = self._timestamps(data)
+        checksums = self._checksums(data)
+        key = self.make_key(symbol, timeframe, name, params)
+
+        with self._lock:
+            state = self._states.get(key)
+            start = self._resume_position(state, timestamps, checksums) if state else None
+
+            if start is None:
+                if state is not None:
+                    logger.debug(f"History revised for {key}, rebuilding indicator state")
+                state = IndicatorState(calculator=self.factory.create_calculator(name, **(params or {})))
+                start = 0
+                self.rebuilds += 1
+
+            self._feed(state, name, symbol, timeframe, data, timestamps, checksums, start)
+
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+
+            values = state.values
+        return pd.Series(values.reindex(timestamps).to_numpy(), index=data.index, name=name)
+
+    def _resume_position(
+        self, state: IndicatorState, timestamps: pd.DatetimeIndex, checksums: np.ndarray
+    ) -> Optional[int]:
+        """Row from which bars must be fed, or None if the state must be rebuilt."""
+        last = state.last_timestamp
+        pos = timestamps.searchsorted(last)
+        if pos >= len(timestamps) or timestamps[pos] != last:
+            return None
+
+        # Processed bars still present in the data must match one for one
+        known = state.checksums
+        overlap = known.index[known.index >= timestamps[0]]
+        first = pos + 1 - len(overlap)
+        if first < 0 or not timestamps[first:pos + 1].equals(overlap):
+            return None
+        expected = known.to_numpy()[-len(overlap):]
+        if not np.array_equal(checksums[first:pos], expected[:-1]):
+            return None
+
+        if checksums[pos] == expected[-1]:
+            return pos + 1
+
+        # Last bar revised (forming candle): replay it from the checkpoint
+        if state.checkpoint is None:
+            return None
+
+        state.calculator = state.checkpoint
+        state.checkpoint = None
+        state.values = state.values.iloc[:-1]
+        state.checksums = state.checksums.iloc[:-1]
+        self.replays += 1
+        return pos
+
+    def _feed(
+        self,
+        state: IndicatorState,
+        name: str,
+        symbol: str,
+        timeframe: str,
+        data: pd.DataFrame,
+        timestamps: pd.DatetimeIndex,
+        checksums: np.ndarray,
+        start: int,
+    ) -> None:
+        """Feed rows [start:] through the calculator."""
+        if start >= len(data):
+            return
+
+        step = STEPPERS[name]
+        frame = TimeFrame(timeframe)
+        last = len(data) - 1
+        rows = data[OHLCV].to_numpy(float)
+        values: List[Optional[float]] = []
+
+        for pos in range(start, len(data)):
+            if pos == last:
+                state.checkpoint = copy.deepcopy(state.calculator)
+            o, h, l, c, v = rows[pos]
+            bar = MarketData(
+                timestamp=timestamps[pos].to_pydatetime(),
+                open=Decimal(str(o)),
+                high=Decimal(str(h)),
+                low=Decimal(str(l)),
+                close=Decimal(str(c)),
+                volume=Decimal(str(v)),
+                timeframe=frame,
+                symbol=symbol,
+            )
+            values.append(step(state.calculator, bar))
+        self.updates += len(values)
+
+        state.values = self._append(
+            state.values, pd.Series(values, index=timestamps[start:], dtype=float)
+        )
+        state.checksums = self._append(
+            state.checksums, pd.Series(checksums[start:], index=timestamps[start:])
+        )
+
+    def _append(self, history: pd.Series, delta: pd.Series) -> pd.Series:
+        combined = pd.concat([history, delta]) if len(history) else delta
+        return combined.iloc[-self.max_history:]
+
+    @staticmethod
+    def _timestamps(data: pd.DataFrame) -> pd.DatetimeIndex:
+        source = data["timestamp"] if "timestamp" in data.columns else data.index
+        return pd.DatetimeIndex(source)
+
+    @staticmethod
+    def _checksums(data: pd.DataFrame) -> np.ndarray:
+        """One 64-bit hash of the OHLCV values per row."""
+        return pd.util.hash_pandas_object(data[OHLCV].astype(float), index=False).to_numpy()
+
+    def invalidate(self, symbol: str, timeframe: Optional[str] = None) -> int:
+        """
+        Drop cached states after a history revision.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Only this timeframe (all timeframes if None)
+
+        Returns:
+            Number of states dropped
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            keys = [
+                key
+                for key in self._states
+                if key[0] == symbol and (timeframe is None or key[1] == timeframe)
+            ]
+            for key in keys:
+                del self._states[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all states."""
+        with self._lock:
+            self._states.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "states": len(self._states),
+                "updates": self.updates,
+                "rebuilds": self.rebuilds,
+                "replays": self.replays,
+            }
+
+
+_state_cache: Optional[IndicatorStateCache] = None
+
+
+def get_indicator_state_cache() -> IndicatorStateCache:
+    """Factory function for singleton access."""
+    global _state_cache
+    if _state_cache is None:
+        _state_cache = IndicatorStateCache()
+    return _state_cache
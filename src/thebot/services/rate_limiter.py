@@ -1,14 +1,16 @@
 """
 Système de limitation de taux pour THEBOT
-Implémentation de sliding window counter pour la protection contre les abus
+Implémentation GCRA (Generic Cell Rate Algorithm) par couple (règle, client)
 """
 
+import asyncio
+import math
 import time
 import threading
 from typing import Dict, List, Optional, Tuple, Union
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from .error_handler import RateLimitError, ErrorSeverity
 
@@ -22,95 +24,141 @@ class RateLimitRule:
     cooldown_seconds: int = 0
 
     def __post_init__(self):
+        if self.requests_per_window <= 0:
+            raise ValueError("requests_per_window must be > 0")
+        if self.window_seconds <= 0:
+            raise ValueError("window_seconds must be > 0")
         if self.burst_limit is None:
             self.burst_limit = self.requests_per_window
+        if self.burst_limit <= 0:
+            raise ValueError("burst_limit must be > 0")
+
+    @property
+    def emission_interval(self) -> float:
+        """Intervalle entre deux requêtes au débit soutenu (secondes)"""
+        return self.window_seconds / self.requests_per_window
 
 
 @dataclass
-class RequestRecord:
-    """Enregistrement d'une requête"""
-    timestamp: float
-    client_id: str
+class RateDecision:
+    """Résultat d'une décision GCRA"""
+    allowed: bool
+    remaining: int
+    retry_after: float
+    reset_after: float
 
 
-class SlidingWindowCounter:
-    """
-    Compteur de fenêtre glissante
-    Implémente un algorithme de sliding window pour le rate limiting
+class GCRALimiter:
     """
+    Limiteur GCRA d'une règle, un état par client
 
-    def __init__(self, max_requests: int, window_seconds: int):
-        self.max_requests = max_requests
-        self.window_seconds = window_seconds
-        self.requests: deque = deque()
-        self.lock = threading.RLock()
-
-    def add_request(self, client_id: str) -> bool:
-        """
-        Ajoute une requête et vérifie si elle est autorisée
-
-        Args:
-            client_id: Identifiant du client
-
-        Returns:
-            True si la requête est autorisée, False sinon
-        """
-        with self.lock:
-            current_time = time.time()
+    Chaque client n'a qu'un flottant d'état (TAT, theoretical arrival time) :
+    décision en O(1) en temps et en mémoire, quel que soit le nombre de
+    requêtes dans la fenêtre. Le débit soutenu est requests_per_window par
+    window_seconds et burst_limit requêtes peuvent passer d'affilée.
 
-            # Nettoyer les anciennes requêtes
-            self._cleanup_old_requests(current_time)
+    Les états sont répartis sur plusieurs verrous (lock striping) pour que des
+    clients différents ne se sérialisent pas, et un client revenu à un bucket
+    plein est évincé : son état est alors identique à celui d'un inconnu.
+    """
 
-            # Compter les requêtes dans la fenêtre
-            if len(self.requests) >= self.max_requests:
-                return False
+    def __init__(self, rule: RateLimitRule, stripes: int = 16):
+        self.rule = rule
+        self.emission_interval = rule.emission_interval
+        self.burst_tolerance = rule.burst_limit * self.emission_interval
+        self._stripes: List[Dict[str, float]] = [{} for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._last_sweep = [time.monotonic()] * stripes
 
-            # Ajouter la nouvelle requête
-            self.requests.append(RequestRecord(current_time, client_id))
-            return True
+    def _stripe(self, client_id: str) -> int:
+        return hash(client_id) % len(self._stripes)
 
-    def get_request_count(self, client_id: Optional[str] = None) -> int:
+    def acquire(self, client_id: str, max_wait: float = 0.0,
+                now: Optional[float] = None) -> RateDecision:
         """
-        Retourne le nombre de requêtes dans la fenêtre actuelle
+        Tente de consommer une requête pour un client
 
         Args:
-            client_id: Filtrer par client (optionnel)
+            client_id: Identifiant du client
+            max_wait: Attente acceptée (s) ; si > 0 la requête est réservée
+                et retry_after indique le délai à respecter avant de l'émettre
+            now: Horloge monotone (tests)
 
         Returns:
-            Nombre de requêtes
+            Décision (allowed, remaining, retry_after, reset_after)
         """
-        with self.lock:
-            current_time = time.time()
-            self._cleanup_old_requests(current_time)
-
-            if client_id:
-                return sum(1 for req in self.requests if req.client_id == client_id)
+        now = time.monotonic() if now is None else now
+        index = self._stripe(client_id)
+        states = self._stripes[index]
+
+        with self._locks[index]:
+            tat = max(states.get(client_id, now), now)
+            new_tat = tat + self.emission_interval
+            wait = new_tat - self.burst_tolerance - now
+
+            if wait > max_wait:
+                decision = RateDecision(
+                    allowed=False,
+                    remaining=0,
+                    retry_after=wait,
+                    reset_after=tat - now,
+                )
             else:
-                return len(self.requests)
-
-    def _cleanup_old_requests(self, current_time: float):
-        """Nettoie les requêtes expirées"""
-        cutoff_time = current_time - self.window_seconds
-
-        while self.requests and self.requests[0].timestamp < cutoff_time:
-            self.requests.popleft()
-
-    def get_remaining_time(self) -> float:
-        """
-        Retourne le temps restant avant la prochaine fenêtre
-
-        Returns:
-            Temps en secondes
-        """
-        with self.lock:
-            if not self.requests:
-                return 0.0
-
-            current_time = time.time()
-            oldest_request = self.requests[0].timestamp
-            elapsed = current_time - oldest_request
+                states[client_id] = new_tat
+                decision = RateDecision(
+                    allowed=True,
+                    remaining=self._remaining(new_tat, now),
+                    retry_after=max(0.0, wait),
+                    reset_after=new_tat - now,
+                )
 
-            return max(0.0, self.window_seconds - elapsed)
+            if now - self._last_sweep[index] >= self.rule.window_seconds:
+                self._sweep(index, now)
+
+        return decision
+
+    def peek(self, client_id: str, now: Optional[float] = None) -> RateDecision:
+        """Décision qu'obtiendrait le client, sans consommer"""
+        now = time.monotonic() if now is None else now
+        index = self._stripe(client_id)
+        with self._locks[index]:
+            tat = max(self._stripes[index].get(client_id, now), now)
+        wait = tat + self.emission_interval - self.burst_tolerance - now
+        return RateDecision(
+            allowed=wait <= 0,
+            remaining=self._remaining(tat, now),
+            retry_after=max(0.0, wait),
+            reset_after=tat - now,
+        )
+
+    def used(self, client_id: str, now: Optional[float] = None) -> int:
+        """Nombre de requêtes actuellement comptées dans le burst du client"""
+        return self.rule.burst_limit - self.peek(client_id, now).remaining
+
+    def _remaining(self, tat: float, now: float) -> int:
+        used = math.ceil(round((tat - now) / self.emission_interval, 9))
+        return max(0, self.rule.burst_limit - used)
+
+    def _sweep(self, index: int, now: float) -> None:
+        """Évince les clients inactifs d'un stripe (verrou déjà pris)"""
+        states = self._stripes[index]
+        for client_id in [c for c, tat in states.items() if tat <= now]:
+            del states[client_id]
+        self._last_sweep[index] = now
+
+    def reset(self, client_id: str) -> None:
+        index = self._stripe(client_id)
+        with self._locks[index]:
+            self._stripes[index].pop(client_id, None)
+
+    def evict_idle(self, now: Optional[float] = None) -> None:
+        now = time.monotonic() if now is None else now
+        for index, lock in enumerate(self._locks):
+            with lock:
+                self._sweep(index, now)
+
+    def client_count(self) -> int:
+        return sum(len(states) for states in self._stripes)
 
 
 class RateLimiter:
@@ -121,8 +169,10 @@ class RateLimiter:
 
     def __init__(self):
         self.rules: Dict[str, RateLimitRule] = {}
-        self.counters: Dict[str, SlidingWindowCounter] = {}
+        self.counters: Dict[str, GCRALimiter] = {}
         self.client_violations: Dict[str, List[float]] = defaultdict(list)
+        # Ne protège que la configuration et les violations : les décisions
+        # passent par les verrous par stripe des GCRALimiter
         self.lock = threading.RLock()
 
         # Règles par défaut
@@ -172,10 +222,7 @@ class RateLimiter:
         """
         with self.lock:
             self.rules[rule_name] = rule
-            self.counters[rule_name] = SlidingWindowCounter(
-                rule.requests_per_window,
-                rule.window_seconds
-            )
+            self.counters[rule_name] = GCRALimiter(rule)
 
     def check_limit(self, rule_name: str, client_id: str,
                    endpoint: Optional[str] = None) -> Tuple[bool, Dict[str, Union[str, int, float]]]:
@@ -190,65 +237,90 @@ class RateLimiter:
         Returns:
             Tuple (autorisé, informations de limite)
         """
-        with self.lock:
-            if rule_name not in self.rules:
-                # Utiliser la règle par défaut
-                rule_name = 'api_general'
+        if rule_name not in self.rules:
+            # Utiliser la règle par défaut
+            rule_name = 'api_general'
 
-            rule = self.rules[rule_name]
-            counter = self.counters[rule_name]
+        rule = self.rules[rule_name]
+        counter = self.counters[rule_name]
 
-            # Vérifier les violations récentes
-            if self._is_in_cooldown(client_id, rule):
-                return False, self._get_limit_info(rule_name, client_id, False, rule.cooldown_seconds)
+        # Vérifier les violations récentes
+        cooldown_remaining = self._cooldown_remaining(client_id, rule)
+        if cooldown_remaining > 0:
+            decision = counter.peek(client_id)
+            decision.allowed = False
+            decision.retry_after = max(decision.retry_after, cooldown_remaining)
+            return False, self._get_limit_info(rule_name, decision, math.ceil(cooldown_remaining))
+
+        # Vérifier la limite
+        decision = counter.acquire(client_id)
+
+        if not decision.allowed:
+            # Enregistrer la violation
+            with self.lock:
+                violations = self.client_violations[client_id]
+                violations.append(time.time())
+                # Garder seulement les 10 dernières violations
+                del violations[:-10]
 
-            # Vérifier la limite
-            allowed = counter.add_request(client_id)
+        return decision.allowed, self._get_limit_info(rule_name, decision)
 
-            if not allowed:
-                # Enregistrer la violation
-                self.client_violations[client_id].append(time.time())
-                # Garder seulement les 10 dernières violations
-                self.client_violations[client_id] = self.client_violations[client_id][-10:]
+    async def acquire_async(self, rule_name: str, client_id: str,
+                            max_wait: float = 1.0) -> Tuple[bool, Dict[str, Union[str, int, float]]]:
+        """
+        Variante asyncio : réserve un créneau et attend son heure au lieu de refuser
 
-            return allowed, self._get_limit_info(rule_name, client_id, allowed)
+        Args:
+            rule_name: Nom de la règle à appliquer
+            client_id: Identifiant du client
+            max_wait: Attente maximale acceptée (s) avant refus
 
-    def _is_in_cooldown(self, client_id: str, rule: RateLimitRule) -> bool:
-        """Vérifie si un client est en cooldown"""
+        Returns:
+            Tuple (autorisé, informations de limite)
+        """
+        rule_name = rule_name if rule_name in self.rules else 'api_general'
+        if self._cooldown_remaining(client_id, self.rules[rule_name]) > 0:
+            return self.check_limit(rule_name, client_id)
+
+        decision = self.counters[rule_name].acquire(client_id, max_wait=max_wait)
+        if decision.allowed and decision.retry_after > 0:
+            await asyncio.sleep(decision.retry_after)
+        return decision.allowed, self._get_limit_info(rule_name, decision)
+
+    def _cooldown_remaining(self, client_id: str, rule: RateLimitRule) -> float:
+        """Temps de cooldown restant pour un client (0 si aucun)"""
         if rule.cooldown_seconds == 0:
-            return False
+            return 0.0
 
-        violations = self.client_violations[client_id]
+        violations = self.client_violations.get(client_id)
         if not violations:
-            return False
+            return 0.0
 
         # Vérifier si la dernière violation est récente
-        last_violation = max(violations)
-        time_since_violation = time.time() - last_violation
+        time_since_violation = time.time() - violations[-1]
+        return max(0.0, rule.cooldown_seconds - time_since_violation)
 
-        return time_since_violation < rule.cooldown_seconds
-
-    def _get_limit_info(self, rule_name: str, client_id: str,
-                       allowed: bool, cooldown_remaining: int = 0) -> Dict[str, Union[str, int, float]]:
+    def _get_limit_info(self, rule_name: str, decision: RateDecision,
+                       cooldown_remaining: int = 0) -> Dict[str, Union[str, int, float]]:
         """Génère les informations de limite pour la réponse"""
         rule = self.rules[rule_name]
-        counter = self.counters[rule_name]
 
         info = {
             'rule': rule_name,
-            'allowed': allowed,
-            'current_requests': counter.get_request_count(client_id),
+            'allowed': decision.allowed,
+            'current_requests': rule.burst_limit - decision.remaining,
+            'remaining_requests': decision.remaining,
             'max_requests': rule.requests_per_window,
             'window_seconds': rule.window_seconds,
-            'remaining_time': counter.get_remaining_time(),
+            'remaining_time': decision.reset_after,
             'burst_limit': rule.burst_limit,
         }
 
         if cooldown_remaining > 0:
             info['cooldown_remaining'] = cooldown_remaining
 
-        if not allowed:
-            info['retry_after'] = counter.get_remaining_time()
+        if not decision.allowed:
+            info['retry_after'] = decision.retry_after
 
         return info
 
@@ -265,14 +337,15 @@ class RateLimiter:
         with self.lock:
             stats = {
                 'client_id': client_id,
-                'total_violations': len(self.client_violations[client_id]),
+                'total_violations': len(self.client_violations.get(client_id, [])),
                 'rules': {}
             }
 
             for rule_name, counter in self.counters.items():
+                decision = counter.peek(client_id)
                 stats['rules'][rule_name] = {
-                    'current_requests': counter.get_request_count(client_id),
-                    'remaining_time': counter.get_remaining_time()
+                    'current_requests': counter.rule.burst_limit - decision.remaining,
+                    'remaining_time': decision.reset_after
                 }
 
             return stats
@@ -288,8 +361,9 @@ class RateLimiter:
             # Supprimer les violations
             self.client_violations.pop(client_id, None)
 
-            # Remettre à zéro les compteurs (difficile avec sliding window,
-            # on laisse expirer naturellement)
+            # Remettre à zéro les compteurs
+            for counter in self.counters.values():
+                counter.reset(client_id)
 
     def get_global_stats(self) -> Dict[str, Union[str, int, float]]:
         """
@@ -307,8 +381,8 @@ class RateLimiter:
 
             for rule_name, counter in self.counters.items():
                 stats['rules'][rule_name] = {
-                    'total_requests': counter.get_request_count(),
-                    'remaining_time': counter.get_remaining_time()
+                    'tracked_clients': counter.client_count(),
+                    'emission_interval': counter.emission_interval
                 }
 
             return stats
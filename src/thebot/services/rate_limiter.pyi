@@ -5,3 +5,10 @@ class RateLimiter:
     def __init__(self, *args: Any, **kwargs: Any) -> None: ...
     def is_rate_limited(self, *args: Any, **kwargs: Any) -> bool: ...
     def get_stats(self) -> Dict[str, Any]: ...
+    def check_limit(self, *args: Any, **kwargs: Any) -> Any: ...
+    async def acquire_async(self, *args: Any, **kwargs: Any) -> Any: ...
+
+class GCRALimiter:
+    def __init__(self, *args: Any, **kwargs: Any) -> None: ...
+    def acquire(self, *args: Any, **kwargs: Any) -> Any: ...
+    def peek(self, *args: Any, **kwargs: Any) -> Any: ...
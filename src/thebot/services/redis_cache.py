@@ -23,6 +23,8 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, Optional, Union
 
+from src.thebot.core.metrics import cache_requests
+
 logger = logging.getLogger(__name__)
 
 # Simulate Redis for development (real Redis would use aioredis)
@@ -181,10 +183,12 @@ class RedisCache:
 
             if value is not None:
                 self.hit_count += 1
+                cache_requests.labels("redis", "hit").inc()
                 logger.debug(f"Cache hit: {key}")
                 return json.loads(value) if isinstance(value, str) else value
 
             self.miss_count += 1
+            cache_requests.labels("redis", "miss").inc()
             logger.debug(f"Cache miss: {key}")
             return None
 
@@ -197,6 +197,71 @@ class TestPhase5Callbacks:
         except ImportError:
             pytest.skip("Callbacks pas encore intégrés à dash_modules")
     
+    def test_chart_refresh_updates_incrementally(self):
+        """Test que le rafraîchissement ne recalcule que les nouvelles bougies"""
+        import dash_modules.callbacks.phase5_2_callbacks as cb_module
+        from src.thebot.services.indicator_integration import IndicatorIntegrationFactory
+        from src.thebot.services.indicator_state_cache import IndicatorStateCache
+        
+        close = 100 + np.random.default_rng(0).standard_normal(201).cumsum()
+        bars = pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 10.0},
+            index=pd.date_range("2024-01-01", periods=201, freq="1h"),
+        )
+        cache = IndicatorStateCache()
+        
+        with patch.object(cb_module, "_factory", IndicatorIntegrationFactory()), \
+             patch.object(cb_module, "_load_ohlcv", side_effect=[bars.iloc[:200], bars.iloc[1:]]), \
+             patch("src.thebot.services.indicator_integration.get_indicator_state_cache", return_value=cache):
+            figure = cb_module.update_indicator_chart("EMA_basic", "1h", [20])
+            current, change, _, _ = cb_module.update_metrics("EMA_basic", "1h", [20])
+        
+        assert len(figure["data"][0]["y"]) == 200
+        assert cache.get_stats() == {"states": 1, "updates": 201, "rebuilds": 1, "replays": 0}
+        assert current != "N/A" and change != "N/A"
+    
+    def test_chart_callback_debounced(self):
+        """Test que des rafraîchissements identiques simultanés partagent un calcul"""
+        from concurrent.futures import ThreadPoolExecutor
+        import dash_modules.callbacks.phase5_2_callbacks as cb_module
+        
+        calls = []
+        
+        def refresh(selected_indicator, timeframe, param_values):
+            calls.append(param_values)
+            return None
+        
+        with patch.object(cb_module, "_refresh_indicator", side_effect=refresh):
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                figures = list(pool.map(
+                    lambda _: cb_module.update_indicator_chart("RSI_oscillators", "1h", [14]), range(4)
+                ))
+        
+        assert calls == [[14]]
+        assert all(figure["layout"]["title"] == "Aucune donnée pour RSI" for figure in figures)
+    
+    def test_comparison_table_uses_shared_graph(self):
+        """Test que la comparaison calcule tous les indicateurs en un passage"""
+        import dash_modules.callbacks.phase5_2_callbacks as cb_module
+        from src.thebot.services.indicator_integration import IndicatorIntegrationFactory
+        
+        close = 100 + np.random.default_rng(1).standard_normal(300).cumsum()
+        bars = pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 10.0},
+            index=pd.date_range("2024-01-01", periods=300, freq="1h"),
+        )
+        factory = IndicatorIntegrationFactory()
+        
+        with patch.object(cb_module, "_factory", factory), \
+             patch.object(cb_module, "_load_ohlcv", return_value=bars), \
+             patch.object(factory, "calculate_indicator") as full_calculation:
+            table = cb_module.update_comparison_table(["SMA_basic", "EMA_basic", "MACD_momentum"], "1h")
+        
+        full_calculation.assert_not_called()
+        rows = table.children.data
+        assert [row["Indicateur"] for row in rows] == ["SMA", "EMA", "MACD"]
+        assert all(row["Moyenne"] != "N/A" for row in rows)
+    
     def test_build_indicator_params_sma(self):
         """Test _build_indicator_params pour SMA"""
         try:
@@ -0,0 +1,94 @@
+"""
+Tests pour l'index de quasi-doublons (MinHash LSH)
+"""
+
+import pytest
+
+from src.thebot.core.dedup import NearDuplicateIndex
+
+
+def _article(title, url, summary="", source="Feed"):
+    return {"title": title, "url": url, "summary": summary, "rss_source_name": source}
+
+
+class TestNearDuplicateIndex:
+    """Tests pour NearDuplicateIndex"""
+
+    def setup_method(self):
+        self.index = NearDuplicateIndex()
+
+    def test_invalid_band_configuration(self):
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(num_perm=64, bands=10)
+
+    def test_syndicated_rewrite_is_grouped(self):
+        articles = [
+            _article(
+                "Bitcoin surges past $70,000 as ETF inflows hit record high",
+                "https://a.com/1",
+                source="CoinDesk",
+            ),
+            _article(
+                "Bitcoin surges past $70,000 as spot ETF inflows hit a record",
+                "https://b.com/2",
+                source="Decrypt",
+            ),
+        ]
+
+        result = self.index.deduplicate(articles)
+
+        assert len(result) == 1
+        assert result[0]["url"] == "https://a.com/1"
+        assert result[0]["duplicate_count"] == 1
+        assert result[0]["related_sources"] == ["CoinDesk", "Decrypt"]
+
+    def test_distinct_stories_are_kept(self):
+        articles = [
+            _article("Federal Reserve holds interest rates steady in June", "u1"),
+            _article("Ethereum developers schedule next network upgrade date", "u2"),
+            _article("Oil prices fall as OPEC output rises unexpectedly", "u3"),
+        ]
+
+        assert len(self.index.deduplicate(articles)) == 3
+
+    def test_short_headlines_only_merge_on_exact_match(self):
+        articles = [
+            _article("Markets wrap", "u1"),
+            _article("Markets open", "u2"),
+            _article("Markets wrap", "u3"),
+        ]
+
+        result = self.index.deduplicate(articles)
+
+        assert [a["url"] for a in result] == ["u1", "u2"]
+
+    def test_same_url_maps_to_same_story(self):
+        story_a, is_new_a = self.index.add(_article("Anything at all here", "u1"))
+        story_b, is_new_b = self.index.add(_article("Totally different text", "U1"))
+
+        assert is_new_a and not is_new_b
+        assert story_a.story_id == story_b.story_id
+
+    def test_index_persists_across_refreshes(self):
+        title = "Solana network outage halts block production for hours"
+        first = self.index.deduplicate([dict(_article(title, "u1"), published_date="2024-01-01")])
+        second = self.index.deduplicate([dict(_article(title, "u2"), published_date="2024-01-02")])
+
+        assert second[0]["story_id"] == first[0]["story_id"]
+        assert second[0]["duplicate_count"] == 1
+        # Représentant issu du rafraîchissement courant : date à jour pour le tri
+        assert second[0]["url"] == "u2"
+        assert second[0]["published_date"] == "2024-01-02"
+        assert self.index.get_story(second[0]["story_id"]).representative["url"] == "u2"
+
+    def test_lru_eviction_cleans_buckets(self):
+        index = NearDuplicateIndex(max_stories=2)
+        index.add(_article("Alpha beta gamma delta epsilon", "u1"))
+        index.add(_article("Zeta eta theta iota kappa", "u2"))
+        index.add(_article("Lambda sigma omega rho tau", "u3"))
+
+        stats = index.get_stats()
+        assert stats["stories"] == 2
+        assert stats["indexed_urls"] == 2
+        story, is_new = index.add(_article("Alpha beta gamma delta epsilon", "u4"))
+        assert is_new
@@ -0,0 +1,95 @@
+"""
+Tests pour le classifieur d'événements économiques
+"""
+
+import feedparser
+import pytest
+
+from src.thebot.core.economic import AsyncEconomicCalendarRSSParser
+from src.thebot.core.economic_classifier import EconomicEventClassifier
+
+
+@pytest.fixture
+def classifier():
+    return EconomicEventClassifier()
+
+
+class TestEconomicEventClassifier:
+    """Tests pour EconomicEventClassifier"""
+
+    def test_country_priority_and_currency_hints(self, classifier):
+        assert classifier.classify("Euro area PMI beats", "").country == "EU"
+        assert classifier.classify("Yen slides as BoJ holds", "").country == "JP"
+        assert classifier.classify("Markets wait", "").country == "US"
+
+    def test_word_boundaries(self, classifier):
+        # "us" dans "business", "ca" dans "because" ne doivent plus matcher
+        result = classifier.classify("Business outlook", "because of demand")
+        assert result.country == "US"
+        assert result.category == "other"
+        assert not result.is_economic
+
+    def test_impact_levels(self, classifier):
+        assert classifier.classify("FOMC minutes", "").impact == "critical"
+        assert classifier.classify("Durable goods orders", "").impact == "high"
+        assert classifier.classify("Chicago PMI", "").impact == "high"  # "pmi" prime
+        assert classifier.classify("Something else", "").impact == "medium"
+
+    def test_contained_keywords_keep_their_tags(self, classifier):
+        # "core cpi" (impact high) porte aussi "cpi" (catégorie inflation)
+        result = classifier.classify("Core CPI rises", "")
+        assert result.impact == "high"
+        assert result.category == "inflation"
+        assert result.is_economic
+
+    def test_category_order_and_plurals(self, classifier):
+        assert classifier.classify("Jobs and rates", "").category == "employment"
+        assert classifier.classify("ECB raises rates", "").category == "monetary_policy"
+        assert classifier.classify("Retail sales", "").category == "consumption"
+
+    def test_exclusion(self, classifier):
+        assert not classifier.classify("Bitcoin market rallies", "").is_economic
+        assert classifier.classify("Stock market rallies", "").is_economic
+
+    def test_guid_cache_and_batch(self, classifier):
+        events = [
+            {"title": "GDP growth", "description": "", "guid": "g1"},
+            {"title": "GDP growth", "description": "", "guid": "g1"},
+            {"title": "Retail sales", "description": ""},
+        ]
+        results = classifier.classify_many(events)
+        assert [r.category for r in results] == [
+            "economic_activity", "economic_activity", "consumption"
+        ]
+        assert classifier.get_stats()["hits"] == 1
+
+
+class TestParserIntegration:
+    """Le parser délègue au classifieur"""
+
+    def test_extract_event_data(self):
+        parser = AsyncEconomicCalendarRSSParser()
+        entry = feedparser.FeedParserDict(
+            title="Fed holds interest rates steady",
+            summary="<p>The Federal Reserve kept rates unchanged. Previous: 5.25%</p>",
+            link="https://example.com/fed",
+            id="fed-2024-01",
+        )
+        event = parser._extract_event_data(
+            entry, {"type": "fed_news", "name": "Fed", "url": "https://example.com"}
+        )
+
+        assert event["guid"] == "fed-2024-01"
+        assert event["country"] == "US"
+        assert event["currency"] == "USD"
+        assert event["impact"] == "critical"
+        assert event["category"] == "monetary_policy"
+        assert event["previous_value"] == "5.25%"
+        assert "<p>" not in event["description"]
+        assert parser._is_economic_event(event)
+
+    def test_legacy_detectors(self):
+        parser = AsyncEconomicCalendarRSSParser()
+        assert parser._detect_country("Britain trade deficit", "") == "UK"
+        assert parser._detect_impact("Jobless claims", "") == "critical"
+        assert parser._categorize_event("Unemployment", "") == "employment"
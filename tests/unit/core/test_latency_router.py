@@ -0,0 +1,155 @@
+"""
+Tests du routeur de latence (EWMA, requêtes couvertes, basculement)
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.thebot.core.api import SpecializedAPIManager
+from src.thebot.core.latency_router import LatencyRouter, ProviderLatencyStats, has_data
+
+
+@pytest.fixture
+def router():
+    router = LatencyRouter(default_hedge_delay=0.05, min_samples=3)
+    yield router
+    router.shutdown()
+
+
+class TestProviderLatencyStats:
+    """Tests pour ProviderLatencyStats"""
+
+    def test_ewma_and_quantile(self):
+        stats = ProviderLatencyStats(alpha=0.5, window=4)
+        for latency in (0.1, 0.2, 0.3, 0.4, 0.5):
+            stats.record(latency, ok=True)
+        stats.record(5.0, ok=False)  # Latence des échecs ignorée
+
+        assert stats.ewma_latency == pytest.approx(0.40625)
+        assert stats.quantile(0.95) == 0.5
+        assert list(stats.recent) == [0.2, 0.3, 0.4, 0.5]
+        assert stats.error_rate == pytest.approx(0.5)
+        assert stats.errors == 1
+
+    def test_has_data(self):
+        assert not has_data(None)
+        assert not has_data({})
+        assert not has_data(pd.DataFrame())
+        assert has_data(pd.DataFrame({"close": [1.0]}))
+        assert has_data(42.0)
+
+
+class TestLatencyRouter:
+    """Tests pour LatencyRouter"""
+
+    def test_rank_by_latency_and_errors(self, router):
+        for _ in range(5):
+            router.record("slow", 0.8, ok=True)
+            router.record("fast", 0.1, ok=True)
+            router.record("flaky", 0.05, ok=False)
+
+        # Sans historique : estimé à default_hedge_delay (0.05 s)
+        assert router.rank(["slow", "flaky", "fast", "new"]) == ["new", "fast", "slow", "flaky"]
+        assert router.rank(["new", "other"]) == ["new", "other"]
+        assert router.hedge_delay("fast") == pytest.approx(0.1)
+        assert router.hedge_delay("unknown") == 0.05
+
+    def test_failover_on_invalid_result(self, router):
+        calls = []
+
+        def fetch(provider):
+            calls.append(provider)
+            if provider == "binance":
+                raise ConnectionError("down")
+            return [] if provider == "coin_gecko" else [{"close": 1}]
+
+        assert router.call(["binance", "coin_gecko", "twelve_data"], fetch) == [{"close": 1}]
+        assert calls == ["binance", "coin_gecko", "twelve_data"]
+        assert router.get_stats()["failovers"] == 2
+
+    def test_hedge_bounds_tail_latency(self, router):
+        release = threading.Event()
+
+        def fetch(provider):
+            if provider == "primary":
+                release.wait(2)
+            return {"provider": provider}
+
+        start = time.perf_counter()
+        try:
+            assert router.call(["primary", "secondary"], fetch) == {"provider": "secondary"}
+            elapsed = time.perf_counter() - start
+        finally:
+            release.set()
+
+        assert elapsed < 0.5
+        assert router.get_stats()["hedged_requests"] == 1
+        assert router.get_stats()["hedge_wins"] == 1
+
+        # La requête perdante se termine en arrière-plan et reste mesurée
+        deadline = time.monotonic() + 2
+        while "primary" not in router.get_stats()["providers"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert router.get_stats()["providers"]["primary"]["calls"] == 1
+
+    def test_no_hedge_when_primary_is_fast(self, router):
+        calls = []
+
+        def fetch(provider):
+            calls.append(provider)
+            return {"provider": provider}
+
+        for _ in range(3):
+            assert router.call(["primary", "secondary"], fetch) == {"provider": "primary"}
+        assert calls == ["primary"] * 3
+        assert router.get_stats()["hedged_requests"] == 0
+
+    def test_timeout(self, router):
+        release = threading.Event()
+
+        def fetch(provider):
+            release.wait(2)
+            return {"provider": provider}
+
+        try:
+            assert router.call(["a", "b"], fetch, timeout=0.2) is None
+        finally:
+            release.set()
+
+
+class TestSpecializedAPIManagerRouting:
+    """Routage latence dans SpecializedAPIManager"""
+
+    def test_optimized_data_hedges_to_secondary(self):
+        release = threading.Event()
+
+        class SlowBinance:
+            def get_ohlcv_data(self, symbol, timeframe, limit):
+                release.wait(2)
+                return [{"source": "binance"}]
+
+        class FastGecko:
+            def get_ohlcv_data(self, symbol, timeframe, limit):
+                return [{"source": "coin_gecko", "id": symbol}]
+
+        manager = SpecializedAPIManager()
+        manager.set_providers({"binance": SlowBinance(), "coin_gecko": FastGecko()})
+        manager.router.default_hedge_delay = 0.05
+
+        try:
+            result = manager.get_optimized_data("ETHUSDT", "4h", 17)
+        finally:
+            release.set()
+
+        assert result == [{"source": "coin_gecko", "id": "ethusdt"}]
+        assert manager.get_provider_candidates("ETHUSDT") == ["binance", "coin_gecko"]
+
+        for _ in range(3):
+            manager.router.record("binance", 1.5, ok=True)
+            manager.router.record("coin_gecko", 0.2, ok=True)
+        assert manager.get_optimal_provider("ETHUSDT") == "coin_gecko"
+        assert manager.get_performance_stats()["provider_routing"]["hedge_wins"] == 1
+        manager.router.shutdown()
@@ -0,0 +1,164 @@
+"""
+Tests du registre de métriques (compteurs par thread, histogrammes HDR, export Prometheus)
+"""
+
+import threading
+
+import dash
+import numpy as np
+import pytest
+from dash import Input, Output, html
+
+from src.thebot.core.metrics import (
+    Histogram,
+    MetricsRegistry,
+    install_flask_metrics,
+    instrumented_request,
+    provider_request_seconds,
+)
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    """Tests pour MetricsRegistry"""
+
+    def test_counter_sums_thread_cells(self, registry):
+        counter = registry.counter("thebot_test_total", "Test", labels=("source",))
+
+        def work():
+            child = counter.labels(source="ws")
+            for _ in range(10_000):
+                child.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.labels("ws").value == 80_000
+        assert registry.counter("thebot_test_total", labels=("source",)) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("thebot_test_total")
+
+    def test_dead_thread_cells_are_folded(self, registry):
+        counter = registry.counter("thebot_requests_test_total", "Test").labels()
+        histogram = registry.histogram("thebot_request_test_seconds", "Test").labels()
+
+        def request():
+            counter.inc()
+            histogram.observe(0.002)
+
+        for _ in range(500):  # Un thread par requête, comme le serveur Werkzeug
+            thread = threading.Thread(target=request)
+            thread.start()
+            thread.join()
+
+        assert counter.value == 500
+        assert histogram.snapshot()["count"] == 500
+        assert histogram.quantiles((0.5,))[0] == pytest.approx(0.002, rel=0.05)
+        # Cellule commune des threads terminés + cellule éventuelle du thread courant
+        assert len(counter._cells.all()) <= 2
+        assert len(histogram._cells.all()) <= 2
+
+    def test_gauge_function(self, registry):
+        queue = [1, 2, 3]
+        gauge = registry.gauge("thebot_queue_size", "Taille de file")
+        gauge.set_function(lambda: len(queue))
+        assert gauge.value == 3
+        queue.clear()
+        assert gauge.value == 0
+
+    def test_render_prometheus_text(self, registry):
+        registry.counter("thebot_requests_total", "Requêtes", labels=("provider",)).labels("binance").inc(3)
+        latency = registry.histogram("thebot_latency_seconds", "Latence", buckets=(0.01, 0.1))
+        for value in (0.005, 0.05, 0.05, 2.0):
+            latency.observe(value)
+
+        text = registry.render()
+        assert "# TYPE thebot_requests_total counter" in text
+        assert 'thebot_requests_total{provider="binance"} 3' in text
+        assert 'thebot_latency_seconds_bucket{le="0.01"} 1' in text
+        assert 'thebot_latency_seconds_bucket{le="0.1"} 3' in text
+        assert 'thebot_latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "thebot_latency_seconds_count 4" in text
+
+        registry.reset()
+        assert registry.snapshot()["thebot_latency_seconds"]["samples"][0]["value"]["count"] == 0
+
+
+class TestHistogram:
+    """Tests pour Histogram"""
+
+    def test_quantiles_within_relative_error(self):
+        rng = np.random.default_rng(11)
+        values = rng.lognormal(mean=-4, sigma=1.5, size=50_000)  # ~1 ms à plusieurs secondes
+        histogram = Histogram()
+        for value in values:
+            histogram.observe(value)
+
+        p50, p90, p99 = histogram.quantiles((0.5, 0.9, 0.99))
+        for measured, q in ((p50, 50), (p90, 90), (p99, 99)):
+            assert measured == pytest.approx(np.percentile(values, q), rel=1 / 32 + 1e-3)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 50_000
+        assert snapshot["max"] == pytest.approx(values.max())
+        assert len(histogram._merged()[3]) < 1000  # Intervalles bornés
+
+    def test_time_context(self):
+        histogram = Histogram()
+        with histogram.time():
+            pass
+        assert histogram.count == 1
+
+
+class TestFlaskIntegration:
+    """Endpoint /metrics et chronométrage des callbacks Dash"""
+
+    def test_metrics_endpoint_and_callback_timing(self, registry):
+        app = dash.Dash(__name__)
+        app.layout = html.Div([html.Button(id="button"), html.Div(id="output")])
+
+        @app.callback(Output("output", "children"), Input("button", "n_clicks"))
+        def update(n_clicks):
+            return str(n_clicks)
+
+        install_flask_metrics(app.server, registry)
+        client = app.server.test_client()
+
+        response = client.post(
+            "/_dash-update-component",
+            json={
+                "output": "output.children",
+                "outputs": {"id": "output", "property": "children"},
+                "inputs": [{"id": "button", "property": "n_clicks", "value": 1}],
+                "changedPropIds": ["button.n_clicks"],
+            },
+        )
+        assert response.status_code == 200
+
+        metrics_page = client.get("/metrics")
+        assert metrics_page.mimetype == "text/plain"
+        assert 'thebot_dash_callback_seconds_count{callback="output.children"} 1' in metrics_page.get_data(
+            as_text=True
+        )
+
+    def test_instrumented_request_records_status(self):
+        class _Response:
+            status_code = 429
+
+        before = provider_request_seconds.labels("test_provider", "429").count
+        assert instrumented_request("test_provider", lambda url: _Response(), "http://x").status_code == 429
+        assert provider_request_seconds.labels("test_provider", "429").count == before + 1
+
+        def failing(url):
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            instrumented_request("test_provider", failing, "http://x")
+        assert provider_request_seconds.labels("test_provider", "error").count >= 1
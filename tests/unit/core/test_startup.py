@@ -0,0 +1,139 @@
+"""
+Tests pour le profil de démarrage, les singletons paresseux et le rendu différé des onglets
+"""
+
+from unittest.mock import MagicMock
+
+import dash
+
+from src.thebot.core.launcher_callbacks import LauncherCallbacks
+from src.thebot.core.layout_manager import LayoutManager
+from src.thebot.core.startup import (
+    LazySingleton,
+    StartupProfiler,
+    check_budget,
+    is_built,
+    lazy_singleton,
+    parse_importtime,
+    startup_profiler,
+)
+
+
+class Service:
+    instances = 0
+
+    def __init__(self):
+        Service.instances += 1
+        self.value = 42
+
+    def ping(self):
+        return "pong"
+
+
+class TestStartupProfiler:
+    """Tests pour StartupProfiler"""
+
+    def test_report_sorted_with_category_totals(self):
+        profiler = StartupProfiler()
+        profiler.record("fast", "module", 1.0, started_at=profiler._origin)
+        profiler.record("slow", "module", 5.0, started_at=profiler._origin + 0.001)
+        profiler.record("db", "singleton", 2.0, started_at=profiler._origin + 0.002)
+
+        report = profiler.report()
+        assert [e["name"] for e in report["entries"]] == ["slow", "db", "fast"]
+        assert report["by_category"] == {"module": 6.0, "singleton": 2.0}
+        assert report["total_ms"] == 6.0  # étendue de 0 à 6 ms
+        assert "slow" in profiler.format_report()
+
+    def test_measure(self):
+        profiler = StartupProfiler()
+        with profiler.measure("block", "tab"):
+            pass
+        assert profiler.entries("tab")[0].name == "block"
+
+
+class TestLazySingleton:
+    """Tests pour LazySingleton"""
+
+    def test_built_on_first_access_only(self):
+        Service.instances = 0
+        proxy = lazy_singleton(Service)
+        assert Service.instances == 0
+        assert not is_built(proxy)
+
+        assert proxy.ping() == "pong"
+        assert proxy.value == 42
+        assert Service.instances == 1
+        assert is_built(proxy)
+
+    def test_isinstance_and_setattr_forwarding(self):
+        proxy = lazy_singleton(Service)
+        assert isinstance(proxy, Service)
+        assert isinstance(proxy, LazySingleton)
+
+        proxy.value = 7
+        assert object.__getattribute__(proxy, "_instance").value == 7
+
+    def test_construction_is_profiled(self):
+        proxy = lazy_singleton(Service, name="ProfiledService")
+        proxy.ping()
+        names = [e.name for e in startup_profiler.entries("singleton")]
+        assert "ProfiledService" in names
+
+
+class TestLazyTabs:
+    """Les layouts des modules ne sont construits qu'à la sélection de l'onglet"""
+
+    def _modules(self):
+        return {
+            "crypto": MagicMock(get_layout=MagicMock(return_value="crypto layout")),
+            "forex": MagicMock(get_layout=MagicMock(return_value="forex layout")),
+        }
+
+    def test_main_layout_does_not_build_tabs(self):
+        modules = self._modules()
+        LayoutManager().create_main_layout(modules)
+        for module in modules.values():
+            module.get_layout.assert_not_called()
+
+    def test_tab_rendered_once_on_first_selection(self):
+        modules = self._modules()
+        callbacks = LauncherCallbacks(app=dash.Dash(__name__), modules=modules)
+
+        assert callbacks.render_tab("crypto") == "crypto layout"
+        assert callbacks.render_tab("crypto") == "crypto layout"
+        modules["crypto"].get_layout.assert_called_once()
+        modules["forex"].get_layout.assert_not_called()
+        assert callbacks.render_tab("missing") is None
+
+        callbacks.invalidate_tab("crypto")
+        callbacks.render_tab("crypto")
+        assert modules["crypto"].get_layout.call_count == 2
+
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       224 |        224 |   _io
+import time:      1500 |       1724 | encodings
+import time:        80 |         80 |     dash_modules.core.config
+import time:      2000 |       2080 |   dash_modules.core
+"""
+
+
+def test_parse_importtime():
+    modules = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert set(modules) == {"_io", "encodings", "dash_modules.core.config", "dash_modules.core"}
+    assert modules["encodings"] == {"self_ms": 1.5, "cumulative_ms": 1.724, "depth": 0}
+    assert modules["dash_modules.core.config"]["depth"] == 2
+    assert modules["dash_modules.core"]["cumulative_ms"] == 2.08
+
+
+def test_check_budget_reports_regressions_beyond_tolerance():
+    budget = {"tolerance": 0.1, "metrics": {"import_ms": 100, "first_layout_ms": 50, "absent": 1}}
+
+    assert check_budget({"import_ms": 109, "first_layout_ms": 10}, budget) == []
+
+    violations = check_budget({"import_ms": 120, "first_layout_ms": 10}, budget)
+    assert [v["metric"] for v in violations] == ["import_ms"]
+    assert violations[0]["allowed_ms"] == 110
+    assert violations[0]["over_by_ms"] == 10
@@ -0,0 +1,116 @@
+"""
+Tests du moteur temps réel de l'application native (threads de calcul, fusion par symbole)
+"""
+
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.thebot.core.types import MarketData, TimeFrame
+from src.thebot.gui.live_engine import (
+    IndicatorSettings,
+    LiveEngine,
+    MarketDataGenerator,
+    SymbolPipeline,
+)
+from src.thebot.indicators.basic.sma.calculator import SMACalculator
+from src.thebot.indicators.basic.sma.config import SMAConfig
+
+
+def _wait_idle(engine, expected, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while engine.get_stats()["processed"] < expected and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert engine.get_stats()["processed"] == expected
+
+
+def _trending_candles(count):
+    """Bougies en hausse constante (RSI en surachat, EMA au-dessus de la SMA)"""
+    start = datetime(2025, 1, 1)
+    prices = [Decimal("100") * Decimal("1.01") ** i for i in range(count + 1)]
+    return [
+        MarketData(
+            timestamp=start + timedelta(minutes=i),
+            open=prices[i],
+            high=prices[i + 1] * Decimal("1.001"),
+            low=prices[i] * Decimal("0.999"),
+            close=prices[i + 1],
+            volume=Decimal("1000"),
+            timeframe=TimeFrame.M1,
+            symbol="BTCUSDT",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def engine():
+    engine = LiveEngine(IndicatorSettings(sma_period=5, ema_period=5, atr_period=5, rsi_period=5), workers=3)
+    engine.start()
+    yield engine
+    engine.stop()
+
+
+class TestLiveEngine:
+    """Tests pour LiveEngine"""
+
+    def test_snapshots_coalesced_per_symbol(self, engine):
+        generators = {f"SYM{i}": MarketDataGenerator(f"SYM{i}", 100 + i) for i in range(24)}
+        candles = {symbol: [] for symbol in generators}
+        for _ in range(30):
+            for symbol, generator in generators.items():
+                candle = generator.generate_next_candle()
+                candles[symbol].append(candle)
+                engine.submit(candle)
+        _wait_idle(engine, 24 * 30)
+
+        snapshots = engine.drain()
+        assert set(snapshots) == set(generators)
+        assert engine.drain() == {}
+
+        snapshot = snapshots["SYM7"]
+        assert snapshot.ticks == 30 and snapshot.bars == 30
+        assert snapshot.close == candles["SYM7"][-1].close
+
+        # Ordre des ticks préservé par symbole : même SMA qu'un calcul séquentiel
+        reference = SMACalculator(SMAConfig(period=5))
+        for candle in candles["SYM7"]:
+            expected = reference.calculate_from_data(candle)
+        assert snapshot.sma == expected
+        assert [c.close for c in engine.history("SYM7")] == [c.close for c in candles["SYM7"]]
+
+    def test_configure_replays_history_on_workers(self, engine):
+        generator = MarketDataGenerator("BTCUSDT")
+        candles = [generator.generate_next_candle() for _ in range(20)]
+        engine.submit_many(candles)
+        _wait_idle(engine, 20)
+
+        engine.configure(IndicatorSettings(sma_period=10))
+        candle = generator.generate_next_candle()
+        engine.submit(candle)
+        _wait_idle(engine, 21)
+
+        closes = [c.close for c in candles[-9:] + [candle]]
+        assert float(engine.drain()["BTCUSDT"].sma) == pytest.approx(float(sum(closes) / 10))
+
+        engine.reset()
+        deadline = time.monotonic() + 5
+        while engine.history("BTCUSDT") and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert engine.history("BTCUSDT") == []
+
+
+class TestSymbolPipeline:
+    """Tests pour SymbolPipeline"""
+
+    def test_signals_only_on_state_change(self):
+        pipeline = SymbolPipeline("BTCUSDT", IndicatorSettings(sma_period=5, ema_period=5, rsi_period=5))
+        signals = [
+            signal for candle in _trending_candles(30) for signal in pipeline.process(candle).signals
+        ]
+        assert sum("Surachat" in signal for signal in signals) == 1
+        assert sum("Tendance haussière" in signal for signal in signals) == 1
+        assert all(signal.startswith("BTCUSDT ") for signal in signals)
+
@@ -0,0 +1,133 @@
+"""
+Tests du graphe d'indicateurs partagé (fusion des intermédiaires communs)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.thebot.indicators.graph import (
+    INDICATOR_DEFINITIONS,
+    IndicatorPlanner,
+    IndicatorRequest,
+    supports,
+)
+from src.thebot.services.indicator_state_cache import IndicatorStateCache
+
+
+@pytest.fixture
+def ohlcv() -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 + rng.standard_normal(300).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + rng.random(300),
+            "low": close - rng.random(300),
+            "close": close,
+            "volume": rng.random(300) * 1000,
+        }
+    )
+
+
+class TestIndicatorPlanner:
+    """Tests pour IndicatorPlanner"""
+
+    def test_shared_intermediates_computed_once(self):
+        plan = IndicatorPlanner().plan(["macd", "bollinger", "squeeze", "atr", "keltner"])
+        keys = [node.key for node in plan.order]
+
+        assert len(keys) == len(set(keys))
+        assert sum(1 for key in keys if key == ("tr",)) == 1
+        assert sum(1 for key in keys if key[0] == "std") == 1
+        assert plan.shared_nodes > 0
+
+    def test_plan_order_is_topological(self):
+        plan = IndicatorPlanner().plan(list(INDICATOR_DEFINITIONS))
+        seen = set()
+        for node in plan.order:
+            assert all(key in seen for key in node.inputs)
+            seen.add(node.key)
+
+    def test_matches_reference_formulas(self, ohlcv):
+        outputs = IndicatorPlanner().compute(
+            ohlcv, ["macd", ("bollinger", {"period": 20, "std_dev": 2.0}), "atr"]
+        )
+        close = ohlcv["close"]
+
+        ema_fast = close.ewm(span=12, adjust=False).mean()
+        ema_slow = close.ewm(span=26, adjust=False).mean()
+        macd = ema_fast - ema_slow
+        pd.testing.assert_series_equal(outputs["macd"]["macd"], macd, check_names=False)
+        pd.testing.assert_series_equal(
+            outputs["macd"]["signal"], macd.ewm(span=9, adjust=False).mean(), check_names=False
+        )
+
+        upper = close.rolling(20).mean() + 2.0 * close.rolling(20).std()
+        pd.testing.assert_series_equal(
+            outputs["bollinger_20_2.0"]["upper"], upper, check_names=False
+        )
+
+        prev_close = close.shift(1)
+        true_range = pd.concat(
+            [ohlcv["high"] - ohlcv["low"], (ohlcv["high"] - prev_close).abs(),
+             (ohlcv["low"] - prev_close).abs()], axis=1
+        ).max(axis=1)
+        pd.testing.assert_series_equal(
+            outputs["atr"]["atr"], true_range.rolling(14).mean(), check_names=False
+        )
+
+    def test_combined_plan_matches_individual_plans(self, ohlcv):
+        planner = IndicatorPlanner()
+        requests = ["rsi", "macd", "squeeze", "supertrend", "stochastic", "breakout", "obv"]
+        combined = planner.compute(ohlcv, requests)
+
+        for request in requests:
+            alone = planner.compute(ohlcv, [request])[request]
+            pd.testing.assert_frame_equal(combined[request], alone)
+
+    def test_plan_cached_and_named_requests(self, ohlcv):
+        planner = IndicatorPlanner()
+        requests = [IndicatorRequest.of("ema", name="fast", period=12), ("ema", {"period": 12})]
+        plan = planner.plan(requests)
+
+        assert planner.plan(requests) is plan
+        assert len([node for node in plan.order if node.key[0] == "ema"]) == 1
+        assert set(plan.execute(ohlcv)) == {"fast", "ema_12"}
+
+    def test_unknown_indicator(self):
+        with pytest.raises(ValueError):
+            IndicatorPlanner().plan(["ichimoku"])
+
+    @pytest.mark.parametrize(
+        "indicator, params",
+        [
+            ("rsi", {"period": 14}),
+            ("atr", {"period": 14}),
+            ("atr", {"period": 14, "smoothing_method": "ema"}),
+        ],
+    )
+    def test_matches_calculators(self, ohlcv, indicator, params):
+        bars = ohlcv.set_index(pd.date_range("2024-01-01", periods=len(ohlcv), freq="1h"))
+        graph = IndicatorPlanner().compute(bars, [IndicatorRequest.of(indicator, name="x", **params)])
+        expected = IndicatorStateCache().update("BTCUSDT", "1h", indicator, params, bars).astype(float)
+        np.testing.assert_allclose(
+            graph["x"][indicator].loc[expected.dropna().index], expected.dropna(), rtol=1e-9
+        )
+
+    def test_warmups_cover_chained_windows(self, ohlcv):
+        plan = IndicatorPlanner().plan([("macd", {}), ("sma", {"period": 20}), ("rsi", {})])
+        warmups = plan.warmups
+
+        assert warmups["macd"] == {"macd": 25, "signal": 33, "histogram": 33}
+        assert warmups["sma_20"] == {"sma": 19}
+        assert warmups["rsi"] == {"rsi": 14}
+        # La SMA est NaN exactement jusqu'à son amorçage
+        sma = plan.execute(ohlcv)["sma_20"]["sma"]
+        assert sma.first_valid_index() == warmups["sma_20"]["sma"]
+
+    def test_supports_checks_parameters(self):
+        assert supports("RSI")
+        assert supports("rsi", {"period": 14, "smoothing_method": "ema"})
+        assert not supports("rsi", {"period": 14, "overbought_level": 70})
+        assert not supports("ichimoku")
@@ -0,0 +1,157 @@
+"""
+Tests des accumulateurs de statistiques glissantes (Welford, deques monotones)
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.thebot.core.types import MarketData, TimeFrame
+from src.thebot.indicators.base.streaming import (
+    RollingMax,
+    RollingMin,
+    RollingVariance,
+    RunningMean,
+    WilderSmoother,
+    _RollingExtreme,
+)
+from src.thebot.indicators.momentum.breakout.calculator import BreakoutCalculator
+from src.thebot.indicators.momentum.breakout.config import BreakoutConfig
+from src.thebot.indicators.momentum.squeeze.calculator import SqueezeCalculator
+from src.thebot.indicators.momentum.squeeze.config import SqueezeConfig
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    rng = np.random.default_rng(3)
+    return 50_000 + rng.standard_normal(500).cumsum() * 100
+
+
+def _bars(count=120, seed=5):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(count).cumsum()
+    base_time = datetime(2025, 1, 1)
+    return [
+        MarketData(
+            timestamp=base_time + timedelta(hours=i),
+            open=Decimal(str(round(close[i], 4))),
+            high=Decimal(str(round(close[i] + rng.random(), 4))),
+            low=Decimal(str(round(close[i] - rng.random(), 4))),
+            close=Decimal(str(round(close[i], 4))),
+            volume=Decimal(str(round(rng.random() * 1000, 2))),
+            timeframe=TimeFrame.H1,
+            symbol="BTCUSDT",
+        )
+        for i in range(count)
+    ]
+
+
+class TestStreamingAccumulators:
+    """Tests des accumulateurs face à pandas rolling"""
+
+    def test_running_mean(self, values):
+        rolling = RunningMean(20)
+        means = [rolling.update(value) for value in values]
+        expected = pd.Series(values).rolling(20).mean()
+        np.testing.assert_allclose(means[19:], expected[19:], rtol=1e-12)
+        assert rolling.ready and rolling.count == 20
+
+        cumulative = RunningMean()
+        for value in (Decimal("1.5"), Decimal("2.5")):
+            cumulative.update(value)
+        assert cumulative.mean == Decimal("2")
+
+    @pytest.mark.parametrize("ddof", [0, 1])
+    def test_rolling_variance(self, values, ddof):
+        rolling = RollingVariance(20, ddof=ddof)
+        variances = [rolling.update(value)[1] for value in values]
+        expected = pd.Series(values).rolling(20).var(ddof=ddof)
+        np.testing.assert_allclose(variances[19:], expected[19:], rtol=1e-8)
+
+        rolling.reset()
+        for _ in range(25):
+            rolling.update(7.0)
+        assert rolling.variance == 0.0
+
+    def test_rolling_extremes(self, values):
+        highs, lows = RollingMax(14), RollingMin(14)
+        maxima = [highs.update(value) for value in values]
+        minima = [lows.update(value) for value in values]
+        series = pd.Series(values)
+        np.testing.assert_array_equal(maxima[13:], series.rolling(14).max()[13:])
+        np.testing.assert_array_equal(minima[13:], series.rolling(14).min()[13:])
+        assert maxima[:13] == list(np.maximum.accumulate(values[:13]))
+
+    def test_wilder_smoother(self):
+        smoother = WilderSmoother(3)
+        assert [smoother.update(v) for v in (1.0, 2.0, 3.0, 6.0)] == [None, None, 2.0, 10 / 3]
+        smoother.reset()
+        assert not smoother.ready
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            RollingVariance(0)
+
+    def test_periodic_resync_bounds_drift(self):
+        rng = np.random.default_rng(1)
+        values = list(1e6 + rng.standard_normal(20 * 500) * 1e3)
+        mean, variance = RunningMean(20), RollingVariance(20)
+        for value in values:
+            mean.update(value)
+            variance.update(value)
+
+        # 20 * 499 retraits : les sommes viennent d'être recalculées sur la fenêtre
+        window = values[-20:]
+        assert mean.sum == sum(window)
+        assert variance.variance == pytest.approx(np.var(window), rel=1e-12)
+
+    def test_extreme_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            _RollingExtreme(5)
+
+
+class TestStreamingCalculators:
+    """Les calculateurs incrémentaux reproduisent le recalcul sur fenêtre"""
+
+    def test_squeeze_matches_window_formulas(self):
+        config = SqueezeConfig(bollinger_period=20, keltner_period=15, momentum_length=12)
+        calculator = SqueezeCalculator(config)
+        bars = _bars()
+        for bar in bars:
+            calculator.add_data(bar)
+
+        closes = np.array([float(bar.close) for bar in bars])
+        middle, upper, _ = calculator.calculate_bollinger_bands()
+        assert float(middle) == pytest.approx(closes[-20:].mean())
+        assert float(upper - middle) == pytest.approx(2 * closes[-20:].std())
+
+        true_ranges = [
+            max(
+                float(bar.high - bar.low),
+                abs(float(bar.high - prev.close)),
+                abs(float(bar.low - prev.close)),
+            )
+            for prev, bar in zip(bars, bars[1:])
+        ]
+        for period in (15, 12, 7):  # 7 n'est pas suivi : recalcul sur l'historique
+            atr = calculator.calculate_atr(period)
+            assert float(atr) == pytest.approx(np.mean(true_ranges[-period:]))
+
+        momentum = (closes[-1] - closes[-12:].mean()) / np.mean(true_ranges[-12:])
+        assert float(calculator.calculate_momentum()) == pytest.approx(momentum)
+
+    def test_breakout_levels(self):
+        calculator = BreakoutCalculator(BreakoutConfig(lookback_period=20))
+        bars = _bars()
+        for bar in bars:
+            calculator.add_data(bar)
+
+        support, resistance = calculator.find_support_resistance()
+        assert resistance == max(bar.high for bar in bars[-20:])
+        assert support == min(bar.low for bar in bars[-20:])
+        assert float(calculator.avg_volume) == pytest.approx(
+            np.mean([float(bar.volume) for bar in bars[-10:]])
+        )
@@ -0,0 +1,144 @@
+"""
+Tests for the persistent event loop worker behind AsyncCallbackWrapper.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from src.thebot.core.data import AsyncDataManager
+from src.thebot.services.async_callbacks import (
+    AsyncCallbackWrapper,
+    EventLoopWorker,
+    get_event_loop_worker,
+)
+
+
+@pytest.fixture
+def worker():
+    worker = EventLoopWorker(name="test-loop")
+    yield worker
+    worker.stop()
+
+
+class TestEventLoopWorker:
+    """Test EventLoopWorker."""
+
+    def test_coroutines_share_one_loop_thread(self, worker) -> None:
+        async def loop_identity():
+            return asyncio.get_running_loop(), threading.get_ident()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: worker.run(loop_identity()), range(8)))
+
+        assert len(set(results)) == 1
+        assert results[0][0] is worker.loop
+        assert results[0][1] != threading.get_ident()
+
+    def test_timeout_cancels_task(self, worker) -> None:
+        cancelled = threading.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            worker.run(slow(), timeout=0.05)
+        assert cancelled.wait(1)
+
+    def test_exceptions_propagate(self, worker) -> None:
+        async def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            worker.run(failing())
+
+    def test_run_shared_coalesces_inflight_requests(self, worker) -> None:
+        calls = []
+        release = threading.Event()
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+            return "payload"
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(worker.run_shared, "BTCUSDT", fetch) for _ in range(6)]
+            while not calls:
+                pass
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["payload"] * 6
+        assert len(calls) == 1
+        assert worker.run_shared("BTCUSDT", fetch) == "payload"  # New request once settled
+        assert len(calls) == 2
+
+    def test_run_from_worker_thread_is_rejected(self, worker) -> None:
+        async def nested():
+            return worker.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            worker.run(nested())
+
+    def test_stop_runs_cleanups(self) -> None:
+        worker = EventLoopWorker()
+        closed = []
+
+        async def close_session():
+            closed.append(asyncio.get_running_loop())
+
+        loop = worker.loop
+        worker.register_cleanup(close_session)
+        worker.register_cleanup(close_session)
+        worker.stop()
+
+        assert closed == [loop]
+        assert loop.is_closed() and not worker.running
+
+
+class TestAsyncCallbackWrapper:
+    """Test AsyncCallbackWrapper on the shared worker."""
+
+    def test_callbacks_reuse_worker_loop(self, worker) -> None:
+        wrapper = AsyncCallbackWrapper(worker=worker, timeout=1)
+
+        @wrapper.async_callback()
+        async def double(value):
+            return value * 2, asyncio.get_running_loop()
+
+        assert double(21) == (42, worker.loop)
+        assert wrapper.get_event_loop() is worker.loop
+        assert AsyncCallbackWrapper().worker is get_event_loop_worker()
+
+        with pytest.raises(TimeoutError):
+            wrapper.run_async(asyncio.sleep(5), timeout=0.05)
+
+
+class TestAsyncDataManagerOnWorker:
+    """AsyncDataManager sync paths run on the shared worker."""
+
+    def test_concurrent_loads_share_one_request(self, monkeypatch) -> None:
+        manager = AsyncDataManager()
+        calls = []
+        frame = pd.DataFrame({"close": [1.0, 2.0]})
+
+        async def fake_binance(symbol, interval, limit):
+            calls.append(symbol)
+            await asyncio.sleep(0.05)
+            return frame
+
+        monkeypatch.setattr(manager, "get_binance_data", fake_binance)
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            results = list(pool.map(lambda _: manager.load_symbol_data_sync("BTCUSDT"), range(5)))
+
+        assert all(result is frame for result in results)
+        assert calls == ["BTCUSDT"]
+        assert manager.get_cached_data("BTCUSDT") is frame
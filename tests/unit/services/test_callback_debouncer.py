@@ -2,20 +2,22 @@
 Tests for callback debouncing service - validates debouncing strategies.
 
 Test coverage:
-- DebounceConfig validation (5 tests)
+- DebounceConfig validation (6 tests)
 - DebouncedCallback leading strategy (4 tests)
 - DebouncedCallback trailing strategy (4 tests)
 - DebouncedCallback throttle strategy (4 tests)
 - CallbackDebouncer singleton (3 tests)
 - Statistics tracking (3 tests)
 - Edge cases (4 tests)
+- Keyed trailing bursts and result sharing (8 tests)
 
-Total: 27 tests
+Total: 36 tests
 """
 
 import asyncio
 import pytest
 import time
+from concurrent.futures import ThreadPoolExecutor
 from src.thebot.services.callback_debouncer import (
     DebounceConfig,
     DebouncedCallback,
@@ -56,6 +58,11 @@ class TestDebounceConfig:
         with pytest.raises(ValueError, match="max_pending must be >= 1"):
             DebounceConfig(max_pending=0)
 
+    def test_max_wait_below_delay(self) -> None:
+        """Test max_wait_ms shorter than delay raises error."""
+        with pytest.raises(ValueError, match="max_wait_ms must be >= delay_ms"):
+            DebounceConfig(delay_ms=100, max_wait_ms=50)
+
 
 class TestDebouncedCallbackLeading:
     """Test leading debounce strategy."""
@@ -414,10 +421,18 @@ class TestCallbackStatistics:
         await debounced.execute_debounced()
 
         assert debounced.call_count == 2
-        debounced.call_count = 0
-        debounced.exec_count = 0
+        debounced.shared_count = debounced.cancelled_count = 1
 
-        assert debounced.call_count == 0
+        debouncer = CallbackDebouncer()
+        debouncer._callbacks["test_id"] = debounced
+        try:
+            debouncer.reset_stats()
+        finally:
+            debouncer._callbacks.pop("test_id", None)
+
+        stats = debounced.get_stats()
+        assert stats["call_count"] == stats["exec_count"] == 0
+        assert stats["shared_count"] == stats["cancelled_count"] == 0
 
 
 class TestEdgeCases:
@@ -490,3 +505,193 @@ class TestEdgeCases:
         assert debounced.exec_count < debounced.call_count // 2
         stats = debounced.get_stats()
         assert stats["reduction_percent"] > 50
+
+
+class TestKeyedTrailing:
+    """Test keyed trailing bursts, result sharing and stale cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_burst_shares_latest_result(self) -> None:
+        """Test every caller of a burst gets the single result of the latest input."""
+        calls = []
+
+        def callback(period: int) -> str:
+            calls.append(period)
+            return f"rsi-{period}"
+
+        config = DebounceConfig(strategy="trailing", delay_ms=30, key_func=lambda period: None)
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        results = await asyncio.gather(
+            *(debounced.execute_debounced(period) for period in (10, 12, 14))
+        )
+
+        assert results == ["rsi-14"] * 3
+        assert calls == [14]
+        assert debounced.get_stats()["shared_count"] == 2
+        assert debounced.get_stats()["pending_bursts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_distinct_arguments_not_coalesced_by_default(self) -> None:
+        """Test without key_func only identical arguments share a burst."""
+        calls = []
+
+        def callback(symbol: str) -> str:
+            calls.append(symbol)
+            return symbol
+
+        config = DebounceConfig(strategy="trailing", delay_ms=30)
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        results = await asyncio.gather(
+            debounced.execute_debounced("BTCUSDT"),
+            debounced.execute_debounced("ETHUSDT"),
+            debounced.execute_debounced("BTCUSDT"),
+        )
+
+        assert results == ["BTCUSDT", "ETHUSDT", "BTCUSDT"]
+        assert sorted(calls) == ["BTCUSDT", "ETHUSDT"]
+        assert debounced.shared_count == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_debounce_independently(self) -> None:
+        """Test calls with different keys are not coalesced together."""
+        calls = []
+
+        def callback(symbol: str, period: int) -> tuple:
+            calls.append((symbol, period))
+            return symbol, period
+
+        config = DebounceConfig(
+            strategy="trailing", delay_ms=30, key_func=lambda symbol, period: symbol
+        )
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        results = await asyncio.gather(
+            debounced.execute_debounced("BTCUSDT", 10),
+            debounced.execute_debounced("ETHUSDT", 10),
+            debounced.execute_debounced("BTCUSDT", 20),
+        )
+
+        assert results == [("BTCUSDT", 20), ("ETHUSDT", 10), ("BTCUSDT", 20)]
+        assert sorted(calls) == [("BTCUSDT", 20), ("ETHUSDT", 10)]
+
+    @pytest.mark.asyncio
+    async def test_newer_input_cancels_stale_run(self) -> None:
+        """Test in-flight work is cancelled when newer input arrives."""
+        started = []
+        finished = []
+
+        async def callback(period: int) -> int:
+            started.append(period)
+            await asyncio.sleep(0.1)
+            finished.append(period)
+            return period
+
+        config = DebounceConfig(strategy="trailing", delay_ms=10, key_func=lambda period: None)
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        first = asyncio.create_task(debounced.execute_debounced(10))
+        await asyncio.sleep(0.03)  # First run in flight
+        second = asyncio.create_task(debounced.execute_debounced(20))
+
+        assert await asyncio.gather(first, second) == [20, 20]
+        assert started == [10, 20]
+        assert finished == [20]
+        assert debounced.cancelled_count == 1
+
+    @pytest.mark.asyncio
+    async def test_identical_input_joins_running(self) -> None:
+        """Test identical input joins the in-flight run instead of restarting it."""
+        calls = []
+
+        async def callback(options: list) -> int:
+            calls.append(options)
+            await asyncio.sleep(0.05)
+            return len(calls)
+
+        config = DebounceConfig(strategy="trailing", delay_ms=10)
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        first = asyncio.create_task(debounced.execute_debounced(["sma", "ema"]))
+        await asyncio.sleep(0.03)
+        second = asyncio.create_task(debounced.execute_debounced(["sma", "ema"]))
+
+        assert await asyncio.gather(first, second) == [1, 1]
+        assert debounced.cancelled_count == 0
+
+    @pytest.mark.asyncio
+    async def test_max_wait_bounds_continuous_burst(self) -> None:
+        """Test max_wait_ms forces execution during a continuous burst."""
+        executed_at = []
+        start = time.monotonic()
+
+        def callback(value: int) -> int:
+            executed_at.append(time.monotonic() - start)
+            return value
+
+        config = DebounceConfig(
+            strategy="trailing", delay_ms=50, max_wait_ms=80, key_func=lambda value: None
+        )
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        tasks = []
+        for value in range(8):
+            tasks.append(asyncio.create_task(debounced.execute_debounced(value)))
+            await asyncio.sleep(0.02)
+        await asyncio.gather(*tasks)
+
+        assert executed_at[0] < 0.15  # Burst lasts ~160ms, never silent for 50ms
+        assert len(executed_at) >= 2
+
+    @pytest.mark.asyncio
+    async def test_exception_shared_by_burst(self) -> None:
+        """Test an error in the burst execution reaches every caller."""
+
+        def callback(value: int) -> None:
+            raise ValueError("Test error")
+
+        config = DebounceConfig(strategy="trailing", delay_ms=10, key_func=lambda value: None)
+        debounced = DebouncedCallback("test_id", callback, config)
+
+        results = await asyncio.gather(
+            debounced.execute_debounced(1),
+            debounced.execute_debounced(2),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending(self) -> None:
+        """Test pending bursts can be cancelled."""
+        config = DebounceConfig(strategy="trailing", delay_ms=1000)
+        debounced = DebouncedCallback("test_id", lambda: None, config)
+
+        task = asyncio.create_task(debounced.execute_debounced())
+        await asyncio.sleep(0.01)
+        debounced.cancel_pending()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert debounced.get_stats()["pending_bursts"] == 0
+
+    def test_register_sync_coalesces_threads(self) -> None:
+        """Test sync wrapper coalesces calls from concurrent request threads."""
+        calls = []
+
+        def callback(period: int) -> int:
+            calls.append(period)
+            return period * 2
+
+        debouncer = CallbackDebouncer()
+        config = DebounceConfig(strategy="trailing", delay_ms=50)
+        wrapper = debouncer.register_sync("test_sync_id", callback, config, timeout=5)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(wrapper, [5, 5, 5, 5]))
+
+        assert results == [10] * 4
+        assert calls == [5]
+
+        # Cleanup
+        debouncer._callbacks.pop("test_sync_id", None)
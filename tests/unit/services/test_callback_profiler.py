@@ -0,0 +1,125 @@
+"""
+Tests for the callback profiler - timing middleware and stack sampling.
+"""
+
+import asyncio
+import threading
+import time
+
+import dash
+import pytest
+from dash import Input, Output, callback, html
+
+from src.thebot.services.callback_debouncer import DebounceConfig, DebouncedCallback
+from src.thebot.services.callback_profiler import (
+    CallbackProfiler,
+    StackSampler,
+    get_callback_profiler,
+)
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _request(client, output: str, trigger: str):
+    return client.post(
+        "/_dash-update-component",
+        json={
+            "output": output,
+            "outputs": {"id": output.split(".")[0], "property": "children"},
+            "inputs": [{"id": trigger, "property": "n_clicks", "value": 1}],
+            "changedPropIds": [f"{trigger}.n_clicks"],
+        },
+    )
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    profiler = get_callback_profiler()
+    enabled, threshold = profiler.enabled, profiler.slow_threshold_ms
+    profiler.reset_stats()
+    profiler.output_dir = tmp_path
+    profiler.slow_threshold_ms = 20
+    yield profiler
+    profiler.enabled, profiler.slow_threshold_ms = enabled, threshold
+    profiler.reset_stats()
+
+
+class TestStackSampler:
+    """Test StackSampler."""
+
+    def test_samples_target_thread(self, tmp_path) -> None:
+        sampler = StackSampler(threading.get_ident(), interval=0.001).start()
+        _busy(0.2)  # Headroom for loaded machines: the sampler waits on the GIL
+        samples = sampler.stop()
+
+        assert sum(samples.values()) >= 5
+        busy = sum(count for stack, count in samples.items() if "_busy (test_callback_profiler.py" in stack)
+        assert busy >= 0.8 * sum(samples.values())
+
+        path = sampler.write_folded(tmp_path / "busy.folded")
+        stack, count = path.read_text().splitlines()[0].rsplit(" ", 1)
+        assert int(count) >= 1 and stack.split(";")[-1].startswith("_busy")
+
+
+class TestCallbackProfiler:
+    """Test CallbackProfiler."""
+
+    def test_singleton(self) -> None:
+        assert CallbackProfiler() is get_callback_profiler()
+
+    def test_dash_callbacks_timed_and_profiled(self, profiler) -> None:
+        app = dash.Dash(__name__)
+        app.layout = html.Div(
+            [html.Button(id="fast-btn"), html.Div(id="fast"), html.Button(id="slow-btn"), html.Div(id="slow")]
+        )
+
+        @app.callback(Output("fast", "children"), Input("fast-btn", "n_clicks"))
+        def fast(n_clicks):
+            return "ok"
+
+        # Registered with dash.callback: copied into callback_map on the first request
+        @callback(Output("slow", "children"), Input("slow-btn", "n_clicks"))
+        def slow(n_clicks):
+            _busy(0.03)
+            return "done"
+
+        profiler.instrument(app)
+        client = app.server.test_client()
+
+        assert _request(client, "fast.children", "fast-btn").status_code == 200
+        assert client.get("/_profiler/profile?callback=slow.children").status_code == 200
+        assert _request(client, "slow.children", "slow-btn").status_code == 200
+
+        stats = client.get("/_profiler/callbacks").get_json()
+        by_id = {entry["callback_id"]: entry for entry in stats["callbacks"]}
+        assert by_id["fast.children"]["calls"] == 1
+        assert by_id["slow.children"]["slow_calls"] == 1
+        assert by_id["slow.children"]["cpu_ms_total"] > 0
+        assert by_id["slow.children"]["avg_input_bytes"] > 0
+        assert stats["callbacks"][0]["callback_id"] == "slow.children"
+        assert [slow["callback_id"] for slow in stats["slow_calls"]] == ["slow.children"]
+
+        assert len(stats["profiles"]) == 1
+        assert "slow (test_callback_profiler.py" in open(stats["profiles"][0]).read()
+        assert client.get("/_profiler/profile?callback=missing").status_code == 404
+
+    def test_measure_is_noop_when_disabled(self, profiler) -> None:
+        profiler.enabled = False
+        with profiler.measure("disabled"):
+            pass
+        assert profiler.get_callback_stats("disabled") is None
+
+    def test_debounced_callbacks_are_measured(self, profiler) -> None:
+        profiler.enabled = True
+
+        async def compute(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        debounced = DebouncedCallback("debounced-chart", compute, DebounceConfig(strategy="leading"))
+        assert asyncio.run(debounced.execute_debounced(21)) == 42
+        assert profiler.get_callback_stats("debounced-chart").calls == 1
@@ -10,17 +10,23 @@ Test coverage:
 - State transitions (3 tests)
 - CircuitBreakerManager (3 tests)
 - Edge cases (4 tests)
+- Sliding window and rate-based tripping (6 tests)
+- Fast-fail fallbacks (4 tests)
+- Per-endpoint breakers (1 test)
 
-Total: 29 tests
+Total: 40 tests
 """
 
 import asyncio
 import pytest
+import time
 from src.thebot.services.circuit_breaker import (
     BreakerState,
     CircuitBreakerConfig,
     CircuitBreaker,
     CircuitBreakerManager,
+    CircuitOpenError,
+    OutcomeWindow,
     get_circuit_breaker_manager,
 )
 
@@ -452,3 +458,236 @@ class TestEdgeCases:
         result = await breaker.call(success_func)
         assert result == "success"
         assert breaker.state == BreakerState.CLOSED
+
+
+class TestSlidingWindow:
+    """Test rolling window outcomes and rate-based tripping."""
+
+    def test_count_window_evicts_oldest(self) -> None:
+        """Test count window keeps only the last N outcomes."""
+        window = OutcomeWindow("count", 3)
+        window.record(failed=True, slow=False, latency=0.1)
+        window.record(failed=True, slow=True, latency=0.2)
+        window.record(failed=False, slow=False, latency=0.3)
+        assert window.totals() == (3, 2, 1)
+
+        window.record(failed=False, slow=False, latency=0.4)
+        assert window.totals() == (3, 1, 1)
+        assert window.latency_sum == pytest.approx(0.9)
+
+    def test_time_window_expires_buckets(self) -> None:
+        """Test time window drops outcomes older than its span."""
+        window = OutcomeWindow("time", 10)
+        window.record(failed=True, slow=False, latency=0.1, now=100.2)
+        window.record(failed=False, slow=True, latency=0.1, now=105.7)
+        assert window.totals(now=106.0) == (2, 1, 1)
+        assert window.totals(now=111.0) == (1, 0, 1)
+        assert window.totals(now=116.0) == (0, 0, 0)
+
+    def test_failure_rate_trips(self) -> None:
+        """Test circuit opens when window failure rate crosses threshold."""
+        config = CircuitBreakerConfig(
+            window_type="count", window_size=10, minimum_calls=4, failure_rate_threshold=0.5
+        )
+        breaker = CircuitBreaker("test_service", config)
+
+        def fail_func() -> None:
+            raise ValueError("Test error")
+
+        breaker.call_sync(lambda: "ok")
+        breaker.call_sync(lambda: "ok")
+        with pytest.raises(ValueError):
+            breaker.call_sync(fail_func)
+        assert breaker.state == BreakerState.CLOSED  # Below minimum_calls
+
+        with pytest.raises(ValueError):
+            breaker.call_sync(fail_func)
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.open_reason == "failure rate 2/4"
+
+    def test_failures_interleaved_with_successes_trip(self) -> None:
+        """Test alternating failures trip a window breaker but not a consecutive one."""
+        window_breaker = CircuitBreaker(
+            "window", CircuitBreakerConfig(window_type="count", window_size=10, minimum_calls=6)
+        )
+        consecutive_breaker = CircuitBreaker("consecutive", CircuitBreakerConfig(failure_threshold=2))
+
+        def fail_func() -> None:
+            raise ValueError("Test error")
+
+        for breaker in (window_breaker, consecutive_breaker):
+            for _ in range(3):
+                breaker.call_sync(lambda: "ok")
+                with pytest.raises(ValueError):
+                    breaker.call_sync(fail_func)
+
+        assert window_breaker.state == BreakerState.OPEN
+        assert consecutive_breaker.state == BreakerState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_trip(self) -> None:
+        """Test slow successes open the circuit."""
+        config = CircuitBreakerConfig(
+            window_type="count",
+            window_size=10,
+            minimum_calls=3,
+            slow_call_threshold_sec=0.02,
+            slow_call_rate_threshold=0.6,
+        )
+        breaker = CircuitBreaker("test_service", config)
+
+        async def slow_func() -> str:
+            await asyncio.sleep(0.03)
+            return "late"
+
+        await breaker.call(slow_func)
+        await breaker.call(lambda: "fast")
+        await breaker.call(slow_func)
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.open_reason == "slow call rate 2/3"
+
+        status = breaker.get_status()
+        assert status["total_slow_calls"] == 2
+        assert status["total_failures"] == 0
+        assert status["window"]["slow_call_rate_percent"] == pytest.approx(200 / 3)
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(lambda: "fast")
+
+    def test_invalid_window_config(self) -> None:
+        """Test invalid window configuration."""
+        with pytest.raises(ValueError, match="Invalid window_type"):
+            CircuitBreakerConfig(window_type="rolling")
+        with pytest.raises(ValueError, match="slow_call_threshold_sec must be positive"):
+            CircuitBreakerConfig(slow_call_threshold_sec=0)
+
+
+class TestFallback:
+    """Test fast-fail fallbacks."""
+
+    def test_open_serves_last_good_value(self) -> None:
+        """Test rejected calls get the last good value for the same arguments."""
+        config = CircuitBreakerConfig(failure_threshold=1, cache_last_good=True)
+        breaker = CircuitBreaker("test_service", config)
+        calls = []
+
+        def fetch(symbol: str) -> dict:
+            calls.append(symbol)
+            if len(calls) > 1:
+                raise ConnectionError("down")
+            return {"symbol": symbol, "price": 50000}
+
+        assert breaker.call_sync(fetch, "BTCUSDT")["price"] == 50000
+        assert breaker.call_sync(fetch, "BTCUSDT")["price"] == 50000  # Failure served from cache
+        assert breaker.state == BreakerState.OPEN
+
+        assert breaker.call_sync(fetch, "BTCUSDT")["price"] == 50000  # Fast-fail
+        assert len(calls) == 2
+        with pytest.raises(CircuitOpenError):
+            breaker.call_sync(fetch, "ETHUSDT")  # Nothing cached for these args
+        assert breaker.get_status()["fallback_calls"] == 2
+
+    def test_last_good_ttl(self) -> None:
+        """Test stale last good values are not served."""
+        config = CircuitBreakerConfig(cache_last_good=True, last_good_ttl_sec=0.01)
+        breaker = CircuitBreaker("test_service", config)
+
+        breaker.call_sync(lambda: "fresh")
+        time.sleep(0.02)
+
+        def fail_func() -> None:
+            raise ValueError("Test error")
+
+        with pytest.raises(ValueError):
+            breaker.call_sync(fail_func)
+
+    @pytest.mark.asyncio
+    async def test_fallback_hook(self) -> None:
+        """Test fallback hook receives the rejection error and call arguments."""
+        received = []
+
+        def fallback(error, *args, **kwargs):
+            received.append((type(error), args, kwargs))
+            return "degraded"
+
+        config = CircuitBreakerConfig(failure_threshold=1)
+        breaker = CircuitBreaker("test_service", config, fallback=fallback)
+
+        async def fail_func(symbol: str, limit: int = 10) -> None:
+            raise ValueError("Test error")
+
+        assert await breaker.call(fail_func, "BTCUSDT", limit=5) == "degraded"
+        assert await breaker.call(fail_func, "BTCUSDT") == "degraded"
+        assert received == [
+            (ValueError, ("BTCUSDT",), {"limit": 5}),
+            (CircuitOpenError, ("BTCUSDT",), {}),
+        ]
+
+    def test_result_is_failure(self) -> None:
+        """Test empty results count as failures and are replaced by last good value."""
+        config = CircuitBreakerConfig(
+            failure_threshold=2,
+            cache_last_good=True,
+            result_is_failure=lambda result: result is None,
+        )
+        breaker = CircuitBreaker("test_service", config)
+        responses = iter([{"price": 1}, None, None])
+
+        assert breaker.call_sync(lambda: next(responses)) == {"price": 1}
+        assert breaker.call_sync(lambda: next(responses)) == {"price": 1}
+        assert breaker.call_sync(lambda: next(responses)) == {"price": 1}
+        assert breaker.total_failures == 2
+        assert breaker.state == BreakerState.OPEN
+
+    def test_call_strict_surfaces_failures(self) -> None:
+        """Test strict calls raise instead of serving the last good value."""
+        config = CircuitBreakerConfig(failure_threshold=2, cache_last_good=True)
+        breaker = CircuitBreaker("test_service", config)
+        calls = []
+
+        def fetch(symbol: str) -> dict:
+            calls.append(symbol)
+            if len(calls) > 1:
+                raise ConnectionError("down")
+            return {"symbol": symbol, "price": 50000}
+
+        assert breaker.call_strict(fetch, "BTCUSDT")["price"] == 50000
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                breaker.call_strict(fetch, "BTCUSDT")
+        assert breaker.state == BreakerState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.call_strict(fetch, "BTCUSDT")
+        assert len(calls) == 3
+        assert breaker.last_good("BTCUSDT")["price"] == 50000
+        assert breaker.last_good("ETHUSDT") is None
+        assert breaker.get_status()["fallback_calls"] == 0
+
+
+class TestEndpointBreakers:
+    """Test per-endpoint breakers."""
+
+    def test_endpoints_trip_independently(self) -> None:
+        """Test endpoints of one service have separate breakers."""
+        manager = get_circuit_breaker_manager()
+        config = CircuitBreakerConfig(failure_threshold=1)
+        klines = manager.endpoint("binance", "klines", config)
+        ticker = manager.endpoint("binance", "ticker", config)
+
+        def fail_func() -> None:
+            raise ValueError("Test error")
+
+        with pytest.raises(ValueError):
+            klines.call_sync(fail_func)
+
+        assert manager.endpoint("binance", "klines") is klines
+        assert klines.state == BreakerState.OPEN
+        assert ticker.call_sync(lambda: "ok") == "ok"
+        assert set(manager.get_all_status()) >= {"binance:klines", "binance:ticker"}
+
+        assert manager.reset_breaker("binance:klines")
+        assert klines.state == BreakerState.CLOSED
+
+        # Cleanup
+        manager._breakers.clear()
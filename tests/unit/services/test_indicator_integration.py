@@ -0,0 +1,83 @@
+"""
+Tests for batched indicator calculation in IndicatorIntegrationFactory.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.thebot.core.types import TimeFrame
+from src.thebot.indicators.graph import indicator_planner
+from src.thebot.services.indicator_integration import (
+    IndicatorConfig,
+    IndicatorIntegrationFactory,
+)
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    close = 100 + rng.standard_normal(200).cumsum()
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.random(200) * 100,
+        },
+        index=pd.date_range("2024-01-01", periods=200, freq="1h"),
+    )
+
+
+def config(name: str, show_signals: bool = False, **parameters) -> IndicatorConfig:
+    return IndicatorConfig(name, "test", parameters, TimeFrame.H1, show_signals=show_signals)
+
+
+class TestCalculateIndicators:
+    """Test IndicatorIntegrationFactory.calculate_indicators."""
+
+    def test_unknown_parameter_does_not_poison_batch(self, bars, monkeypatch) -> None:
+        factory = IndicatorIntegrationFactory()
+        fallback = []
+        monkeypatch.setattr(
+            factory, "calculate_indicator", lambda data, cfg: fallback.append(cfg.name)
+        )
+
+        results = factory.calculate_indicators(
+            bars, [config("rsi", period=14, overbought_level=70), config("macd"), config("atr")]
+        )
+
+        assert fallback == ["rsi"]
+        assert set(results) == {"macd", "atr"}
+        assert all(result.error is None for result in results.values())
+
+    def test_graph_failure_falls_back_per_indicator(self, bars, monkeypatch) -> None:
+        factory = IndicatorIntegrationFactory()
+        fallback = []
+
+        def failing_compute(data, requests):
+            raise ValueError("boom")
+
+        monkeypatch.setattr(indicator_planner, "compute", failing_compute)
+        monkeypatch.setattr(
+            factory, "calculate_indicator", lambda data, cfg: fallback.append(cfg.name)
+        )
+
+        factory.calculate_indicators(bars, [config("rsi"), config("macd")])
+
+        assert fallback == ["rsi", "macd"]
+
+    def test_signal_configs_use_full_calculator(self, bars, monkeypatch) -> None:
+        factory = IndicatorIntegrationFactory()
+        fallback = []
+        monkeypatch.setattr(
+            factory, "calculate_indicator", lambda data, cfg: fallback.append(cfg.name)
+        )
+
+        results = factory.calculate_indicators(
+            bars, [config("rsi", show_signals=True), config("ema", period=20)]
+        )
+
+        assert fallback == ["rsi"]
+        assert set(results) == {"ema"}
@@ -0,0 +1,118 @@
+"""
+Tests for the incremental indicator state cache.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.thebot.services.indicator_state_cache import IndicatorStateCache
+
+
+def make_bars(count: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(count).cumsum()
+    index = pd.date_range("2024-01-01", periods=count, freq="1h")
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.random(count) * 100,
+        },
+        index=index,
+    )
+
+
+def revise_last(bars: pd.DataFrame, delta: float) -> pd.DataFrame:
+    revised = bars.copy()
+    for column in ("high", "close"):
+        revised.iloc[-1, revised.columns.get_loc(column)] += delta
+    return revised
+
+
+@pytest.fixture
+def cache():
+    return IndicatorStateCache()
+
+
+class TestIndicatorStateCache:
+    """Test IndicatorStateCache."""
+
+    def test_new_bar_costs_one_update(self, cache):
+        bars = make_bars(301)
+        cache.update("BTCUSDT", "1h", "rsi", {"period": 14}, bars.iloc[:300])
+        assert cache.get_stats()["updates"] == 300
+
+        values = cache.update("BTCUSDT", "1h", "rsi", {"period": 14}, bars.iloc[1:])
+        stats = cache.get_stats()
+        assert stats["updates"] == 301
+        assert stats["rebuilds"] == 1
+
+        full = IndicatorStateCache().update("BTCUSDT", "1h", "rsi", {"period": 14}, bars)
+        assert values.iloc[-1] == pytest.approx(full.iloc[-1])
+        assert list(values.index) == list(bars.index[1:])
+
+    def test_unchanged_data_costs_nothing(self, cache):
+        bars = make_bars(100)
+        first = cache.update("ETHUSDT", "1h", "ema", {"period": 10}, bars)
+        second = cache.update("ETHUSDT", "1h", "ema", {"period": 10}, bars)
+
+        assert cache.get_stats()["updates"] == 100
+        pd.testing.assert_series_equal(first, second)
+
+    def test_forming_bar_replayed_from_checkpoint(self, cache):
+        bars = make_bars(200)
+        cache.update("BTCUSDT", "1h", "atr", {"period": 14}, bars)
+
+        revised = revise_last(bars, 2.0)
+        values = cache.update("BTCUSDT", "1h", "atr", {"period": 14}, revised)
+        stats = cache.get_stats()
+        assert stats["updates"] == 201
+        assert stats["replays"] == 1
+
+        full = IndicatorStateCache().update("BTCUSDT", "1h", "atr", {"period": 14}, revised)
+        assert values.iloc[-1] == pytest.approx(full.iloc[-1])
+
+    def test_history_revision_rebuilds_state(self, cache):
+        bars = make_bars(100)
+        cache.update("BTCUSDT", "1h", "sma", {"period": 20}, bars)
+
+        revised = bars.copy()
+        revised.iloc[-2, revised.columns.get_loc("volume")] += 10
+        revised = revise_last(revised, 1.0)
+        cache.update("BTCUSDT", "1h", "sma", {"period": 20}, revised)
+        assert cache.get_stats()["rebuilds"] == 2
+
+        cache.update("BTCUSDT", "1h", "sma", {"period": 20}, make_bars(50, seed=1))
+        assert cache.get_stats()["rebuilds"] == 3
+
+    def test_older_revision_or_gap_rebuilds_state(self, cache):
+        bars = make_bars(100)
+        cache.update("BTCUSDT", "1h", "ema", {"period": 10}, bars)
+
+        revised = bars.copy()
+        revised.iloc[50, revised.columns.get_loc("close")] += 0.5
+        values = cache.update("BTCUSDT", "1h", "ema", {"period": 10}, revised)
+        assert cache.get_stats()["rebuilds"] == 2
+
+        full = IndicatorStateCache().update("BTCUSDT", "1h", "ema", {"period": 10}, revised)
+        pd.testing.assert_series_equal(values, full)
+
+        cache.update("BTCUSDT", "1h", "ema", {"period": 10}, revised.drop(revised.index[70]))
+        assert cache.get_stats()["rebuilds"] == 3
+
+    def test_keys_isolated_and_invalidation(self, cache):
+        bars = make_bars(60)
+        cache.update("BTCUSDT", "1h", "ema", {"period": 10}, bars)
+        cache.update("BTCUSDT", "1h", "ema", {"period": 20}, bars)
+        cache.update("BTCUSDT", "4h", "ema", {"period": 10}, bars)
+        assert cache.get_stats()["states"] == 3
+
+        assert cache.invalidate("btcusdt", "1h") == 2
+        assert cache.invalidate("BTCUSDT") == 1
+
+    def test_unsupported_indicator(self, cache):
+        with pytest.raises(ValueError):
+            cache.update("BTCUSDT", "1h", "macd", {}, make_bars(10))
@@ -0,0 +1,146 @@
+"""
+Tests for the GCRA rate limiter.
+
+Test coverage:
+- RateLimitRule validation
+- GCRALimiter burst, sustained rate, reservations and eviction
+- RateLimiter per-client isolation, cooldown and async variant
+"""
+
+import asyncio
+
+import pytest
+
+from src.thebot.services.error_handler import RateLimitError
+from src.thebot.services.rate_limiter import (
+    GCRALimiter,
+    RateLimiter,
+    RateLimitRule,
+    rate_limit,
+    rate_limiter,
+)
+
+
+class TestRateLimitRule:
+    """Test RateLimitRule validation."""
+
+    def test_burst_defaults_to_requests(self) -> None:
+        rule = RateLimitRule(requests_per_window=10, window_seconds=60)
+        assert rule.burst_limit == 10
+        assert rule.emission_interval == 6.0
+
+    def test_invalid_rule(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimitRule(requests_per_window=0, window_seconds=60)
+        with pytest.raises(ValueError):
+            RateLimitRule(requests_per_window=10, window_seconds=60, burst_limit=0)
+
+
+class TestGCRALimiter:
+    """Test the per-client GCRA state machine."""
+
+    def setup_method(self) -> None:
+        # 10 req / 10 s soutenu, rafale de 3
+        self.limiter = GCRALimiter(
+            RateLimitRule(requests_per_window=10, window_seconds=10, burst_limit=3)
+        )
+
+    def test_burst_then_reject(self) -> None:
+        decisions = [self.limiter.acquire("a", now=100.0) for _ in range(4)]
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+        assert decisions[3].retry_after == pytest.approx(1.0)
+
+    def test_sustained_rate_refills(self) -> None:
+        for _ in range(3):
+            self.limiter.acquire("a", now=100.0)
+        assert not self.limiter.acquire("a", now=100.5).allowed
+        assert self.limiter.acquire("a", now=101.0).allowed
+        assert not self.limiter.acquire("a", now=101.0).allowed
+
+    def test_clients_are_isolated(self) -> None:
+        for _ in range(3):
+            self.limiter.acquire("a", now=100.0)
+        assert not self.limiter.acquire("a", now=100.0).allowed
+        assert self.limiter.acquire("b", now=100.0).allowed
+
+    def test_reservation_with_max_wait(self) -> None:
+        for _ in range(3):
+            self.limiter.acquire("a", now=100.0)
+        decision = self.limiter.acquire("a", max_wait=2.0, now=100.0)
+        assert decision.allowed
+        assert decision.retry_after == pytest.approx(1.0)
+
+    def test_idle_clients_evicted(self) -> None:
+        for client in ("a", "b", "c"):
+            self.limiter.acquire(client, now=100.0)
+        assert self.limiter.client_count() == 3
+        self.limiter.evict_idle(now=200.0)
+        assert self.limiter.client_count() == 0
+        assert self.limiter.peek("a", now=200.0).remaining == 3
+
+
+class TestRateLimiter:
+    """Test the rule-level RateLimiter facade."""
+
+    def test_burst_limit_enforced(self) -> None:
+        limiter = RateLimiter()
+        results = [limiter.check_limit("api_trading", "client")[0] for _ in range(13)]
+        assert results.count(True) == 12
+
+    def test_one_client_cannot_exhaust_rule(self) -> None:
+        limiter = RateLimiter()
+        for _ in range(20):
+            limiter.check_limit("api_trading", "greedy")
+        allowed, info = limiter.check_limit("api_trading", "other")
+        assert allowed
+        assert info["current_requests"] == 1
+
+    def test_cooldown_after_violation(self) -> None:
+        limiter = RateLimiter()
+        for _ in range(3):
+            assert limiter.check_limit("auth_login", "user")[0]
+        allowed, info = limiter.check_limit("auth_login", "user")
+        assert not allowed
+        allowed, info = limiter.check_limit("auth_login", "user")
+        assert not allowed
+        assert info["cooldown_remaining"] > 0
+
+    def test_reset_client(self) -> None:
+        limiter = RateLimiter()
+        for _ in range(13):
+            limiter.check_limit("api_trading", "client")
+        limiter.reset_client("client")
+        assert limiter.check_limit("api_trading", "client")[0]
+
+    def test_unknown_rule_uses_default(self) -> None:
+        allowed, info = RateLimiter().check_limit("missing", "client")
+        assert allowed
+        assert info["rule"] == "api_general"
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_waits_for_slot(self) -> None:
+        limiter = RateLimiter()
+        limiter.add_rule("fast", RateLimitRule(requests_per_window=20, window_seconds=1, burst_limit=1))
+        assert (await limiter.acquire_async("fast", "c"))[0]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        allowed, _ = await limiter.acquire_async("fast", "c", max_wait=1.0)
+        assert allowed
+        assert loop.time() - start >= 0.04
+
+        allowed, _ = await limiter.acquire_async("fast", "c", max_wait=0.0)
+        assert not allowed
+
+
+def test_rate_limit_decorator() -> None:
+    rate_limiter.add_rule("test_decorator", RateLimitRule(requests_per_window=1, window_seconds=60))
+
+    @rate_limit("test_decorator")
+    def endpoint(client_id: str) -> str:
+        return "ok"
+
+    assert endpoint(client_id="decorated") == "ok"
+    with pytest.raises(RateLimitError):
+        endpoint(client_id="decorated")
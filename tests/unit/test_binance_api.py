@@ -15,6 +15,7 @@ class TestBinanceAPI:
     def setup_method(self):
         """Configuration avant chaque test"""
         self.api = BinanceProvider()
+        self.api.cache.invalidate("crypto_ohlcv")  # Cache global partagé entre les tests
 
     def test_initialization(self):
         """Test initialisation de l'API"""
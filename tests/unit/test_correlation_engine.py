@@ -0,0 +1,186 @@
+"""
+Tests du moteur de corrélations glissantes (sommes courantes, clusters, diversification)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dash_modules.services.correlation_engine import (
+    CorrelationEngine,
+    RollingCorrelation,
+    correlation_clusters,
+    diversification_metrics,
+)
+
+
+def _closes(count=300, seed=7):
+    """Deux groupes de symboles corrélés (facteurs communs) et un symbole indépendant"""
+    rng = np.random.default_rng(seed)
+    factor_a, factor_b = rng.standard_normal((2, count)) * 0.01
+    returns = {
+        "BTCUSDT": factor_a + rng.standard_normal(count) * 0.003,
+        "ETHUSDT": factor_a + rng.standard_normal(count) * 0.003,
+        "SOLUSDT": factor_a + rng.standard_normal(count) * 0.004,
+        "DOGEUSDT": factor_b + rng.standard_normal(count) * 0.003,
+        "SHIBUSDT": factor_b + rng.standard_normal(count) * 0.003,
+        "XAUTUSDT": rng.standard_normal(count) * 0.01,
+    }
+    index = pd.date_range("2024-01-01", periods=count, freq="1h")
+    return 100 * np.exp(pd.DataFrame(returns, index=index).cumsum())
+
+
+def _reference(closes, window, method="pearson"):
+    returns = np.log(closes / closes.shift(1)).iloc[1:].iloc[-window:]
+    return returns.corr(method=method, min_periods=20)
+
+
+class TestRollingCorrelation:
+    """Tests pour RollingCorrelation"""
+
+    def test_matches_pandas_with_missing_data(self):
+        closes = _closes()
+        closes.iloc[:150, closes.columns.get_loc("SOLUSDT")] = np.nan  # Cotation tardive
+        closes.iloc[200, closes.columns.get_loc("XAUTUSDT")] = np.nan
+
+        rolling = RollingCorrelation(window=100)
+        rolling.update(closes)
+
+        pd.testing.assert_frame_equal(rolling.matrix(), _reference(closes, 100), atol=1e-9)
+
+    def test_incremental_updates_match_rebuild(self):
+        closes = _closes()
+        rolling = RollingCorrelation(window=48)
+        rolling.update(closes.iloc[:100])
+
+        for end in range(101, 260, 7):
+            added = rolling.update(closes.iloc[end - 100:end])
+            assert added == 7 or end == 101
+
+        pd.testing.assert_frame_equal(
+            rolling.matrix(), _reference(closes.iloc[:255], 48), atol=1e-9
+        )
+        assert len(rolling) == 48
+
+    def test_forming_bar_replaced(self):
+        closes = _closes()
+        rolling = RollingCorrelation(window=60)
+        rolling.update(closes.iloc[:200])
+
+        revised = closes.iloc[:200].copy()
+        revised.iloc[-1] *= 1.02
+        assert rolling.update(revised) == 1
+        pd.testing.assert_frame_equal(rolling.matrix(), _reference(revised, 60), atol=1e-9)
+
+        assert rolling.update(revised[["BTCUSDT", "ETHUSDT"]]) == 200  # Univers modifié
+
+    def test_spearman(self):
+        closes = _closes()
+        rolling = RollingCorrelation(window=80)
+        rolling.update(closes)
+
+        pd.testing.assert_frame_equal(
+            rolling.matrix("spearman"), _reference(closes, 80, "spearman"), atol=1e-9
+        )
+        with pytest.raises(ValueError):
+            rolling.matrix("kendall")
+
+    def test_spearman_ranks_each_pair_on_common_rows(self):
+        closes = _closes()
+        closes.iloc[:150, closes.columns.get_loc("SOLUSDT")] = np.nan
+        closes.iloc[[200, 230], closes.columns.get_loc("XAUTUSDT")] = np.nan
+
+        rolling = RollingCorrelation(window=100)
+        rolling.update(closes)
+
+        pd.testing.assert_frame_equal(
+            rolling.matrix("spearman"), _reference(closes, 100, "spearman"), atol=1e-9
+        )
+
+
+class TestCorrelationAnalysis:
+    """Tests des clusters et scores de diversification"""
+
+    def test_clusters_follow_common_factors(self):
+        rolling = RollingCorrelation(window=200)
+        rolling.update(_closes())
+
+        clusters = correlation_clusters(rolling.matrix(), threshold=0.6)
+        assert clusters == [
+            ["BTCUSDT", "ETHUSDT", "SOLUSDT"],
+            ["DOGEUSDT", "SHIBUSDT"],
+            ["XAUTUSDT"],
+        ]
+
+    def test_diversification_metrics(self):
+        symbols = ["A", "B", "C"]
+        independent = pd.DataFrame(np.eye(3), index=symbols, columns=symbols)
+        identical = pd.DataFrame(np.ones((3, 3)), index=symbols, columns=symbols)
+
+        spread = diversification_metrics(independent)
+        assert spread["effective_bets"] == pytest.approx(3)
+        assert spread["diversification_ratio"] == pytest.approx(np.sqrt(3))
+        assert spread["score"] == pytest.approx(100)
+
+        concentrated = diversification_metrics(identical)
+        assert concentrated["average_correlation"] == pytest.approx(1)
+        assert concentrated["diversification_ratio"] == pytest.approx(1)
+        assert concentrated["score"] == pytest.approx(0)
+
+
+class FakeScanner:
+    def __init__(self, closes):
+        self.closes = closes
+        self.end = 150
+
+    def load_ohlcv(self, symbols, interval="1h", bars=250):
+        closes = self.closes.iloc[:self.end].iloc[-bars:][symbols[::-1]]
+        return {column: closes for column in ("open", "high", "low", "close", "volume")}, {}
+
+
+class TestCorrelationEngine:
+    """Tests pour CorrelationEngine"""
+
+    def test_analyze_keeps_state_between_refreshes(self):
+        closes = _closes()
+        scanner = FakeScanner(closes)
+        engine = CorrelationEngine(scanner=scanner, window=50)
+        symbols = list(closes.columns)
+
+        first = engine.analyze(symbols)
+        assert list(first["matrix"].columns) == symbols
+
+        scanner.end = 153
+        second = engine.analyze(symbols)
+        pd.testing.assert_frame_equal(
+            second["matrix"], _reference(closes.iloc[:153], 50), atol=1e-9
+        )
+        assert second["clusters"][0] == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+        assert 0 < second["diversification"]["score"] < 100
+
+    def test_alternating_baskets_keep_their_state(self, monkeypatch):
+        closes = _closes()
+        scanner = FakeScanner(closes)
+        engine = CorrelationEngine(scanner=scanner, window=50)
+        full, pair = list(closes.columns), ["ETHUSDT", "BTCUSDT"]
+
+        engine.analyze(full)
+        engine.analyze(pair)
+        assert len(engine._states) == 2
+
+        resets = []
+        original = RollingCorrelation.reset
+        monkeypatch.setattr(
+            RollingCorrelation, "reset", lambda self, *a: resets.append(self) or original(self, *a)
+        )
+        scanner.end = 152
+        result = engine.analyze(pair)
+        engine.analyze(full[::-1])
+
+        # Chaque panier n'intègre que les nouvelles bougies, sans reconstruction
+        assert resets == []
+        assert len(engine._states) == 2
+        assert list(result["matrix"].columns) == pair
+        pd.testing.assert_frame_equal(
+            result["matrix"], _reference(closes.iloc[:152][pair], 50), atol=1e-9
+        )
@@ -0,0 +1,109 @@
+"""
+Tests pour l'upsert en masse de l'historique de prix (DatabaseService)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from dash_modules.models import PriceHistory
+from dash_modules.models.base import Base, configure_sqlite_engine
+from dash_modules.services.database_service import DatabaseService
+
+
+def _bars(count, start=None, close=100.0):
+    start = start or datetime(2024, 1, 1)
+    return [
+        {
+            "timestamp": start + timedelta(minutes=i),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 10.0,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def service(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    configure_sqlite_engine(engine)
+    Base.metadata.create_all(bind=engine)
+    yield DatabaseService(session_factory=sessionmaker(bind=engine))
+    engine.dispose()
+
+
+class TestBulkUpsertPriceHistory:
+    """Tests pour bulk_upsert_price_history"""
+
+    def test_inserts_all_rows_across_chunks(self, service):
+        saved = service.bulk_upsert_price_history(
+            _bars(25), "BTCUSDT", "binance", "1m", chunk_size=10
+        )
+        assert saved == 25
+        assert len(service.get_price_history("BTCUSDT", limit=100)) == 25
+
+    def test_duplicates_are_skipped(self, service):
+        service.save_price_history(_bars(10), "BTCUSDT", "binance", "1m")
+        saved = service.save_price_history(_bars(15), "BTCUSDT", "binance", "1m")
+
+        assert saved == 5
+        assert len(service.get_price_history("BTCUSDT", limit=100)) == 15
+
+    def test_same_timestamp_other_interval_is_distinct(self, service):
+        service.save_price_history(_bars(3), "BTCUSDT", "binance", "1m")
+        assert service.save_price_history(_bars(3), "BTCUSDT", "binance", "5m") == 3
+
+    def test_update_existing_overwrites_bars(self, service):
+        service.save_price_history(_bars(5), "ETHUSDT", "binance", "1m")
+        service.bulk_upsert_price_history(
+            _bars(5, close=200.0), "ETHUSDT", "binance", "1m", update_existing=True
+        )
+
+        history = service.get_price_history("ETHUSDT", limit=10)
+        assert len(history) == 5
+        assert all(bar.close_price == 200.0 for bar in history)
+
+    def test_rows_without_timestamp_are_ignored(self, service):
+        assert service.save_price_history([{"close": 1.0}], "X", "p", "1m") == 0
+
+
+def test_sqlite_pragmas_applied(service):
+    with service.get_session() as session:
+        assert session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_bar_key_is_unique_index():
+    indexes = {index.name: index for index in PriceHistory.__table__.indexes}
+    index = indexes["ux_price_history_bar"]
+    assert index.unique
+    assert tuple(c.name for c in index.columns) == PriceHistory.BAR_KEY
+
+
+def test_legacy_table_without_bar_index(tmp_path):
+    """Base antérieure à la migration 002 : doublons purgés et index créé à la volée"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ux_price_history_bar"))
+    service = DatabaseService(session_factory=sessionmaker(bind=engine))
+
+    with service.get_session() as session:
+        for _ in range(2):
+            session.add(PriceHistory(**PriceHistory.ohlcv_row("X", "p", "1m", _bars(1)[0], datetime(2024, 1, 1))))
+        session.commit()
+
+    assert service.save_price_history(_bars(3), "X", "p", "1m") == 2
+    with service.get_session() as session:
+        assert session.query(PriceHistory).count() == 3
+        indexes = {row[1] for row in session.execute(text("PRAGMA index_list(price_history)"))}
+    assert "ux_price_history_bar" in indexes
+    engine.dispose()
@@ -3,11 +3,21 @@ Tests pour Free AI Engine - Moteur IA utilisant APIs gratuites
 Tests se concentrant sur les fonctionnalités sans appels réseau réels (mocks)
 """
 
+import sys
+
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from dash_modules.ai_engine.free_ai_engine import FreeAIEngine, free_ai_engine
+from dash_modules.ai_engine.huggingface_client import HuggingFaceClient
+
+
+@pytest.fixture(autouse=True)
+def isolated_inference_cache(tmp_path, monkeypatch):
+    """Cache disque HuggingFace propre à chaque test"""
+    module = sys.modules["dash_modules.ai_engine.free_ai_engine"]
+    monkeypatch.setattr(module, "HF_CACHE_PATH", tmp_path / "hf_cache.db")
 
 
 class TestFreeAIEngine:
@@ -48,21 +58,18 @@ class TestFreeAIEngine:
         assert len(engine.request_history) == initial_count + 1
         assert isinstance(engine.request_history[-1], datetime)
 
-    @patch('requests.post')
+    @patch.object(HuggingFaceClient, '_post_batch')
     def test_analyze_with_huggingface_success(self, mock_post):
         """Test analyse HuggingFace réussie"""
         engine = FreeAIEngine()
 
-        # Mock réponse réussie
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
+        # Mock réponse réussie (un résultat par texte du lot)
+        mock_post.return_value = [
             {
                 "label": "POSITIVE",  # Positive
                 "score": 0.85
             }
         ]
-        mock_post.return_value = mock_response
 
         result = engine.analyze_with_huggingface("Great market performance!")
 
@@ -72,36 +79,31 @@ class TestFreeAIEngine:
         assert result["model"] == "twitter-roberta-base-sentiment"
         assert "raw_result" in result
 
-    @patch('requests.post')
+    @patch.object(HuggingFaceClient, '_post_batch')
     def test_analyze_with_huggingface_negative(self, mock_post):
         """Test analyse HuggingFace avec sentiment négatif"""
         engine = FreeAIEngine()
 
         # Mock réponse négative
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_post.return_value = [
             {
                 "label": "NEGATIVE",  # Negative
                 "score": 0.92
             }
         ]
-        mock_post.return_value = mock_response
 
         result = engine.analyze_with_huggingface("Market crash incoming!")
 
         assert result["sentiment"] == "bearish"
         assert result["confidence"] == 92.0
 
-    @patch('requests.post')
+    @patch.object(HuggingFaceClient, '_post_batch')
     def test_analyze_with_huggingface_api_error(self, mock_post):
         """Test analyse HuggingFace avec erreur API"""
         engine = FreeAIEngine()
 
         # Mock erreur API
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_post.return_value = mock_response
+        mock_post.side_effect = RuntimeError("HuggingFace API erreur: 500")
 
         result = engine.analyze_with_huggingface("Test text")
 
@@ -110,7 +112,7 @@ class TestFreeAIEngine:
         assert "confidence" in result
         # Le fallback peut retourner différents formats selon l'implémentation
 
-    @patch('requests.post')
+    @patch.object(HuggingFaceClient, '_post_batch')
     def test_analyze_with_huggingface_rate_limit(self, mock_post):
         """Test analyse HuggingFace avec rate limit dépassé"""
         engine = FreeAIEngine()
@@ -124,6 +126,7 @@ class TestFreeAIEngine:
         # Devrait utiliser le fallback local
         assert "sentiment" in result
         assert "confidence" in result
+        mock_post.assert_not_called()
 
     def test_analyze_with_free_llm(self):
         """Test analyse avec LLM gratuit"""
@@ -0,0 +1,143 @@
+"""
+Tests du client d'inférence HuggingFace par lots (serveur local simulant l'API)
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dash_modules.ai_engine.free_ai_engine import FreeAIEngine
+from dash_modules.ai_engine.huggingface_client import HuggingFaceClient, InferenceCache
+
+MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+
+
+class _InferenceStub(BaseHTTPRequestHandler):
+    """Imite l'API d'inférence : tous les labels par texte, triés par score"""
+
+    requests = []
+    status = 200
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append((self.path, body["inputs"], self.headers.get("Authorization")))
+        if type(self).status != 200:
+            self.send_response(type(self).status)
+            self.end_headers()
+            return
+
+        outputs = []
+        for text in body["inputs"]:
+            positive = 0.9 if "up" in text else 0.05
+            outputs.append(
+                sorted(
+                    [
+                        {"label": "positive", "score": positive},
+                        {"label": "negative", "score": 0.95 - positive},
+                        {"label": "neutral", "score": 0.05},
+                    ],
+                    key=lambda item: -item["score"],
+                )
+            )
+        payload = json.dumps(outputs).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _InferenceStub.requests = []
+    _InferenceStub.status = 200
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _InferenceStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/models"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub_server, tmp_path):
+    client = HuggingFaceClient(
+        MODEL, base_url=stub_server, cache=InferenceCache(tmp_path / "cache.db"), batch_size=128
+    )
+    yield client
+    client.close()
+
+
+def _headlines(count):
+    return [f"Headline {i}: market {'up' if i % 3 else 'down'}" for i in range(count)]
+
+
+class TestHuggingFaceClient:
+    """Tests pour HuggingFaceClient"""
+
+    def test_feed_scored_in_two_batches_then_cached(self, client):
+        texts = _headlines(200)
+        batch = client.classify(texts + texts[:10], api_key="hf_test")
+
+        assert batch.requests == 2
+        assert [len(inputs) for _, inputs, _ in _InferenceStub.requests] == [128, 72]
+        assert all(path == f"/models/{MODEL}" for path, _, _ in _InferenceStub.requests)
+        assert _InferenceStub.requests[0][2] == "Bearer hf_test"
+        assert batch.results[1] == {"label": "positive", "score": 0.9}
+        assert batch.results[0]["label"] == "negative"
+        assert batch.results[200] == batch.results[0]
+
+        again = client.classify(texts)
+        assert again.requests == 0 and again.cached == 200
+        assert len(_InferenceStub.requests) == 2
+
+    def test_quota_applied_per_batch(self, client):
+        client.batch_size = 50
+        batch = client.classify(_headlines(120), max_requests=2)
+
+        assert batch.requests == 2
+        assert sum(result is not None for result in batch.results) == 100
+        assert batch.results[-1] is None
+
+    def test_errors_leave_results_empty(self, client):
+        _InferenceStub.status = 503  # Modèle en cours de chargement
+        batch = client.classify(["market up"])
+
+        assert batch.results == [None]
+        assert batch.requests == 1 and batch.errors
+
+    def test_cache_entries_expire(self, tmp_path):
+        cache = InferenceCache(tmp_path / "cache.db", ttl=0.05)
+        cache.set_many(MODEL, {"abc": {"label": "positive", "score": 0.9}})
+        assert cache.get_many(MODEL, ["abc"]) == {"abc": {"label": "positive", "score": 0.9}}
+        assert cache.get_many("other-model", ["abc"]) == {}
+
+        time.sleep(0.1)
+        assert cache.get_many(MODEL, ["abc"]) == {}
+        assert cache.purge_expired() == 1
+
+
+class TestFreeAIEngineBatching:
+    """FreeAIEngine : un flux d'articles analysé en quelques requêtes"""
+
+    def test_news_feed_uses_batches_and_quota(self, client, tmp_path):
+        engine = FreeAIEngine(cache_path=tmp_path / "engine.db")
+        engine._hf_client = client
+
+        news = [{"title": text, "description": ""} for text in _headlines(200)]
+        result = engine.analyze_news_with_huggingface(news)
+
+        assert len(_InferenceStub.requests) == 2
+        assert engine.get_daily_usage()["requests_today"] == 2
+        assert result["analysis"]["total_articles"] == 200
+        assert result["analysis"]["bullish_articles"] == 133
+        assert result["sentiment"] == "bullish"
+
+        engine.analyze_news_with_huggingface(news)
+        assert engine.get_daily_usage()["requests_today"] == 2  # Servi depuis le cache
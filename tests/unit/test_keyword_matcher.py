@@ -0,0 +1,78 @@
+"""
+Tests pour le KeywordMatcher compilé de l'IA locale
+"""
+
+import pytest
+
+from dash_modules.ai_engine.keyword_matcher import KeywordMatcher
+from dash_modules.ai_engine.local_ai_engine import LocalAIEngine
+
+
+class TestKeywordMatcher:
+    """Tests pour KeywordMatcher"""
+
+    def setup_method(self):
+        self.matcher = KeywordMatcher(
+            {
+                "bullish": ["bull", "bullish", "rise", "up"],
+                "bearish": ["bear", "sell-off", "fall"],
+            }
+        )
+
+    def test_word_boundaries(self):
+        found = self.matcher.find("Update on supply: bullish setup")
+        assert found["bullish"] == {"bullish"}  # "up" ne matche pas "update"
+
+    def test_simple_inflections(self):
+        found = self.matcher.find("Prices rises then falls")
+        assert found["bullish"] == {"rise"}
+        assert found["bearish"] == {"fall"}
+
+    def test_keywords_with_punctuation(self):
+        assert self.matcher.find("Massive sell-off in equities")["bearish"] == {"sell-off"}
+
+    def test_score_counts_distinct_keywords(self):
+        score = self.matcher.score("Bull bull BULL rise")
+        assert score.get("bullish") == 2
+        assert score.get("bearish") == 0
+        assert score.get("unknown") == 0
+
+    def test_scores_are_cached_by_content(self):
+        self.matcher.score("Bear market ahead")
+        self.matcher.score("Bear market ahead")
+
+        stats = self.matcher.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_cache_is_bounded(self):
+        matcher = KeywordMatcher({"a": ["x"]}, cache_size=2)
+        matcher.score_many(["one", "two", "three"])
+        assert matcher.get_stats()["cached_scores"] == 2
+
+    def test_contains_any(self):
+        assert self.matcher.contains_any("the bear is back")
+        assert not self.matcher.contains_any("nothing to see")
+
+
+class TestLocalAIEngineBatchScoring:
+    """Scoring batch de LocalAIEngine via le matcher compilé"""
+
+    def test_score_articles_batch(self):
+        engine = LocalAIEngine()
+        scores = engine.score_articles(
+            [
+                {"title": "Bitcoin rally", "description": "Strong gains"},
+                {"title": "Crash fears", "description": None},
+            ]
+        )
+
+        assert scores[0].get("bullish_keywords") == 2
+        assert scores[1].get("bearish_keywords") == 1
+
+    def test_forex_boost_requires_whole_word(self):
+        engine = LocalAIEngine()
+        base = engine.analyze_sentiment(["Markets stable"], "forex")["confidence"]
+        boosted = engine.analyze_sentiment(["Fed holds, markets stable"], "forex")
+
+        assert boosted["confidence"] == min(95, base + 5)
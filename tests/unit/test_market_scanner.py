@@ -0,0 +1,186 @@
+"""
+Tests du screener multi-symboles (DSL, évaluation vectorisée, cache OHLCV local)
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dash_modules.models.base import Base, configure_sqlite_engine
+from dash_modules.services.database_service import DatabaseService
+from dash_modules.services.market_scanner import (
+    MarketScanner,
+    ScanExpression,
+    ScanExpressionError,
+)
+from src.thebot.indicators.graph import IndicatorPlanner
+
+
+def _bars(count, drift, seed, end=None):
+    rng = np.random.default_rng(seed)
+    end = end or datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    close = 100 * np.exp(np.cumsum(drift + rng.standard_normal(count) * 0.005))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.random(count) * 1000,
+        },
+        index=pd.date_range(end=end, periods=count, freq="1h", name="timestamp"),
+    )
+
+
+def _wide(frames):
+    return {
+        column: pd.DataFrame({symbol: frame[column] for symbol, frame in frames.items()})
+        for column in ("open", "high", "low", "close", "volume")
+    }
+
+
+class FakeProvider:
+    def __init__(self, frames):
+        self.frames = frames
+        self.calls = []
+
+    def get_all_symbols(self):
+        return list(self.frames)
+
+    def get_klines(self, symbol, interval="1h", limit=100):
+        self.calls.append(symbol)
+        return self.frames[symbol].iloc[-limit:]
+
+
+@pytest.fixture
+def frames():
+    return {
+        "UPUSDT": _bars(300, 0.004, seed=1),
+        "DOWNUSDT": _bars(300, -0.004, seed=2),
+        "FLATUSDT": _bars(300, 0.0, seed=3),
+    }
+
+
+@pytest.fixture
+def db_service(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'scanner.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    configure_sqlite_engine(engine)
+    Base.metadata.create_all(bind=engine)
+    yield DatabaseService(session_factory=sessionmaker(bind=engine))
+    engine.dispose()
+
+
+class TestScanExpression:
+    """Tests pour ScanExpression"""
+
+    def test_conditions_match_reference_values(self, frames):
+        columns = _wide(frames)
+        mask, values = ScanExpression("RSI(14) > 70 AND close > EMA(50)").evaluate(columns)
+
+        assert list(mask[mask].index) == ["UPUSDT"]
+        reference = IndicatorPlanner().compute(frames["DOWNUSDT"], [("rsi", {"period": 14})])
+        assert values["RSI(14)"]["DOWNUSDT"] == pytest.approx(reference["rsi_14"]["rsi"].iloc[-1])
+
+    def test_lag_change_and_chained_comparison(self, frames):
+        columns = _wide(frames)
+        close = columns["close"]
+        expected_change = (close.iloc[-1] / close.iloc[-6] - 1) * 100
+
+        mask, values = ScanExpression("CHANGE(5) < 0 and close < close[5]").evaluate(columns)
+        pd.testing.assert_series_equal(values["CHANGE(5)"], expected_change)
+        assert mask.equals(expected_change < 0)
+
+        mask, _ = ScanExpression("0 < RSI(14) < 100 and not SUPERTREND_DIR(10, 3) < 0").evaluate(
+            columns
+        )
+        assert mask["UPUSDT"] and not mask["DOWNUSDT"]
+
+    def test_nan_never_matches(self, frames):
+        short = {symbol: frame.iloc[-10:] for symbol, frame in frames.items()}
+        mask, _ = ScanExpression("EMA(200) > 0 or SMA(50) > 0").evaluate(_wide(short))
+        assert not mask.any()
+
+    def test_lookback_follows_indicator_warmup(self, frames):
+        expression = ScanExpression("MACD_SIGNAL(12, 26, 9) > 0")
+        assert expression.lookback == 26 + 9 - 1
+        assert ScanExpression("MACD_SIGNAL(12, 26, 9)[2] > 0").lookback == 26 + 9 - 1 + 2
+
+        # 30 bougies : assez pour EMA(26) mais pas pour le signal
+        short = {symbol: frame.iloc[-30:] for symbol, frame in frames.items()}
+        mask, _ = expression.evaluate(_wide(short))
+        assert not mask.any()
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "RSI(14) <",
+            "__import__('os').system('x') > 0",
+            "price > 1",
+            "FOO(3) > 1",
+            "RSI(period='14') > 1",
+            "RSI(14, 2, 3) > 1",
+            "close[-1] > 1",
+            "close.real > 1",
+        ],
+    )
+    def test_invalid_expressions(self, source):
+        with pytest.raises(ScanExpressionError):
+            ScanExpression(source)
+
+
+class TestMarketScanner:
+    """Tests pour MarketScanner"""
+
+    def test_scan_fetches_once_then_reuses_local_cache(self, frames, db_service):
+        provider = FakeProvider(frames)
+        scanner = MarketScanner(provider=provider, db_service=db_service)
+
+        first = scanner.scan("close > SMA(20)", interval="1h", bars=250)
+        assert first.fetched == 3 and first.from_cache == 0
+        assert sorted(provider.calls) == sorted(frames)
+
+        provider.calls.clear()
+        second = scanner.scan("close > SMA(20)", interval="1h", bars=250)
+        assert provider.calls == []
+        assert second.from_cache == 3
+        assert second.matches == first.matches
+        assert "UPUSDT" in second.matches and "DOWNUSDT" not in second.matches
+        assert scanner._pool is None  # Évaluation dans le processus par défaut
+
+    def test_chunked_scan_matches_single_pass(self, frames, db_service):
+        provider = FakeProvider(frames)
+        single = MarketScanner(provider=provider, db_service=db_service, processes=0)
+        chunked = MarketScanner(
+            provider=provider, db_service=db_service, chunk_size=1, processes=2
+        )
+
+        expression = "MACD_HIST(12, 26, 9) > 0 or BB_LOWER(20, 2) > close"
+        expected = single.scan(expression, bars=200)
+        try:
+            result = chunked.scan(expression, bars=200)
+            assert chunked.scan(expression, bars=200).matches == result.matches
+            pool = chunked._pool
+        finally:
+            chunked.shutdown()
+
+        assert pool is not None and pool._mp_context.get_start_method() == "spawn"
+
+        assert sorted(result.matches) == sorted(expected.matches)
+        for symbol, values in expected.values.items():
+            assert result.values[symbol] == pytest.approx(values)
+        assert result.scanned == 3
+
+    def test_failed_symbols_reported(self, frames, db_service):
+        provider = FakeProvider(frames)
+        scanner = MarketScanner(provider=provider, db_service=db_service, processes=0)
+
+        result = scanner.scan("close > 0", symbols=["UPUSDT", "MISSINGUSDT"])
+        assert result.matches == ["UPUSDT"]
+        assert result.failed == ["MISSINGUSDT"]
@@ -0,0 +1,214 @@
+"""
+Tests pour le News Ingestion Scheduler
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dash_modules.data_providers.news_ingestion_scheduler import (
+    NewsIngestionScheduler,
+    NewsStore,
+)
+from dash_modules.data_providers.rss_news_manager import RSSNewsManager
+
+
+def _source(name, interval=300, category="crypto"):
+    return {
+        "name": name,
+        "url": f"https://example.com/{name}.xml",
+        "category": category,
+        "update_interval": interval,
+        "max_entries": 10,
+        "active": True,
+    }
+
+
+def _config(*sources):
+    config = MagicMock()
+    config.get_active_sources.return_value = list(sources)
+    return config
+
+
+class FakeParser:
+    """Parser async minimal renvoyant des articles prédéfinis par URL"""
+
+    feeds = {}
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    async def parse_feed_async(self, url, max_entries=50):
+        return [dict(article) for article in self.feeds.get(url, [])]
+
+
+class TestNewsStore:
+    """Tests pour NewsStore"""
+
+    def test_update_counts_new_articles(self):
+        store = NewsStore()
+        assert store.update("A", [{"url": "u1"}, {"url": "u2"}]) == 2
+        assert store.update("A", [{"url": "u2"}, {"url": "u3"}]) == 1
+        assert store.update("A", [{"url": "u2"}, {"url": "u3"}]) == 0
+
+    def test_get_articles_by_source(self):
+        store = NewsStore()
+        store.update("A", [{"url": "a"}])
+        store.update("B", [{"url": "b"}])
+
+        assert [a["url"] for a in store.get_articles(["B"])] == ["b"]
+        assert len(store.get_articles()) == 2
+        assert store.get_articles(["missing"]) == []
+
+    def test_version_changes_only_on_new_content(self):
+        store = NewsStore()
+        store.update("A", [{"url": "a"}])
+        version = store.version
+        store.update("A", [{"url": "a"}])
+        assert store.version == version
+
+
+class TestAdaptiveIntervals:
+    """Tests des intervalles adaptatifs"""
+
+    def setup_method(self):
+        self.scheduler = NewsIngestionScheduler(
+            sources_config=_config(_source("A", interval=400)), min_interval=60
+        )
+        self.scheduler.sync_sources()
+        self.state = self.scheduler._states["A"]
+
+    def test_new_articles_shorten_interval(self):
+        self.scheduler._record_success(self.state, new_count=5)
+        assert self.state.interval < 400
+        assert self.state.consecutive_failures == 0
+
+    def test_interval_floor(self):
+        for _ in range(50):
+            self.scheduler._record_success(self.state, new_count=1)
+        assert self.state.interval == 100  # base / 4
+
+    def test_idle_source_relaxes_up_to_ceiling(self):
+        for _ in range(50):
+            self.scheduler._record_success(self.state, new_count=0)
+        assert self.state.interval == 1600  # base * 4
+
+    def test_failures_back_off_exponentially(self):
+        self.scheduler._record_failure(self.state)
+        first_delay = self.state.next_poll - time.monotonic()
+        self.scheduler._record_failure(self.state)
+        second_delay = self.state.next_poll - time.monotonic()
+
+        assert self.state.consecutive_failures == 2
+        assert second_delay > first_delay
+        assert second_delay <= self.scheduler.max_backoff * 1.1
+
+    def test_refresh_does_not_bypass_backoff(self):
+        self.scheduler._record_failure(self.state)
+        next_poll = self.state.next_poll
+        self.scheduler.request_refresh(["A"])
+        assert self.state.next_poll == next_poll
+
+    def test_sync_sources_drops_inactive(self):
+        self.scheduler.sources_config = _config(_source("B"))
+        self.scheduler.sync_sources()
+        assert list(self.scheduler._states) == ["B"]
+
+
+class TestSchedulerLoop:
+    """Tests du cycle de vie de la boucle d'ingestion"""
+
+    def test_background_ingestion_fills_store(self):
+        source = _source("A")
+        FakeParser.feeds = {source["url"]: [{"url": "u1", "title": "BTC up"}]}
+        scheduler = NewsIngestionScheduler(sources_config=_config(source))
+
+        with patch(
+            "dash_modules.data_providers.news_ingestion_scheduler.AsyncRSSParser",
+            FakeParser,
+        ):
+            scheduler.start()
+            try:
+                deadline = time.time() + 5
+                while not scheduler.store.has_data() and time.time() < deadline:
+                    time.sleep(0.02)
+            finally:
+                scheduler.stop()
+
+        articles = scheduler.store.get_articles(["A"])
+        assert articles[0]["rss_source_name"] == "A"
+        assert articles[0]["rss_category"] == "crypto"
+        assert not scheduler.is_running
+
+    def test_empty_feed_counts_as_failure(self):
+        source = _source("A")
+        FakeParser.feeds = {}
+        scheduler = NewsIngestionScheduler(sources_config=_config(source))
+
+        with patch(
+            "dash_modules.data_providers.news_ingestion_scheduler.AsyncRSSParser",
+            FakeParser,
+        ):
+            scheduler.start()
+            try:
+                deadline = time.time() + 5
+                while (
+                    scheduler._states["A"].total_failures == 0
+                    and time.time() < deadline
+                ):
+                    time.sleep(0.02)
+            finally:
+                scheduler.stop()
+
+        assert scheduler.get_status()["sources"]["A"]["consecutive_failures"] == 1
+
+
+class TestRSSNewsManagerStoreReads:
+    """RSSNewsManager lit le store quand l'ingestion tourne"""
+
+    def test_get_news_reads_store_without_fetching(self):
+        manager = RSSNewsManager(max_workers=2)
+        manager.scheduler = MagicMock()
+        manager.scheduler.is_running = True
+        manager.scheduler.store.get_articles.return_value = [
+            {"url": "u1", "title": "Old", "published_date": "2024-01-01"},
+            {"url": "u2", "title": "New", "published_date": "2024-02-01"},
+        ]
+
+        with patch.object(manager, "_fetch_sources") as mock_fetch:
+            result = manager.get_news(categories=["crypto"], limit=10)
+
+        mock_fetch.assert_not_called()
+        assert [a["title"] for a in result] == ["New", "Old"]
+
+    def test_manual_refresh_requests_background_poll(self):
+        manager = RSSNewsManager(max_workers=2)
+        manager.scheduler = MagicMock()
+        manager.scheduler.is_running = True
+        manager.scheduler.store.get_articles.return_value = []
+
+        manager.get_news(categories=["crypto"], use_cache=False)
+
+        manager.scheduler.request_refresh.assert_called_once()
+
+    def test_cold_start_falls_back_to_sync_fetch(self):
+        manager = RSSNewsManager(max_workers=2)
+        manager.scheduler = MagicMock()
+        manager.scheduler.is_running = True
+        manager.scheduler.store.has_data.return_value = False
+
+        with patch.object(
+            manager, "_fetch_sources", return_value=[{"url": "u1", "title": "Live"}]
+        ) as mock_fetch:
+            result = manager.get_news(categories=["crypto"], limit=10)
+
+        mock_fetch.assert_called_once()
+        manager.scheduler.store.get_articles.assert_not_called()
+        assert [a["title"] for a in result] == ["Live"]
@@ -0,0 +1,134 @@
+"""
+Tests du backend de sentiment ONNX local (padding dynamique, processus worker)
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from dash_modules.ai_engine.onnx_sentiment_engine import (
+    OnnxSentimentEngine,
+    length_batches,
+    pad_batch,
+    softmax,
+)
+from dash_modules.ai_engine.smart_ai_manager import SmartAIManager
+
+
+class _KeywordModel:
+    """Modèle factice chargé dans le worker (mêmes sorties que SentimentModel.predict)"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.pid = os.getpid()
+
+    def predict(self, texts):
+        if self.fail_on in texts:
+            raise ValueError("texte invalide")
+        return [
+            {"label": "positive", "score": 0.9, "pid": self.pid}
+            if "rally" in text
+            else {"label": "negative", "score": 0.8, "pid": self.pid}
+            for text in texts
+        ]
+
+
+class _BrokenModel:
+    def __init__(self):
+        raise FileNotFoundError("model.onnx")
+
+
+@pytest.fixture
+def engine():
+    engine = OnnxSentimentEngine(
+        model_factory=_KeywordModel, start_method="fork", timeout=10
+    )
+    yield engine
+    engine.stop()
+
+
+class TestBatchingHelpers:
+    """Tests du regroupement par longueur et du padding"""
+
+    def test_length_batches_sorted_by_length(self):
+        batches = length_batches([5, 1, 9, 3, 7], batch_size=2)
+        assert batches == [[1, 3], [0, 4], [2]]
+
+    def test_pad_batch_to_longest_sequence(self):
+        input_ids, attention_mask = pad_batch([[101, 7, 102], [101, 102]], pad_id=0)
+        np.testing.assert_array_equal(input_ids, [[101, 7, 102], [101, 102, 0]])
+        np.testing.assert_array_equal(attention_mask, [[1, 1, 1], [1, 1, 0]])
+        assert input_ids.dtype == np.int64
+
+    def test_softmax_rows_sum_to_one(self):
+        probabilities = softmax(np.array([[2.0, 1.0, 0.1], [1000.0, 0.0, 0.0]]))
+        np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+        assert probabilities[1, 0] == pytest.approx(1.0)
+
+
+class TestOnnxSentimentEngine:
+    """Tests pour OnnxSentimentEngine"""
+
+    def test_batch_runs_in_worker_process(self, engine):
+        texts = ["BTC rally continues", "ETH selloff", "BTC rally continues"]
+        predictions = engine.predict(texts)
+
+        assert predictions[0] == predictions[2]
+        assert predictions[0]["pid"] != os.getpid()
+        assert engine.stats["texts"] == 2  # Doublon calculé une fois
+
+        results = engine.analyze_batch(texts)
+        assert results[0]["sentiment"] == "bullish"
+        assert results[1]["sentiment"] == "bearish"
+        assert results[0]["source"] == "ONNX (Local)"
+        assert set(results[0]) >= {"sentiment", "confidence", "score", "model", "raw_result"}
+
+        # Le modèle n'est chargé qu'une fois : même worker entre les appels
+        assert engine.predict(["rally"])[0]["pid"] == predictions[0]["pid"]
+
+    def test_news_aggregation(self, engine):
+        news = [{"title": f"Crypto rally {i}", "description": ""} for i in range(8)]
+        news += [{"title": "Exchange hack", "description": "funds lost"}] * 2
+        result = engine.analyze_news(news)
+
+        assert result["sentiment"] == "bullish"
+        assert result["analysis"]["bullish_articles"] == 8
+        assert result["analysis"]["total_articles"] == 10
+
+    def test_worker_errors_surface_and_engine_recovers(self):
+        engine = OnnxSentimentEngine(
+            model_factory=lambda: _KeywordModel(fail_on="boom"), start_method="fork", timeout=10
+        )
+        try:
+            with pytest.raises(RuntimeError, match="texte invalide"):
+                engine.predict(["boom"])
+            assert engine.predict(["rally"])[0]["label"] == "positive"
+        finally:
+            engine.stop()
+
+    def test_model_load_failure_disables_backend(self):
+        engine = OnnxSentimentEngine(model_factory=_BrokenModel, start_method="fork", timeout=10)
+        with pytest.raises(RuntimeError, match="model.onnx"):
+            engine.start()
+        assert not engine.is_available()
+        assert engine.get_status()["error"]
+
+    def test_unavailable_without_model_files(self, tmp_path):
+        assert not OnnxSentimentEngine(model_dir=tmp_path).is_available()
+
+
+class TestSmartAIManagerRouting:
+    """SmartAIManager : le modèle local passe avant l'API distante pour le sentiment"""
+
+    def test_sentiment_routed_to_onnx(self, engine):
+        manager = SmartAIManager()
+        manager.onnx_ai = engine
+
+        assert manager.choose_best_ai("sentiment") == "onnx"
+        result = manager.analyze_with_best_ai({"news_articles": ["BTC rally", "ETH rally"]})
+        assert result["sentiment"] == "bullish"
+        assert result["metadata"]["ai_used"] == "onnx"
+
+        manager.user_preferences["onnx_enabled"] = False
+        assert manager.choose_best_ai("sentiment") != "onnx"
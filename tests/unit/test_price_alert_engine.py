@@ -0,0 +1,211 @@
+"""
+Tests pour le moteur d'alertes de prix indexé
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from dash_modules.models.alerts import PriceAlert
+from dash_modules.models.base import Base
+from dash_modules.services.database_service import DatabaseService
+from dash_modules.services.price_alert_engine import PriceAlertEngine, _IntervalTree
+
+_ids = iter(range(1, 100000))
+
+
+def _alert(condition, symbol="BTCUSDT", **kwargs):
+    kwargs.setdefault("id", next(_ids))
+    return PriceAlert(
+        symbol=symbol,
+        provider="binance",
+        condition_type=condition,
+        is_active=1,
+        is_triggered=0,
+        **kwargs,
+    )
+
+
+class FakeStream:
+    def __init__(self, config=None):
+        self.config = config
+        self.observers = []
+        self.start_background = MagicMock()
+
+    async def add_observer(self, observer):
+        self.observers.append(observer)
+
+    async def remove_observer(self, observer):
+        self.observers.remove(observer)
+
+
+@pytest.fixture
+def engine():
+    db_service = MagicMock()
+    db_service.mark_price_alerts_triggered.side_effect = len
+    return PriceAlertEngine(db_service=db_service)
+
+
+class TestPriceAlertEngine:
+    """Tests pour PriceAlertEngine"""
+
+    def test_above_and_below_fire_only_when_crossed(self, engine):
+        above = _alert("above", target_price=110)
+        below = _alert("below", target_price=90)
+        engine.add_alerts([above, below])
+
+        assert engine.on_tick("BTCUSDT", 100) == []
+        assert [a.alert_id for a in engine.on_tick("BTCUSDT", 111)] == [above.id]
+        assert [a.alert_id for a in engine.on_tick("BTCUSDT", 90)] == [below.id]
+
+    def test_alert_fires_only_once(self, engine):
+        engine.add_alert(_alert("above", target_price=110))
+        assert len(engine.on_tick("BTCUSDT", 120)) == 1
+        assert engine.on_tick("BTCUSDT", 130) == []
+
+    def test_between_and_change_percent(self, engine):
+        between = _alert("between", target_price_min=95, target_price_max=97)
+        change = _alert("change_percent", change_percent=5, reference_price=100)
+        engine.add_alerts([between, change])
+
+        assert [a.alert_id for a in engine.on_tick("BTCUSDT", 96)] == [between.id]
+        assert [a.alert_id for a in engine.on_tick("BTCUSDT", 94)] == [change.id]
+        assert engine.get_stats()["indexed_alerts"] == 0
+
+    def test_other_symbols_untouched(self, engine):
+        engine.add_alert(_alert("above", symbol="ETHUSDT", target_price=1))
+        assert engine.on_tick("BTCUSDT", 1000) == []
+
+    def test_matches_check_condition(self, engine):
+        rng = random.Random(7)
+        alerts = []
+        for _ in range(300):
+            condition = rng.choice(["above", "below", "between", "change_percent"])
+            low, high = sorted(rng.uniform(50, 150) for _ in range(2))
+            alerts.append(_alert(
+                condition,
+                target_price=rng.uniform(50, 150),
+                target_price_min=low,
+                target_price_max=high,
+                change_percent=rng.uniform(1, 30),
+                reference_price=100.0,
+            ))
+        engine.add_alerts(alerts)
+
+        for _ in range(50):
+            price = rng.uniform(40, 160)
+            expected = {a.id for a in alerts if a.check_condition(price)}
+            fired = {a.alert_id for a in engine.on_tick("BTCUSDT", price)}
+            assert fired == expected
+            for alert in alerts:
+                if alert.id in fired:
+                    alert.trigger()
+
+    def test_flush_batches_and_requeues_on_error(self, engine):
+        engine.add_alerts([_alert("above", target_price=1), _alert("above", target_price=2)])
+        engine.on_tick("BTCUSDT", 10)
+
+        engine.db_service.mark_price_alerts_triggered.side_effect = RuntimeError("db")
+        assert engine.flush() == 0
+        assert engine.get_stats()["pending_writes"] == 2
+
+        engine.db_service.mark_price_alerts_triggered.side_effect = len
+        assert engine.flush() == 2
+        batch = engine.db_service.mark_price_alerts_triggered.call_args[0][0]
+        assert len({trigger["alert_id"] for trigger in batch}) == 2
+        assert engine.flush() == 0
+
+    def test_listener_notified(self, engine):
+        listener = MagicMock()
+        engine.add_listener(listener)
+        engine.add_alert(_alert("below", target_price=50))
+        engine.on_tick("BTCUSDT", 40)
+        listener.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_attach_to_data_stream(self, engine):
+        stream = FakeStream()
+        engine.add_alert(_alert("above", target_price=100))
+        await engine.attach(stream)
+
+        stream.observers[0]("BTCUSDT", MagicMock(latest_price=Decimal("101")))
+        await engine.detach()
+
+        assert stream.observers == []
+        engine.db_service.mark_price_alerts_triggered.assert_called_once()
+
+
+def test_alerts_monitor_attaches_engine_to_stream(engine, monkeypatch):
+    from dash_modules.core.alerts_monitor import AlertsMonitor
+
+    streams = []
+    # Le paquet services réexporte l'instance sous le nom du module
+    monkeypatch.setattr(sys.modules[PriceAlertEngine.__module__], "price_alert_engine", engine)
+    monkeypatch.setattr(
+        "src.thebot.services.data_stream.get_data_stream",
+        lambda config: streams.append(FakeStream(config)) or streams[-1],
+    )
+    engine.db_service.get_price_alerts.return_value = [
+        _alert("above", symbol="ETHUSDT", target_price=100)
+    ]
+
+    monitor = AlertsMonitor()
+    monitor.start_monitoring()
+    deadline = time.monotonic() + 2
+    while not engine.attached and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    stream = streams[0]
+    stream.start_background.assert_called_once()
+    assert "ETHUSDT" in stream.config.symbols
+    assert monitor.get_status()["is_running"]
+
+    stream.observers[0]("ETHUSDT", MagicMock(latest_price=Decimal("120")))
+    monitor.stop_monitoring()
+
+    assert stream.observers == []
+    assert monitor.get_status()["triggered_alerts_count"] == 1
+    engine.db_service.mark_price_alerts_triggered.assert_called_once()
+
+
+def test_interval_tree_stab():
+    rng = random.Random(3)
+    tree = _IntervalTree()
+    intervals = {}
+    for alert_id in range(200):
+        low = rng.uniform(0, 100)
+        intervals[alert_id] = (low, low + rng.uniform(0, 20))
+        tree.add(alert_id, *intervals[alert_id])
+    for alert_id in range(0, 200, 3):
+        tree.remove(alert_id)
+        del intervals[alert_id]
+
+    for x in (0.0, 10.5, 50.0, 99.9, 130.0):
+        expected = {i for i, (low, high) in intervals.items() if low <= x <= high}
+        assert set(tree.stab(x)) == expected
+
+
+def test_mark_price_alerts_triggered(tmp_path):
+    db_engine = create_engine(f"sqlite:///{tmp_path / 'alerts.db'}")
+    Base.metadata.create_all(bind=db_engine)
+    service = DatabaseService(session_factory=sessionmaker(bind=db_engine))
+
+    with service.get_session() as session:
+        session.add_all([_alert("above", id=1, target_price=10),
+                         _alert("above", id=2, target_price=20)])
+        session.commit()
+
+    engine = PriceAlertEngine(db_service=service)
+    assert engine.load_from_database() == 2
+    engine.on_tick("BTCUSDT", 15)
+    assert engine.flush() == 1
+
+    remaining = service.get_price_alerts()
+    assert {a.id: a.is_triggered for a in remaining} == {1: 1, 2: 0}
+    assert PriceAlertEngine(db_service=service).load_from_database() == 1
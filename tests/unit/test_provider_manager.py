@@ -3,6 +3,9 @@ Tests pour ProviderManager - Gestionnaire unifié des providers de données
 Phase 3 - Expansion couverture de test THEBOT
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock, Mock
 from dash_modules.data_providers.provider_manager import ProviderManager
@@ -194,6 +197,135 @@ class TestProviderManager:
 
         assert result == 48000.0
 
+    def test_get_price_data_breaker_opens_on_failures(self):
+        """Test disjoncteur : un provider en échec répété n'est plus appelé"""
+        failing_provider = Mock(spec=DataProviderInterface)
+        failing_provider.get_price_data.side_effect = ConnectionError("refused")
+        self.manager.providers['provider1'] = failing_provider
+
+        for _ in range(5):
+            with pytest.raises(ConnectionError):
+                self.manager.get_price_data('ETHUSDT', provider='provider1')
+        for _ in range(3):
+            assert self.manager.get_price_data('ETHUSDT', provider='provider1') is None
+
+        assert failing_provider.get_price_data.call_count == 5  # minimum_calls puis OPEN
+        assert self.manager.get_breaker_status()['provider1:price_data']['state'] == 'open'
+
+    def test_get_price_data_unsupported_symbol_keeps_breaker_closed(self):
+        """Test disjoncteur : une réponse vide (symbole non supporté) n'est pas un échec"""
+        mock_provider = Mock(spec=DataProviderInterface)
+        mock_provider.get_price_data.side_effect = (
+            lambda symbol, interval, limit: {'price': 50000} if symbol == 'BTCUSDT' else None
+        )
+        self.manager.providers['binance'] = mock_provider
+
+        for _ in range(8):
+            assert self.manager.get_price_data('UNKNOWN', provider='binance') is None
+
+        assert self.manager.get_price_data('BTCUSDT', provider='binance') == {'price': 50000}
+        assert self.manager.get_breaker_status()['binance:price_data']['state'] == 'closed'
+
+    def test_get_price_data_routes_to_fastest_provider(self):
+        """Test routage : le provider en échec passe derrière le provider sain"""
+        failing_provider = Mock(spec=DataProviderInterface)
+        failing_provider.get_price_data.return_value = None
+
+        success_provider = Mock(spec=DataProviderInterface)
+        success_provider.get_price_data.return_value = {'price': 45000}
+
+        self.manager.providers = {
+            'provider1': failing_provider,
+            'provider2': success_provider
+        }
+
+        for _ in range(5):
+            assert self.manager.get_price_data('ETHUSDT') == {'price': 45000}
+
+        assert failing_provider.get_price_data.call_count == 1
+        assert success_provider.get_price_data.call_count == 5
+        assert self.manager.get_routing_stats()['failovers'] == 1
+
+    def test_get_price_data_hedges_slow_provider(self):
+        """Test couverture : un provider lent est doublé par le suivant"""
+        release = threading.Event()
+
+        def slow_price_data(symbol, interval, limit):
+            release.wait(2)
+            return {'price': 1, 'source': 'slow'}
+
+        slow_provider = Mock(spec=DataProviderInterface)
+        slow_provider.get_price_data.side_effect = slow_price_data
+
+        fast_provider = Mock(spec=DataProviderInterface)
+        fast_provider.get_price_data.return_value = {'price': 2, 'source': 'fast'}
+
+        self.manager.providers = {
+            'slow': slow_provider,
+            'fast': fast_provider
+        }
+        self.manager.router.default_hedge_delay = 0.05
+
+        start = time.perf_counter()
+        try:
+            assert self.manager.get_price_data('BTCUSDT') == {'price': 2, 'source': 'fast'}
+        finally:
+            release.set()
+
+        assert time.perf_counter() - start < 1
+        assert self.manager.get_routing_stats()['hedge_wins'] == 1
+
+    def test_get_price_data_serves_last_good_value(self):
+        """Test disjoncteur : dernière valeur valide servie si le provider échoue"""
+        mock_provider = Mock(spec=DataProviderInterface)
+        mock_provider.get_price_data.side_effect = [{'price': 50000}, ConnectionError("timeout")]
+        self.manager.providers['binance'] = mock_provider
+
+        assert self.manager.get_price_data('BTCUSDT', provider='binance') == {'price': 50000}
+        assert self.manager.get_price_data('BTCUSDT', provider='binance') == {'price': 50000}
+        assert self.manager.get_breaker('binance', 'price_data').total_failures == 1
+
+    def test_get_price_data_fails_over_from_erroring_provider(self):
+        """Test routage : une erreur bascule vers le provider suivant au lieu de la valeur en cache"""
+        flaky_provider = Mock(spec=DataProviderInterface)
+        flaky_provider.get_price_data.side_effect = [{'p': 'A'}, ConnectionError("reset")]
+
+        healthy_provider = Mock(spec=DataProviderInterface)
+        healthy_provider.get_price_data.return_value = {'p': 'B'}
+
+        self.manager.providers = {
+            'a': flaky_provider,
+            'b': healthy_provider
+        }
+
+        assert self.manager.get_price_data('BTCUSDT') == {'p': 'A'}
+        assert self.manager.get_price_data('BTCUSDT') == {'p': 'B'}
+
+        healthy_provider.get_price_data.assert_called_once()
+        stats = self.manager.get_routing_stats()
+        assert stats['failovers'] == 1
+        assert stats['providers']['a']['errors'] == 1
+        assert self.manager.get_breaker('a', 'price_data').total_failures == 1
+
+    def test_get_price_data_last_good_when_all_providers_fail(self):
+        """Test routage : dernière valeur valide servie seulement si tous les providers échouent"""
+        flaky_provider = Mock(spec=DataProviderInterface)
+        flaky_provider.get_price_data.side_effect = [{'p': 'A'}, ConnectionError("reset")]
+
+        down_provider = Mock(spec=DataProviderInterface)
+        down_provider.get_price_data.side_effect = ConnectionError("refused")
+
+        self.manager.providers = {
+            'a': flaky_provider,
+            'b': down_provider
+        }
+
+        assert self.manager.get_price_data('BTCUSDT') == {'p': 'A'}
+        assert self.manager.get_price_data('BTCUSDT') == {'p': 'A'}
+
+        down_provider.get_price_data.assert_called_once()
+        assert self.manager.get_price_data('ETHUSDT') is None
+
     def test_get_market_info_specific_provider(self):
         """Test récupération informations marché avec provider spécifique"""
         mock_provider = Mock(spec=DataProviderInterface)
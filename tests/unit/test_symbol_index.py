@@ -0,0 +1,83 @@
+"""
+Tests de l'index de recherche de symboles (trie de préfixes et n-grammes)
+"""
+
+import pytest
+
+from dash_modules.data_providers.symbol_index import SymbolEntry, SymbolIndex
+
+
+def _crypto(symbol, volume):
+    return SymbolEntry(symbol=symbol, provider="binance", market_type="crypto", volume=volume)
+
+
+@pytest.fixture
+def index():
+    index = SymbolIndex()
+    index.update_source(
+        "binance",
+        [
+            _crypto("BTCUSDT", 900.0),
+            _crypto("WBTCUSDT", 5.0),
+            _crypto("BTTCUSDT", 20.0),
+            _crypto("ETHUSDT", 800.0),
+            _crypto("ETHFIUSDT", 50.0),
+            _crypto("OPUSDT", 10.0),
+            _crypto("OPENUSDT", 400.0),
+            _crypto("DOGEUSDT", 300.0),
+        ],
+    )
+    index.update_source(
+        "markets",
+        [
+            SymbolEntry("EUR/USD", name="Euro / US Dollar", provider="twelve_data", market_type="forex"),
+            SymbolEntry("AAPL", name="Apple Inc.", provider="yahoo", market_type="stocks"),
+        ],
+    )
+    return index
+
+
+class TestSymbolIndex:
+    """Tests pour SymbolIndex"""
+
+    def test_prefix_ranked_by_volume_exact_first(self, index):
+        assert index.symbols("bt") == ["BTCUSDT", "BTTCUSDT", "WBTCUSDT"]
+        assert index.symbols("OP") == ["OPUSDT", "OPENUSDT"]
+        assert index.symbols("eth", limit=1) == ["ETHUSDT"]
+
+    def test_substring_names_and_normalization(self, index):
+        assert index.symbols("BTC") == ["BTCUSDT", "WBTCUSDT"]
+        assert index.symbols("eur/usd") == ["EUR/USD"]
+        assert index.symbols("eurusd") == ["EUR/USD"]
+        assert index.symbols("apple") == ["AAPL"]
+        assert index.symbols("dollar") == ["EUR/USD"]
+
+    def test_fuzzy_matches_typos(self, index):
+        assert index.symbols("DOGEE") == ["DOGEUSDT"]
+        assert index.symbols("ETHFY")[0] == "ETHFIUSDT"
+        assert index.search("DOGEE", fuzzy=False) == []
+
+    def test_market_type_filter(self, index):
+        assert index.symbols("E", market_type="forex") == ["EUR/USD"]
+        assert "EUR/USD" not in index.symbols("E", market_type="crypto")
+
+    def test_rebuilt_only_when_source_changes(self, index):
+        version = index.version
+        assert index.search("btc") is index.search("btc")  # Frappe répétée servie depuis le cache
+
+        symbols = ["BTCUSDT", "ETHUSDT"]
+        assert index.update_source("binance", [_crypto(s, 1.0) for s in symbols], signature=symbols)
+        assert index.is_current("binance", symbols)
+        assert not index.update_source("binance", [], signature=list(symbols))
+        assert index.version == version + 1
+
+        assert index.symbols("btc") == ["BTCUSDT"]
+        assert index.get_stats()["sources"] == {"binance": 2, "markets": 2}
+
+    def test_sources_merged_by_symbol(self, index):
+        index.update_source(
+            "markets_crypto", [SymbolEntry("BTCUSDT", name="Bitcoin/USDT", provider="markets")]
+        )
+        entry = index.search("bitcoin")[0]
+        assert entry.symbol == "BTCUSDT"
+        assert entry.volume == 900.0 and entry.provider == "binance"
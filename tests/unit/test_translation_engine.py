@@ -0,0 +1,117 @@
+"""
+Tests pour le TranslationEngine local (lexique précompilé + LRU)
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dash_modules.ai_engine.smart_ai_manager import SmartAIManager
+from dash_modules.ai_engine.translation_engine import EN_FR_LEXICON, TranslationEngine
+
+
+class TestTranslationEngine:
+    """Tests pour TranslationEngine"""
+
+    def setup_method(self):
+        self.engine = TranslationEngine()
+
+    def test_empty_text(self):
+        assert self.engine.translate("   ") == {"translated_text": "   ", "confidence": 0}
+
+    def test_preserves_case_and_punctuation(self):
+        result = self.engine.translate("Stock market (today), up!")
+        assert result["translated_text"] == "Action marché (aujourd'hui), hausse!"
+        assert result["words_translated"] == 4
+        assert result["total_words"] == 4
+
+    def test_compound_words_are_looked_up_whole(self):
+        result = self.engine.translate("sell-off")
+        assert result["translated_text"] == "sell-off"
+        assert result["words_translated"] == 0
+
+    def test_repeated_text_hits_cache(self):
+        first = self.engine.translate("Bitcoin price forecast")
+        first["translated_text"] = "mutated"
+        second = self.engine.translate("Bitcoin price forecast")
+
+        assert second["translated_text"] == "Bitcoin prix prévision"
+        assert self.engine.get_stats()["hits"] == 1
+
+    def test_cache_is_bounded(self):
+        engine = TranslationEngine(cache_size=2)
+        engine.translate_many(["market one", "market two", "market three"])
+        assert engine.get_stats()["cached_translations"] == 2
+
+    def test_custom_lexicon(self):
+        engine = TranslationEngine(lexicon={"hello": "bonjour"})
+        assert engine.translate("Hello world")["translated_text"] == "Bonjour world"
+        assert "market" in EN_FR_LEXICON
+
+
+class TestSmartAIManagerBatchTranslation:
+    """Traduction batch via SmartAIManager"""
+
+    def test_translate_many_skips_french_and_empty(self):
+        manager = SmartAIManager()
+        manager.local_ai = MagicMock()
+        manager.local_ai.translate_many.return_value = [{"translated_text": "Marché"}]
+
+        texts = ["Market", "", "Le marché et la bourse de Paris"]
+        result = manager.translate_many_to_french(texts)
+
+        manager.local_ai.translate_many.assert_called_once_with(["Market"])
+        assert result == ["Marché", "", "Le marché et la bourse de Paris"]
+
+    def test_translate_many_without_engine(self):
+        manager = SmartAIManager()
+        manager.local_ai = None
+        assert manager.translate_many_to_french(["Market"]) == ["Market"]
+
+
+class TestNewsModulesBatchTranslation:
+    """Les modules de news traduisent leur flux en un seul lot"""
+
+    def test_economic_news_single_batch(self, monkeypatch):
+        from dash_modules.tabs import economic_news_module
+        from dash_modules.tabs.economic_news_module import EconomicNewsModule
+
+        manager = MagicMock()
+        manager.translate_many_to_french.side_effect = lambda texts: [f"FR {t}" for t in texts]
+        monkeypatch.setattr(economic_news_module, "smart_ai_manager", manager, raising=False)
+        monkeypatch.setattr(economic_news_module, "AI_AVAILABLE", True)
+
+        articles = [
+            {"original_title": "Inflation rises again", "original_summary": "Consumer prices rose in May"},
+            {"original_title": "GDP", "original_summary": "Résumé non disponible"},
+        ]
+        for article in articles:
+            article.update(title=article["original_title"], summary=article["original_summary"])
+        EconomicNewsModule().translate_articles(articles)
+
+        manager.translate_many_to_french.assert_called_once_with(
+            ["Inflation rises again", "Consumer prices rose in May"]
+        )
+        assert articles[0]["title"] == "FR Inflation rises again"
+        assert articles[1]["title"] == "GDP"
+
+    def test_crypto_news_single_batch(self, monkeypatch):
+        from dash_modules.tabs import crypto_news_module
+        from dash_modules.tabs.crypto_news_module import CryptoNewsModule
+
+        manager = MagicMock()
+        manager.translate_many_to_french.side_effect = lambda texts: [f"FR {t}" for t in texts]
+        monkeypatch.setattr(crypto_news_module, "smart_ai_manager", manager, raising=False)
+        monkeypatch.setattr(crypto_news_module, "AI_AVAILABLE", True)
+
+        articles = [
+            {"original_title": "Bitcoin hits record", "original_summary": "short"},
+            {"original_title": "Ether upgrade ships", "original_summary": "The network upgrade went live"},
+        ]
+        CryptoNewsModule().translate_articles(articles)
+
+        manager.translate_many_to_french.assert_called_once_with(
+            ["Bitcoin hits record", "Ether upgrade ships", "The network upgrade went live"]
+        )
+        assert articles[1]["summary"] == "FR The network upgrade went live"
+        assert "summary" not in articles[0]